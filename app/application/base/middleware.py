@@ -0,0 +1,29 @@
+from abc import ABC
+from contextlib import (
+    AbstractContextManager,
+    nullcontext,
+)
+
+from application.base.command import BaseCommand
+from application.base.query import BaseQuery
+
+
+class BaseMediatorMiddleware(ABC):
+    """Обертка выполнения команд и запросов в Mediator.
+
+    Сквозные задачи (маршрутизация чтений, метрики, трассировка) реализуются
+    в инфраструктуре и передаются медиатору из контейнера, поэтому ядро CQRS
+    от них не зависит. Области middleware открываются в порядке списка:
+    первый - внешний.
+    """
+
+    def command_scope(self, command: BaseCommand) -> AbstractContextManager[None]:
+        return nullcontext()
+
+    def query_scope(self, query: BaseQuery) -> AbstractContextManager[None]:
+        """Область одного вызывающего; задача объединенного запроса создается внутри нее и копирует ее контекст."""
+        return nullcontext()
+
+    def can_coalesce(self, query: BaseQuery) -> bool:
+        """False - запрос выполняется отдельно, без объединения с равными ему."""
+        return True
@@ -5,13 +5,17 @@ from abc import (
 from dataclasses import dataclass
 from typing import (
     Any,
+    ClassVar,
     Generic,
     TypeVar,
 )
 
 
 @dataclass(frozen=True)
-class BaseQuery(ABC): ...
+class BaseQuery(ABC):
+    # Одинаковые параллельные запросы медиатор выполняет один раз и раздает результат всем.
+    # Отключается для запросов, результат которых нельзя разделить (потоки, курсоры)
+    coalesce: ClassVar[bool] = True
 
 
 QueryType = TypeVar("QueryType", bound=BaseQuery)
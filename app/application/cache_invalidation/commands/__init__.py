@@ -0,0 +1,10 @@
+from application.cache_invalidation.commands.invalidate import (
+    InvalidateCachesCommand,
+    InvalidateCachesCommandHandler,
+)
+
+
+__all__ = [
+    "InvalidateCachesCommand",
+    "InvalidateCachesCommandHandler",
+]
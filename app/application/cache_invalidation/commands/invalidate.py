@@ -0,0 +1,62 @@
+from dataclasses import dataclass
+from typing import Optional
+from uuid import UUID
+
+from application.base.command import (
+    BaseCommand,
+    BaseCommandHandler,
+)
+from domain.base.cache import SlugCache
+from domain.news.services import NewsService
+from domain.products.services import ProductService
+from domain.seo_settings.services import SeoSettingsService
+
+
+@dataclass(frozen=True)
+class InvalidateCachesCommand(BaseCommand):
+    """Изменение документа коллекции, сделанное любым процессом (из change stream).
+
+    Без oid и slugs изменение считается неизвестным: кэши коллекции
+    сбрасываются целиком.
+    """
+
+    collection_name: str
+    oid: Optional[UUID] = None
+    slugs: frozenset[str] = frozenset()
+
+    @property
+    def is_targeted(self) -> bool:
+        return self.oid is not None or bool(self.slugs)
+
+
+def _invalidate_slug_cache(slug_cache: SlugCache, command: InvalidateCachesCommand) -> None:
+    if not command.is_targeted:
+        slug_cache.clear()
+        return
+
+    slug_cache.invalidate(*command.slugs)
+
+    if command.oid is not None:
+        slug_cache.invalidate_oid(command.oid)
+
+
+@dataclass(frozen=True)
+class InvalidateCachesCommandHandler(BaseCommandHandler[InvalidateCachesCommand, None]):
+    """Сбрасывает кэши процесса, зависящие от измененной коллекции.
+
+    Портфолио и сертификаты в памяти процесса не кэшируются, а карта сайта
+    перепроверяет версию на каждый запрос, поэтому для них сбрасывать нечего.
+    """
+
+    product_service: ProductService
+    news_service: NewsService
+    seo_settings_service: SeoSettingsService
+
+    async def handle(self, command: InvalidateCachesCommand) -> None:
+        if command.collection_name == "products":
+            _invalidate_slug_cache(self.product_service.slug_cache, command)
+        elif command.collection_name == "news":
+            _invalidate_slug_cache(self.news_service.slug_cache, command)
+        elif command.collection_name == "seo_settings":
+            # Коллекция маленькая: снимок проще перечитать, чем править точечно
+            await self.seo_settings_service.refresh_snapshot()
@@ -5,6 +5,10 @@ from punq import (
     Scope,
 )
 
+from application.cache_invalidation.commands import (
+    InvalidateCachesCommand,
+    InvalidateCachesCommandHandler,
+)
 from application.certificates.commands import (
     CreateCertificateCommand,
     CreateCertificateCommandHandler,
@@ -70,6 +74,10 @@ from application.news.queries import (
     GetNewsListQuery,
     GetNewsListQueryHandler,
 )
+from application.pages.queries import (
+    GetPageBundleQuery,
+    GetPageBundleQueryHandler,
+)
 from application.portfolios.commands import (
     CreatePortfolioCommand,
     CreatePortfolioCommandHandler,
@@ -85,6 +93,8 @@ from application.portfolios.queries import (
     GetPortfolioBySlugQueryHandler,
     GetPortfolioListQuery,
     GetPortfolioListQueryHandler,
+    GetPortfolioSummaryListQuery,
+    GetPortfolioSummaryListQueryHandler,
 )
 from application.products.commands import (
     CreateProductCommand,
@@ -103,6 +113,10 @@ from application.products.queries import (
     GetProductBySlugQueryHandler,
     GetProductListQuery,
     GetProductListQueryHandler,
+    GetProductSummaryListQuery,
+    GetProductSummaryListQueryHandler,
+    StreamProductListQuery,
+    StreamProductListQueryHandler,
 )
 from application.reviews.commands import (
     CreateReviewCommand,
@@ -134,6 +148,21 @@ from application.seo_settings.queries import (
     GetSeoSettingsListQuery,
     GetSeoSettingsListQueryHandler,
 )
+from application.sitemap.commands import (
+    RebuildSitemapCommand,
+    RebuildSitemapCommandHandler,
+    SitemapRebuildScheduler,
+    SyncNewsSitemapEntryCommandHandler,
+    SyncPortfolioSitemapEntryCommandHandler,
+    SyncProductSitemapEntryCommandHandler,
+)
+from application.sitemap.documents import SitemapDocumentCache
+from application.sitemap.queries import (
+    GetSitemapQuery,
+    GetSitemapQueryHandler,
+    GetSitemapVersionQuery,
+    GetSitemapVersionQueryHandler,
+)
 from application.submissions.commands import (
     CreateSubmissionCommand,
     CreateSubmissionCommandHandler,
@@ -141,10 +170,14 @@ from application.submissions.commands import (
     DeleteSubmissionCommandHandler,
 )
 from application.submissions.queries import (
+    ExportSubmissionsQuery,
+    ExportSubmissionsQueryHandler,
     GetSubmissionByIdQuery,
     GetSubmissionByIdQueryHandler,
     GetSubmissionListQuery,
     GetSubmissionListQueryHandler,
+    StreamSubmissionListQuery,
+    StreamSubmissionListQueryHandler,
 )
 from application.users.commands import (
     CreateUserCommand,
@@ -170,6 +203,10 @@ from application.vacancies.queries import (
     GetVacancyListQuery,
     GetVacancyListQueryHandler,
 )
+from application.warmup.commands import (
+    WarmUpCachesCommand,
+    WarmUpCachesCommandHandler,
+)
 from domain.certificates.interfaces.repositories.certificate_groups import BaseCertificateGroupRepository
 from domain.certificates.interfaces.repositories.certificates import BaseCertificateRepository
 from domain.certificates.services import (
@@ -179,15 +216,26 @@ from domain.certificates.services import (
 from domain.members.interfaces.repository import BaseMemberRepository
 from domain.members.services import MemberService
 from domain.news.interfaces.repository import BaseNewsRepository
-from domain.news.services import NewsService
+from domain.news.services import (
+    NewsService,
+    NewsSlugCache,
+)
 from domain.portfolios.interfaces.repository import BasePortfolioRepository
 from domain.portfolios.services.portfolios import PortfolioService
 from domain.products.interfaces.repository import BaseProductRepository
-from domain.products.services import ProductService
+from domain.products.services import (
+    ProductService,
+    ProductSlugCache,
+)
 from domain.reviews.interfaces.repository import BaseReviewRepository
 from domain.reviews.services import ReviewService
 from domain.seo_settings.interfaces.repository import BaseSeoSettingsRepository
-from domain.seo_settings.services import SeoSettingsService
+from domain.seo_settings.services import (
+    SeoSettingsService,
+    SeoSettingsSnapshot,
+)
+from domain.sitemap.interfaces import BaseSitemapRepository
+from domain.sitemap.services import SitemapService
 from domain.submissions.interfaces.repository import BaseSubmissionRepository
 from domain.submissions.services import SubmissionService
 from domain.users.interfaces.repository import BaseUserRepository
@@ -195,6 +243,11 @@ from domain.users.services import UserService
 from domain.vacancies.interfaces.repository import BaseVacancyRepository
 from domain.vacancies.services import VacancyService
 from infrastructure.database.gateways.mongo import MongoDatabase
+from infrastructure.database.gateways.routing import (
+    make_read_preference,
+    primary_reads,
+    ReadRoutingMiddleware,
+)
 from infrastructure.database.repositories.certificates import (
     MongoCertificateGroupRepository,
     MongoCertificateRepository,
@@ -205,12 +258,15 @@ from infrastructure.database.repositories.portfolios.mongo import MongoPortfolio
 from infrastructure.database.repositories.products.mongo import MongoProductRepository
 from infrastructure.database.repositories.reviews.mongo import MongoReviewRepository
 from infrastructure.database.repositories.seo_settings.mongo import MongoSeoSettingsRepository
+from infrastructure.database.repositories.sitemap.mongo import MongoSitemapRepository
 from infrastructure.database.repositories.submissions.mongo import MongoSubmissionRepository
 from infrastructure.database.repositories.users.mongo import MongoUserRepository
 from infrastructure.database.repositories.vacancies.mongo import MongoVacancyRepository
+from infrastructure.metrics.mediator import MediatorMetricsMiddleware
 from infrastructure.s3.base import BaseFileStorage
 from infrastructure.s3.client import S3Client
 from infrastructure.s3.storage import S3FileStorage
+from infrastructure.tracing.mediator import MediatorTracingMiddleware
 from settings.config import Config
 
 
@@ -239,7 +295,19 @@ def _init_container() -> Container:
 
     # Регистрируем Mongo Database
     def init_mongo_database() -> MongoDatabase:
-        return MongoDatabase(mongo_url=config.mongo_connection_url, mongo_database=config.mongo_database)
+        return MongoDatabase(
+            mongo_url=config.mongo_connection_url,
+            mongo_database=config.mongo_database,
+            client_options=config.mongo_client_options,
+            max_time_ms=config.mongo_max_time_ms,
+            stream_max_time_ms=config.mongo_stream_max_time_ms,
+            query_read_preference=make_read_preference(
+                config.mongo_query_read_preference,
+                config.mongo_max_staleness_seconds,
+            ),
+            slow_command_ms=config.mongo_slow_command_ms,
+            explain_slow_commands=config.mongo_explain_slow_commands,
+        )
 
     container.register(MongoDatabase, factory=init_mongo_database, scope=Scope.singleton)
 
@@ -255,19 +323,34 @@ def _init_container() -> Container:
     container.register(BaseMemberRepository, MongoMemberRepository)
     container.register(BaseReviewRepository, MongoReviewRepository)
     container.register(BaseSubmissionRepository, MongoSubmissionRepository)
+    container.register(BaseSitemapRepository, MongoSitemapRepository)
 
     # Регистрируем доменные сервисы
     container.register(UserService)
+    # Кэши slug общие для всех экземпляров сервисов процесса.
+    # С change streams чужие записи сбрасывают кэш сразу, поэтому TTL можно держать длинными
+    # Кэши заполняются только чтениями из primary, даже если чтения запросов идут на реплики
+    slug_cache_options = {"read_scope": primary_reads}
+
+    if config.change_streams_enabled:
+        slug_cache_options["fresh_ttl"] = config.change_streams_slug_cache_fresh_ttl
+        slug_cache_options["negative_ttl"] = config.change_streams_slug_cache_negative_ttl
+
+    container.register(NewsSlugCache, instance=NewsSlugCache(**slug_cache_options), scope=Scope.singleton)
+    container.register(ProductSlugCache, instance=ProductSlugCache(**slug_cache_options), scope=Scope.singleton)
     container.register(NewsService)
     container.register(VacancyService)
     container.register(PortfolioService)
     container.register(ProductService)
+    # Снимок SEO настроек общий для всех экземпляров SeoSettingsService процесса
+    container.register(SeoSettingsSnapshot, instance=SeoSettingsSnapshot(), scope=Scope.singleton)
     container.register(SeoSettingsService)
     container.register(CertificateGroupService)
     container.register(CertificateService)
     container.register(MemberService)
     container.register(ReviewService)
     container.register(SubmissionService)
+    container.register(SitemapService)
 
     # Регистрируем command handlers
     # Media
@@ -316,6 +399,17 @@ def _init_container() -> Container:
     container.register(CreateReviewCommandHandler)
     container.register(UpdateReviewCommandHandler)
     container.register(DeleteReviewCommandHandler)
+    # Sitemap
+    container.register(SyncProductSitemapEntryCommandHandler)
+    container.register(SyncNewsSitemapEntryCommandHandler)
+    container.register(SyncPortfolioSitemapEntryCommandHandler)
+    container.register(RebuildSitemapCommandHandler)
+    # Одна фоновая пересборка на процесс
+    container.register(SitemapRebuildScheduler, scope=Scope.singleton)
+    # Warm-up
+    container.register(WarmUpCachesCommandHandler)
+    # Cache invalidation
+    container.register(InvalidateCachesCommandHandler)
 
     # Регистрируем query handlers
     # Users
@@ -337,14 +431,19 @@ def _init_container() -> Container:
     # Submissions
     container.register(GetSubmissionByIdQueryHandler)
     container.register(GetSubmissionListQueryHandler)
+    container.register(StreamSubmissionListQueryHandler)
+    container.register(ExportSubmissionsQueryHandler)
     # Portfolios
     container.register(GetPortfolioByIdQueryHandler)
     container.register(GetPortfolioBySlugQueryHandler)
     container.register(GetPortfolioListQueryHandler)
+    container.register(GetPortfolioSummaryListQueryHandler)
     # Products
     container.register(GetProductByIdQueryHandler)
     container.register(GetProductBySlugQueryHandler)
     container.register(GetProductListQueryHandler)
+    container.register(GetProductSummaryListQueryHandler)
+    container.register(StreamProductListQueryHandler)
     # SEO Settings
     container.register(GetSeoSettingsByIdQueryHandler)
     container.register(GetSeoSettingsByPathQueryHandler)
@@ -354,10 +453,24 @@ def _init_container() -> Container:
     container.register(GetCertificateGroupsListQueryHandler)
     container.register(GetCertificateByIdQueryHandler)
     container.register(GetCertificatesListQueryHandler)
+    # Sitemap
+    container.register(GetSitemapVersionQueryHandler)
+    container.register(SitemapDocumentCache, scope=Scope.singleton)
+    container.register(GetSitemapQueryHandler)
 
     # Инициализируем медиатор
     def init_mediator() -> Mediator:
-        mediator = Mediator()
+        middlewares = []
+
+        if config.tracing_enabled:
+            middlewares.append(MediatorTracingMiddleware())
+
+        if config.metrics_enabled:
+            middlewares.append(MediatorMetricsMiddleware())
+
+        # Внутренний: задачи объединенных запросов наследуют пометку чтений запроса
+        middlewares.append(ReadRoutingMiddleware())
+        mediator = Mediator(middlewares=middlewares)
 
         # Регистрируем commands
         # Media
@@ -373,15 +486,24 @@ def _init_container() -> Container:
         # News
         mediator.register_command(
             CreateNewsCommand,
-            [container.resolve(CreateNewsCommandHandler)],
+            [
+                container.resolve(CreateNewsCommandHandler),
+                container.resolve(SyncNewsSitemapEntryCommandHandler),
+            ],
         )
         mediator.register_command(
             UpdateNewsCommand,
-            [container.resolve(UpdateNewsCommandHandler)],
+            [
+                container.resolve(UpdateNewsCommandHandler),
+                container.resolve(SyncNewsSitemapEntryCommandHandler),
+            ],
         )
         mediator.register_command(
             DeleteNewsCommand,
-            [container.resolve(DeleteNewsCommandHandler)],
+            [
+                container.resolve(DeleteNewsCommandHandler),
+                container.resolve(SyncNewsSitemapEntryCommandHandler),
+            ],
         )
         # Vacancies
         mediator.register_command(
@@ -408,24 +530,39 @@ def _init_container() -> Container:
         # Portfolios
         mediator.register_command(
             CreatePortfolioCommand,
-            [container.resolve(CreatePortfolioCommandHandler)],
+            [
+                container.resolve(CreatePortfolioCommandHandler),
+                container.resolve(SyncPortfolioSitemapEntryCommandHandler),
+            ],
         )
         mediator.register_command(
             UpdatePortfolioCommand,
-            [container.resolve(UpdatePortfolioCommandHandler)],
+            [
+                container.resolve(UpdatePortfolioCommandHandler),
+                container.resolve(SyncPortfolioSitemapEntryCommandHandler),
+            ],
         )
         mediator.register_command(
             DeletePortfolioCommand,
-            [container.resolve(DeletePortfolioCommandHandler)],
+            [
+                container.resolve(DeletePortfolioCommandHandler),
+                container.resolve(SyncPortfolioSitemapEntryCommandHandler),
+            ],
         )
         # Products
         mediator.register_command(
             CreateProductCommand,
-            [container.resolve(CreateProductCommandHandler)],
+            [
+                container.resolve(CreateProductCommandHandler),
+                container.resolve(SyncProductSitemapEntryCommandHandler),
+            ],
         )
         mediator.register_command(
             UpdateProductCommand,
-            [container.resolve(UpdateProductCommandHandler)],
+            [
+                container.resolve(UpdateProductCommandHandler),
+                container.resolve(SyncProductSitemapEntryCommandHandler),
+            ],
         )
         mediator.register_command(
             PatchProductOrderCommand,
@@ -433,7 +570,10 @@ def _init_container() -> Container:
         )
         mediator.register_command(
             DeleteProductCommand,
-            [container.resolve(DeleteProductCommandHandler)],
+            [
+                container.resolve(DeleteProductCommandHandler),
+                container.resolve(SyncProductSitemapEntryCommandHandler),
+            ],
         )
         # SEO Settings
         mediator.register_command(
@@ -511,6 +651,21 @@ def _init_container() -> Container:
             DeleteReviewCommand,
             [container.resolve(DeleteReviewCommandHandler)],
         )
+        # Sitemap
+        mediator.register_command(
+            RebuildSitemapCommand,
+            [container.resolve(RebuildSitemapCommandHandler)],
+        )
+        # Warm-up
+        mediator.register_command(
+            WarmUpCachesCommand,
+            [container.resolve(WarmUpCachesCommandHandler)],
+        )
+        # Cache invalidation
+        mediator.register_command(
+            InvalidateCachesCommand,
+            [container.resolve(InvalidateCachesCommandHandler)],
+        )
 
         # Регистрируем queries
         # Users
@@ -571,6 +726,14 @@ def _init_container() -> Container:
             GetSubmissionListQuery,
             container.resolve(GetSubmissionListQueryHandler),
         )
+        mediator.register_query(
+            StreamSubmissionListQuery,
+            container.resolve(StreamSubmissionListQueryHandler),
+        )
+        mediator.register_query(
+            ExportSubmissionsQuery,
+            container.resolve(ExportSubmissionsQueryHandler),
+        )
         # Portfolios
         mediator.register_query(
             GetPortfolioByIdQuery,
@@ -584,6 +747,10 @@ def _init_container() -> Container:
             GetPortfolioListQuery,
             container.resolve(GetPortfolioListQueryHandler),
         )
+        mediator.register_query(
+            GetPortfolioSummaryListQuery,
+            container.resolve(GetPortfolioSummaryListQueryHandler),
+        )
         # Products
         mediator.register_query(
             GetProductByIdQuery,
@@ -597,6 +764,14 @@ def _init_container() -> Container:
             GetProductListQuery,
             container.resolve(GetProductListQueryHandler),
         )
+        mediator.register_query(
+            GetProductSummaryListQuery,
+            container.resolve(GetProductSummaryListQueryHandler),
+        )
+        mediator.register_query(
+            StreamProductListQuery,
+            container.resolve(StreamProductListQueryHandler),
+        )
         # SEO Settings
         mediator.register_query(
             GetSeoSettingsByIdQuery,
@@ -627,6 +802,21 @@ def _init_container() -> Container:
             GetCertificatesListQuery,
             container.resolve(GetCertificatesListQueryHandler),
         )
+        # Sitemap
+        mediator.register_query(
+            GetSitemapVersionQuery,
+            container.resolve(GetSitemapVersionQueryHandler),
+        )
+        mediator.register_query(
+            GetSitemapQuery,
+            container.resolve(GetSitemapQueryHandler),
+        )
+        # Pages
+        # Хендлер сам диспатчит подзапросы через медиатор, поэтому создается здесь, а не резолвится из контейнера
+        mediator.register_query(
+            GetPageBundleQuery,
+            GetPageBundleQueryHandler(mediator=mediator),
+        )
 
         return mediator
 
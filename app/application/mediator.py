@@ -1,5 +1,13 @@
+import asyncio
 from collections import defaultdict
-from collections.abc import Iterable
+from collections.abc import (
+    Iterable,
+    Iterator,
+)
+from contextlib import (
+    contextmanager,
+    ExitStack,
+)
 from dataclasses import (
     dataclass,
     field,
@@ -11,6 +19,7 @@ from application.base.command import (
     CommandResultType,
     CommandType,
 )
+from application.base.middleware import BaseMediatorMiddleware
 from application.base.query import (
     BaseQuery,
     BaseQueryHandler,
@@ -35,6 +44,19 @@ class Mediator:
         kw_only=True,
     )
 
+    # Маршрутизация чтений, метрики и трассировка (см. container.init_mediator)
+    middlewares: list[BaseMediatorMiddleware] = field(
+        default_factory=list,
+        kw_only=True,
+    )
+
+    # Выполняющиеся сейчас запросы: ключ - сам frozen-запрос, равные запросы делят одну задачу
+    in_flight_queries: dict[BaseQuery, asyncio.Task] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+    )
+
     def register_command(
         self,
         command: CommandType,
@@ -57,13 +79,66 @@ class Mediator:
         if not handlers:
             raise CommandHandlersNotRegisteredException(command_type)
 
-        return [await handler.handle(command) for handler in handlers]
+        with self._scope(middleware.command_scope(command) for middleware in self.middlewares):
+            return [await handler.handle(command) for handler in handlers]
 
     async def handle_query(self, query: BaseQuery) -> QueryResultType:
+        """Выполняет запрос, объединяя одновременные одинаковые запросы (single-flight).
+
+        Пока запрос выполняется, равный ему запрос не идет в обработчик повторно,
+        а дожидается той же задачи и получает тот же результат или то же
+        исключение. Кэширования нет: следующий запрос после завершения задачи
+        снова выполняется. Результат общий, поэтому вызывающий код не должен
+        его изменять.
+
+        Запрос, который какой-либо middleware запрещает объединять (например,
+        с чтениями, закрепленными за primary), выполняется отдельно: иначе он
+        мог бы получить результат, прочитанный с отстающей реплики.
+
+        Области middleware открываются для каждого вызывающего, в том числе
+        присоединившегося к уже выполняющейся задаче.
+        """
         query_type = query.__class__
         handler = self.queries_map.get(query_type)
 
         if not handler:
             raise QueryHandlerNotRegisteredException(query_type)
 
-        return await handler.handle(query=query)
+        with self._scope(middleware.query_scope(query) for middleware in self.middlewares):
+            return await self._dispatch_query(handler, query)
+
+    async def _dispatch_query(self, handler: BaseQueryHandler, query: BaseQuery) -> QueryResultType:
+        if not query.coalesce or not all(middleware.can_coalesce(query) for middleware in self.middlewares):
+            return await handler.handle(query=query)
+
+        try:
+            task = self.in_flight_queries.get(query)
+        except TypeError:
+            # В запросе есть нехэшируемые поля (списки, словари) - выполняем без объединения
+            return await handler.handle(query=query)
+
+        if task is None:
+            # Задача копирует контекст на момент создания, в том числе состояние областей middleware
+            task = asyncio.ensure_future(handler.handle(query=query))
+            self.in_flight_queries[query] = task
+            task.add_done_callback(lambda done_task: self._forget_query(query, done_task))
+
+        # shield: отмена одного из ожидающих (например, клиент закрыл соединение) не отменяет запрос остальным
+        return await asyncio.shield(task)
+
+    @staticmethod
+    @contextmanager
+    def _scope(scopes: Iterable) -> Iterator[None]:
+        with ExitStack() as stack:
+            for scope in scopes:
+                stack.enter_context(scope)
+
+            yield
+
+    def _forget_query(self, query: BaseQuery, task: asyncio.Task) -> None:
+        if self.in_flight_queries.get(query) is task:
+            del self.in_flight_queries[query]
+
+        if not task.cancelled():
+            # Помечаем исключение полученным, даже если все ожидающие успели отмениться
+            task.exception()
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Optional
 from uuid import UUID
 
 from application.base.query import (
@@ -12,6 +13,7 @@ from domain.news.services import NewsService
 @dataclass(frozen=True)
 class GetNewsByIdQuery(BaseQuery):
     news_id: UUID
+    fields: Optional[frozenset[str]] = None
 
 
 @dataclass(frozen=True)
@@ -26,4 +28,5 @@ class GetNewsByIdQueryHandler(
     ) -> NewsEntity:
         return await self.news_service.get_by_id(
             news_id=query.news_id,
+            fields=query.fields,
         )
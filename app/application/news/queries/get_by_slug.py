@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Optional
 
 from application.base.query import (
     BaseQuery,
@@ -11,6 +12,7 @@ from domain.news.services import NewsService
 @dataclass(frozen=True)
 class GetNewsBySlugQuery(BaseQuery):
     slug: str
+    fields: Optional[frozenset[str]] = None
 
 
 @dataclass(frozen=True)
@@ -25,4 +27,5 @@ class GetNewsBySlugQueryHandler(
     ) -> NewsEntity:
         return await self.news_service.get_by_slug(
             slug=query.slug,
+            fields=query.fields,
         )
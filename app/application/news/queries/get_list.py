@@ -18,6 +18,7 @@ class GetNewsListQuery(BaseQuery):
     limit: int
     search: Optional[str] = None
     category: Optional[str] = None
+    fields: Optional[frozenset[str]] = None
 
 
 @dataclass(frozen=True)
@@ -38,6 +39,7 @@ class GetNewsListQueryHandler(
                 limit=query.limit,
                 search=query.search,
                 category=query.category,
+                fields=query.fields,
             ),
         )
         count_task = asyncio.create_task(
@@ -0,0 +1,14 @@
+from application.pages.queries.get_bundle import (
+    GetPageBundleQuery,
+    GetPageBundleQueryHandler,
+    PageBundle,
+    PageSection,
+)
+
+
+__all__ = [
+    "GetPageBundleQuery",
+    "GetPageBundleQueryHandler",
+    "PageBundle",
+    "PageSection",
+]
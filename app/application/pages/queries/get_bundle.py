@@ -0,0 +1,65 @@
+import asyncio
+from dataclasses import (
+    dataclass,
+    field,
+)
+from typing import Any
+
+from application.base.query import (
+    BaseQuery,
+    BaseQueryHandler,
+)
+from application.mediator import Mediator
+from domain.base.exceptions import DomainException
+
+
+@dataclass(frozen=True)
+class PageSection:
+    name: str
+    query: BaseQuery
+    # Доменная ошибка необязательной секции (например, нет SEO для пути) не роняет всю страницу
+    optional: bool = False
+
+
+@dataclass(frozen=True)
+class GetPageBundleQuery(BaseQuery):
+    sections: tuple[PageSection, ...]
+
+
+@dataclass
+class PageBundle:
+    results: dict[str, Any] = field(default_factory=dict)
+    errors: dict[str, DomainException] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class GetPageBundleQueryHandler(
+    BaseQueryHandler[GetPageBundleQuery, PageBundle],
+):
+    mediator: Mediator
+
+    async def handle(
+        self,
+        query: GetPageBundleQuery,
+    ) -> PageBundle:
+        bundle = PageBundle()
+
+        async def run_section(section: PageSection) -> None:
+            try:
+                bundle.results[section.name] = await self.mediator.handle_query(section.query)
+            except DomainException as exception:
+                if not section.optional:
+                    raise
+
+                bundle.results[section.name] = None
+                bundle.errors[section.name] = exception
+
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                for section in query.sections:
+                    task_group.create_task(run_section(section))
+        except ExceptionGroup as exception_group:
+            # Наружу отдаем первую ошибку как есть, чтобы сработали обычные обработчики исключений API
+            raise exception_group.exceptions[0] from None
+
+        return bundle
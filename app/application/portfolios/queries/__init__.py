@@ -10,6 +10,10 @@ from application.portfolios.queries.get_list import (
     GetPortfolioListQuery,
     GetPortfolioListQueryHandler,
 )
+from application.portfolios.queries.get_summary_list import (
+    GetPortfolioSummaryListQuery,
+    GetPortfolioSummaryListQueryHandler,
+)
 
 
 __all__ = [
@@ -19,4 +23,6 @@ __all__ = [
     "GetPortfolioBySlugQueryHandler",
     "GetPortfolioListQuery",
     "GetPortfolioListQueryHandler",
+    "GetPortfolioSummaryListQuery",
+    "GetPortfolioSummaryListQueryHandler",
 ]
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Optional
 from uuid import UUID
 
 from application.base.query import (
@@ -12,6 +13,7 @@ from domain.portfolios.services.portfolios import PortfolioService
 @dataclass(frozen=True)
 class GetPortfolioByIdQuery(BaseQuery):
     portfolio_id: UUID
+    fields: Optional[frozenset[str]] = None
 
 
 @dataclass(frozen=True)
@@ -26,4 +28,5 @@ class GetPortfolioByIdQueryHandler(
     ) -> PortfolioEntity:
         return await self.portfolio_service.get_by_id(
             portfolio_id=query.portfolio_id,
+            fields=query.fields,
         )
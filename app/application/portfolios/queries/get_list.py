@@ -18,6 +18,7 @@ class GetPortfolioListQuery(BaseQuery):
     limit: int
     search: Optional[str] = None
     year: Optional[int] = None
+    fields: Optional[frozenset[str]] = None
 
 
 @dataclass(frozen=True)
@@ -38,6 +39,7 @@ class GetPortfolioListQueryHandler(
                 limit=query.limit,
                 search=query.search,
                 year=query.year,
+                fields=query.fields,
             ),
         )
         count_task = asyncio.create_task(
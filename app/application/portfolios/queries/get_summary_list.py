@@ -0,0 +1,50 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Optional
+
+from application.base.query import (
+    BaseQuery,
+    BaseQueryHandler,
+)
+from domain.portfolios.entities import PortfolioSummaryEntity
+from domain.portfolios.services.portfolios import PortfolioService
+
+
+@dataclass(frozen=True)
+class GetPortfolioSummaryListQuery(BaseQuery):
+    sort_field: str
+    sort_order: int
+    offset: int
+    limit: int
+    search: Optional[str] = None
+    year: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class GetPortfolioSummaryListQueryHandler(
+    BaseQueryHandler[GetPortfolioSummaryListQuery, tuple[list[PortfolioSummaryEntity], int]],
+):
+    portfolio_service: PortfolioService
+
+    async def handle(
+        self,
+        query: GetPortfolioSummaryListQuery,
+    ) -> tuple[list[PortfolioSummaryEntity], int]:
+        summaries_task = asyncio.create_task(
+            self.portfolio_service.find_many_summaries(
+                sort_field=query.sort_field,
+                sort_order=query.sort_order,
+                offset=query.offset,
+                limit=query.limit,
+                search=query.search,
+                year=query.year,
+            ),
+        )
+        count_task = asyncio.create_task(
+            self.portfolio_service.count_many(
+                search=query.search,
+                year=query.year,
+            ),
+        )
+
+        return await summaries_task, await count_task
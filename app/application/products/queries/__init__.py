@@ -10,6 +10,14 @@ from application.products.queries.get_list import (
     GetProductListQuery,
     GetProductListQueryHandler,
 )
+from application.products.queries.get_summary_list import (
+    GetProductSummaryListQuery,
+    GetProductSummaryListQueryHandler,
+)
+from application.products.queries.stream_list import (
+    StreamProductListQuery,
+    StreamProductListQueryHandler,
+)
 
 
 __all__ = [
@@ -19,4 +27,8 @@ __all__ = [
     "GetProductBySlugQueryHandler",
     "GetProductListQuery",
     "GetProductListQueryHandler",
+    "GetProductSummaryListQuery",
+    "GetProductSummaryListQueryHandler",
+    "StreamProductListQuery",
+    "StreamProductListQueryHandler",
 ]
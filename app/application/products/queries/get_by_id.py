@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Optional
 from uuid import UUID
 
 from application.base.query import (
@@ -12,6 +13,7 @@ from domain.products.services import ProductService
 @dataclass(frozen=True)
 class GetProductByIdQuery(BaseQuery):
     product_id: UUID
+    fields: Optional[frozenset[str]] = None
 
 
 @dataclass(frozen=True)
@@ -26,4 +28,5 @@ class GetProductByIdQueryHandler(
     ) -> ProductEntity:
         return await self.product_service.get_by_id(
             product_id=query.product_id,
+            fields=query.fields,
         )
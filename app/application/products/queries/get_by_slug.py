@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Optional
 
 from application.base.query import (
     BaseQuery,
@@ -11,6 +12,7 @@ from domain.products.services import ProductService
 @dataclass(frozen=True)
 class GetProductBySlugQuery(BaseQuery):
     slug: str
+    fields: Optional[frozenset[str]] = None
 
 
 @dataclass(frozen=True)
@@ -25,4 +27,5 @@ class GetProductBySlugQueryHandler(
     ) -> ProductEntity:
         return await self.product_service.get_by_slug(
             slug=query.slug,
+            fields=query.fields,
         )
@@ -19,6 +19,7 @@ class GetProductListQuery(BaseQuery):
     search: Optional[str] = None
     category: Optional[str] = None
     is_shown: Optional[bool] = None
+    fields: Optional[frozenset[str]] = None
 
 
 @dataclass(frozen=True)
@@ -40,6 +41,7 @@ class GetProductListQueryHandler(
                 search=query.search,
                 category=query.category,
                 is_shown=query.is_shown,
+                fields=query.fields,
             ),
         )
         count_task = asyncio.create_task(
@@ -0,0 +1,53 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Optional
+
+from application.base.query import (
+    BaseQuery,
+    BaseQueryHandler,
+)
+from domain.products.entities import ProductSummaryEntity
+from domain.products.services import ProductService
+
+
+@dataclass(frozen=True)
+class GetProductSummaryListQuery(BaseQuery):
+    sort_field: str
+    sort_order: int
+    offset: int
+    limit: int
+    search: Optional[str] = None
+    category: Optional[str] = None
+    is_shown: Optional[bool] = None
+
+
+@dataclass(frozen=True)
+class GetProductSummaryListQueryHandler(
+    BaseQueryHandler[GetProductSummaryListQuery, tuple[list[ProductSummaryEntity], int]],
+):
+    product_service: ProductService
+
+    async def handle(
+        self,
+        query: GetProductSummaryListQuery,
+    ) -> tuple[list[ProductSummaryEntity], int]:
+        summaries_task = asyncio.create_task(
+            self.product_service.find_many_summaries(
+                sort_field=query.sort_field,
+                sort_order=query.sort_order,
+                offset=query.offset,
+                limit=query.limit,
+                search=query.search,
+                category=query.category,
+                is_shown=query.is_shown,
+            ),
+        )
+        count_task = asyncio.create_task(
+            self.product_service.count_many(
+                search=query.search,
+                category=query.category,
+                is_shown=query.is_shown,
+            ),
+        )
+
+        return await summaries_task, await count_task
@@ -0,0 +1,51 @@
+from dataclasses import dataclass
+from typing import (
+    AsyncIterable,
+    ClassVar,
+    Optional,
+)
+
+from application.base.query import (
+    BaseQuery,
+    BaseQueryHandler,
+)
+from domain.products.entities import ProductEntity
+from domain.products.services import ProductService
+
+
+@dataclass(frozen=True)
+class StreamProductListQuery(BaseQuery):
+    # Результат - одноразовый асинхронный итератор, поделить его между запросами нельзя
+    coalesce: ClassVar[bool] = False
+
+    sort_field: str
+    sort_order: int
+    offset: int
+    # Поток не ограничен размером страницы: None - весь список начиная с offset
+    limit: Optional[int] = None
+    search: Optional[str] = None
+    category: Optional[str] = None
+    is_shown: Optional[bool] = None
+    fields: Optional[frozenset[str]] = None
+
+
+@dataclass(frozen=True)
+class StreamProductListQueryHandler(
+    BaseQueryHandler[StreamProductListQuery, AsyncIterable[ProductEntity]],
+):
+    product_service: ProductService
+
+    async def handle(
+        self,
+        query: StreamProductListQuery,
+    ) -> AsyncIterable[ProductEntity]:
+        return self.product_service.stream_many(
+            sort_field=query.sort_field,
+            sort_order=query.sort_order,
+            offset=query.offset,
+            limit=query.limit,
+            search=query.search,
+            category=query.category,
+            is_shown=query.is_shown,
+            fields=query.fields,
+        )
@@ -0,0 +1,22 @@
+from application.sitemap.commands.rebuild import (
+    RebuildSitemapCommand,
+    RebuildSitemapCommandHandler,
+    SitemapRebuildScheduler,
+)
+from application.sitemap.commands.sync import (
+    BaseSyncSitemapEntryCommandHandler,
+    SyncNewsSitemapEntryCommandHandler,
+    SyncPortfolioSitemapEntryCommandHandler,
+    SyncProductSitemapEntryCommandHandler,
+)
+
+
+__all__ = [
+    "BaseSyncSitemapEntryCommandHandler",
+    "RebuildSitemapCommand",
+    "RebuildSitemapCommandHandler",
+    "SitemapRebuildScheduler",
+    "SyncNewsSitemapEntryCommandHandler",
+    "SyncPortfolioSitemapEntryCommandHandler",
+    "SyncProductSitemapEntryCommandHandler",
+]
@@ -0,0 +1,124 @@
+import asyncio
+import logging
+from dataclasses import (
+    dataclass,
+    field,
+)
+from typing import Optional
+
+from application.base.command import (
+    BaseCommand,
+    BaseCommandHandler,
+)
+from application.sitemap.entries import (
+    news_sitemap_entry,
+    NEWS_SITEMAP_FIELDS,
+    portfolio_sitemap_entry,
+    PORTFOLIO_SITEMAP_FIELDS,
+    product_sitemap_entry,
+    PRODUCT_SITEMAP_FIELDS,
+)
+from domain.news.services import NewsService
+from domain.portfolios.services.portfolios import PortfolioService
+from domain.products.services import ProductService
+from domain.sitemap.entities import SitemapEntryEntity
+from domain.sitemap.services import SitemapService
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RebuildSitemapCommand(BaseCommand):
+    batch_size: int = 500
+
+
+@dataclass(frozen=True)
+class RebuildSitemapCommandHandler(
+    BaseCommandHandler[RebuildSitemapCommand, int],
+):
+    """Полностью пересобирает карту сайта из источников.
+
+    Нужна для первичного заполнения и после ручных правок в базе в обход
+    команд. Возвращает количество записей в карте.
+    """
+
+    product_service: ProductService
+    news_service: NewsService
+    portfolio_service: PortfolioService
+    sitemap_service: SitemapService
+
+    async def handle(self, command: RebuildSitemapCommand) -> int:
+        entries: list[SitemapEntryEntity] = []
+        offset = 0
+
+        while products := await self.product_service.find_many(
+            sort_field="created_at",
+            sort_order=1,
+            offset=offset,
+            limit=command.batch_size,
+            is_shown=True,
+            fields=PRODUCT_SITEMAP_FIELDS,
+        ):
+            entries.extend(product_sitemap_entry(product) for product in products)
+            offset += command.batch_size
+
+        offset = 0
+
+        while news_list := await self.news_service.find_many(
+            sort_field="created_at",
+            sort_order=1,
+            offset=offset,
+            limit=command.batch_size,
+            fields=NEWS_SITEMAP_FIELDS,
+        ):
+            entries.extend(news_sitemap_entry(news) for news in news_list)
+            offset += command.batch_size
+
+        offset = 0
+
+        while portfolios := await self.portfolio_service.find_many(
+            sort_field="created_at",
+            sort_order=1,
+            offset=offset,
+            limit=command.batch_size,
+            fields=PORTFOLIO_SITEMAP_FIELDS,
+        ):
+            entries.extend(portfolio_sitemap_entry(portfolio) for portfolio in portfolios)
+            offset += command.batch_size
+
+        await self.sitemap_service.replace_all(entries)
+        return len(entries)
+
+
+@dataclass(eq=False)
+class SitemapRebuildScheduler:
+    """Фоновая пересборка карты сайта после сбоя синхронизации отдельной записи.
+
+    Одна задача на процесс: повторный вызов во время пересборки запускает
+    еще один проход после текущего (он мог прочитать источники до новой
+    записи). Неудачная пересборка повторяется через retry_delay секунд.
+    """
+
+    rebuild_handler: RebuildSitemapCommandHandler
+    retry_delay: float = 30.0
+    _requested: bool = field(default=False, init=False, repr=False)
+    _task: Optional[asyncio.Task] = field(default=None, init=False, repr=False)
+
+    def schedule(self) -> None:
+        self._requested = True
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        while self._requested:
+            self._requested = False
+
+            try:
+                entries_count = await self.rebuild_handler.handle(RebuildSitemapCommand())
+                logger.info("Sitemap rebuilt after a failed sync: %s entries", entries_count)
+            except Exception:
+                self._requested = True
+                logger.exception("Failed to rebuild sitemap, retrying in %ss", self.retry_delay)
+                await asyncio.sleep(self.retry_delay)
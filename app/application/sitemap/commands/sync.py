@@ -0,0 +1,114 @@
+import logging
+from abc import abstractmethod
+from dataclasses import dataclass
+
+from application.base.command import (
+    BaseCommand,
+    BaseCommandHandler,
+)
+from application.news.commands import (
+    CreateNewsCommand,
+    DeleteNewsCommand,
+    UpdateNewsCommand,
+)
+from application.portfolios.commands import (
+    CreatePortfolioCommand,
+    DeletePortfolioCommand,
+    UpdatePortfolioCommand,
+)
+from application.products.commands import (
+    CreateProductCommand,
+    DeleteProductCommand,
+    UpdateProductCommand,
+)
+from application.sitemap.commands.rebuild import SitemapRebuildScheduler
+from application.sitemap.entries import (
+    news_sitemap_entry,
+    NEWS_SITEMAP_FIELDS,
+    portfolio_sitemap_entry,
+    PORTFOLIO_SITEMAP_FIELDS,
+    product_sitemap_entry,
+    PRODUCT_SITEMAP_FIELDS,
+)
+from domain.news.services import NewsService
+from domain.portfolios.services.portfolios import PortfolioService
+from domain.products.services import ProductService
+from domain.sitemap.services import SitemapService
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class BaseSyncSitemapEntryCommandHandler(BaseCommandHandler):
+    """Второй обработчик команд сущности: переносит изменение в карту сайта.
+
+    Выполняется медиатором после основного обработчика, когда запись уже
+    сохранена. Поэтому сбой карты сайта не пробрасывается (клиент получил бы
+    500 на успешную запись и повторил бы создание), а логируется, и карта
+    пересобирается целиком в фоне.
+    """
+
+    sitemap_service: SitemapService
+    rebuild_scheduler: SitemapRebuildScheduler
+
+    async def handle(self, command: BaseCommand) -> None:
+        try:
+            await self.sync(command)
+        except Exception:
+            logger.exception("Failed to sync sitemap entry for %s, scheduling a rebuild", type(command).__name__)
+            self.rebuild_scheduler.schedule()
+
+    @abstractmethod
+    async def sync(self, command: BaseCommand) -> None: ...
+
+
+@dataclass(frozen=True)
+class SyncProductSitemapEntryCommandHandler(BaseSyncSitemapEntryCommandHandler):
+    """Продукт перечитывается уже в сохраненном виде; скрытые продукты из карты убираются."""
+
+    product_service: ProductService
+
+    async def sync(self, command: CreateProductCommand | UpdateProductCommand | DeleteProductCommand) -> None:
+        if isinstance(command, DeleteProductCommand):
+            await self.sitemap_service.remove(command.product_id)
+            return
+
+        product_id = command.product_id if isinstance(command, UpdateProductCommand) else command.product.oid
+        product = await self.product_service.get_by_id(product_id, fields=PRODUCT_SITEMAP_FIELDS)
+
+        if product.is_shown:
+            await self.sitemap_service.upsert(product_sitemap_entry(product))
+        else:
+            await self.sitemap_service.remove(product.oid)
+
+
+@dataclass(frozen=True)
+class SyncNewsSitemapEntryCommandHandler(BaseSyncSitemapEntryCommandHandler):
+    news_service: NewsService
+
+    async def sync(self, command: CreateNewsCommand | UpdateNewsCommand | DeleteNewsCommand) -> None:
+        if isinstance(command, DeleteNewsCommand):
+            await self.sitemap_service.remove(command.news_id)
+            return
+
+        news_id = command.news_id if isinstance(command, UpdateNewsCommand) else command.news.oid
+        news = await self.news_service.get_by_id(news_id, fields=NEWS_SITEMAP_FIELDS)
+        await self.sitemap_service.upsert(news_sitemap_entry(news))
+
+
+@dataclass(frozen=True)
+class SyncPortfolioSitemapEntryCommandHandler(BaseSyncSitemapEntryCommandHandler):
+    portfolio_service: PortfolioService
+
+    async def sync(
+        self,
+        command: CreatePortfolioCommand | UpdatePortfolioCommand | DeletePortfolioCommand,
+    ) -> None:
+        if isinstance(command, DeletePortfolioCommand):
+            await self.sitemap_service.remove(command.portfolio_id)
+            return
+
+        portfolio_id = command.portfolio_id if isinstance(command, UpdatePortfolioCommand) else command.portfolio.oid
+        portfolio = await self.portfolio_service.get_by_id(portfolio_id, fields=PORTFOLIO_SITEMAP_FIELDS)
+        await self.sitemap_service.upsert(portfolio_sitemap_entry(portfolio))
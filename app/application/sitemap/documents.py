@@ -0,0 +1,34 @@
+from dataclasses import (
+    dataclass,
+    field,
+)
+from typing import (
+    Any,
+    Optional,
+)
+
+
+@dataclass(frozen=True)
+class RenderedSitemapDocument:
+    version: str
+    # Готовое к отдаче содержимое в формате слоя представления (например, заранее сжатое)
+    content: Any
+
+
+@dataclass(eq=False)
+class SitemapDocumentCache:
+    """Последний отрендеренный документ каждого вида карты сайта.
+
+    Документ пересобирается, только когда меняется версия данных. Кэш -
+    синглтон контейнера: новый контейнер (тесты, перезагрузка приложения)
+    начинает с пустого кэша.
+    """
+
+    _documents: dict[str, RenderedSitemapDocument] = field(default_factory=dict, init=False)
+
+    def get(self, kind: str, version: str) -> Optional[RenderedSitemapDocument]:
+        document = self._documents.get(kind)
+        return document if document is not None and document.version == version else None
+
+    def put(self, kind: str, document: RenderedSitemapDocument) -> None:
+        self._documents[kind] = document
@@ -0,0 +1,41 @@
+from domain.news.entities import NewsEntity
+from domain.portfolios.entities import PortfolioEntity
+from domain.products.entities import ProductEntity
+from domain.sitemap.entities import SitemapEntryEntity
+
+
+PRODUCT_SITEMAP_SOURCE = "products"
+NEWS_SITEMAP_SOURCE = "news"
+PORTFOLIO_SITEMAP_SOURCE = "portfolios"
+
+# Для записи в карту сайта достаточно slug и признака публикации
+PRODUCT_SITEMAP_FIELDS = frozenset({"slug", "is_shown"})
+NEWS_SITEMAP_FIELDS = frozenset({"slug"})
+PORTFOLIO_SITEMAP_FIELDS = frozenset({"slug"})
+
+
+def product_sitemap_entry(product: ProductEntity) -> SitemapEntryEntity:
+    return SitemapEntryEntity(
+        oid=product.oid,
+        source=PRODUCT_SITEMAP_SOURCE,
+        page_path=f"/products/{product.slug.as_generic_type()}",
+        lastmod=product.updated_at,
+    )
+
+
+def news_sitemap_entry(news: NewsEntity) -> SitemapEntryEntity:
+    return SitemapEntryEntity(
+        oid=news.oid,
+        source=NEWS_SITEMAP_SOURCE,
+        page_path=f"/news/{news.slug.as_generic_type()}",
+        lastmod=news.updated_at,
+    )
+
+
+def portfolio_sitemap_entry(portfolio: PortfolioEntity) -> SitemapEntryEntity:
+    return SitemapEntryEntity(
+        oid=portfolio.oid,
+        source=PORTFOLIO_SITEMAP_SOURCE,
+        page_path=f"/portfolios/{portfolio.slug.as_generic_type()}",
+        lastmod=portfolio.updated_at,
+    )
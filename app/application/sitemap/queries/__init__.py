@@ -0,0 +1,16 @@
+from application.sitemap.queries.get import (
+    GetSitemapQuery,
+    GetSitemapQueryHandler,
+    GetSitemapVersionQuery,
+    GetSitemapVersionQueryHandler,
+    Sitemap,
+)
+
+
+__all__ = [
+    "GetSitemapQuery",
+    "GetSitemapQueryHandler",
+    "GetSitemapVersionQuery",
+    "GetSitemapVersionQueryHandler",
+    "Sitemap",
+]
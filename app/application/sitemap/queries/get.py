@@ -0,0 +1,61 @@
+from dataclasses import dataclass
+
+from application.base.query import (
+    BaseQuery,
+    BaseQueryHandler,
+)
+from domain.seo_settings.services import (
+    SeoSettingsPathIndex,
+    SeoSettingsService,
+)
+from domain.sitemap.entities import SitemapEntryEntity
+from domain.sitemap.services import SitemapService
+
+
+@dataclass(frozen=True)
+class Sitemap:
+    version: str
+    entries: list[SitemapEntryEntity]
+    seo_index: SeoSettingsPathIndex
+
+
+@dataclass(frozen=True)
+class GetSitemapVersionQuery(BaseQuery): ...
+
+
+@dataclass(frozen=True)
+class GetSitemapVersionQueryHandler(
+    BaseQueryHandler[GetSitemapVersionQuery, str],
+):
+    """Версия карты сайта вместе с SEO настройками: дешевая проверка перед сборкой документа."""
+
+    sitemap_service: SitemapService
+    seo_settings_service: SeoSettingsService
+
+    async def handle(self, query: GetSitemapVersionQuery) -> str:
+        _, seo_version = await self.seo_settings_service.get_path_index()
+        sitemap_version = await self.sitemap_service.get_version()
+        return f"{sitemap_version}|{seo_version}"
+
+
+@dataclass(frozen=True)
+class GetSitemapQuery(BaseQuery): ...
+
+
+@dataclass(frozen=True)
+class GetSitemapQueryHandler(
+    BaseQueryHandler[GetSitemapQuery, Sitemap],
+):
+    sitemap_service: SitemapService
+    seo_settings_service: SeoSettingsService
+
+    async def handle(self, query: GetSitemapQuery) -> Sitemap:
+        seo_index, seo_version = await self.seo_settings_service.get_path_index()
+        sitemap_version = await self.sitemap_service.get_version()
+        entries = await self.sitemap_service.find_all()
+
+        return Sitemap(
+            version=f"{sitemap_version}|{seo_version}",
+            entries=entries,
+            seo_index=seo_index,
+        )
@@ -1,3 +1,7 @@
+from application.submissions.queries.export import (
+    ExportSubmissionsQuery,
+    ExportSubmissionsQueryHandler,
+)
 from application.submissions.queries.get_by_id import (
     GetSubmissionByIdQuery,
     GetSubmissionByIdQueryHandler,
@@ -6,11 +10,19 @@ from application.submissions.queries.get_list import (
     GetSubmissionListQuery,
     GetSubmissionListQueryHandler,
 )
+from application.submissions.queries.stream_list import (
+    StreamSubmissionListQuery,
+    StreamSubmissionListQueryHandler,
+)
 
 
 __all__ = [
+    "ExportSubmissionsQuery",
+    "ExportSubmissionsQueryHandler",
     "GetSubmissionByIdQuery",
     "GetSubmissionByIdQueryHandler",
     "GetSubmissionListQuery",
     "GetSubmissionListQueryHandler",
+    "StreamSubmissionListQuery",
+    "StreamSubmissionListQueryHandler",
 ]
@@ -0,0 +1,40 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import (
+    AsyncIterable,
+    ClassVar,
+    Optional,
+)
+
+from application.base.query import (
+    BaseQuery,
+    BaseQueryHandler,
+)
+from domain.submissions.entities.submissions import SubmissionEntity
+from domain.submissions.services import SubmissionService
+
+
+@dataclass(frozen=True)
+class ExportSubmissionsQuery(BaseQuery):
+    coalesce: ClassVar[bool] = False
+
+    form_type: Optional[str] = None
+    created_from: Optional[datetime] = None
+    created_to: Optional[datetime] = None
+
+
+@dataclass(frozen=True)
+class ExportSubmissionsQueryHandler(
+    BaseQueryHandler[ExportSubmissionsQuery, AsyncIterable[SubmissionEntity]],
+):
+    submission_service: SubmissionService
+
+    async def handle(
+        self,
+        query: ExportSubmissionsQuery,
+    ) -> AsyncIterable[SubmissionEntity]:
+        return self.submission_service.export(
+            form_type=query.form_type,
+            created_from=query.created_from,
+            created_to=query.created_to,
+        )
@@ -0,0 +1,44 @@
+from dataclasses import dataclass
+from typing import (
+    AsyncIterable,
+    ClassVar,
+    Optional,
+)
+
+from application.base.query import (
+    BaseQuery,
+    BaseQueryHandler,
+)
+from domain.submissions.entities.submissions import SubmissionEntity
+from domain.submissions.services import SubmissionService
+
+
+@dataclass(frozen=True)
+class StreamSubmissionListQuery(BaseQuery):
+    coalesce: ClassVar[bool] = False
+
+    sort_field: str
+    sort_order: int
+    offset: int
+    # Поток не ограничен размером страницы: None - весь список начиная с offset
+    limit: Optional[int] = None
+    form_type: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class StreamSubmissionListQueryHandler(
+    BaseQueryHandler[StreamSubmissionListQuery, AsyncIterable[SubmissionEntity]],
+):
+    submission_service: SubmissionService
+
+    async def handle(
+        self,
+        query: StreamSubmissionListQuery,
+    ) -> AsyncIterable[SubmissionEntity]:
+        return self.submission_service.stream_many(
+            sort_field=query.sort_field,
+            sort_order=query.sort_order,
+            offset=query.offset,
+            limit=query.limit,
+            form_type=query.form_type,
+        )
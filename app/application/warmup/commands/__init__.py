@@ -0,0 +1,12 @@
+from application.warmup.commands.warm_up import (
+    WarmUpCachesCommand,
+    WarmUpCachesCommandHandler,
+    WarmUpCachesResult,
+)
+
+
+__all__ = [
+    "WarmUpCachesCommand",
+    "WarmUpCachesCommandHandler",
+    "WarmUpCachesResult",
+]
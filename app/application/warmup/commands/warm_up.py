@@ -0,0 +1,40 @@
+from dataclasses import dataclass
+
+from application.base.command import (
+    BaseCommand,
+    BaseCommandHandler,
+)
+from domain.news.services import NewsService
+from domain.products.services import ProductService
+from domain.seo_settings.services import SeoSettingsService
+
+
+@dataclass(frozen=True)
+class WarmUpCachesCommand(BaseCommand):
+    products_limit: int
+    news_limit: int
+
+
+@dataclass(frozen=True)
+class WarmUpCachesResult:
+    products: int
+    news: int
+
+
+@dataclass(frozen=True)
+class WarmUpCachesCommandHandler(
+    BaseCommandHandler[WarmUpCachesCommand, WarmUpCachesResult],
+):
+    """Заполняет кэши процесса до приема трафика: снимок SEO настроек и кэши slug продуктов и новостей."""
+
+    seo_settings_service: SeoSettingsService
+    product_service: ProductService
+    news_service: NewsService
+
+    async def handle(self, command: WarmUpCachesCommand) -> WarmUpCachesResult:
+        await self.seo_settings_service.refresh_snapshot()
+
+        return WarmUpCachesResult(
+            products=await self.product_service.warm_slug_cache(limit=command.products_limit),
+            news=await self.news_service.warm_slug_cache(limit=command.news_limit),
+        )
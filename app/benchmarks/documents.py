@@ -0,0 +1,185 @@
+from datetime import datetime
+from uuid import uuid4
+
+from infrastructure.database.converters.base import (
+    datetime_to_document,
+    uuid_to_document,
+)
+
+
+def _base_fields() -> dict:
+    now = datetime_to_document(datetime(2025, 1, 15, 12, 30))
+    return {
+        "oid": uuid_to_document(uuid4()),
+        "created_at": now,
+        "updated_at": now,
+    }
+
+
+def user_document() -> dict:
+    return {
+        **_base_fields(),
+        "email": "manager@example.com",
+        "hashed_password": "$2b$12$" + "x" * 53,
+        "name": "Иван Петров",
+    }
+
+
+def news_document() -> dict:
+    return {
+        **_base_fields(),
+        "category": "Производство",
+        "title": "Запуск новой производственной линии",
+        "slug": "zapusk-novoy-proizvodstvennoy-linii",
+        "content": "Полный текст новости. " * 40,
+        "short_content": "Краткое описание новости о запуске линии.",
+        "image_url": "https://cdn.example.com/news/line.jpg",
+        "alt": "Производственная линия",
+        "reading_time": 5,
+        "date": datetime_to_document(datetime(2025, 1, 10)),
+    }
+
+
+def vacancy_document() -> dict:
+    return {
+        **_base_fields(),
+        "title": "Инженер-конструктор",
+        "requirements": ["Высшее техническое образование", "Опыт работы в КОМПАС-3D", "Знание ГОСТ"],
+        "experience": ["От 3 лет в проектировании", "Опыт работы с КТП"],
+        "salary": 120000,
+        "category": "Производство",
+    }
+
+
+def submission_document() -> dict:
+    return {
+        **_base_fields(),
+        "form_type": "Обращение",
+        "name": "Сергей Смирнов",
+        "email": "client@example.com",
+        "phone": "+79991234567",
+        "comments": "Прошу связаться для уточнения сроков поставки.",
+        "files": ["https://cdn.example.com/files/request.pdf"],
+        "answers_file_url": None,
+    }
+
+
+def portfolio_document() -> dict:
+    return {
+        **_base_fields(),
+        "name": "Подстанция для логистического центра",
+        "slug": "podstantsiya-dlya-logisticheskogo-tsentra",
+        "poster": "https://cdn.example.com/portfolio/poster.jpg",
+        "poster_alt": "Подстанция",
+        "year": 2024,
+        "description": "Описание проекта. " * 20,
+        "task_title": "Задача",
+        "task_description": "Обеспечить электроснабжение склада. " * 5,
+        "solution_title": "Решение",
+        "solution_description": "Поставлена КТП 2x1600 кВА. " * 5,
+        "solution_subtitle": "Результат",
+        "solution_subdescription": "Объект введен в эксплуатацию в срок.",
+        "solution_image_left": "https://cdn.example.com/portfolio/left.jpg",
+        "solution_image_left_alt": "Монтаж",
+        "solution_image_right": "https://cdn.example.com/portfolio/right.jpg",
+        "solution_image_right_alt": "Пусконаладка",
+        "has_review": True,
+        "review_title": "Отзыв заказчика",
+        "review_text": "Благодарим за качественную работу.",
+        "review_name": "Алексей Кузнецов",
+        "review_image": "https://cdn.example.com/portfolio/review.jpg",
+        "review_role": "Главный энергетик",
+    }
+
+
+def product_document() -> dict:
+    return {
+        **_base_fields(),
+        "category": "Трансформаторные подстанции",
+        "name": "КТП 10/0,4 кВ",
+        "slug": "ktp-10-0-4-kv",
+        "description": "Комплектная трансформаторная подстанция. " * 10,
+        "preview_image_url": "https://cdn.example.com/products/ktp.jpg",
+        "preview_image_alt": "КТП",
+        "important_characteristics": [
+            {"value": str(index), "unit": {"text": "кВА"}, "description": f"Характеристика {index}"}
+            for index in range(6)
+        ],
+        "advantages": [
+            {"label": f"Преимущество {index}", "icon": "https://cdn.example.com/icons/adv.svg", "image": None}
+            for index in range(4)
+        ],
+        "simple_description": [{"text": "Простое описание. " * 5} for _ in range(3)],
+        "detailed_description": [
+            {"title": "Конструкция", "description": "Подробное описание. " * 10} for _ in range(3)
+        ],
+        "documentation": [
+            {"title": f"Паспорт {index}", "url": "https://cdn.example.com/docs/passport.pdf", "type": "pdf"}
+            for index in range(2)
+        ],
+        "order": 1,
+        "is_shown": True,
+        "show_advantages": True,
+        "portfolio_ids": [uuid_to_document(uuid4()) for _ in range(3)],
+    }
+
+
+def seo_settings_document() -> dict:
+    return {
+        **_base_fields(),
+        "page_path": "/products",
+        "page_name": "Продукция",
+        "title": "Продукция завода",
+        "description": "Каталог продукции: подстанции, распределительные устройства.",
+        "keywords": "ктп, ру, подстанции",
+        "og_title": "Продукция завода",
+        "og_description": "Каталог продукции",
+        "og_image": "https://cdn.example.com/og/products.jpg",
+        "canonical_url": "https://example.com/products",
+        "is_active": True,
+    }
+
+
+def certificate_group_document() -> dict:
+    return {
+        **_base_fields(),
+        "section": "Сертификаты",
+        "title": "Сертификаты соответствия",
+        "content": "Перечень действующих сертификатов.",
+        "order": 0,
+        "is_active": True,
+    }
+
+
+def certificate_document() -> dict:
+    return {
+        **_base_fields(),
+        "certificate_group_id": uuid_to_document(uuid4()),
+        "title": "Сертификат ТР ТС",
+        "link": "https://cdn.example.com/certificates/tr-ts.pdf",
+        "order": 0,
+    }
+
+
+def member_document() -> dict:
+    return {
+        **_base_fields(),
+        "name": "Ольга Иванова",
+        "position": "Руководитель отдела продаж",
+        "image": "https://cdn.example.com/team/olga.jpg",
+        "email": "olga@example.com",
+        "order": 0,
+    }
+
+
+def review_document() -> dict:
+    return {
+        **_base_fields(),
+        "name": "Дмитрий Соколов",
+        "category": "Клиенты",
+        "position": "Директор",
+        "image": "https://cdn.example.com/reviews/dmitry.jpg",
+        "text": "Отличный поставщик. " * 10,
+        "short_text": "Отличный поставщик.",
+        "content_url": "https://cdn.example.com/reviews/letter.pdf",
+    }
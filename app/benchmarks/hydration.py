@@ -0,0 +1,91 @@
+"""Микробенчмарк гидратации сущностей из документов MongoDB.
+
+Сравнивает стоимость `*_document_to_entity` с повторной валидацией value
+objects (как было до fast-path) и через `BaseValueObject.from_trusted`.
+
+Запуск: `python -m benchmarks.hydration [--number N]`
+"""
+
+import argparse
+import timeit
+from collections.abc import (
+    Callable,
+    Iterator,
+)
+from contextlib import contextmanager
+
+from benchmarks import documents
+
+from domain.base.value_object import BaseValueObject
+from infrastructure.database.converters.certificates import (
+    certificate_document_to_entity,
+    certificate_group_document_to_entity,
+)
+from infrastructure.database.converters.members import member_document_to_entity
+from infrastructure.database.converters.news import news_document_to_entity
+from infrastructure.database.converters.portfolios.mongo import portfolio_document_to_entity
+from infrastructure.database.converters.products import product_document_to_entity
+from infrastructure.database.converters.reviews import review_document_to_entity
+from infrastructure.database.converters.seo_settings import seo_settings_document_to_entity
+from infrastructure.database.converters.submissions import submission_document_to_entity
+from infrastructure.database.converters.users.mongo import user_document_to_entity
+from infrastructure.database.converters.vacancies import vacancy_document_to_entity
+
+
+CONVERTERS: dict[str, tuple[Callable[[dict], object], Callable[[], dict]]] = {
+    "users": (user_document_to_entity, documents.user_document),
+    "news": (news_document_to_entity, documents.news_document),
+    "vacancies": (vacancy_document_to_entity, documents.vacancy_document),
+    "submissions": (submission_document_to_entity, documents.submission_document),
+    "portfolios": (portfolio_document_to_entity, documents.portfolio_document),
+    "products": (product_document_to_entity, documents.product_document),
+    "seo_settings": (seo_settings_document_to_entity, documents.seo_settings_document),
+    "certificate_groups": (certificate_group_document_to_entity, documents.certificate_group_document),
+    "certificates": (certificate_document_to_entity, documents.certificate_document),
+    "members": (member_document_to_entity, documents.member_document),
+    "reviews": (review_document_to_entity, documents.review_document),
+}
+
+
+@contextmanager
+def validating_hydration() -> Iterator[None]:
+    """Временно возвращает старое поведение: каждый value object валидируется."""
+    trusted = BaseValueObject.__dict__["from_trusted"]
+    BaseValueObject.from_trusted = classmethod(lambda cls, value: cls(value))
+    try:
+        yield
+    finally:
+        BaseValueObject.from_trusted = trusted
+
+
+def measure(converter: Callable[[dict], object], document: dict, number: int, repeat: int = 5) -> float:
+    """Лучшее время одной гидратации в микросекундах."""
+    timings = timeit.repeat(lambda: converter(document), number=number, repeat=repeat)
+    return min(timings) / number * 1_000_000
+
+
+def run(number: int) -> list[tuple[str, float, float]]:
+    results = []
+    for name, (converter, document_factory) in CONVERTERS.items():
+        document = document_factory()
+        with validating_hydration():
+            # Заодно проверяем, что тестовый документ проходит валидацию домена
+            converter(document)
+            before = measure(converter, document, number)
+        after = measure(converter, document, number)
+        results.append((name, before, after))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20_000, help="Количество гидратаций в одном замере")
+    args = parser.parse_args()
+
+    print(f"{'converter':<20}{'validated, us':>16}{'trusted, us':>14}{'speedup':>10}")
+    for name, before, after in run(args.number):
+        print(f"{name:<20}{before:>16.2f}{after:>14.2f}{before / after:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Бенчмарк памяти, занимаемой гидратированными сущностями.
+
+Держит в памяти N продуктов и N портфолио (как результат страницы списка или
+прогретый кэш) и считает через tracemalloc, сколько занимают сами сущности
+без исходных документов.
+
+Запуск: `python -m benchmarks.memory [--count N]`
+"""
+
+import argparse
+import gc
+import tracemalloc
+from collections.abc import Callable
+
+from benchmarks import documents
+
+from infrastructure.database.converters.portfolios.mongo import portfolio_document_to_entity
+from infrastructure.database.converters.products import product_document_to_entity
+
+
+SCENARIOS: dict[str, tuple[Callable[[dict], object], Callable[[], dict]]] = {
+    "products": (product_document_to_entity, documents.product_document),
+    "portfolios": (portfolio_document_to_entity, documents.portfolio_document),
+}
+
+
+def measure(converter: Callable[[dict], object], document_factory: Callable[[], dict], count: int) -> int:
+    """Количество байт, удерживаемых `count` сущностями."""
+    source = [document_factory() for _ in range(count)]
+    gc.collect()
+
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        entities = [converter(document) for document in source]
+        gc.collect()
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    del entities
+    return retained - baseline
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=1_000, help="Количество сущностей каждого типа")
+    args = parser.parse_args()
+
+    print(f"{'entities':<14}{'count':>8}{'total, KiB':>14}{'per entity, B':>16}")
+    for name, (converter, document_factory) in SCENARIOS.items():
+        retained = measure(converter, document_factory, args.count)
+        print(f"{name:<14}{args.count:>8}{retained / 1024:>14.1f}{retained / args.count:>16.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,311 @@
+"""Проверка планов запросов списков Mongo-репозиториев через explain().
+
+Заполняет отдельную базу документами в объеме, близком к боевому, создает
+индексы из `infrastructure/database/indexes.py` и прогоняет через explain()
+каждый фильтр `_build_find_query` репозиториев со всеми допустимыми полями
+сортировки в обе стороны. Выводит отчет keys examined / docs examined /
+returned по каждому запросу и завершается с ошибкой, если в выигравшем
+плане есть COLLSCAN или блокирующий SORT, кроме разрешенных исключений.
+
+Запуск: `python -m benchmarks.query_plans [--mongo-url mongodb://...] [--documents N]`
+"""
+
+import argparse
+import asyncio
+import sys
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import (
+    datetime,
+    timedelta,
+)
+from uuid import uuid4
+
+from benchmarks import documents
+
+from infrastructure.database.converters.base import (
+    datetime_to_document,
+    uuid_to_document,
+)
+from infrastructure.database.explain import plan_stages
+from infrastructure.database.gateways.mongo import MongoDatabase
+from infrastructure.database.indexes import ensure_indexes
+from infrastructure.database.repositories.certificates import (
+    MongoCertificateGroupRepository,
+    MongoCertificateRepository,
+)
+from infrastructure.database.repositories.news.mongo import MongoNewsRepository
+from infrastructure.database.repositories.portfolios.mongo import MongoPortfolioRepository
+from infrastructure.database.repositories.products.mongo import MongoProductRepository
+from infrastructure.database.repositories.reviews.mongo import MongoReviewRepository
+from infrastructure.database.repositories.seo_settings.mongo import MongoSeoSettingsRepository
+from infrastructure.database.repositories.submissions.mongo import MongoSubmissionRepository
+from infrastructure.database.repositories.vacancies.mongo import MongoVacancyRepository
+from infrastructure.database.sorting import (
+    SORT_FIELDS,
+    sort_spec,
+)
+from settings.config import Config
+
+
+DATABASE_NAME = "sk_query_plans"
+
+PAGE_SIZE = 20
+
+FORBIDDEN_STAGES = frozenset({"COLLSCAN", "SORT"})
+
+# (коллекция, фильтр) -> причина, по которой запрещенная стадия допустима
+ALLOWED_EXCEPTIONS: dict[tuple[str, str], str] = {}
+
+CATEGORIES = ("Трансформаторные подстанции", "Распределительные устройства", "Производство", "Клиенты")
+SECTIONS = ("Сертификаты", "Декларации", "Лицензии")
+FORM_TYPES = ("Обращение", "Заявка", "Вакансия")
+
+DOCUMENT_FACTORIES: dict[str, Callable[[], dict]] = {
+    "products": documents.product_document,
+    "news": documents.news_document,
+    "portfolio": documents.portfolio_document,
+    "seo_settings": documents.seo_settings_document,
+    "certificates": documents.certificate_document,
+    "certificate_groups": documents.certificate_group_document,
+    "submissions": documents.submission_document,
+    "reviews": documents.review_document,
+    "vacancies": documents.vacancy_document,
+    "members": documents.member_document,
+}
+
+# Поля, значения которых должны различаться между документами, иначе индекс по ним ничего не отсекает
+_UNIQUE_TEXT_FIELDS = ("slug", "name", "title", "page_path", "page_name", "position")
+
+_CERTIFICATE_GROUP_IDS = [uuid4() for _ in range(10)]
+
+
+@dataclass(frozen=True)
+class QueryPlanCase:
+    collection_name: str
+    filter_name: str
+    query: dict
+    sort_field: str
+    sort_order: int
+
+
+@dataclass(frozen=True)
+class QueryPlanReport:
+    case: QueryPlanCase
+    stages: tuple[str, ...]
+    index_name: str | None
+    keys_examined: int
+    docs_examined: int
+    returned: int
+
+    @property
+    def violations(self) -> frozenset[str]:
+        if (self.case.collection_name, self.case.filter_name) in ALLOWED_EXCEPTIONS:
+            return frozenset()
+
+        return FORBIDDEN_STAGES.intersection(self.stages)
+
+
+def build_report(case: QueryPlanCase, explain: dict) -> QueryPlanReport:
+    stages = list(plan_stages(explain["queryPlanner"]["winningPlan"]))
+    execution_stats = explain.get("executionStats", {})
+
+    return QueryPlanReport(
+        case=case,
+        stages=tuple(stage["stage"] for stage in stages),
+        index_name=next((stage["indexName"] for stage in stages if "indexName" in stage), None),
+        keys_examined=execution_stats.get("totalKeysExamined", 0),
+        docs_examined=execution_stats.get("totalDocsExamined", 0),
+        returned=execution_stats.get("nReturned", 0),
+    )
+
+
+def _seed_document(collection_name: str, index: int) -> dict:
+    document = DOCUMENT_FACTORIES[collection_name]()
+    created_at = datetime(2024, 1, 1) + timedelta(minutes=index)
+
+    document.update(
+        oid=uuid_to_document(uuid4()),
+        created_at=datetime_to_document(created_at),
+        updated_at=datetime_to_document(created_at + timedelta(days=index % 30)),
+    )
+
+    for field_name in _UNIQUE_TEXT_FIELDS:
+        if field_name in document:
+            document[field_name] = f"{document[field_name]}-{index}"
+
+    for field_name, values in (("category", CATEGORIES), ("section", SECTIONS), ("form_type", FORM_TYPES)):
+        if field_name in document:
+            document[field_name] = values[index % len(values)]
+
+    for field_name in ("order", "salary", "year"):
+        if field_name in document:
+            document[field_name] = document[field_name] + index % 100
+
+    for field_name in ("is_shown", "is_active"):
+        if field_name in document:
+            document[field_name] = index % 5 != 0
+
+    if "date" in document:
+        document["date"] = document["created_at"]
+
+    if collection_name == "certificates":
+        document["certificate_group_id"] = uuid_to_document(_CERTIFICATE_GROUP_IDS[index % len(_CERTIFICATE_GROUP_IDS)])
+
+    return document
+
+
+def query_filters(mongo_database: MongoDatabase) -> dict[str, dict[str, dict]]:
+    """Фильтры, которые строят репозитории: без фильтра, по каждому полю равенства и поиск."""
+    products = MongoProductRepository(mongo_database=mongo_database)
+    news = MongoNewsRepository(mongo_database=mongo_database)
+    portfolios = MongoPortfolioRepository(mongo_database=mongo_database)
+    seo_settings = MongoSeoSettingsRepository(mongo_database=mongo_database)
+    certificates = MongoCertificateRepository(mongo_database=mongo_database)
+    certificate_groups = MongoCertificateGroupRepository(mongo_database=mongo_database)
+    submissions = MongoSubmissionRepository(mongo_database=mongo_database)
+    reviews = MongoReviewRepository(mongo_database=mongo_database)
+    vacancies = MongoVacancyRepository(mongo_database=mongo_database)
+
+    return {
+        "products": {
+            "all": products._build_find_query(),
+            "is_shown": products._build_find_query(is_shown=True),
+            "category": products._build_find_query(category=CATEGORIES[0]),
+            "search": products._build_find_query(search="ктп"),
+        },
+        "news": {
+            "all": news._build_find_query(),
+            "category": news._build_find_query(category=CATEGORIES[2]),
+            "search": news._build_find_query(search="линии"),
+        },
+        "portfolio": {
+            "all": portfolios._build_find_query(),
+            "year": portfolios._build_find_query(year=2030),
+            "search": portfolios._build_find_query(search="склад"),
+        },
+        "seo_settings": {
+            "all": seo_settings._build_find_query(),
+            "is_active": seo_settings._build_find_query(is_active=True),
+            "search": seo_settings._build_find_query(search="products"),
+        },
+        "certificates": {
+            "all": certificates._build_find_query(),
+            "certificate_group_id": certificates._build_find_query(certificate_group_id=_CERTIFICATE_GROUP_IDS[0]),
+            "search": certificates._build_find_query(search="ТР ТС"),
+        },
+        "certificate_groups": {
+            "all": certificate_groups._build_find_query(),
+            "section": certificate_groups._build_find_query(section=SECTIONS[0]),
+            "is_active": certificate_groups._build_find_query(is_active=True),
+            "search": certificate_groups._build_find_query(search="сертификат"),
+        },
+        "submissions": {
+            "all": submissions._build_find_query(),
+            "form_type": submissions._build_find_query(form_type=FORM_TYPES[0]),
+            "created_range": submissions._build_find_query(
+                created_from=datetime(2024, 1, 2),
+                created_to=datetime(2024, 1, 3),
+            ),
+        },
+        "reviews": {
+            "all": reviews._build_query(category=None),
+            "category": reviews._build_query(category=CATEGORIES[3]),
+        },
+        "vacancies": {
+            "all": vacancies._build_find_query(),
+            "category": vacancies._build_find_query(category=CATEGORIES[2]),
+            "search": vacancies._build_find_query(search="инженер"),
+        },
+        "members": {"all": {}},
+    }
+
+
+def query_plan_cases(mongo_database: MongoDatabase) -> list[QueryPlanCase]:
+    return [
+        QueryPlanCase(
+            collection_name=collection_name,
+            filter_name=filter_name,
+            query=query,
+            sort_field=sort_field,
+            sort_order=sort_order,
+        )
+        for collection_name, filters in query_filters(mongo_database).items()
+        for filter_name, query in filters.items()
+        for sort_field in SORT_FIELDS[collection_name]
+        for sort_order in (1, -1)
+    ]
+
+
+async def seed(mongo_database: MongoDatabase, documents_count: int, batch_size: int = 1_000) -> None:
+    for collection_name in DOCUMENT_FACTORIES:
+        collection = mongo_database.connection[collection_name]
+        await collection.drop()
+
+        for start in range(0, documents_count, batch_size):
+            batch = [
+                _seed_document(collection_name, index)
+                for index in range(start, min(start + batch_size, documents_count))
+            ]
+            await collection.insert_many(batch)
+
+    await ensure_indexes(mongo_database)
+
+
+async def explain_cases(mongo_database: MongoDatabase) -> list[QueryPlanReport]:
+    reports = []
+
+    for case in query_plan_cases(mongo_database):
+        cursor = (
+            mongo_database.connection[case.collection_name]
+            .find(case.query)
+            .sort(sort_spec(case.collection_name, case.sort_field, case.sort_order))
+            .limit(PAGE_SIZE)
+        )
+        reports.append(build_report(case, await cursor.explain()))
+
+    return reports
+
+
+async def run(mongo_url: str, documents_count: int) -> list[QueryPlanReport]:
+    mongo_database = MongoDatabase(mongo_url=mongo_url, mongo_database=DATABASE_NAME)
+
+    try:
+        await seed(mongo_database, documents_count)
+        return await explain_cases(mongo_database)
+    finally:
+        await mongo_database.connection.client.drop_database(DATABASE_NAME)
+        mongo_database.close()
+
+
+def print_report(reports: list[QueryPlanReport]) -> None:
+    print(f"{'query':<58}{'index':<26}{'keys':>8}{'docs':>8}{'returned':>10}  stages")
+
+    for report in reports:
+        case = report.case
+        name = f"{case.collection_name}[{case.filter_name}] {case.sort_field} {case.sort_order:+d}"
+        marker = " !" if report.violations else ""
+        print(
+            f"{name:<58}{report.index_name or '-':<26}{report.keys_examined:>8}{report.docs_examined:>8}"
+            f"{report.returned:>10}  {' > '.join(report.stages)}{marker}",
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mongo-url", default=None, help="MongoDB для временной базы (по умолчанию из настроек)")
+    parser.add_argument("--documents", type=int, default=10_000, help="Количество документов в каждой коллекции")
+    args = parser.parse_args()
+
+    reports = asyncio.run(run(args.mongo_url or Config().mongo_connection_url, args.documents))
+    print_report(reports)
+
+    violations = [report for report in reports if report.violations]
+
+    if violations:
+        print(f"\n{len(violations)} queries are not served by an index", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Бенчмарк сериализации ответа списка продуктов.
+
+Сравнивает прежний путь FastAPI (повторная валидация по response_model,
+jsonable_encoder, json.dumps) с FastJSONResponse, который сериализует уже
+собранную модель ответа напрямую в байты.
+
+Запуск: `python -m benchmarks.serialization [--items N] [--number N]`
+"""
+
+import argparse
+import asyncio
+import json
+import timeit
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from benchmarks import documents
+
+from infrastructure.database.converters.products import product_document_to_entity
+from presentation.api.filters import PaginationOut
+from presentation.api.responses import FastJSONResponse
+from presentation.api.schemas import (
+    ApiResponse,
+    ListPaginatedResponse,
+)
+from presentation.api.v1.products.schemas import ProductResponseSchema
+
+
+ResponseModel = ApiResponse[ListPaginatedResponse[ProductResponseSchema]]
+
+
+def build_response(entities: list) -> ResponseModel:
+    return ResponseModel(
+        data=ListPaginatedResponse[ProductResponseSchema](
+            items=[ProductResponseSchema.from_entity(entity) for entity in entities],
+            pagination=PaginationOut(limit=len(entities), offset=0, total=len(entities)),
+        ),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=50, help="Количество продуктов на странице")
+    parser.add_argument("--number", type=int, default=200, help="Количество сериализаций в одном замере")
+    args = parser.parse_args()
+
+    entities = [product_document_to_entity(documents.product_document()) for _ in range(args.items)]
+    response_field = create_model_field(name="Response", type_=ResponseModel, mode="serialization")
+    loop = asyncio.new_event_loop()
+
+    def response_model_path(response: ResponseModel) -> bytes:
+        content = loop.run_until_complete(serialize_response(field=response_field, response_content=response))
+        return JSONResponse(content).body
+
+    def fast_path(response: ResponseModel) -> bytes:
+        return FastJSONResponse(response).body
+
+    prebuilt = build_response(entities)
+    # Оба пути должны отдавать один и тот же документ
+    assert json.loads(response_model_path(prebuilt)) == json.loads(fast_path(prebuilt))
+
+    print(f"{'path':<18}{'serialize, ms':>15}{'build + serialize, ms':>24}")
+    for name, path in (("response_model", response_model_path), ("FastJSONResponse", fast_path)):
+        serialize = min(timeit.repeat(lambda: path(prebuilt), number=args.number, repeat=5)) / args.number
+        total = min(timeit.repeat(lambda: path(build_response(entities)), number=args.number, repeat=5)) / args.number
+        print(f"{name:<18}{serialize * 1000:>15.3f}{total * 1000:>24.3f}")
+
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
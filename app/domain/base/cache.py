@@ -0,0 +1,204 @@
+import asyncio
+import logging
+import time
+from collections import (
+    Counter,
+    OrderedDict,
+)
+from collections.abc import Iterable
+from contextlib import (
+    AbstractContextManager,
+    nullcontext,
+)
+from dataclasses import (
+    dataclass,
+    field,
+)
+from typing import (
+    Awaitable,
+    Callable,
+    Generic,
+    Optional,
+    TypeVar,
+)
+from uuid import UUID
+
+
+logger = logging.getLogger(__name__)
+
+CachedType = TypeVar("CachedType")
+
+SlugCacheKey = tuple[str, Optional[frozenset[str]]]
+
+
+@dataclass(slots=True)
+class _SlugCacheEntry(Generic[CachedType]):
+    value: Optional[CachedType]
+    stored_at: float
+
+
+@dataclass
+class SlugCache(Generic[CachedType]):
+    """Кэш разрешения slug -> сущность в памяти процесса.
+
+    Найденная сущность отдается из кэша fresh_ttl секунд, затем еще до
+    stale_ttl секунд отдается устаревшей, а в фоне перечитывается
+    (stale-while-revalidate). Промах (None) запоминается на negative_ttl
+    секунд, чтобы перебор несуществующих slug не доходил до базы.
+
+    Сервис сбрасывает ключи своими командами, а изменения из других
+    воркеров видны не позже чем через fresh_ttl / negative_ttl, либо сразу,
+    если включено отслеживание change streams (InvalidateCachesCommand).
+
+    Загрузчик выполняется внутри read_scope: контейнер направляет эти чтения
+    в primary, чтобы после сброса ключа кэш не заполнился старой версией
+    сущности с отстающей реплики. Сброс, пришедший во время чтения, повышает
+    поколение slug, и прочитанное до записи значение не кэшируется.
+    """
+
+    fresh_ttl: float = 30.0
+    stale_ttl: float = 300.0
+    negative_ttl: float = 10.0
+    max_entries: int = 10_000
+    clock: Callable[[], float] = time.monotonic
+    read_scope: Callable[[], AbstractContextManager] = nullcontext
+    _entries: OrderedDict[SlugCacheKey, _SlugCacheEntry[CachedType]] = field(
+        default_factory=OrderedDict,
+        init=False,
+        repr=False,
+    )
+    _revalidations: dict[SlugCacheKey, asyncio.Task] = field(default_factory=dict, init=False, repr=False)
+    # Поколения и число идущих чтений - только для slug, которые сейчас загружаются
+    _generations: dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    _loading: Counter[str] = field(default_factory=Counter, init=False, repr=False)
+
+    async def get(
+        self,
+        slug: str,
+        fields: Optional[frozenset[str]],
+        loader: Callable[[], Awaitable[Optional[CachedType]]],
+    ) -> Optional[CachedType]:
+        key = (slug, fields)
+        entry = self._entries.get(key)
+
+        if entry is not None:
+            age = self.clock() - entry.stored_at
+
+            if entry.value is None and age < self.negative_ttl:
+                return None
+
+            if entry.value is not None and age < self.fresh_ttl:
+                self._entries.move_to_end(key)
+                return entry.value
+
+            if entry.value is not None and age < self.stale_ttl:
+                self._entries.move_to_end(key)
+                self._schedule_revalidation(key, loader)
+                return entry.value
+
+        return await self._load_and_store(key, loader)
+
+    def prime(
+        self,
+        slug: str,
+        fields: Optional[frozenset[str]],
+        value: CachedType,
+    ) -> None:
+        """Кладет заранее прочитанную сущность, например при прогреве на старте."""
+        self._store((slug, fields), value)
+
+    def invalidate(self, *slugs: str) -> None:
+        """Сбрасывает все закэшированные проекции указанных slug (и положительные, и промахи)."""
+        slugs_set = set(slugs)
+
+        for key in [key for key in self._entries if key[0] in slugs_set]:
+            del self._entries[key]
+
+        for key in [key for key in self._revalidations if key[0] in slugs_set]:
+            # Фоновое чтение могло начаться до записи и вернуть старые данные
+            self._revalidations.pop(key).cancel()
+
+        self._bump_generations(slugs_set)
+
+    def invalidate_oid(self, oid: UUID) -> None:
+        """Сбрасывает проекции сущности по oid, когда ее прежний slug неизвестен (например, slug сменили)."""
+        slugs = {key[0] for key, entry in self._entries.items() if getattr(entry.value, "oid", None) == oid}
+
+        if slugs:
+            self.invalidate(*slugs)
+
+        # Идущее чтение могло вернуть эту сущность под новым slug, который в кэше еще не встречался
+        self._bump_generations(self._generations)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+        for task in self._revalidations.values():
+            task.cancel()
+
+        self._revalidations.clear()
+        self._bump_generations(self._generations)
+
+    def _store(self, key: SlugCacheKey, value: Optional[CachedType]) -> None:
+        self._entries[key] = _SlugCacheEntry(value=value, stored_at=self.clock())
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _bump_generations(self, slugs: Iterable[str]) -> None:
+        for slug in [slug for slug in slugs if slug in self._generations]:
+            self._generations[slug] += 1
+
+    async def _load_and_store(
+        self,
+        key: SlugCacheKey,
+        loader: Callable[[], Awaitable[Optional[CachedType]]],
+    ) -> Optional[CachedType]:
+        slug = key[0]
+        generation = self._generations.setdefault(slug, 0)
+        self._loading[slug] += 1
+
+        try:
+            value = await self._load(loader)
+
+            # Ключ сбросили, пока шло чтение: значение могло быть прочитано до записи
+            if self._generations[slug] == generation:
+                self._store(key, value)
+
+            return value
+        finally:
+            self._loading[slug] -= 1
+
+            if not self._loading[slug]:
+                del self._loading[slug]
+                del self._generations[slug]
+
+    async def _load(self, loader: Callable[[], Awaitable[Optional[CachedType]]]) -> Optional[CachedType]:
+        with self.read_scope():
+            return await loader()
+
+    def _schedule_revalidation(
+        self,
+        key: SlugCacheKey,
+        loader: Callable[[], Awaitable[Optional[CachedType]]],
+    ) -> None:
+        if key in self._revalidations:
+            return
+
+        task = asyncio.create_task(self._revalidate(key, loader))
+        self._revalidations[key] = task
+
+    async def _revalidate(
+        self,
+        key: SlugCacheKey,
+        loader: Callable[[], Awaitable[Optional[CachedType]]],
+    ) -> None:
+        try:
+            await self._load_and_store(key, loader)
+        except Exception:
+            # Остаемся на устаревшем значении до следующей попытки
+            logger.exception("Failed to revalidate slug cache entry %s", key[0])
+        finally:
+            if self._revalidations.get(key) is asyncio.current_task():
+                del self._revalidations[key]
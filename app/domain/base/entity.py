@@ -10,7 +10,7 @@ from uuid import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseEntity(ABC):
     oid: UUID = field(default_factory=uuid4, kw_only=True)
     created_at: datetime = field(default_factory=datetime.now, kw_only=True)
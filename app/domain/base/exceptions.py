@@ -13,3 +13,13 @@ class DomainException(ApplicationException):
     @property
     def message(self) -> str:
         return "Произошла доменная ошибка"
+
+
+@dataclass(eq=False)
+class InvalidSortFieldException(DomainException):
+    sort_field: str
+    allowed_fields: tuple[str, ...]
+
+    @property
+    def message(self) -> str:
+        return f"Сортировка по полю '{self.sort_field}' не поддерживается. Допустимые поля: {', '.join(self.allowed_fields)}"
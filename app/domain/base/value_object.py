@@ -6,6 +6,7 @@ from dataclasses import dataclass
 from typing import (
     Any,
     Generic,
+    Self,
     TypeVar,
 )
 
@@ -13,13 +14,24 @@ from typing import (
 ValueType = TypeVar("ValueType", bound=Any)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BaseValueObject(ABC, Generic[ValueType]):
     value: ValueType
 
     def __post_init__(self):
         self.validate()
 
+    @classmethod
+    def from_trusted(cls, value: ValueType) -> Self:
+        """Создает value object без повторной валидации.
+
+        Только для данных, которые уже прошли валидацию при записи (чтение из
+        репозитория). Пользовательский ввод всегда создается через конструктор.
+        """
+        instance = object.__new__(cls)
+        object.__setattr__(instance, "value", value)
+        return instance
+
     @abstractmethod
     def validate(self): ...
 
@@ -12,7 +12,7 @@ from domain.certificates.value_objects.certificate_groups import (
 )
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class CertificateGroupEntity(BaseEntity):
     section: SectionValueObject
     title: TitleValueObject
@@ -7,7 +7,7 @@ from domain.certificates.value_objects.certificates import (
 )
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class CertificateEntity(BaseEntity):
     title: CertificateTitleValueObject
     link: CertificateLinkValueObject
@@ -20,7 +20,7 @@ VALID_SECTIONS = {
 }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SectionValueObject(BaseValueObject):
     value: str
 
@@ -32,7 +32,7 @@ class SectionValueObject(BaseValueObject):
         return str(self.value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TitleValueObject(BaseValueObject):
     value: str
 
@@ -50,7 +50,7 @@ class TitleValueObject(BaseValueObject):
         return str(self.value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ContentValueObject(BaseValueObject):
     value: str
 
@@ -7,7 +7,7 @@ from domain.certificates.exceptions.certificates import (
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CertificateTitleValueObject(BaseValueObject):
     value: str
 
@@ -19,7 +19,7 @@ class CertificateTitleValueObject(BaseValueObject):
         return str(self.value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CertificateLinkValueObject(BaseValueObject):
     value: str
 
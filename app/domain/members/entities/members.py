@@ -9,7 +9,7 @@ from domain.members.value_objects.members import (
 )
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class MemberEntity(BaseEntity):
     name: MemberNameValueObject
     position: MemberPositionValueObject
@@ -9,7 +9,7 @@ from domain.members.exceptions.members import (
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MemberNameValueObject(BaseValueObject):
     value: str
 
@@ -21,7 +21,7 @@ class MemberNameValueObject(BaseValueObject):
         return str(self.value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MemberPositionValueObject(BaseValueObject):
     value: str
 
@@ -33,7 +33,7 @@ class MemberPositionValueObject(BaseValueObject):
         return str(self.value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MemberImageValueObject(BaseValueObject):
     value: str
 
@@ -45,7 +45,7 @@ class MemberImageValueObject(BaseValueObject):
         return str(self.value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MemberEmailValueObject(BaseValueObject):
     value: Optional[str]
 
@@ -14,7 +14,7 @@ from domain.news.value_objects import (
 )
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class NewsEntity(BaseEntity):
     category: CategoryValueObject
     title: TitleValueObject
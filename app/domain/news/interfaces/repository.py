@@ -13,10 +13,10 @@ class BaseNewsRepository(ABC):
     async def add(self, news: NewsEntity) -> NewsEntity: ...
 
     @abstractmethod
-    async def get_by_id(self, news_id: UUID) -> NewsEntity | None: ...
+    async def get_by_id(self, news_id: UUID, fields: frozenset[str] | None = None) -> NewsEntity | None: ...
 
     @abstractmethod
-    async def get_by_slug(self, slug: str) -> NewsEntity | None: ...
+    async def get_by_slug(self, slug: str, fields: frozenset[str] | None = None) -> NewsEntity | None: ...
 
     @abstractmethod
     async def update(self, news: NewsEntity) -> None: ...
@@ -33,6 +33,7 @@ class BaseNewsRepository(ABC):
         limit: int,
         search: str | None = None,
         category: str | None = None,
+        fields: frozenset[str] | None = None,
     ) -> AsyncIterable[NewsEntity]: ...
 
     @abstractmethod
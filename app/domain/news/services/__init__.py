@@ -1,4 +1,5 @@
+from domain.news.services.cache import NewsSlugCache
 from domain.news.services.news import NewsService
 
 
-__all__ = ["NewsService"]
+__all__ = ["NewsService", "NewsSlugCache"]
@@ -0,0 +1,6 @@
+from domain.base.cache import SlugCache
+from domain.news.entities import NewsEntity
+
+
+class NewsSlugCache(SlugCache[NewsEntity]):
+    """Кэш новостей по slug, общий для всех экземпляров NewsService процесса."""
@@ -9,11 +9,13 @@ from domain.news.exceptions import (
     NewsNotFoundException,
 )
 from domain.news.interfaces.repository import BaseNewsRepository
+from domain.news.services.cache import NewsSlugCache
 
 
 @dataclass
 class NewsService:
     news_repository: BaseNewsRepository
+    slug_cache: NewsSlugCache
 
     async def create(
         self,
@@ -26,14 +28,17 @@ class NewsService:
             raise NewsAlreadyExistsException(slug=slug)
 
         await self.news_repository.add(news)
+        # Slug мог быть закэширован как несуществующий
+        self.slug_cache.invalidate(slug)
 
         return news
 
     async def get_by_id(
         self,
         news_id: UUID,
+        fields: Optional[frozenset[str]] = None,
     ) -> NewsEntity:
-        news = await self.news_repository.get_by_id(news_id)
+        news = await self.news_repository.get_by_id(news_id, fields)
 
         if not news:
             raise NewsNotFoundException(news_id=news_id)
@@ -43,8 +48,13 @@ class NewsService:
     async def get_by_slug(
         self,
         slug: str,
+        fields: Optional[frozenset[str]] = None,
     ) -> NewsEntity:
-        news = await self.news_repository.get_by_slug(slug)
+        news = await self.slug_cache.get(
+            slug,
+            fields,
+            loader=lambda: self.news_repository.get_by_slug(slug, fields),
+        )
 
         if not news:
             raise NewsNotFoundBySlugException(slug=slug)
@@ -66,6 +76,7 @@ class NewsService:
                 raise NewsAlreadyExistsException(slug=new_slug)
 
         await self.news_repository.update(news)
+        self.slug_cache.invalidate(current_slug, new_slug)
 
         return news
 
@@ -73,8 +84,9 @@ class NewsService:
         self,
         news_id: UUID,
     ) -> None:
-        await self.get_by_id(news_id)
+        news = await self.get_by_id(news_id)
         await self.news_repository.delete(news_id)
+        self.slug_cache.invalidate(news.slug.as_generic_type())
 
     async def find_many(
         self,
@@ -84,6 +96,7 @@ class NewsService:
         limit: int,
         search: Optional[str] = None,
         category: Optional[str] = None,
+        fields: Optional[frozenset[str]] = None,
     ) -> list[NewsEntity]:
         news_iterable = self.news_repository.find_many(
             sort_field=sort_field,
@@ -92,6 +105,7 @@ class NewsService:
             limit=limit,
             search=search,
             category=category,
+            fields=fields,
         )
         return [news async for news in news_iterable]
 
@@ -104,3 +118,20 @@ class NewsService:
             search=search,
             category=category,
         )
+
+    async def warm_slug_cache(
+        self,
+        limit: int,
+    ) -> int:
+        """Заполняет кэш slug последними новостями; возвращает их количество."""
+        news_list = await self.find_many(
+            sort_field="created_at",
+            sort_order=-1,
+            offset=0,
+            limit=limit,
+        )
+
+        for news in news_list:
+            self.slug_cache.prime(news.slug.as_generic_type(), None, news)
+
+        return len(news_list)
@@ -24,7 +24,7 @@ MAX_SHORT_CONTENT_LENGTH = 500
 MAX_ALT_LENGTH = 255
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CategoryValueObject(BaseValueObject):
     value: str
 
@@ -36,7 +36,7 @@ class CategoryValueObject(BaseValueObject):
         return str(self.value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TitleValueObject(BaseValueObject):
     value: str
 
@@ -54,7 +54,7 @@ class TitleValueObject(BaseValueObject):
         return str(self.value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SlugValueObject(BaseValueObject):
     value: str
 
@@ -70,7 +70,7 @@ class SlugValueObject(BaseValueObject):
         return str(self.value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ContentValueObject(BaseValueObject):
     value: str
 
@@ -82,7 +82,7 @@ class ContentValueObject(BaseValueObject):
         return str(self.value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ShortContentValueObject(BaseValueObject):
     value: str
 
@@ -100,7 +100,7 @@ class ShortContentValueObject(BaseValueObject):
         return str(self.value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ImageUrlValueObject(BaseValueObject):
     value: Optional[str]
 
@@ -111,7 +111,7 @@ class ImageUrlValueObject(BaseValueObject):
         return self.value
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AltValueObject(BaseValueObject):
     value: Optional[str]
 
@@ -126,7 +126,7 @@ class AltValueObject(BaseValueObject):
         return self.value
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReadingTimeValueObject(BaseValueObject):
     value: int
 
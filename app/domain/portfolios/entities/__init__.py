@@ -1,4 +1,5 @@
 from domain.portfolios.entities.portfolios import PortfolioEntity
+from domain.portfolios.entities.summaries import PortfolioSummaryEntity
 
 
-__all__ = ["PortfolioEntity"]
+__all__ = ["PortfolioEntity", "PortfolioSummaryEntity"]
@@ -23,7 +23,7 @@ from domain.portfolios.value_objects import (
 )
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class PortfolioEntity(BaseEntity):
     name: NameValueObject
     slug: SlugValueObject
@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+
+from domain.base.entity import BaseEntity
+from domain.portfolios.value_objects import (
+    ImageAltValueObject,
+    NameValueObject,
+    PosterUrlValueObject,
+    SlugValueObject,
+    YearValueObject,
+)
+
+
+@dataclass(eq=False, slots=True)
+class PortfolioSummaryEntity(BaseEntity):
+    name: NameValueObject
+    slug: SlugValueObject
+    poster: PosterUrlValueObject
+    poster_alt: ImageAltValueObject
+    year: YearValueObject
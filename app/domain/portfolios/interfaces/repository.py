@@ -5,7 +5,10 @@ from abc import (
 from collections.abc import AsyncIterable
 from uuid import UUID
 
-from domain.portfolios.entities import PortfolioEntity
+from domain.portfolios.entities import (
+    PortfolioEntity,
+    PortfolioSummaryEntity,
+)
 
 
 class BasePortfolioRepository(ABC):
@@ -13,10 +16,10 @@ class BasePortfolioRepository(ABC):
     async def add(self, portfolio: PortfolioEntity) -> PortfolioEntity: ...
 
     @abstractmethod
-    async def get_by_id(self, portfolio_id: UUID) -> PortfolioEntity | None: ...
+    async def get_by_id(self, portfolio_id: UUID, fields: frozenset[str] | None = None) -> PortfolioEntity | None: ...
 
     @abstractmethod
-    async def get_by_slug(self, slug: str) -> PortfolioEntity | None: ...
+    async def get_by_slug(self, slug: str, fields: frozenset[str] | None = None) -> PortfolioEntity | None: ...
 
     @abstractmethod
     async def update(self, portfolio: PortfolioEntity) -> None: ...
@@ -33,7 +36,19 @@ class BasePortfolioRepository(ABC):
         limit: int,
         search: str | None = None,
         year: int | None = None,
+        fields: frozenset[str] | None = None,
     ) -> AsyncIterable[PortfolioEntity]: ...
 
+    @abstractmethod
+    async def find_many_summaries(
+        self,
+        sort_field: str,
+        sort_order: int,
+        offset: int,
+        limit: int,
+        search: str | None = None,
+        year: int | None = None,
+    ) -> AsyncIterable[PortfolioSummaryEntity]: ...
+
     @abstractmethod
     async def count_many(self, search: str | None = None, year: int | None = None) -> int: ...
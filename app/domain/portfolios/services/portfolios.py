@@ -2,7 +2,10 @@ from dataclasses import dataclass
 from typing import Optional
 from uuid import UUID
 
-from domain.portfolios.entities import PortfolioEntity
+from domain.portfolios.entities import (
+    PortfolioEntity,
+    PortfolioSummaryEntity,
+)
 from domain.portfolios.exceptions import (
     PortfolioAlreadyExistsException,
     PortfolioNotFoundBySlugException,
@@ -31,8 +34,9 @@ class PortfolioService:
     async def get_by_id(
         self,
         portfolio_id: UUID,
+        fields: Optional[frozenset[str]] = None,
     ) -> PortfolioEntity:
-        portfolio = await self.portfolio_repository.get_by_id(portfolio_id)
+        portfolio = await self.portfolio_repository.get_by_id(portfolio_id, fields)
 
         if not portfolio:
             raise PortfolioNotFoundException(portfolio_id=portfolio_id)
@@ -42,8 +46,9 @@ class PortfolioService:
     async def get_by_slug(
         self,
         slug: str,
+        fields: Optional[frozenset[str]] = None,
     ) -> PortfolioEntity:
-        portfolio = await self.portfolio_repository.get_by_slug(slug)
+        portfolio = await self.portfolio_repository.get_by_slug(slug, fields)
 
         if not portfolio:
             raise PortfolioNotFoundBySlugException(slug=slug)
@@ -83,6 +88,7 @@ class PortfolioService:
         limit: int,
         search: Optional[str] = None,
         year: Optional[int] = None,
+        fields: Optional[frozenset[str]] = None,
     ) -> list[PortfolioEntity]:
         portfolios_iterable = self.portfolio_repository.find_many(
             sort_field=sort_field,
@@ -91,9 +97,29 @@ class PortfolioService:
             limit=limit,
             search=search,
             year=year,
+            fields=fields,
         )
         return [portfolio async for portfolio in portfolios_iterable]
 
+    async def find_many_summaries(
+        self,
+        sort_field: str,
+        sort_order: int,
+        offset: int,
+        limit: int,
+        search: Optional[str] = None,
+        year: Optional[int] = None,
+    ) -> list[PortfolioSummaryEntity]:
+        summaries_iterable = self.portfolio_repository.find_many_summaries(
+            sort_field=sort_field,
+            sort_order=sort_order,
+            offset=offset,
+            limit=limit,
+            search=search,
+            year=year,
+        )
+        return [summary async for summary in summaries_iterable]
+
     async def count_many(
         self,
         search: Optional[str] = None,
@@ -28,7 +28,7 @@ MIN_YEAR = 2000
 MAX_YEAR = 2100
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NameValueObject(BaseValueObject):
     value: str
 
@@ -46,7 +46,7 @@ class NameValueObject(BaseValueObject):
         return str(self.value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SlugValueObject(BaseValueObject):
     value: str
 
@@ -65,7 +65,7 @@ class SlugValueObject(BaseValueObject):
         return str(self.value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PosterUrlValueObject(BaseValueObject):
     value: str
 
@@ -80,7 +80,7 @@ class PosterUrlValueObject(BaseValueObject):
         return str(self.value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ImageAltValueObject(BaseValueObject):
     value: str
 
@@ -91,7 +91,7 @@ class ImageAltValueObject(BaseValueObject):
         return str(self.value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class YearValueObject(BaseValueObject):
     value: int
 
@@ -103,7 +103,7 @@ class YearValueObject(BaseValueObject):
         return int(self.value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TaskTitleValueObject(BaseValueObject):
     value: str
 
@@ -115,7 +115,7 @@ class TaskTitleValueObject(BaseValueObject):
         return str(self.value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TaskDescriptionValueObject(BaseValueObject):
     value: str
 
@@ -127,7 +127,7 @@ class TaskDescriptionValueObject(BaseValueObject):
         return str(self.value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SolutionTitleValueObject(BaseValueObject):
     value: str
 
@@ -139,7 +139,7 @@ class SolutionTitleValueObject(BaseValueObject):
         return str(self.value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SolutionDescriptionValueObject(BaseValueObject):
     value: str
 
@@ -151,7 +151,7 @@ class SolutionDescriptionValueObject(BaseValueObject):
         return str(self.value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SolutionSubtitleValueObject(BaseValueObject):
     value: str
 
@@ -163,7 +163,7 @@ class SolutionSubtitleValueObject(BaseValueObject):
         return str(self.value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SolutionSubdescriptionValueObject(BaseValueObject):
     value: str
 
@@ -175,7 +175,7 @@ class SolutionSubdescriptionValueObject(BaseValueObject):
         return str(self.value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SolutionImageUrlValueObject(BaseValueObject):
     value: str
 
@@ -190,7 +190,7 @@ class SolutionImageUrlValueObject(BaseValueObject):
         return str(self.value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VideoUrlValueObject(BaseValueObject):
     value: str | None
 
@@ -206,7 +206,7 @@ class VideoUrlValueObject(BaseValueObject):
         return self.value if self.value else None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DescriptionValueObject(BaseValueObject):
     value: str
 
@@ -218,7 +218,7 @@ class DescriptionValueObject(BaseValueObject):
         return str(self.value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReviewTitleValueObject(BaseValueObject):
     value: str | None
 
@@ -229,7 +229,7 @@ class ReviewTitleValueObject(BaseValueObject):
         return self.value if self.value else None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReviewTextValueObject(BaseValueObject):
     value: str | None
 
@@ -240,7 +240,7 @@ class ReviewTextValueObject(BaseValueObject):
         return self.value if self.value else None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReviewNameValueObject(BaseValueObject):
     value: str | None
 
@@ -251,7 +251,7 @@ class ReviewNameValueObject(BaseValueObject):
         return self.value if self.value else None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReviewImageUrlValueObject(BaseValueObject):
     value: str | None
 
@@ -263,7 +263,7 @@ class ReviewImageUrlValueObject(BaseValueObject):
         return self.value if self.value else None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReviewRoleValueObject(BaseValueObject):
     value: str | None
 
@@ -7,10 +7,12 @@ from domain.products.entities.important_characteristics import (
 )
 from domain.products.entities.products import ProductEntity
 from domain.products.entities.simple_descriptions import SimpleDescriptionEntity
+from domain.products.entities.summaries import ProductSummaryEntity
 
 
 __all__ = [
     "ProductEntity",
+    "ProductSummaryEntity",
     "ImportantCharacteristicEntity",
     "ImportantCharacteristicUnit",
     "AdvantageEntity",
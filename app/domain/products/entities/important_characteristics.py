@@ -1,12 +1,12 @@
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ImportantCharacteristicUnit:
     text: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ImportantCharacteristicEntity:
     value: str
     unit: ImportantCharacteristicUnit | None = None
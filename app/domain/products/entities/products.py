@@ -20,7 +20,7 @@ from domain.products.value_objects import (
 )
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class ProductEntity(BaseEntity):
     category: CategoryValueObject
     name: NameValueObject
@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+
+from domain.base.entity import BaseEntity
+from domain.products.value_objects import (
+    CategoryValueObject,
+    NameValueObject,
+    PreviewImageAltValueObject,
+    PreviewImageUrlValueObject,
+    SlugValueObject,
+)
+
+
+@dataclass(eq=False, slots=True)
+class ProductSummaryEntity(BaseEntity):
+    category: CategoryValueObject
+    name: NameValueObject
+    slug: SlugValueObject
+    preview_image_url: PreviewImageUrlValueObject
+    preview_image_alt: PreviewImageAltValueObject | None = None
+    order: int = 0
+    is_shown: bool = True
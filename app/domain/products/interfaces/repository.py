@@ -5,7 +5,10 @@ from abc import (
 from collections.abc import AsyncIterable
 from uuid import UUID
 
-from domain.products.entities import ProductEntity
+from domain.products.entities import (
+    ProductEntity,
+    ProductSummaryEntity,
+)
 
 
 class BaseProductRepository(ABC):
@@ -13,10 +16,10 @@ class BaseProductRepository(ABC):
     async def add(self, product: ProductEntity) -> ProductEntity: ...
 
     @abstractmethod
-    async def get_by_id(self, product_id: UUID) -> ProductEntity | None: ...
+    async def get_by_id(self, product_id: UUID, fields: frozenset[str] | None = None) -> ProductEntity | None: ...
 
     @abstractmethod
-    async def get_by_slug(self, slug: str) -> ProductEntity | None: ...
+    async def get_by_slug(self, slug: str, fields: frozenset[str] | None = None) -> ProductEntity | None: ...
 
     @abstractmethod
     async def update(self, product: ProductEntity) -> None: ...
@@ -33,12 +36,25 @@ class BaseProductRepository(ABC):
         sort_field: str,
         sort_order: int,
         offset: int,
-        limit: int,
+        limit: int | None,
         search: str | None = None,
         category: str | None = None,
         is_shown: bool | None = None,
+        fields: frozenset[str] | None = None,
     ) -> AsyncIterable[ProductEntity]: ...
 
+    @abstractmethod
+    async def find_many_summaries(
+        self,
+        sort_field: str,
+        sort_order: int,
+        offset: int,
+        limit: int,
+        search: str | None = None,
+        category: str | None = None,
+        is_shown: bool | None = None,
+    ) -> AsyncIterable[ProductSummaryEntity]: ...
+
     @abstractmethod
     async def count_many(
         self,
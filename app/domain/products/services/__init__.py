@@ -1,4 +1,5 @@
+from domain.products.services.cache import ProductSlugCache
 from domain.products.services.products import ProductService
 
 
-__all__ = ["ProductService"]
+__all__ = ["ProductService", "ProductSlugCache"]
@@ -0,0 +1,6 @@
+from domain.base.cache import SlugCache
+from domain.products.entities import ProductEntity
+
+
+class ProductSlugCache(SlugCache[ProductEntity]):
+    """Кэш страниц продуктов по slug, общий для всех экземпляров ProductService процесса."""
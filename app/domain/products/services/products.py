@@ -1,19 +1,27 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import (
+    AsyncIterable,
+    Optional,
+)
 from uuid import UUID
 
-from domain.products.entities import ProductEntity
+from domain.products.entities import (
+    ProductEntity,
+    ProductSummaryEntity,
+)
 from domain.products.exceptions import (
     ProductAlreadyExistsException,
     ProductNotFoundBySlugException,
     ProductNotFoundException,
 )
 from domain.products.interfaces.repository import BaseProductRepository
+from domain.products.services.cache import ProductSlugCache
 
 
 @dataclass
 class ProductService:
     product_repository: BaseProductRepository
+    slug_cache: ProductSlugCache
 
     async def create(
         self,
@@ -26,14 +34,17 @@ class ProductService:
             raise ProductAlreadyExistsException(slug=slug)
 
         await self.product_repository.add(product)
+        # Slug мог быть закэширован как несуществующий
+        self.slug_cache.invalidate(slug)
 
         return product
 
     async def get_by_id(
         self,
         product_id: UUID,
+        fields: Optional[frozenset[str]] = None,
     ) -> ProductEntity:
-        product = await self.product_repository.get_by_id(product_id)
+        product = await self.product_repository.get_by_id(product_id, fields)
 
         if not product:
             raise ProductNotFoundException(product_id=product_id)
@@ -43,8 +54,13 @@ class ProductService:
     async def get_by_slug(
         self,
         slug: str,
+        fields: Optional[frozenset[str]] = None,
     ) -> ProductEntity:
-        product = await self.product_repository.get_by_slug(slug)
+        product = await self.slug_cache.get(
+            slug,
+            fields,
+            loader=lambda: self.product_repository.get_by_slug(slug, fields),
+        )
 
         if not product:
             raise ProductNotFoundBySlugException(slug=slug)
@@ -70,6 +86,7 @@ class ProductService:
                 raise ProductAlreadyExistsException(slug=new_slug)
 
         await self.product_repository.update(product)
+        self.slug_cache.invalidate(current_slug, new_slug)
 
         return product
 
@@ -82,14 +99,16 @@ class ProductService:
         await self.product_repository.update_order(product_id, order)
         updated = await self.product_repository.get_by_id(product_id)
         assert updated is not None
+        self.slug_cache.invalidate(updated.slug.as_generic_type())
         return updated
 
     async def delete(
         self,
         product_id: UUID,
     ) -> None:
-        await self.check_exists(product_id)
+        product = await self.get_by_id(product_id)
         await self.product_repository.delete(product_id)
+        self.slug_cache.invalidate(product.slug.as_generic_type())
 
     async def find_many(
         self,
@@ -100,6 +119,7 @@ class ProductService:
         search: Optional[str] = None,
         category: Optional[str] = None,
         is_shown: Optional[bool] = None,
+        fields: Optional[frozenset[str]] = None,
     ) -> list[ProductEntity]:
         products_iterable = self.product_repository.find_many(
             sort_field=sort_field,
@@ -109,9 +129,57 @@ class ProductService:
             search=search,
             category=category,
             is_shown=is_shown,
+            fields=fields,
         )
         return [product async for product in products_iterable]
 
+    def stream_many(
+        self,
+        sort_field: str,
+        sort_order: int,
+        offset: int,
+        limit: Optional[int] = None,
+        search: Optional[str] = None,
+        category: Optional[str] = None,
+        is_shown: Optional[bool] = None,
+        fields: Optional[frozenset[str]] = None,
+    ) -> AsyncIterable[ProductEntity]:
+        """Ленивый вариант find_many: отдает продукты по мере чтения курсора, не собирая список.
+
+        Без limit отдается весь список начиная с offset.
+        """
+        return self.product_repository.find_many(
+            sort_field=sort_field,
+            sort_order=sort_order,
+            offset=offset,
+            limit=limit,
+            search=search,
+            category=category,
+            is_shown=is_shown,
+            fields=fields,
+        )
+
+    async def find_many_summaries(
+        self,
+        sort_field: str,
+        sort_order: int,
+        offset: int,
+        limit: int,
+        search: Optional[str] = None,
+        category: Optional[str] = None,
+        is_shown: Optional[bool] = None,
+    ) -> list[ProductSummaryEntity]:
+        summaries_iterable = self.product_repository.find_many_summaries(
+            sort_field=sort_field,
+            sort_order=sort_order,
+            offset=offset,
+            limit=limit,
+            search=search,
+            category=category,
+            is_shown=is_shown,
+        )
+        return [summary async for summary in summaries_iterable]
+
     async def count_many(
         self,
         search: Optional[str] = None,
@@ -124,6 +192,24 @@ class ProductService:
             is_shown=is_shown,
         )
 
+    async def warm_slug_cache(
+        self,
+        limit: int,
+    ) -> int:
+        """Заполняет кэш slug последними опубликованными продуктами; возвращает их количество."""
+        products = await self.find_many(
+            sort_field="created_at",
+            sort_order=-1,
+            offset=0,
+            limit=limit,
+            is_shown=True,
+        )
+
+        for product in products:
+            self.slug_cache.prime(product.slug.as_generic_type(), None, product)
+
+        return len(products)
+
     async def check_exists(
         self,
         product_id: UUID,
@@ -24,7 +24,7 @@ VALID_CATEGORIES = {
 }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NameValueObject(BaseValueObject):
     value: str
 
@@ -42,7 +42,7 @@ class NameValueObject(BaseValueObject):
         return str(self.value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SlugValueObject(BaseValueObject):
     value: str
 
@@ -61,7 +61,7 @@ class SlugValueObject(BaseValueObject):
         return str(self.value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DescriptionValueObject(BaseValueObject):
     value: str
 
@@ -73,7 +73,7 @@ class DescriptionValueObject(BaseValueObject):
         return str(self.value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CategoryValueObject(BaseValueObject):
     value: str
 
@@ -85,7 +85,7 @@ class CategoryValueObject(BaseValueObject):
         return str(self.value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PreviewImageUrlValueObject(BaseValueObject):
     value: str
 
@@ -99,7 +99,7 @@ class PreviewImageUrlValueObject(BaseValueObject):
         return str(self.value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PreviewImageAltValueObject(BaseValueObject):
     value: str | None
 
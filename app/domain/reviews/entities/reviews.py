@@ -12,7 +12,7 @@ from domain.reviews.value_objects.reviews import (
 )
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class ReviewEntity(BaseEntity):
     name: ReviewNameValueObject
     category: ReviewCategoryValueObject
@@ -14,7 +14,7 @@ VALID_REVIEW_CATEGORIES = {
 }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReviewCategoryValueObject(BaseValueObject):
     value: str
 
@@ -26,7 +26,7 @@ class ReviewCategoryValueObject(BaseValueObject):
         return str(self.value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReviewNameValueObject(BaseValueObject):
     value: str
 
@@ -38,7 +38,7 @@ class ReviewNameValueObject(BaseValueObject):
         return str(self.value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReviewPositionValueObject(BaseValueObject):
     value: Optional[str]
 
@@ -49,7 +49,7 @@ class ReviewPositionValueObject(BaseValueObject):
         return self.value
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReviewImageValueObject(BaseValueObject):
     value: Optional[str]
 
@@ -60,7 +60,7 @@ class ReviewImageValueObject(BaseValueObject):
         return self.value
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReviewTextValueObject(BaseValueObject):
     value: Optional[str]
 
@@ -71,7 +71,7 @@ class ReviewTextValueObject(BaseValueObject):
         return self.value
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReviewShortTextValueObject(BaseValueObject):
     value: Optional[str]
 
@@ -82,7 +82,7 @@ class ReviewShortTextValueObject(BaseValueObject):
         return self.value
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReviewContentUrlValueObject(BaseValueObject):
     value: Optional[str]
 
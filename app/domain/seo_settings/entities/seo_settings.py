@@ -15,7 +15,7 @@ from domain.seo_settings.value_objects import (
 )
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class SeoSettingsEntity(BaseEntity):
     page_path: PagePathValueObject
     page_name: PageNameValueObject
@@ -41,3 +41,10 @@ class BaseSeoSettingsRepository(ABC):
         search: str | None = None,
         is_active: bool | None = None,
     ) -> int: ...
+
+    @abstractmethod
+    async def find_all(self) -> AsyncIterable[SeoSettingsEntity]: ...
+
+    @abstractmethod
+    async def get_version(self) -> str:
+        """Отпечаток содержимого коллекции: меняется при любом добавлении, изменении или удалении."""
@@ -1,6 +1,12 @@
 from domain.seo_settings.services.seo_settings import SeoSettingsService
+from domain.seo_settings.services.snapshot import (
+    SeoSettingsPathIndex,
+    SeoSettingsSnapshot,
+)
 
 
 __all__ = [
+    "SeoSettingsPathIndex",
     "SeoSettingsService",
+    "SeoSettingsSnapshot",
 ]
@@ -1,3 +1,4 @@
+import logging
 from dataclasses import dataclass
 from typing import Optional
 from uuid import UUID
@@ -9,11 +10,19 @@ from domain.seo_settings.exceptions import (
     SeoSettingsNotFoundException,
 )
 from domain.seo_settings.interfaces.repository import BaseSeoSettingsRepository
+from domain.seo_settings.services.snapshot import (
+    SeoSettingsPathIndex,
+    SeoSettingsSnapshot,
+)
+
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
 class SeoSettingsService:
     seo_settings_repository: BaseSeoSettingsRepository
+    snapshot: SeoSettingsSnapshot
 
     async def create(
         self,
@@ -26,6 +35,7 @@ class SeoSettingsService:
             raise SeoSettingsAlreadyExistsException(page_path=page_path)
 
         await self.seo_settings_repository.add(seo_settings)
+        await self._refresh_snapshot_after_write()
 
         return seo_settings
 
@@ -44,13 +54,31 @@ class SeoSettingsService:
         self,
         page_path: str,
     ) -> SeoSettingsEntity:
-        seo_settings = await self.seo_settings_repository.get_by_path(page_path)
+        """Настройки страницы из снимка в памяти, с откатом на ближайший wildcard-префикс ("/products/*")."""
+        index = await self.snapshot.get_index(self.seo_settings_repository)
+        seo_settings = index.lookup(page_path)
 
         if not seo_settings:
             raise SeoSettingsNotFoundByPathException(page_path=page_path)
 
         return seo_settings
 
+    async def refresh_snapshot(self) -> None:
+        await self.snapshot.refresh(self.seo_settings_repository)
+
+    async def _refresh_snapshot_after_write(self) -> None:
+        try:
+            await self.snapshot.refresh(self.seo_settings_repository)
+        except Exception:
+            # Запись уже сохранена, отвечать ошибкой поздно: сбрасываем снимок, его перечитает следующее чтение
+            logger.exception("Failed to refresh SEO settings snapshot after write")
+            self.snapshot.index = None
+
+    async def get_path_index(self) -> tuple[SeoSettingsPathIndex, str]:
+        """Индекс настроек из снимка вместе с версией, по которой он построен."""
+        index = await self.snapshot.get_index(self.seo_settings_repository)
+        return index, self.snapshot.version
+
     async def update(
         self,
         seo_settings: SeoSettingsEntity,
@@ -70,6 +98,7 @@ class SeoSettingsService:
                 raise SeoSettingsAlreadyExistsException(page_path=new_path)
 
         await self.seo_settings_repository.update(seo_settings)
+        await self._refresh_snapshot_after_write()
 
         return seo_settings
 
@@ -79,6 +108,7 @@ class SeoSettingsService:
     ) -> None:
         await self.check_exists(seo_settings_id)
         await self.seo_settings_repository.delete(seo_settings_id)
+        await self._refresh_snapshot_after_write()
 
     async def check_exists(
         self,
@@ -0,0 +1,144 @@
+import asyncio
+import logging
+import time
+from dataclasses import (
+    dataclass,
+    field,
+)
+from typing import Optional
+
+from domain.seo_settings.entities import SeoSettingsEntity
+from domain.seo_settings.interfaces.repository import BaseSeoSettingsRepository
+
+
+logger = logging.getLogger(__name__)
+
+# Настройка вида "/products/*" служит дефолтом для всех страниц под "/products/"
+WILDCARD_SEGMENT = "*"
+
+
+def normalize_page_path(page_path: str) -> str:
+    """Приводит путь к виду, в котором он хранится: с ведущим слэшем, без хвостового, без query и fragment."""
+    path = page_path.strip().split("?", 1)[0].split("#", 1)[0]
+    segments = [segment for segment in path.split("/") if segment]
+    return "/" + "/".join(segments)
+
+
+def _path_segments(page_path: str) -> list[str]:
+    return [segment for segment in page_path.split("/") if segment]
+
+
+@dataclass(slots=True)
+class _TrieNode:
+    children: dict[str, "_TrieNode"] = field(default_factory=dict)
+    default: Optional[SeoSettingsEntity] = None
+
+
+@dataclass
+class SeoSettingsPathIndex:
+    """Индекс SEO настроек: точные пути в словаре, wildcard-дефолты в префиксном дереве по сегментам пути."""
+
+    exact: dict[str, SeoSettingsEntity] = field(default_factory=dict)
+    root: _TrieNode = field(default_factory=_TrieNode)
+
+    @classmethod
+    def build(cls, seo_settings: list[SeoSettingsEntity]) -> "SeoSettingsPathIndex":
+        index = cls()
+
+        for settings in seo_settings:
+            page_path = normalize_page_path(settings.page_path.as_generic_type())
+            segments = _path_segments(page_path)
+
+            if segments and segments[-1] == WILDCARD_SEGMENT:
+                node = index.root
+
+                for segment in segments[:-1]:
+                    node = node.children.setdefault(segment, _TrieNode())
+
+                node.default = settings
+            else:
+                index.exact[page_path] = settings
+
+        return index
+
+    def lookup(self, page_path: str) -> Optional[SeoSettingsEntity]:
+        page_path = normalize_page_path(page_path)
+        settings = self.exact.get(page_path)
+
+        if settings is not None:
+            return settings
+
+        # Самый длинный префикс с wildcard-настройкой; "/a/*" покрывает только пути глубже "/a"
+        node = self.root
+        best = None
+
+        for segment in _path_segments(page_path):
+            if node.default is not None:
+                best = node.default
+
+            node = node.children.get(segment)
+
+            if node is None:
+                break
+
+        return best
+
+
+@dataclass
+class SeoSettingsSnapshot:
+    """Снимок коллекции seo_settings в памяти процесса.
+
+    Коллекция маленькая и меняется редко, поэтому чтение по пути целиком
+    обслуживается из памяти. Снимок перечитывается после каждой команды
+    этого процесса, а изменения из других воркеров подхватываются фоновой
+    сверкой версии коллекции не чаще раза в version_check_interval секунд:
+    сам запрос при этом отдается из текущего снимка без ожидания Mongo.
+    """
+
+    version_check_interval: float = 5.0
+    index: Optional[SeoSettingsPathIndex] = None
+    version: Optional[str] = None
+    checked_at: float = 0.0
+    _lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False, repr=False)
+    _background_check: Optional[asyncio.Task] = field(default=None, init=False, repr=False)
+
+    async def get_index(self, repository: BaseSeoSettingsRepository) -> SeoSettingsPathIndex:
+        if self.index is None:
+            await self.refresh(repository)
+        elif time.monotonic() - self.checked_at >= self.version_check_interval:
+            self._schedule_version_check(repository)
+
+        return self.index
+
+    async def refresh(self, repository: BaseSeoSettingsRepository) -> None:
+        async with self._lock:
+            version = await repository.get_version()
+
+            # Пока ждали блокировку, снимок этой версии мог построить другой запрос
+            if self.index is not None and version == self.version:
+                self.checked_at = time.monotonic()
+                return
+
+            seo_settings = [settings async for settings in repository.find_all()]
+
+            self.index = SeoSettingsPathIndex.build(seo_settings)
+            self.version = version
+            self.checked_at = time.monotonic()
+
+    async def refresh_if_changed(self, repository: BaseSeoSettingsRepository) -> None:
+        try:
+            version = await repository.get_version()
+            self.checked_at = time.monotonic()
+
+            if version != self.version:
+                await self.refresh(repository)
+        except Exception:
+            # Фоновая сверка не должна ронять запросы: до следующей попытки живем со старым снимком
+            logger.exception("Failed to refresh SEO settings snapshot")
+
+    def _schedule_version_check(self, repository: BaseSeoSettingsRepository) -> None:
+        if self._background_check is not None and not self._background_check.done():
+            return
+
+        self.checked_at = time.monotonic()
+        self._background_check = asyncio.create_task(self.refresh_if_changed(repository))
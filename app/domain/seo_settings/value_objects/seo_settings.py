@@ -12,7 +12,7 @@ from domain.seo_settings.exceptions import (
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PagePathValueObject(BaseValueObject):
     value: str
 
@@ -28,7 +28,7 @@ class PagePathValueObject(BaseValueObject):
         return str(self.value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PageNameValueObject(BaseValueObject):
     value: str
 
@@ -40,7 +40,7 @@ class PageNameValueObject(BaseValueObject):
         return str(self.value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TitleValueObject(BaseValueObject):
     value: str
 
@@ -52,7 +52,7 @@ class TitleValueObject(BaseValueObject):
         return str(self.value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DescriptionValueObject(BaseValueObject):
     value: str
 
@@ -63,7 +63,7 @@ class DescriptionValueObject(BaseValueObject):
         return str(self.value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class KeywordsValueObject(BaseValueObject):
     value: Optional[str]
 
@@ -74,7 +74,7 @@ class KeywordsValueObject(BaseValueObject):
         return self.value
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OgTitleValueObject(BaseValueObject):
     value: Optional[str]
 
@@ -85,7 +85,7 @@ class OgTitleValueObject(BaseValueObject):
         return self.value
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OgDescriptionValueObject(BaseValueObject):
     value: Optional[str]
 
@@ -96,7 +96,7 @@ class OgDescriptionValueObject(BaseValueObject):
         return self.value
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OgImageValueObject(BaseValueObject):
     value: Optional[str]
 
@@ -108,7 +108,7 @@ class OgImageValueObject(BaseValueObject):
         return self.value
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CanonicalUrlValueObject(BaseValueObject):
     value: Optional[str]
 
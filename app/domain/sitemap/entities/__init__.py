@@ -0,0 +1,4 @@
+from domain.sitemap.entities.sitemap import SitemapEntryEntity
+
+
+__all__ = ["SitemapEntryEntity"]
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from domain.base.entity import BaseEntity
+
+
+@dataclass(eq=False, slots=True)
+class SitemapEntryEntity(BaseEntity):
+    """Публичная страница сущности в материализованной карте сайта.
+
+    oid совпадает с oid исходной сущности (продукта, новости, портфолио),
+    поэтому запись обновляется и удаляется по тому же идентификатору.
+    """
+
+    source: str
+    page_path: str
+    lastmod: datetime
@@ -0,0 +1,4 @@
+from domain.sitemap.interfaces.repository import BaseSitemapRepository
+
+
+__all__ = ["BaseSitemapRepository"]
@@ -0,0 +1,26 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from collections.abc import AsyncIterable
+from uuid import UUID
+
+from domain.sitemap.entities import SitemapEntryEntity
+
+
+class BaseSitemapRepository(ABC):
+    @abstractmethod
+    async def upsert(self, entry: SitemapEntryEntity) -> None: ...
+
+    @abstractmethod
+    async def delete(self, entry_id: UUID) -> None: ...
+
+    @abstractmethod
+    async def replace_all(self, entries: list[SitemapEntryEntity]) -> None: ...
+
+    @abstractmethod
+    async def find_all(self) -> AsyncIterable[SitemapEntryEntity]: ...
+
+    @abstractmethod
+    async def get_version(self) -> str:
+        """Отпечаток состояния коллекции: меняется при любой записи или удалении."""
@@ -0,0 +1,4 @@
+from domain.sitemap.services.sitemap import SitemapService
+
+
+__all__ = ["SitemapService"]
@@ -0,0 +1,36 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from domain.sitemap.entities import SitemapEntryEntity
+from domain.sitemap.interfaces.repository import BaseSitemapRepository
+
+
+@dataclass
+class SitemapService:
+    sitemap_repository: BaseSitemapRepository
+
+    async def upsert(
+        self,
+        entry: SitemapEntryEntity,
+    ) -> None:
+        await self.sitemap_repository.upsert(entry)
+
+    async def remove(
+        self,
+        entry_id: UUID,
+    ) -> None:
+        await self.sitemap_repository.delete(entry_id)
+
+    async def replace_all(
+        self,
+        entries: list[SitemapEntryEntity],
+    ) -> None:
+        await self.sitemap_repository.replace_all(entries)
+
+    async def find_all(self) -> list[SitemapEntryEntity]:
+        entries = [entry async for entry in self.sitemap_repository.find_all()]
+        entries.sort(key=lambda entry: entry.page_path)
+        return entries
+
+    async def get_version(self) -> str:
+        return await self.sitemap_repository.get_version()
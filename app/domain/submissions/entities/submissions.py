@@ -13,7 +13,7 @@ from domain.submissions.value_objects import (
 )
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class SubmissionEntity(BaseEntity):
     form_type: FormTypeValueObject
     name: NameValueObject
@@ -3,6 +3,7 @@ from abc import (
     abstractmethod,
 )
 from collections.abc import AsyncIterable
+from datetime import datetime
 from uuid import UUID
 
 from domain.submissions.entities import SubmissionEntity
@@ -24,9 +25,17 @@ class BaseSubmissionRepository(ABC):
         sort_field: str,
         sort_order: int,
         offset: int,
-        limit: int,
+        limit: int | None,
         form_type: str | None = None,
     ) -> AsyncIterable[SubmissionEntity]: ...
 
     @abstractmethod
     async def count_many(self, form_type: str | None = None) -> int: ...
+
+    @abstractmethod
+    async def export_many(
+        self,
+        form_type: str | None = None,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+    ) -> AsyncIterable[SubmissionEntity]: ...
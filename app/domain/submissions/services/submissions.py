@@ -1,5 +1,9 @@
 from dataclasses import dataclass
-from typing import Optional
+from datetime import datetime
+from typing import (
+    AsyncIterable,
+    Optional,
+)
 from uuid import UUID
 
 from domain.submissions.entities import SubmissionEntity
@@ -53,8 +57,41 @@ class SubmissionService:
         )
         return [submission async for submission in submissions_iterable]
 
+    def stream_many(
+        self,
+        sort_field: str,
+        sort_order: int,
+        offset: int,
+        limit: Optional[int] = None,
+        form_type: Optional[str] = None,
+    ) -> AsyncIterable[SubmissionEntity]:
+        """Ленивый вариант find_many: отдает заявки по мере чтения курсора, не собирая список.
+
+        Без limit отдается весь список начиная с offset.
+        """
+        return self.submission_repository.find_many(
+            sort_field=sort_field,
+            sort_order=sort_order,
+            offset=offset,
+            limit=limit,
+            form_type=form_type,
+        )
+
     async def count_many(
         self,
         form_type: Optional[str] = None,
     ) -> int:
         return await self.submission_repository.count_many(form_type=form_type)
+
+    def export(
+        self,
+        form_type: Optional[str] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+    ) -> AsyncIterable[SubmissionEntity]:
+        """Все заявки за период в хронологическом порядке, без пагинации."""
+        return self.submission_repository.export_many(
+            form_type=form_type,
+            created_from=created_from,
+            created_to=created_to,
+        )
@@ -12,7 +12,7 @@ from domain.submissions.exceptions import (
 VALID_FORM_TYPES = {"Опросный лист", "Отклик на вакансию", "Обращение"}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FormTypeValueObject(BaseValueObject):
     value: str
 
@@ -24,7 +24,7 @@ class FormTypeValueObject(BaseValueObject):
         return str(self.value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NameValueObject(BaseValueObject):
     value: str
 
@@ -36,7 +36,7 @@ class NameValueObject(BaseValueObject):
         return str(self.value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EmailValueObject(BaseValueObject):
     value: str | None
 
@@ -50,7 +50,7 @@ class EmailValueObject(BaseValueObject):
         return self.value if self.value else None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PhoneValueObject(BaseValueObject):
     value: str | None
 
@@ -61,7 +61,7 @@ class PhoneValueObject(BaseValueObject):
         return self.value if self.value else None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CommentsValueObject(BaseValueObject):
     value: str | None
 
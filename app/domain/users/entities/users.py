@@ -7,7 +7,7 @@ from domain.users.value_objects import (
 )
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class UserEntity(BaseEntity):
     email: EmailValueObject
     hashed_password: str
@@ -14,7 +14,7 @@ MIN_USER_NAME_LENGTH = 3
 MAX_USER_NAME_LENGTH = 255
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EmailValueObject(BaseValueObject):
     value: str
 
@@ -30,7 +30,7 @@ class EmailValueObject(BaseValueObject):
         return str(self.value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UserNameValueObject(BaseValueObject):
     value: str
 
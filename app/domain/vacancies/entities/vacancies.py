@@ -10,7 +10,7 @@ from domain.vacancies.value_objects import (
 )
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class VacancyEntity(BaseEntity):
     title: TitleValueObject
     requirements: RequirementsValueObject
@@ -17,7 +17,7 @@ MAX_TITLE_LENGTH = 255
 MIN_SALARY = 0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CategoryValueObject(BaseValueObject):
     value: str
 
@@ -29,7 +29,7 @@ class CategoryValueObject(BaseValueObject):
         return str(self.value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TitleValueObject(BaseValueObject):
     value: str
 
@@ -47,7 +47,7 @@ class TitleValueObject(BaseValueObject):
         return str(self.value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RequirementsValueObject(BaseValueObject):
     value: list[str]
 
@@ -59,7 +59,7 @@ class RequirementsValueObject(BaseValueObject):
         return list(self.value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExperienceValueObject(BaseValueObject):
     value: list[str]
 
@@ -71,7 +71,7 @@ class ExperienceValueObject(BaseValueObject):
         return list(self.value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SalaryValueObject(BaseValueObject):
     value: int
 
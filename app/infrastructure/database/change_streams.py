@@ -0,0 +1,238 @@
+"""Отслеживание изменений коллекций через change streams для сброса кэшей процесса.
+
+Один поток на базу с фильтром по коллекциям вместо потока на каждую
+коллекцию: одно соединение и один resume token. Change streams доступны
+только на replica set (в том числе из одного узла, см. make storages-replica).
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import (
+    dataclass,
+    field,
+)
+from datetime import (
+    datetime,
+    timezone,
+)
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Optional,
+)
+from uuid import UUID
+
+from pymongo.errors import (
+    OperationFailure,
+    PyMongoError,
+)
+
+from infrastructure.database.gateways.mongo import MongoDatabase
+
+
+logger = logging.getLogger(__name__)
+
+WATCHED_COLLECTIONS = (
+    "products",
+    "news",
+    "portfolio",
+    "seo_settings",
+    "certificates",
+    "certificate_groups",
+)
+
+RESUME_TOKENS_COLLECTION = "change_stream_tokens"
+
+# ChangeStreamHistoryLost, ChangeStreamFatalError: продолжить с сохраненного токена нельзя
+_HISTORY_LOST_CODES = frozenset({280, 286})
+
+# События по одному документу; остальные (drop, rename, invalidate) сбрасывают кэши коллекции целиком
+_DOCUMENT_OPERATIONS = frozenset({"insert", "update", "replace", "delete"})
+
+
+@dataclass(frozen=True)
+class ChangeEvent:
+    """Изменение коллекции; без oid и slugs документ неизвестен."""
+
+    collection_name: str
+    operation: str
+    oid: Optional[UUID] = None
+    slugs: frozenset[str] = frozenset()
+
+
+def _as_uuid(value: Any) -> Optional[UUID]:
+    if isinstance(value, UUID):
+        return value
+
+    try:
+        return UUID(str(value))
+    except ValueError:
+        return None
+
+
+def change_events_from_document(
+    change: dict,
+    collections: tuple[str, ...] = WATCHED_COLLECTIONS,
+) -> list[ChangeEvent]:
+    """События сброса по документу change stream.
+
+    oid и slug берутся из документа после изменения (updateLookup) и из
+    pre-image до изменения: так сбрасывается и старый slug при переименовании.
+    """
+    operation = change.get("operationType", "")
+    collection_name = change.get("ns", {}).get("coll")
+
+    if collection_name is None:
+        # dropDatabase и invalidate на уровне базы касаются всех коллекций
+        return [ChangeEvent(collection_name=name, operation=operation) for name in collections]
+
+    if operation not in _DOCUMENT_OPERATIONS:
+        return [ChangeEvent(collection_name=collection_name, operation=operation)]
+
+    documents = [
+        document for document in (change.get("fullDocument"), change.get("fullDocumentBeforeChange")) if document
+    ]
+    oid = next((_as_uuid(document["oid"]) for document in documents if document.get("oid") is not None), None)
+
+    return [
+        ChangeEvent(
+            collection_name=collection_name,
+            operation=operation,
+            oid=oid,
+            slugs=frozenset(document["slug"] for document in documents if document.get("slug")),
+        ),
+    ]
+
+
+@dataclass
+class ChangeStreamWatcher:
+    """Фоновая задача процесса, читающая change stream и публикующая события сброса кэшей.
+
+    Resume token сохраняется в коллекцию change_stream_tokens не чаще раза
+    в token_save_interval секунд и при остановке, поэтому после рестарта или
+    обрыва соединения чтение продолжается с места остановки. Если история
+    уже вытеснена из oplog, кэши отслеживаемых коллекций сбрасываются целиком.
+    """
+
+    mongo_database: MongoDatabase
+    publish: Callable[[ChangeEvent], Awaitable[None]]
+    collections: tuple[str, ...] = WATCHED_COLLECTIONS
+    name: str = "cache_invalidation"
+    retry_delay: float = 5.0
+    token_save_interval: float = 5.0
+    max_await_time_ms: int = 1_000
+    resume_token: Optional[dict] = field(default=None, init=False)
+    _saved_token: Optional[dict] = field(default=None, init=False, repr=False)
+    _token_saved_at: float = field(default=0.0, init=False, repr=False)
+    _task: Optional[asyncio.Task] = field(default=None, init=False, repr=False)
+
+    async def start(self) -> None:
+        await self._enable_pre_images()
+        self.resume_token = self._saved_token = await self._load_resume_token()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+            self._task = None
+
+        await self._save_resume_token()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._watch()
+            except OperationFailure as error:
+                if error.code not in _HISTORY_LOST_CODES:
+                    logger.exception("Change stream failed, retrying in %ss", self.retry_delay)
+                    await asyncio.sleep(self.retry_delay)
+                    continue
+
+                # Пропущенные события не восстановить: начинаем заново и сбрасываем кэши целиком
+                logger.warning("Change stream history lost, resetting caches of %s", ", ".join(self.collections))
+                self.resume_token = None
+                await self._publish_all("historyLost")
+            except PyMongoError:
+                logger.exception("Change stream failed, retrying in %ss", self.retry_delay)
+                await asyncio.sleep(self.retry_delay)
+
+    async def _watch(self) -> None:
+        pipeline = [{"$match": {"ns.coll": {"$in": list(self.collections)}}}]
+
+        async with self.mongo_database.connection.watch(
+            pipeline,
+            full_document="updateLookup",
+            full_document_before_change="whenAvailable",
+            resume_after=self.resume_token,
+            max_await_time_ms=self.max_await_time_ms,
+        ) as stream:
+            while stream.alive:
+                change = await stream.try_next()
+
+                if change is not None:
+                    await self._handle_change(change)
+
+                # Токен двигается и по пустым батчам, поэтому после простоя не приходится перечитывать oplog
+                self.resume_token = stream.resume_token
+
+                if change is not None and change.get("operationType") == "invalidate":
+                    # После invalidate поток закрыт, продолжать с его токена нельзя
+                    self.resume_token = None
+
+                if time.monotonic() - self._token_saved_at >= self.token_save_interval:
+                    await self._save_resume_token()
+
+    async def _handle_change(self, change: dict) -> None:
+        for event in change_events_from_document(change, self.collections):
+            try:
+                await self.publish(event)
+            except Exception:
+                # Ошибка одного подписчика не должна останавливать поток
+                logger.exception("Failed to publish %s event for %s", event.operation, event.collection_name)
+
+    async def _publish_all(self, operation: str) -> None:
+        for collection_name in self.collections:
+            await self._handle_change({"operationType": operation, "ns": {"coll": collection_name}})
+
+    async def _enable_pre_images(self) -> None:
+        """Включает pre-images (MongoDB 6.0+), чтобы удаление и смена slug сбрасывали точные ключи.
+
+        Без них удаление не несет oid и slug, и кэш коллекции сбрасывается целиком.
+        """
+        for collection_name in self.collections:
+            try:
+                await self.mongo_database.connection.command(
+                    "collMod",
+                    collection_name,
+                    changeStreamPreAndPostImages={"enabled": True},
+                )
+            except OperationFailure as error:
+                logger.info("Change stream pre-images are not enabled for %s: %s", collection_name, error)
+
+    async def _load_resume_token(self) -> Optional[dict]:
+        document = await self.mongo_database.connection[RESUME_TOKENS_COLLECTION].find_one({"_id": self.name})
+        return document["token"] if document else None
+
+    async def _save_resume_token(self) -> None:
+        self._token_saved_at = time.monotonic()
+
+        if self.resume_token is None or self.resume_token == self._saved_token:
+            return
+
+        try:
+            await self.mongo_database.connection[RESUME_TOKENS_COLLECTION].replace_one(
+                {"_id": self.name},
+                {"_id": self.name, "token": self.resume_token, "updated_at": datetime.now(timezone.utc)},
+                upsert=True,
+            )
+            self._saved_token = self.resume_token
+        except PyMongoError:
+            logger.exception("Failed to save change stream resume token")
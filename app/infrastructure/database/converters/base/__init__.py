@@ -0,0 +1,22 @@
+from infrastructure.database.converters.base.mongo import (
+    datetime_from_document,
+    datetime_to_document,
+    ENTITY_PROJECTION_FIELDS,
+    fields_projection,
+    uuid_document_query,
+    uuid_from_document,
+    uuid_to_document,
+    value_object_from_document,
+)
+
+
+__all__ = [
+    "ENTITY_PROJECTION_FIELDS",
+    "datetime_from_document",
+    "datetime_to_document",
+    "fields_projection",
+    "uuid_document_query",
+    "uuid_from_document",
+    "uuid_to_document",
+    "value_object_from_document",
+]
@@ -0,0 +1,86 @@
+from collections.abc import Iterable
+from datetime import datetime
+from typing import TypeVar
+from uuid import UUID
+
+from bson import Binary
+
+from domain.base.value_object import BaseValueObject
+
+
+def uuid_to_document(value: UUID) -> Binary:
+    return Binary.from_uuid(value)
+
+
+def uuid_from_document(value: UUID | Binary | str) -> UUID:
+    # Документы старого формата хранят UUID строкой, новые - BSON binary (subtype 4)
+    if isinstance(value, UUID):
+        return value
+    if isinstance(value, Binary):
+        return value.as_uuid()
+    return UUID(value)
+
+
+def uuid_document_query(value: UUID) -> dict:
+    # Пока миграция не завершена, ищем по обоим представлениям
+    return {"$in": [uuid_to_document(value), str(value)]}
+
+
+def datetime_to_document(value: datetime) -> datetime:
+    return value
+
+
+def datetime_from_document(value: datetime | str) -> datetime:
+    if isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
+
+
+def datetime_range_document_query(
+    field: str,
+    start: datetime | None = None,
+    end: datetime | None = None,
+) -> dict:
+    """Фильтр [start, end) по полю даты для обоих форматов хранения.
+
+    Сравнения Mongo не пересекают границы типов: $gte с датой не находит
+    ISO-строки старого формата, поэтому для них есть отдельная ветка $or.
+    Порядок ISO-строк без таймзоны совпадает с хронологическим.
+    """
+    native, legacy = {}, {}
+
+    if start is not None:
+        native["$gte"] = datetime_to_document(start)
+        legacy["$gte"] = start.isoformat()
+    if end is not None:
+        native["$lt"] = datetime_to_document(end)
+        legacy["$lt"] = end.isoformat()
+
+    if not native:
+        return {}
+
+    return {"$or": [{field: native}, {field: legacy}]}
+
+
+ValueObjectType = TypeVar("ValueObjectType", bound=BaseValueObject)
+
+
+def value_object_from_document(
+    value_object_type: type[ValueObjectType],
+    document: dict,
+    key: str,
+) -> ValueObjectType | None:
+    # Поле может отсутствовать, если документ прочитан с проекцией (sparse fieldset)
+    if key not in document:
+        return None
+    return value_object_type.from_trusted(document[key])
+
+
+# Поля BaseEntity нужны для сборки любой сущности, поэтому читаются при любой проекции
+ENTITY_PROJECTION_FIELDS = ("oid", "created_at", "updated_at")
+
+
+def fields_projection(fields: Iterable[str] | None) -> dict | None:
+    if fields is None:
+        return None
+    return {"_id": 0, **dict.fromkeys((*ENTITY_PROJECTION_FIELDS, *fields), 1)}
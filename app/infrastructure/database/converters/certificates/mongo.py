@@ -1,4 +1,3 @@
-from datetime import datetime
 from uuid import UUID
 
 from domain.certificates.entities.certificate_groups import CertificateGroupEntity
@@ -12,52 +11,58 @@ from domain.certificates.value_objects.certificates import (
     CertificateLinkValueObject,
     CertificateTitleValueObject,
 )
+from infrastructure.database.converters.base.mongo import (
+    datetime_from_document,
+    datetime_to_document,
+    uuid_from_document,
+    uuid_to_document,
+)
 
 
 def certificate_group_entity_to_document(entity: CertificateGroupEntity) -> dict:
     return {
-        "oid": str(entity.oid),
+        "oid": uuid_to_document(entity.oid),
         "section": entity.section.as_generic_type(),
         "title": entity.title.as_generic_type(),
         "content": entity.content.as_generic_type(),
         "order": entity.order,
         "is_active": entity.is_active,
-        "created_at": entity.created_at.isoformat(),
-        "updated_at": entity.updated_at.isoformat(),
+        "created_at": datetime_to_document(entity.created_at),
+        "updated_at": datetime_to_document(entity.updated_at),
     }
 
 
 def certificate_group_document_to_entity(document: dict) -> CertificateGroupEntity:
     return CertificateGroupEntity(
-        oid=UUID(document["oid"]),
-        section=SectionValueObject(value=document["section"]),
-        title=TitleValueObject(value=document["title"]),
-        content=ContentValueObject(value=document["content"]),
+        oid=uuid_from_document(document["oid"]),
+        section=SectionValueObject.from_trusted(document["section"]),
+        title=TitleValueObject.from_trusted(document["title"]),
+        content=ContentValueObject.from_trusted(document["content"]),
         order=document.get("order", 0),
         is_active=document.get("is_active", True),
-        created_at=datetime.fromisoformat(document["created_at"]),
-        updated_at=datetime.fromisoformat(document["updated_at"]),
+        created_at=datetime_from_document(document["created_at"]),
+        updated_at=datetime_from_document(document["updated_at"]),
     )
 
 
 def certificate_entity_to_document(entity: CertificateEntity, certificate_group_id: UUID) -> dict:
     return {
-        "oid": str(entity.oid),
-        "certificate_group_id": str(certificate_group_id),
+        "oid": uuid_to_document(entity.oid),
+        "certificate_group_id": uuid_to_document(certificate_group_id),
         "title": entity.title.as_generic_type(),
         "link": entity.link.as_generic_type(),
         "order": entity.order,
-        "created_at": entity.created_at.isoformat(),
-        "updated_at": entity.updated_at.isoformat(),
+        "created_at": datetime_to_document(entity.created_at),
+        "updated_at": datetime_to_document(entity.updated_at),
     }
 
 
 def certificate_document_to_entity(document: dict) -> CertificateEntity:
     return CertificateEntity(
-        oid=UUID(document["oid"]),
-        title=CertificateTitleValueObject(value=document["title"]),
-        link=CertificateLinkValueObject(value=document["link"]),
+        oid=uuid_from_document(document["oid"]),
+        title=CertificateTitleValueObject.from_trusted(document["title"]),
+        link=CertificateLinkValueObject.from_trusted(document["link"]),
         order=document["order"],
-        created_at=datetime.fromisoformat(document["created_at"]),
-        updated_at=datetime.fromisoformat(document["updated_at"]),
+        created_at=datetime_from_document(document["created_at"]),
+        updated_at=datetime_from_document(document["updated_at"]),
     )
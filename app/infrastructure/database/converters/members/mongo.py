@@ -1,6 +1,3 @@
-from datetime import datetime
-from uuid import UUID
-
 from domain.members.entities import MemberEntity
 from domain.members.value_objects.members import (
     MemberEmailValueObject,
@@ -8,17 +5,23 @@ from domain.members.value_objects.members import (
     MemberNameValueObject,
     MemberPositionValueObject,
 )
+from infrastructure.database.converters.base.mongo import (
+    datetime_from_document,
+    datetime_to_document,
+    uuid_from_document,
+    uuid_to_document,
+)
 
 
 def member_entity_to_document(entity: MemberEntity) -> dict:
     doc = {
-        "oid": str(entity.oid),
+        "oid": uuid_to_document(entity.oid),
         "name": entity.name.as_generic_type(),
         "position": entity.position.as_generic_type(),
         "image": entity.image.as_generic_type(),
         "order": entity.order,
-        "created_at": entity.created_at.isoformat(),
-        "updated_at": entity.updated_at.isoformat(),
+        "created_at": datetime_to_document(entity.created_at),
+        "updated_at": datetime_to_document(entity.updated_at),
     }
     if entity.email is not None:
         doc["email"] = entity.email.as_generic_type()
@@ -29,14 +32,14 @@ def member_entity_to_document(entity: MemberEntity) -> dict:
 
 def member_document_to_entity(document: dict) -> MemberEntity:
     email_value = document.get("email")
-    email = MemberEmailValueObject(value=email_value) if email_value is not None else None
+    email = MemberEmailValueObject.from_trusted(email_value) if email_value is not None else None
     return MemberEntity(
-        oid=UUID(document["oid"]),
-        name=MemberNameValueObject(value=document["name"]),
-        position=MemberPositionValueObject(value=document["position"]),
-        image=MemberImageValueObject(value=document["image"]),
+        oid=uuid_from_document(document["oid"]),
+        name=MemberNameValueObject.from_trusted(document["name"]),
+        position=MemberPositionValueObject.from_trusted(document["position"]),
+        image=MemberImageValueObject.from_trusted(document["image"]),
         order=document["order"],
         email=email,
-        created_at=datetime.fromisoformat(document["created_at"]),
-        updated_at=datetime.fromisoformat(document["updated_at"]),
+        created_at=datetime_from_document(document["created_at"]),
+        updated_at=datetime_from_document(document["updated_at"]),
     )
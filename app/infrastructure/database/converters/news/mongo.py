@@ -1,6 +1,3 @@
-from datetime import datetime
-from uuid import UUID
-
 from domain.news.entities.news import NewsEntity
 from domain.news.value_objects.news import (
     AltValueObject,
@@ -12,11 +9,18 @@ from domain.news.value_objects.news import (
     SlugValueObject,
     TitleValueObject,
 )
+from infrastructure.database.converters.base.mongo import (
+    datetime_from_document,
+    datetime_to_document,
+    uuid_from_document,
+    uuid_to_document,
+    value_object_from_document,
+)
 
 
 def news_entity_to_document(entity: NewsEntity) -> dict:
     return {
-        "oid": str(entity.oid),
+        "oid": uuid_to_document(entity.oid),
         "category": entity.category.as_generic_type(),
         "title": entity.title.as_generic_type(),
         "slug": entity.slug.as_generic_type(),
@@ -25,24 +29,24 @@ def news_entity_to_document(entity: NewsEntity) -> dict:
         "image_url": entity.image_url.as_generic_type(),
         "alt": entity.alt.as_generic_type(),
         "reading_time": entity.reading_time.as_generic_type(),
-        "date": entity.date.isoformat(),
-        "created_at": entity.created_at.isoformat(),
-        "updated_at": entity.updated_at.isoformat(),
+        "date": datetime_to_document(entity.date),
+        "created_at": datetime_to_document(entity.created_at),
+        "updated_at": datetime_to_document(entity.updated_at),
     }
 
 
 def news_document_to_entity(document: dict) -> NewsEntity:
     return NewsEntity(
-        oid=UUID(document["oid"]),
-        category=CategoryValueObject(value=document["category"]),
-        title=TitleValueObject(value=document["title"]),
-        slug=SlugValueObject(value=document["slug"]),
-        content=ContentValueObject(value=document["content"]),
-        short_content=ShortContentValueObject(value=document["short_content"]),
-        image_url=ImageUrlValueObject(value=document.get("image_url")),
-        alt=AltValueObject(value=document.get("alt")),
-        reading_time=ReadingTimeValueObject(value=document["reading_time"]),
-        date=datetime.fromisoformat(document["date"]),
-        created_at=datetime.fromisoformat(document["created_at"]),
-        updated_at=datetime.fromisoformat(document["updated_at"]),
+        oid=uuid_from_document(document["oid"]),
+        category=value_object_from_document(CategoryValueObject, document, "category"),
+        title=value_object_from_document(TitleValueObject, document, "title"),
+        slug=value_object_from_document(SlugValueObject, document, "slug"),
+        content=value_object_from_document(ContentValueObject, document, "content"),
+        short_content=value_object_from_document(ShortContentValueObject, document, "short_content"),
+        image_url=ImageUrlValueObject.from_trusted(document.get("image_url")),
+        alt=AltValueObject.from_trusted(document.get("alt")),
+        reading_time=value_object_from_document(ReadingTimeValueObject, document, "reading_time"),
+        date=datetime_from_document(document["date"]) if "date" in document else None,
+        created_at=datetime_from_document(document["created_at"]),
+        updated_at=datetime_from_document(document["updated_at"]),
     )
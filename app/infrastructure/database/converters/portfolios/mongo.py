@@ -1,7 +1,5 @@
-from datetime import datetime
-from uuid import UUID
-
 from domain.portfolios.entities.portfolios import PortfolioEntity
+from domain.portfolios.entities.summaries import PortfolioSummaryEntity
 from domain.portfolios.value_objects.portfolios import (
     DescriptionValueObject,
     ImageAltValueObject,
@@ -22,11 +20,18 @@ from domain.portfolios.value_objects.portfolios import (
     TaskTitleValueObject,
     YearValueObject,
 )
+from infrastructure.database.converters.base.mongo import (
+    datetime_from_document,
+    datetime_to_document,
+    uuid_from_document,
+    uuid_to_document,
+    value_object_from_document,
+)
 
 
 def portfolio_entity_to_document(entity: PortfolioEntity) -> dict:
     document = {
-        "oid": str(entity.oid),
+        "oid": uuid_to_document(entity.oid),
         "name": entity.name.as_generic_type(),
         "slug": entity.slug.as_generic_type(),
         "poster": entity.poster.as_generic_type(),
@@ -44,8 +49,8 @@ def portfolio_entity_to_document(entity: PortfolioEntity) -> dict:
         "solution_image_right": entity.solution_image_right.as_generic_type(),
         "solution_image_right_alt": entity.solution_image_right_alt.as_generic_type(),
         "has_review": entity.has_review,
-        "created_at": entity.created_at.isoformat(),
-        "updated_at": entity.updated_at.isoformat(),
+        "created_at": datetime_to_document(entity.created_at),
+        "updated_at": datetime_to_document(entity.updated_at),
     }
 
     if entity.review_title:
@@ -64,29 +69,64 @@ def portfolio_entity_to_document(entity: PortfolioEntity) -> dict:
 
 def portfolio_document_to_entity(document: dict) -> PortfolioEntity:
     return PortfolioEntity(
-        oid=UUID(document["oid"]),
-        name=NameValueObject(value=document["name"]),
-        slug=SlugValueObject(value=document["slug"]),
-        poster=PosterUrlValueObject(value=document["poster"]),
-        poster_alt=ImageAltValueObject(value=document.get("poster_alt", "")),
-        year=YearValueObject(value=document["year"]),
-        description=DescriptionValueObject(value=document["description"]),
-        task_title=TaskTitleValueObject(value=document["task_title"]),
-        task_description=TaskDescriptionValueObject(value=document["task_description"]),
-        solution_title=SolutionTitleValueObject(value=document["solution_title"]),
-        solution_description=SolutionDescriptionValueObject(value=document["solution_description"]),
-        solution_subtitle=SolutionSubtitleValueObject(value=document["solution_subtitle"]),
-        solution_subdescription=SolutionSubdescriptionValueObject(value=document["solution_subdescription"]),
-        solution_image_left=SolutionImageUrlValueObject(value=document["solution_image_left"]),
-        solution_image_left_alt=ImageAltValueObject(value=document.get("solution_image_left_alt", "")),
-        solution_image_right=SolutionImageUrlValueObject(value=document["solution_image_right"]),
-        solution_image_right_alt=ImageAltValueObject(value=document.get("solution_image_right_alt", "")),
-        has_review=document["has_review"],
-        review_title=ReviewTitleValueObject(value=document.get("review_title")),
-        review_text=ReviewTextValueObject(value=document.get("review_text")),
-        review_name=ReviewNameValueObject(value=document.get("review_name")),
-        review_image=ReviewImageUrlValueObject(value=document.get("review_image")),
-        review_role=ReviewRoleValueObject(value=document.get("review_role")),
-        created_at=datetime.fromisoformat(document["created_at"]),
-        updated_at=datetime.fromisoformat(document["updated_at"]),
+        oid=uuid_from_document(document["oid"]),
+        name=value_object_from_document(NameValueObject, document, "name"),
+        slug=value_object_from_document(SlugValueObject, document, "slug"),
+        poster=value_object_from_document(PosterUrlValueObject, document, "poster"),
+        poster_alt=ImageAltValueObject.from_trusted(document.get("poster_alt", "")),
+        year=value_object_from_document(YearValueObject, document, "year"),
+        description=value_object_from_document(DescriptionValueObject, document, "description"),
+        task_title=value_object_from_document(TaskTitleValueObject, document, "task_title"),
+        task_description=value_object_from_document(TaskDescriptionValueObject, document, "task_description"),
+        solution_title=value_object_from_document(SolutionTitleValueObject, document, "solution_title"),
+        solution_description=value_object_from_document(
+            SolutionDescriptionValueObject,
+            document,
+            "solution_description",
+        ),
+        solution_subtitle=value_object_from_document(SolutionSubtitleValueObject, document, "solution_subtitle"),
+        solution_subdescription=value_object_from_document(
+            SolutionSubdescriptionValueObject,
+            document,
+            "solution_subdescription",
+        ),
+        solution_image_left=value_object_from_document(SolutionImageUrlValueObject, document, "solution_image_left"),
+        solution_image_left_alt=ImageAltValueObject.from_trusted(document.get("solution_image_left_alt", "")),
+        solution_image_right=value_object_from_document(SolutionImageUrlValueObject, document, "solution_image_right"),
+        solution_image_right_alt=ImageAltValueObject.from_trusted(document.get("solution_image_right_alt", "")),
+        has_review=document.get("has_review", False),
+        review_title=ReviewTitleValueObject.from_trusted(document.get("review_title")),
+        review_text=ReviewTextValueObject.from_trusted(document.get("review_text")),
+        review_name=ReviewNameValueObject.from_trusted(document.get("review_name")),
+        review_image=ReviewImageUrlValueObject.from_trusted(document.get("review_image")),
+        review_role=ReviewRoleValueObject.from_trusted(document.get("review_role")),
+        created_at=datetime_from_document(document["created_at"]),
+        updated_at=datetime_from_document(document["updated_at"]),
+    )
+
+
+# Поля карточки проекта: тексты задачи, решения и отзыва не читаются из базы
+PORTFOLIO_SUMMARY_PROJECTION = {
+    "_id": 0,
+    "oid": 1,
+    "name": 1,
+    "slug": 1,
+    "poster": 1,
+    "poster_alt": 1,
+    "year": 1,
+    "created_at": 1,
+    "updated_at": 1,
+}
+
+
+def portfolio_summary_document_to_entity(document: dict) -> PortfolioSummaryEntity:
+    return PortfolioSummaryEntity(
+        oid=uuid_from_document(document["oid"]),
+        name=NameValueObject.from_trusted(document["name"]),
+        slug=SlugValueObject.from_trusted(document["slug"]),
+        poster=PosterUrlValueObject.from_trusted(document["poster"]),
+        poster_alt=ImageAltValueObject.from_trusted(document.get("poster_alt", "")),
+        year=YearValueObject.from_trusted(document["year"]),
+        created_at=datetime_from_document(document["created_at"]),
+        updated_at=datetime_from_document(document["updated_at"]),
     )
@@ -1,7 +1,14 @@
 from infrastructure.database.converters.products.mongo import (
     product_document_to_entity,
     product_entity_to_document,
+    product_summary_document_to_entity,
+    PRODUCT_SUMMARY_PROJECTION,
 )
 
 
-__all__ = ["product_document_to_entity", "product_entity_to_document"]
+__all__ = [
+    "PRODUCT_SUMMARY_PROJECTION",
+    "product_document_to_entity",
+    "product_entity_to_document",
+    "product_summary_document_to_entity",
+]
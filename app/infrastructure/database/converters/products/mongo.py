@@ -1,6 +1,3 @@
-from datetime import datetime
-from uuid import UUID
-
 from domain.products.entities import (
     AdvantageEntity,
     DetailedDescriptionEntity,
@@ -8,6 +5,7 @@ from domain.products.entities import (
     ImportantCharacteristicEntity,
     ImportantCharacteristicUnit,
     ProductEntity,
+    ProductSummaryEntity,
     SimpleDescriptionEntity,
 )
 from domain.products.value_objects import (
@@ -18,11 +16,18 @@ from domain.products.value_objects import (
     PreviewImageUrlValueObject,
     SlugValueObject,
 )
+from infrastructure.database.converters.base.mongo import (
+    datetime_from_document,
+    datetime_to_document,
+    uuid_from_document,
+    uuid_to_document,
+    value_object_from_document,
+)
 
 
 def product_entity_to_document(entity: ProductEntity) -> dict:
     document = {
-        "oid": str(entity.oid),
+        "oid": uuid_to_document(entity.oid),
         "category": entity.category.as_generic_type(),
         "name": entity.name.as_generic_type(),
         "slug": entity.slug.as_generic_type(),
@@ -53,9 +58,9 @@ def product_entity_to_document(entity: ProductEntity) -> dict:
         "order": entity.order,
         "is_shown": entity.is_shown,
         "show_advantages": entity.show_advantages,
-        "portfolio_ids": [str(pid) for pid in entity.portfolio_ids],
-        "created_at": entity.created_at.isoformat(),
-        "updated_at": entity.updated_at.isoformat(),
+        "portfolio_ids": [uuid_to_document(pid) for pid in entity.portfolio_ids],
+        "created_at": datetime_to_document(entity.created_at),
+        "updated_at": datetime_to_document(entity.updated_at),
     }
 
     if entity.preview_image_alt:
@@ -114,16 +119,16 @@ def product_document_to_entity(document: dict) -> ProductEntity:
             for doc_data in document["documentation"]
         ]
 
-    portfolio_ids = [UUID(pid) for pid in document.get("portfolio_ids", [])]
+    portfolio_ids = [uuid_from_document(pid) for pid in document.get("portfolio_ids", [])]
 
     return ProductEntity(
-        oid=UUID(document["oid"]),
-        category=CategoryValueObject(value=document["category"]),
-        name=NameValueObject(value=document["name"]),
-        slug=SlugValueObject(value=document["slug"]),
-        description=DescriptionValueObject(value=document["description"]),
-        preview_image_url=PreviewImageUrlValueObject(value=document["preview_image_url"]),
-        preview_image_alt=PreviewImageAltValueObject(value=document.get("preview_image_alt")),
+        oid=uuid_from_document(document["oid"]),
+        category=value_object_from_document(CategoryValueObject, document, "category"),
+        name=value_object_from_document(NameValueObject, document, "name"),
+        slug=value_object_from_document(SlugValueObject, document, "slug"),
+        description=value_object_from_document(DescriptionValueObject, document, "description"),
+        preview_image_url=value_object_from_document(PreviewImageUrlValueObject, document, "preview_image_url"),
+        preview_image_alt=PreviewImageAltValueObject.from_trusted(document.get("preview_image_alt")),
         important_characteristics=important_characteristics,
         advantages=advantages,
         simple_description=simple_description,
@@ -133,6 +138,37 @@ def product_document_to_entity(document: dict) -> ProductEntity:
         is_shown=document.get("is_shown", True),
         show_advantages=document.get("show_advantages", True),
         portfolio_ids=portfolio_ids,
-        created_at=datetime.fromisoformat(document["created_at"]),
-        updated_at=datetime.fromisoformat(document["updated_at"]),
+        created_at=datetime_from_document(document["created_at"]),
+        updated_at=datetime_from_document(document["updated_at"]),
+    )
+
+
+# Поля карточки каталога: тексты, характеристики и документация не читаются из базы
+PRODUCT_SUMMARY_PROJECTION = {
+    "_id": 0,
+    "oid": 1,
+    "category": 1,
+    "name": 1,
+    "slug": 1,
+    "preview_image_url": 1,
+    "preview_image_alt": 1,
+    "order": 1,
+    "is_shown": 1,
+    "created_at": 1,
+    "updated_at": 1,
+}
+
+
+def product_summary_document_to_entity(document: dict) -> ProductSummaryEntity:
+    return ProductSummaryEntity(
+        oid=uuid_from_document(document["oid"]),
+        category=CategoryValueObject.from_trusted(document["category"]),
+        name=NameValueObject.from_trusted(document["name"]),
+        slug=SlugValueObject.from_trusted(document["slug"]),
+        preview_image_url=PreviewImageUrlValueObject.from_trusted(document["preview_image_url"]),
+        preview_image_alt=PreviewImageAltValueObject.from_trusted(document.get("preview_image_alt")),
+        order=document.get("order", 0),
+        is_shown=document.get("is_shown", True),
+        created_at=datetime_from_document(document["created_at"]),
+        updated_at=datetime_from_document(document["updated_at"]),
     )
@@ -1,6 +1,3 @@
-from datetime import datetime
-from uuid import UUID
-
 from domain.reviews.entities import ReviewEntity
 from domain.reviews.value_objects.reviews import (
     ReviewCategoryValueObject,
@@ -11,15 +8,21 @@ from domain.reviews.value_objects.reviews import (
     ReviewShortTextValueObject,
     ReviewTextValueObject,
 )
+from infrastructure.database.converters.base.mongo import (
+    datetime_from_document,
+    datetime_to_document,
+    uuid_from_document,
+    uuid_to_document,
+)
 
 
 def review_entity_to_document(entity: ReviewEntity) -> dict:
     document = {
-        "oid": str(entity.oid),
+        "oid": uuid_to_document(entity.oid),
         "name": entity.name.as_generic_type(),
         "category": entity.category.as_generic_type(),
-        "created_at": entity.created_at.isoformat(),
-        "updated_at": entity.updated_at.isoformat(),
+        "created_at": datetime_to_document(entity.created_at),
+        "updated_at": datetime_to_document(entity.updated_at),
     }
     if entity.position:
         document["position"] = entity.position.as_generic_type()
@@ -36,14 +39,14 @@ def review_entity_to_document(entity: ReviewEntity) -> dict:
 
 def review_document_to_entity(document: dict) -> ReviewEntity:
     return ReviewEntity(
-        oid=UUID(document["oid"]),
-        name=ReviewNameValueObject(value=document["name"]),
-        category=ReviewCategoryValueObject(value=document["category"]),
-        position=ReviewPositionValueObject(value=document.get("position")),
-        image=ReviewImageValueObject(value=document.get("image")),
-        text=ReviewTextValueObject(value=document.get("text")),
-        short_text=ReviewShortTextValueObject(value=document.get("short_text")),
-        content_url=ReviewContentUrlValueObject(value=document.get("content_url")),
-        created_at=datetime.fromisoformat(document["created_at"]),
-        updated_at=datetime.fromisoformat(document["updated_at"]),
+        oid=uuid_from_document(document["oid"]),
+        name=ReviewNameValueObject.from_trusted(document["name"]),
+        category=ReviewCategoryValueObject.from_trusted(document["category"]),
+        position=ReviewPositionValueObject.from_trusted(document.get("position")),
+        image=ReviewImageValueObject.from_trusted(document.get("image")),
+        text=ReviewTextValueObject.from_trusted(document.get("text")),
+        short_text=ReviewShortTextValueObject.from_trusted(document.get("short_text")),
+        content_url=ReviewContentUrlValueObject.from_trusted(document.get("content_url")),
+        created_at=datetime_from_document(document["created_at"]),
+        updated_at=datetime_from_document(document["updated_at"]),
     )
@@ -1,6 +1,3 @@
-from datetime import datetime
-from uuid import UUID
-
 from domain.seo_settings.entities import SeoSettingsEntity
 from domain.seo_settings.value_objects import (
     CanonicalUrlValueObject,
@@ -13,18 +10,24 @@ from domain.seo_settings.value_objects import (
     PagePathValueObject,
     TitleValueObject,
 )
+from infrastructure.database.converters.base.mongo import (
+    datetime_from_document,
+    datetime_to_document,
+    uuid_from_document,
+    uuid_to_document,
+)
 
 
 def seo_settings_entity_to_document(entity: SeoSettingsEntity) -> dict:
     document = {
-        "oid": str(entity.oid),
+        "oid": uuid_to_document(entity.oid),
         "page_path": entity.page_path.as_generic_type(),
         "page_name": entity.page_name.as_generic_type(),
         "title": entity.title.as_generic_type(),
         "description": entity.description.as_generic_type(),
         "is_active": entity.is_active,
-        "created_at": entity.created_at.isoformat(),
-        "updated_at": entity.updated_at.isoformat(),
+        "created_at": datetime_to_document(entity.created_at),
+        "updated_at": datetime_to_document(entity.updated_at),
     }
 
     if entity.keywords:
@@ -43,21 +46,21 @@ def seo_settings_entity_to_document(entity: SeoSettingsEntity) -> dict:
 
 def seo_settings_document_to_entity(document: dict) -> SeoSettingsEntity:
     return SeoSettingsEntity(
-        oid=UUID(document["oid"]),
-        page_path=PagePathValueObject(value=document["page_path"]),
-        page_name=PageNameValueObject(value=document["page_name"]),
-        title=TitleValueObject(value=document["title"]),
-        description=DescriptionValueObject(value=document["description"]),
-        keywords=KeywordsValueObject(value=document.get("keywords")) if document.get("keywords") else None,
-        og_title=OgTitleValueObject(value=document.get("og_title")) if document.get("og_title") else None,
-        og_description=OgDescriptionValueObject(value=document.get("og_description"))
+        oid=uuid_from_document(document["oid"]),
+        page_path=PagePathValueObject.from_trusted(document["page_path"]),
+        page_name=PageNameValueObject.from_trusted(document["page_name"]),
+        title=TitleValueObject.from_trusted(document["title"]),
+        description=DescriptionValueObject.from_trusted(document["description"]),
+        keywords=KeywordsValueObject.from_trusted(document.get("keywords")) if document.get("keywords") else None,
+        og_title=OgTitleValueObject.from_trusted(document.get("og_title")) if document.get("og_title") else None,
+        og_description=OgDescriptionValueObject.from_trusted(document.get("og_description"))
         if document.get("og_description")
         else None,
-        og_image=OgImageValueObject(value=document.get("og_image")) if document.get("og_image") else None,
-        canonical_url=CanonicalUrlValueObject(value=document.get("canonical_url"))
+        og_image=OgImageValueObject.from_trusted(document.get("og_image")) if document.get("og_image") else None,
+        canonical_url=CanonicalUrlValueObject.from_trusted(document.get("canonical_url"))
         if document.get("canonical_url")
         else None,
         is_active=document.get("is_active", True),
-        created_at=datetime.fromisoformat(document["created_at"]),
-        updated_at=datetime.fromisoformat(document["updated_at"]),
+        created_at=datetime_from_document(document["created_at"]),
+        updated_at=datetime_from_document(document["updated_at"]),
     )
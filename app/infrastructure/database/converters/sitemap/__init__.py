@@ -0,0 +1,10 @@
+from infrastructure.database.converters.sitemap.mongo import (
+    sitemap_entry_document_to_entity,
+    sitemap_entry_entity_to_document,
+)
+
+
+__all__ = [
+    "sitemap_entry_document_to_entity",
+    "sitemap_entry_entity_to_document",
+]
@@ -0,0 +1,29 @@
+from domain.sitemap.entities import SitemapEntryEntity
+from infrastructure.database.converters.base.mongo import (
+    datetime_from_document,
+    datetime_to_document,
+    uuid_from_document,
+    uuid_to_document,
+)
+
+
+def sitemap_entry_entity_to_document(entity: SitemapEntryEntity) -> dict:
+    return {
+        "oid": uuid_to_document(entity.oid),
+        "source": entity.source,
+        "page_path": entity.page_path,
+        "lastmod": datetime_to_document(entity.lastmod),
+        "created_at": datetime_to_document(entity.created_at),
+        "updated_at": datetime_to_document(entity.updated_at),
+    }
+
+
+def sitemap_entry_document_to_entity(document: dict) -> SitemapEntryEntity:
+    return SitemapEntryEntity(
+        oid=uuid_from_document(document["oid"]),
+        source=document["source"],
+        page_path=document["page_path"],
+        lastmod=datetime_from_document(document["lastmod"]),
+        created_at=datetime_from_document(document["created_at"]),
+        updated_at=datetime_from_document(document["updated_at"]),
+    )
@@ -1,6 +1,3 @@
-from datetime import datetime
-from uuid import UUID
-
 from domain.submissions.entities.submissions import SubmissionEntity
 from domain.submissions.value_objects.submissions import (
     CommentsValueObject,
@@ -9,16 +6,22 @@ from domain.submissions.value_objects.submissions import (
     NameValueObject,
     PhoneValueObject,
 )
+from infrastructure.database.converters.base.mongo import (
+    datetime_from_document,
+    datetime_to_document,
+    uuid_from_document,
+    uuid_to_document,
+)
 
 
 def submission_entity_to_document(entity: SubmissionEntity) -> dict:
     document = {
-        "oid": str(entity.oid),
+        "oid": uuid_to_document(entity.oid),
         "form_type": entity.form_type.as_generic_type(),
         "name": entity.name.as_generic_type(),
         "files": entity.files,
-        "created_at": entity.created_at.isoformat(),
-        "updated_at": entity.updated_at.isoformat(),
+        "created_at": datetime_to_document(entity.created_at),
+        "updated_at": datetime_to_document(entity.updated_at),
     }
 
     if entity.email:
@@ -35,14 +38,14 @@ def submission_entity_to_document(entity: SubmissionEntity) -> dict:
 
 def submission_document_to_entity(document: dict) -> SubmissionEntity:
     return SubmissionEntity(
-        oid=UUID(document["oid"]),
-        form_type=FormTypeValueObject(value=document["form_type"]),
-        name=NameValueObject(value=document["name"]),
-        email=EmailValueObject(value=document.get("email")),
-        phone=PhoneValueObject(value=document.get("phone")),
-        comments=CommentsValueObject(value=document.get("comments")),
+        oid=uuid_from_document(document["oid"]),
+        form_type=FormTypeValueObject.from_trusted(document["form_type"]),
+        name=NameValueObject.from_trusted(document["name"]),
+        email=EmailValueObject.from_trusted(document.get("email")),
+        phone=PhoneValueObject.from_trusted(document.get("phone")),
+        comments=CommentsValueObject.from_trusted(document.get("comments")),
         files=document.get("files", []),
         answers_file_url=document.get("answers_file_url"),
-        created_at=datetime.fromisoformat(document["created_at"]),
-        updated_at=datetime.fromisoformat(document["updated_at"]),
+        created_at=datetime_from_document(document["created_at"]),
+        updated_at=datetime_from_document(document["updated_at"]),
     )
@@ -1,30 +1,33 @@
-from datetime import datetime
-from uuid import UUID
-
 from domain.users.entities.users import UserEntity
 from domain.users.value_objects.users import (
     EmailValueObject,
     UserNameValueObject,
 )
+from infrastructure.database.converters.base.mongo import (
+    datetime_from_document,
+    datetime_to_document,
+    uuid_from_document,
+    uuid_to_document,
+)
 
 
 def user_entity_to_document(entity: UserEntity) -> dict:
     return {
-        "oid": str(entity.oid),
+        "oid": uuid_to_document(entity.oid),
         "email": entity.email.as_generic_type(),
         "hashed_password": entity.hashed_password,
         "name": entity.name.as_generic_type(),
-        "created_at": entity.created_at.isoformat(),
-        "updated_at": entity.updated_at.isoformat(),
+        "created_at": datetime_to_document(entity.created_at),
+        "updated_at": datetime_to_document(entity.updated_at),
     }
 
 
 def user_document_to_entity(document: dict) -> UserEntity:
     return UserEntity(
-        oid=UUID(document["oid"]),
-        email=EmailValueObject(value=document["email"]),
+        oid=uuid_from_document(document["oid"]),
+        email=EmailValueObject.from_trusted(document["email"]),
         hashed_password=document["hashed_password"],
-        name=UserNameValueObject(value=document["name"]),
-        created_at=datetime.fromisoformat(document["created_at"]),
-        updated_at=datetime.fromisoformat(document["updated_at"]),
+        name=UserNameValueObject.from_trusted(document["name"]),
+        created_at=datetime_from_document(document["created_at"]),
+        updated_at=datetime_from_document(document["updated_at"]),
     )
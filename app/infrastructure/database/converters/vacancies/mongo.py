@@ -1,6 +1,3 @@
-from datetime import datetime
-from uuid import UUID
-
 from domain.vacancies.entities.vacancies import VacancyEntity
 from domain.vacancies.value_objects.vacancies import (
     CategoryValueObject,
@@ -9,29 +6,35 @@ from domain.vacancies.value_objects.vacancies import (
     SalaryValueObject,
     TitleValueObject,
 )
+from infrastructure.database.converters.base.mongo import (
+    datetime_from_document,
+    datetime_to_document,
+    uuid_from_document,
+    uuid_to_document,
+)
 
 
 def vacancy_entity_to_document(entity: VacancyEntity) -> dict:
     return {
-        "oid": str(entity.oid),
+        "oid": uuid_to_document(entity.oid),
         "title": entity.title.as_generic_type(),
         "requirements": entity.requirements.as_generic_type(),
         "experience": entity.experience.as_generic_type(),
         "salary": entity.salary.as_generic_type(),
         "category": entity.category.as_generic_type(),
-        "created_at": entity.created_at.isoformat(),
-        "updated_at": entity.updated_at.isoformat(),
+        "created_at": datetime_to_document(entity.created_at),
+        "updated_at": datetime_to_document(entity.updated_at),
     }
 
 
 def vacancy_document_to_entity(document: dict) -> VacancyEntity:
     return VacancyEntity(
-        oid=UUID(document["oid"]),
-        title=TitleValueObject(value=document["title"]),
-        requirements=RequirementsValueObject(value=document["requirements"]),
-        experience=ExperienceValueObject(value=document["experience"]),
-        salary=SalaryValueObject(value=document["salary"]),
-        category=CategoryValueObject(value=document["category"]),
-        created_at=datetime.fromisoformat(document["created_at"]),
-        updated_at=datetime.fromisoformat(document["updated_at"]),
+        oid=uuid_from_document(document["oid"]),
+        title=TitleValueObject.from_trusted(document["title"]),
+        requirements=RequirementsValueObject.from_trusted(document["requirements"]),
+        experience=ExperienceValueObject.from_trusted(document["experience"]),
+        salary=SalaryValueObject.from_trusted(document["salary"]),
+        category=CategoryValueObject.from_trusted(document["category"]),
+        created_at=datetime_from_document(document["created_at"]),
+        updated_at=datetime_from_document(document["updated_at"]),
     )
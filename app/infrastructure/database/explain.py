@@ -0,0 +1,48 @@
+"""Разбор вывода explain(): обход дерева плана и краткая сводка по нему."""
+
+from typing import (
+    Iterator,
+    Optional,
+)
+
+
+def plan_stages(plan: dict) -> Iterator[dict]:
+    """Обходит дерево плана explain() сверху вниз (включая план SBE в queryPlan)."""
+    if "queryPlan" in plan:
+        plan = plan["queryPlan"]
+
+    yield plan
+
+    if "inputStage" in plan:
+        yield from plan_stages(plan["inputStage"])
+
+    for input_stage in plan.get("inputStages", ()):
+        yield from plan_stages(input_stage)
+
+
+def _query_planner(explain: dict) -> Optional[dict]:
+    if "queryPlanner" in explain:
+        return explain["queryPlanner"]
+
+    # aggregate: план первой стадии $cursor (до 7.0) или первой стадии конвейера
+    for stage in explain.get("stages", ()):
+        if "$cursor" in stage:
+            return stage["$cursor"].get("queryPlanner")
+
+    return None
+
+
+def plan_summary(explain: dict) -> dict:
+    """Стадии и индекс выигравшего плана без литералов фильтра (parsedQuery в сводку не попадает)."""
+    query_planner = _query_planner(explain)
+
+    if query_planner is None:
+        return {"stages": [], "index_name": None, "rejected_plans": 0}
+
+    stages = list(plan_stages(query_planner["winningPlan"]))
+
+    return {
+        "stages": [stage["stage"] for stage in stages if "stage" in stage],
+        "index_name": next((stage["indexName"] for stage in stages if "indexName" in stage), None),
+        "rejected_plans": len(query_planner.get("rejectedPlans", ())),
+    }
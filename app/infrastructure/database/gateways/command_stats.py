@@ -0,0 +1,304 @@
+import json
+import logging
+import threading
+from bisect import bisect_left
+from dataclasses import (
+    dataclass,
+    field,
+    replace,
+)
+from typing import (
+    Any,
+    Optional,
+)
+
+from pymongo import monitoring
+
+
+logger = logging.getLogger(__name__)
+
+# Верхние границы корзин гистограммы задержек, мс; последняя корзина - все, что дольше
+LATENCY_BUCKETS_MS = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1_000, 2_500, 5_000, 10_000)
+
+# Команды, для которых можно получить план через explain
+EXPLAINABLE_COMMANDS = frozenset({"find", "aggregate", "count", "distinct", "update", "delete", "findAndModify"})
+
+# Служебные поля команды, которые драйвер добавляет сам и которые нельзя передать в explain
+_DRIVER_FIELDS = frozenset({"lsid", "txnNumber", "autocommit", "startTransaction", "readConcern", "writeConcern"})
+
+REDACTED = "?"
+
+
+def redact(value: Any) -> Any:
+    """Заменяет литералы фильтра на "?", сохраняя поля и операторы.
+
+    Одинаковые элементы списков схлопываются, поэтому $in по любому числу
+    значений дает одну и ту же форму запроса.
+    """
+    if isinstance(value, dict):
+        return {key: redact(item) for key, item in value.items()}
+
+    if isinstance(value, (list, tuple)):
+        items = []
+
+        for item in value:
+            redacted = redact(item)
+
+            if redacted not in items:
+                items.append(redacted)
+
+        return items
+
+    return REDACTED
+
+
+def command_filter(command_name: str, command: dict) -> Any:
+    """Фильтр (для aggregate - конвейер) команды без литералов; None, если фильтра у команды нет."""
+    if command_name == "find":
+        shape = {"filter": redact(command.get("filter", {}))}
+
+        if "sort" in command:
+            # Направление сортировки влияет на план, поэтому остается в форме как есть
+            shape["sort"] = dict(command["sort"])
+
+        return shape
+
+    if command_name == "aggregate":
+        return redact(command.get("pipeline", []))
+
+    if command_name in ("count", "distinct", "findAndModify"):
+        return redact(command.get("query", {}))
+
+    if command_name == "update":
+        return redact([statement.get("q", {}) for statement in command.get("updates", ())])
+
+    if command_name == "delete":
+        return redact([statement.get("q", {}) for statement in command.get("deletes", ())])
+
+    return None
+
+
+def explainable_command(command: dict) -> dict:
+    """Команда без полей, которые добавляет драйвер ($db, lsid, $clusterTime и т.п.)."""
+    return {key: value for key, value in command.items() if not key.startswith("$") and key not in _DRIVER_FIELDS}
+
+
+def _command_collection(command_name: str, command: dict) -> str:
+    if command_name == "getMore":
+        return command.get("collection", "-")
+
+    value = command.get(command_name)
+    return value if isinstance(value, str) else "-"
+
+
+def _documents_count(command_name: str, reply: dict) -> int:
+    """Сколько документов вернула или затронула команда."""
+    cursor = reply.get("cursor")
+
+    if isinstance(cursor, dict):
+        return len(cursor.get("firstBatch", cursor.get("nextBatch", ())))
+
+    if command_name == "findAndModify":
+        return 1 if reply.get("value") is not None else 0
+
+    if command_name == "distinct":
+        return len(reply.get("values", ()))
+
+    n = reply.get("n", 0)
+    return n if isinstance(n, int) else 0
+
+
+@dataclass
+class CommandStats:
+    """Гистограмма задержек и счетчики одной команды одного метода репозитория."""
+
+    count: int = 0
+    failed_total: int = 0
+    documents_total: int = 0
+    duration_ms_total: float = 0.0
+    max_duration_ms: float = 0.0
+    bucket_counts: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1))
+
+    def observe(self, duration_ms: float, documents: int, failed: bool) -> None:
+        self.count += 1
+        self.failed_total += failed
+        self.documents_total += documents
+        self.duration_ms_total += duration_ms
+        self.max_duration_ms = max(self.max_duration_ms, duration_ms)
+        self.bucket_counts[bisect_left(LATENCY_BUCKETS_MS, duration_ms)] += 1
+
+    def buckets(self) -> dict[str, int]:
+        """Накопительные корзины в духе Prometheus: сколько команд уложилось в le миллисекунд."""
+        buckets = {}
+        total = 0
+
+        for bound, count in zip((*LATENCY_BUCKETS_MS, "+Inf"), self.bucket_counts):
+            total += count
+            buckets[str(bound)] = total
+
+        return buckets
+
+
+@dataclass
+class SlowCommandShape:
+    """Форма медленной команды: фильтр без литералов, число медленных выполнений и план, если он снят."""
+
+    collection: str
+    command: str
+    method: str
+    filter: Any
+    count: int = 0
+    max_duration_ms: float = 0.0
+    explain: Optional[dict] = None
+
+
+@dataclass(frozen=True)
+class _StartedCommand:
+    database_name: str
+    collection: str
+    method: str
+    command: dict
+
+
+class CommandStatsListener(monitoring.CommandListener):
+    """Считает задержки и число документов команд драйвера по коллекциям, командам и методам репозиториев.
+
+    Метод репозитория берется из comment команды, который проставляет
+    BaseMongoRepository. Команды дольше slow_command_ms пишутся в лог с
+    фильтром без литералов и запоминаются по форме: хранятся
+    max_slow_shapes самых медленных форм. Если keep_commands включен, для
+    них сохраняется и сама команда, чтобы потом снять план через explain.
+
+    Колбэки вызываются из потоков Motor, поэтому состояние под блокировкой.
+    """
+
+    def __init__(self, slow_command_ms: int = 0, max_slow_shapes: int = 20, keep_commands: bool = False) -> None:
+        self.slow_command_ms = slow_command_ms
+        self.max_slow_shapes = max_slow_shapes
+        self.keep_commands = keep_commands
+        self._lock = threading.Lock()
+        self._started: dict[tuple, _StartedCommand] = {}
+        self._stats: dict[tuple[str, str, str], CommandStats] = {}
+        self._slow_shapes: dict[str, SlowCommandShape] = {}
+        self._slow_commands: dict[str, tuple[str, dict]] = {}
+
+    def snapshot(self) -> list[dict]:
+        with self._lock:
+            return [
+                {
+                    "collection": collection,
+                    "command": command_name,
+                    "method": method,
+                    "count": stats.count,
+                    "failed_total": stats.failed_total,
+                    "documents_total": stats.documents_total,
+                    "duration_ms_total": stats.duration_ms_total,
+                    "max_duration_ms": stats.max_duration_ms,
+                    "buckets": stats.buckets(),
+                }
+                for (collection, command_name, method), stats in self._stats.items()
+            ]
+
+    def slow_shapes(self) -> list[SlowCommandShape]:
+        """Медленные формы, начиная с самой медленной."""
+        with self._lock:
+            shapes = sorted(self._slow_shapes.values(), key=lambda shape: shape.max_duration_ms, reverse=True)
+            return [replace(shape) for shape in shapes]
+
+    def commands_to_explain(self) -> dict[str, tuple[str, dict]]:
+        """Сохраненные команды медленных форм, для которых план еще не снят: ключ формы -> (база, команда)."""
+        with self._lock:
+            return {
+                key: command
+                for key, command in self._slow_commands.items()
+                if key in self._slow_shapes and self._slow_shapes[key].explain is None
+            }
+
+    def set_explain(self, key: str, explain: dict) -> None:
+        with self._lock:
+            if key in self._slow_shapes:
+                self._slow_shapes[key].explain = explain
+
+            self._slow_commands.pop(key, None)
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        command = event.command
+        started = _StartedCommand(
+            database_name=event.database_name,
+            collection=_command_collection(event.command_name, command),
+            method=command.get("comment") if isinstance(command.get("comment"), str) else "-",
+            command=command,
+        )
+
+        with self._lock:
+            self._started[(event.connection_id, event.request_id)] = started
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        self._finish(event, _documents_count(event.command_name, event.reply), failed=False)
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        self._finish(event, 0, failed=True)
+
+    def _finish(self, event, documents: int, failed: bool) -> None:
+        duration_ms = event.duration_micros / 1000
+
+        with self._lock:
+            started = self._started.pop((event.connection_id, event.request_id), None)
+
+            if started is None:
+                return
+
+            key = (started.collection, event.command_name, started.method)
+            stats = self._stats.get(key)
+
+            if stats is None:
+                stats = self._stats[key] = CommandStats()
+
+            stats.observe(duration_ms, documents, failed)
+
+        if self.slow_command_ms and duration_ms >= self.slow_command_ms:
+            self._record_slow(event, started, duration_ms)
+
+    def _record_slow(self, event, started: _StartedCommand, duration_ms: float) -> None:
+        redacted_filter = command_filter(event.command_name, started.command)
+
+        logger.warning(
+            "Slow Mongo command %s.%s from %s took %.1fms: %s",
+            started.collection,
+            event.command_name,
+            started.method,
+            duration_ms,
+            json.dumps(redacted_filter, ensure_ascii=False, default=str),
+        )
+
+        shape_key = json.dumps(
+            [started.collection, event.command_name, started.method, redacted_filter],
+            ensure_ascii=False,
+            default=str,
+        )
+
+        with self._lock:
+            shape = self._slow_shapes.get(shape_key)
+
+            if shape is None:
+                if len(self._slow_shapes) >= self.max_slow_shapes:
+                    fastest_key = min(self._slow_shapes, key=lambda key: self._slow_shapes[key].max_duration_ms)
+
+                    if self._slow_shapes[fastest_key].max_duration_ms >= duration_ms:
+                        return
+
+                    del self._slow_shapes[fastest_key]
+                    self._slow_commands.pop(fastest_key, None)
+
+                shape = self._slow_shapes[shape_key] = SlowCommandShape(
+                    collection=started.collection,
+                    command=event.command_name,
+                    method=started.method,
+                    filter=redacted_filter,
+                )
+
+            shape.count += 1
+            shape.max_duration_ms = max(shape.max_duration_ms, duration_ms)
+
+            if self.keep_commands and event.command_name in EXPLAINABLE_COMMANDS and shape.explain is None:
+                self._slow_commands[shape_key] = (started.database_name, explainable_command(started.command))
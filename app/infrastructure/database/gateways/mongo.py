@@ -1,11 +1,101 @@
+import asyncio
+import logging
+from typing import Optional
+
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo.errors import PyMongoError
+
+from infrastructure.database.explain import plan_summary
+from infrastructure.database.gateways.command_stats import (
+    CommandStatsListener,
+    SlowCommandShape,
+)
+from infrastructure.database.gateways.pool_stats import PoolStatsListener
+from infrastructure.database.gateways.routing import (
+    QueryReadPreference,
+    reads_from_replicas,
+)
+from infrastructure.tracing.mongo import CommandTracingListener
+
+
+logger = logging.getLogger(__name__)
 
 
 class MongoDatabase:
-    def __init__(self, mongo_url: str, mongo_database: str):
-        self._client = AsyncIOMotorClient(mongo_url)
+    def __init__(
+        self,
+        mongo_url: str,
+        mongo_database: str,
+        client_options: Optional[dict] = None,
+        max_time_ms: int = 0,
+        stream_max_time_ms: int = 0,
+        query_read_preference: Optional[QueryReadPreference] = None,
+        slow_command_ms: int = 0,
+        explain_slow_commands: bool = False,
+    ):
+        self.pool_stats_listener = PoolStatsListener()
+        self.command_stats_listener = CommandStatsListener(
+            slow_command_ms=slow_command_ms,
+            keep_commands=explain_slow_commands,
+        )
+        # Ограничение времени чтений на сервере (maxTimeMS), применяется в BaseMongoRepository
+        self.max_time_ms = max_time_ms
+        # maxTimeMS потоковых выдач и выгрузок: он суммируется по всем getMore курсора
+        self.stream_max_time_ms = stream_max_time_ms
+        # Read preference чтений запросов (CQRS query); None - все чтения идут в primary
+        self.query_read_preference = query_read_preference
+        # UUID хранятся как BSON binary subtype 4 и декодируются обратно в uuid.UUID
+        self._client = AsyncIOMotorClient(
+            mongo_url,
+            uuidRepresentation="standard",
+            event_listeners=[self.pool_stats_listener, self.command_stats_listener, CommandTracingListener()],
+            **(client_options or {}),
+        )
         self._connection = self._client.get_database(mongo_database)
 
     @property
     def connection(self):
         return self._connection
+
+    def get_collection(self, collection_name: str):
+        """Коллекция с read preference текущего контекста.
+
+        Внутри Mediator.handle_query чтения уходят по query_read_preference
+        (например, secondaryPreferred с maxStalenessSeconds), остальное - в primary.
+        Записи всегда идут в primary независимо от read preference.
+        """
+        if self.query_read_preference is not None and reads_from_replicas():
+            return self._connection.get_collection(collection_name, read_preference=self.query_read_preference)
+
+        return self._connection[collection_name]
+
+    def pool_stats(self) -> dict[str, dict[str, int]]:
+        """Счетчики пула соединений этого процесса по серверам."""
+        return self.pool_stats_listener.snapshot()
+
+    def command_stats(self) -> list[dict]:
+        """Задержки и число документов команд этого процесса по коллекциям, командам и методам репозиториев."""
+        return self.command_stats_listener.snapshot()
+
+    async def slow_commands(self) -> list[SlowCommandShape]:
+        """Самые медленные формы команд; планы для новых форм снимаются здесь же, если это включено."""
+        for key, (database_name, command) in self.command_stats_listener.commands_to_explain().items():
+            try:
+                # queryPlanner только выбирает план и не выполняет запрос повторно
+                explain = await self._client[database_name].command({"explain": command, "verbosity": "queryPlanner"})
+                self.command_stats_listener.set_explain(key, plan_summary(explain))
+            except PyMongoError as error:
+                logger.info("Failed to explain slow %s command: %s", next(iter(command), "?"), type(error).__name__)
+                self.command_stats_listener.set_explain(key, {"error": type(error).__name__})
+
+        return self.command_stats_listener.slow_shapes()
+
+    async def ping(self) -> None:
+        await self._connection.command("ping")
+
+    async def warm_up(self, connections: int) -> None:
+        """Открывает соединения пула заранее: параллельные ping занимают каждый свое соединение."""
+        await asyncio.gather(*(self.ping() for _ in range(max(connections, 1))))
+
+    def close(self) -> None:
+        self._client.close()
@@ -0,0 +1,92 @@
+import threading
+from dataclasses import (
+    asdict,
+    dataclass,
+)
+
+from pymongo import monitoring
+
+
+@dataclass
+class ServerPoolStats:
+    """Состояние пула соединений к одному серверу."""
+
+    open: int = 0
+    in_use: int = 0
+    waiting: int = 0
+    created_total: int = 0
+    closed_total: int = 0
+    checked_out_total: int = 0
+    checkout_failed_total: int = 0
+    cleared_total: int = 0
+
+
+class PoolStatsListener(monitoring.ConnectionPoolListener):
+    """Считает события CMAP-мониторинга драйвера по каждому серверу.
+
+    Колбэки вызываются из потоков Motor, поэтому счетчики под блокировкой.
+    waiting - запросы, ждущие свободного соединения: если он не нулевой
+    под обычной нагрузкой, пул воркера мал (MONGO_MAX_POOL_SIZE).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._servers: dict[str, ServerPoolStats] = {}
+
+    def snapshot(self) -> dict[str, dict[str, int]]:
+        with self._lock:
+            return {address: asdict(stats) for address, stats in self._servers.items()}
+
+    def _stats(self, address: tuple[str, int]) -> ServerPoolStats:
+        key = f"{address[0]}:{address[1]}"
+        return self._servers.setdefault(key, ServerPoolStats())
+
+    def pool_created(self, event: monitoring.PoolCreatedEvent) -> None:
+        with self._lock:
+            self._stats(event.address)
+
+    def pool_ready(self, event: monitoring.PoolReadyEvent) -> None: ...
+
+    def pool_cleared(self, event: monitoring.PoolClearedEvent) -> None:
+        with self._lock:
+            self._stats(event.address).cleared_total += 1
+
+    def pool_closed(self, event: monitoring.PoolClosedEvent) -> None:
+        with self._lock:
+            self._servers.pop(f"{event.address[0]}:{event.address[1]}", None)
+
+    def connection_created(self, event: monitoring.ConnectionCreatedEvent) -> None:
+        with self._lock:
+            stats = self._stats(event.address)
+            stats.open += 1
+            stats.created_total += 1
+
+    def connection_ready(self, event: monitoring.ConnectionReadyEvent) -> None: ...
+
+    def connection_closed(self, event: monitoring.ConnectionClosedEvent) -> None:
+        with self._lock:
+            stats = self._stats(event.address)
+            stats.open = max(stats.open - 1, 0)
+            stats.closed_total += 1
+
+    def connection_check_out_started(self, event: monitoring.ConnectionCheckOutStartedEvent) -> None:
+        with self._lock:
+            self._stats(event.address).waiting += 1
+
+    def connection_check_out_failed(self, event: monitoring.ConnectionCheckOutFailedEvent) -> None:
+        with self._lock:
+            stats = self._stats(event.address)
+            stats.waiting = max(stats.waiting - 1, 0)
+            stats.checkout_failed_total += 1
+
+    def connection_checked_out(self, event: monitoring.ConnectionCheckedOutEvent) -> None:
+        with self._lock:
+            stats = self._stats(event.address)
+            stats.waiting = max(stats.waiting - 1, 0)
+            stats.in_use += 1
+            stats.checked_out_total += 1
+
+    def connection_checked_in(self, event: monitoring.ConnectionCheckedInEvent) -> None:
+        with self._lock:
+            stats = self._stats(event.address)
+            stats.in_use = max(stats.in_use - 1, 0)
@@ -0,0 +1,129 @@
+from contextlib import (
+    AbstractContextManager,
+    contextmanager,
+)
+from contextvars import ContextVar
+from typing import (
+    Iterator,
+    Optional,
+    Union,
+)
+
+from pymongo.read_preferences import (
+    Nearest,
+    PrimaryPreferred,
+    Secondary,
+    SecondaryPreferred,
+)
+
+from application.base.command import BaseCommand
+from application.base.middleware import BaseMediatorMiddleware
+from application.base.query import BaseQuery
+
+
+# Чтения внутри Mediator.handle_query: их можно отдавать репликам
+_query_reads: ContextVar[bool] = ContextVar("mongo_query_reads", default=False)
+
+# Чтения, закрепленные за primary до конца запроса (read-your-writes)
+_primary_pinned: ContextVar[bool] = ContextVar("mongo_primary_pinned", default=False)
+
+# В текущем запросе выполнена команда: следующие запросы клиента тоже читают из primary
+_write_recorded: ContextVar[bool] = ContextVar("mongo_write_recorded", default=False)
+
+QueryReadPreference = Union[PrimaryPreferred, Secondary, SecondaryPreferred, Nearest]
+
+_READ_PREFERENCES: dict[str, type[QueryReadPreference]] = {
+    "primaryPreferred": PrimaryPreferred,
+    "secondary": Secondary,
+    "secondaryPreferred": SecondaryPreferred,
+    "nearest": Nearest,
+}
+
+
+def make_read_preference(mode: str, max_staleness_seconds: int = -1) -> Optional[QueryReadPreference]:
+    """Read preference для чтений запросов; None для primary - маршрутизация не нужна."""
+    if mode == "primary":
+        return None
+
+    if mode not in _READ_PREFERENCES:
+        raise ValueError(f"Unknown read preference: {mode}")
+
+    return _READ_PREFERENCES[mode](max_staleness=max_staleness_seconds)
+
+
+@contextmanager
+def query_reads() -> Iterator[None]:
+    """Помечает чтения внутри блока как чтения запроса (CQRS query)."""
+    token = _query_reads.set(True)
+
+    try:
+        yield
+    finally:
+        _query_reads.reset(token)
+
+
+@contextmanager
+def primary_reads() -> Iterator[None]:
+    """Чтения внутри блока идут в primary, даже внутри запроса (CQRS query).
+
+    Для чтений, которыми заполняются кэши процесса: прочитанное с отстающей
+    реплики осталось бы в кэше на весь его TTL.
+    """
+    token = _query_reads.set(False)
+
+    try:
+        yield
+    finally:
+        _query_reads.reset(token)
+
+
+def pin_reads_to_primary() -> None:
+    """Закрепляет все чтения текущего запроса (и порожденных им задач) за primary.
+
+    Вызывается после команды и для админской сессии: запись, только что
+    сделанная администратором, может еще не доехать до реплики.
+    """
+    _primary_pinned.set(True)
+
+
+def record_write() -> None:
+    """Отмечает команду в текущем запросе и закрепляет его чтения за primary.
+
+    По отметке HTTP слой закрепляет за primary и следующие запросы того же
+    клиента (см. presentation.api.read_routing), пока реплики не догонят запись.
+    """
+    _write_recorded.set(True)
+    _primary_pinned.set(True)
+
+
+def write_recorded() -> bool:
+    return _write_recorded.get()
+
+
+def reads_pinned_to_primary() -> bool:
+    return _primary_pinned.get()
+
+
+def reads_from_replicas() -> bool:
+    return _query_reads.get() and not _primary_pinned.get()
+
+
+class ReadRoutingMiddleware(BaseMediatorMiddleware):
+    """Маршрутизация чтений для Mediator.
+
+    Чтения запросов (CQRS query) могут уходить на реплики; команда закрепляет
+    чтения запроса за primary (read-your-writes), а запрос с закрепленными
+    чтениями не объединяется с остальными, чтобы не получить результат,
+    прочитанный с реплики.
+    """
+
+    @contextmanager
+    def command_scope(self, command: BaseCommand) -> Iterator[None]:
+        record_write()
+        yield
+
+    def query_scope(self, query: BaseQuery) -> AbstractContextManager[None]:
+        return query_reads()
+
+    def can_coalesce(self, query: BaseQuery) -> bool:
+        return not reads_pinned_to_primary()
@@ -0,0 +1,81 @@
+"""Индексы, на которые рассчитаны запросы репозиториев.
+
+Индексы создаются при старте приложения: create_indexes идемпотентен, поэтому
+существующие индексы не пересоздаются, а недостающие добавляются. Уникальность
+slug и page_path проверяется сервисами, поэтому индексы не уникальные: старые
+данные с дублями не должны мешать запуску.
+
+Индексы, замененные более полными (например, created_at на created_at_oid),
+не удаляются автоматически: их стоит удалить вручную после выкладки.
+"""
+
+import logging
+
+from pymongo import (
+    ASCENDING,
+    DESCENDING,
+    IndexModel,
+)
+from pymongo.errors import OperationFailure
+
+from infrastructure.database.gateways.mongo import MongoDatabase
+from infrastructure.database.sorting import sort_indexes
+
+
+logger = logging.getLogger(__name__)
+
+
+def _oid_index() -> IndexModel:
+    return IndexModel([("oid", ASCENDING)], name="oid")
+
+
+_SECONDARY_INDEXES: dict[str, list[IndexModel]] = {
+    "products": [
+        IndexModel([("slug", ASCENDING)], name="slug"),
+        # Публичный список: фильтр is_shown и сортировка по дате с тай-брейкером
+        IndexModel(
+            [("is_shown", ASCENDING), ("created_at", DESCENDING), ("oid", DESCENDING)],
+            name="is_shown_created_at_oid",
+        ),
+    ],
+    "news": [IndexModel([("slug", ASCENDING)], name="slug")],
+    "portfolio": [IndexModel([("slug", ASCENDING)], name="slug")],
+    "seo_settings": [IndexModel([("page_path", ASCENDING)], name="page_path")],
+    "users": [IndexModel([("email", ASCENDING)], name="email")],
+    "submissions": [
+        IndexModel(
+            [("form_type", ASCENDING), ("created_at", ASCENDING), ("oid", ASCENDING)],
+            name="form_type_created_at_oid",
+        ),
+    ],
+    "reviews": [],
+    "vacancies": [],
+    "members": [],
+    "certificates": [],
+    "certificate_groups": [],
+    "sitemap_entries": [],
+}
+
+# oid, вторичные индексы и индексы (поле, oid) под каждое допустимое поле сортировки (см. sorting.py)
+MONGO_INDEXES: dict[str, list[IndexModel]] = {
+    collection_name: [_oid_index(), *models, *sort_indexes(collection_name)]
+    for collection_name, models in _SECONDARY_INDEXES.items()
+}
+
+
+async def ensure_indexes(
+    mongo_database: MongoDatabase,
+    indexes: dict[str, list[IndexModel]] = MONGO_INDEXES,
+) -> list[str]:
+    """Создает недостающие индексы и возвращает коллекции, где это не удалось."""
+    failed_collections = []
+
+    for collection_name, models in indexes.items():
+        try:
+            await mongo_database.connection[collection_name].create_indexes(models)
+        except OperationFailure:
+            # Например, индекс с тем же именем, но другими опциями создан вручную
+            logger.exception("Failed to ensure indexes for collection %s", collection_name)
+            failed_collections.append(collection_name)
+
+    return failed_collections
@@ -0,0 +1,202 @@
+"""Онлайн-миграция документов на нативные BSON-типы.
+
+Старый формат хранил идентификаторы строками, а даты - ISO-строками.
+Мигратор проходит коллекции пачками в порядке ``_id`` и переписывает только
+поля, которые всё ещё в старом формате. Обновление выполняется с условием на
+исходные значения, поэтому параллельные записи приложения не затираются.
+
+Приложение работает во время миграции: конвертеры читают оба формата, поиск
+по oid и фильтры по диапазону дат учитывают оба представления. Сортировка по
+дате до конца миграции может ставить еще не переведенные документы отдельно
+от переведенных (Mongo упорядочивает строки раньше дат). После прогона без
+ошибок в коллекции migrations ставится отметка; пока ее нет и остаются
+документы старого формата, API пишет предупреждение при старте (см.
+native_bson_migration_completed).
+
+Запуск: ``python -m infrastructure.database.migrations.native_bson``
+"""
+
+import asyncio
+import logging
+from datetime import (
+    datetime,
+    UTC,
+)
+from dataclasses import (
+    dataclass,
+    field,
+)
+
+from pymongo import UpdateOne
+
+from application.container import get_container
+from infrastructure.database.converters.base.mongo import (
+    datetime_from_document,
+    datetime_to_document,
+    uuid_from_document,
+    uuid_to_document,
+)
+from infrastructure.database.gateways.mongo import MongoDatabase
+
+
+logger = logging.getLogger(__name__)
+
+MIGRATIONS_COLLECTION = "migrations"
+NATIVE_BSON_MIGRATION_ID = "native_bson"
+
+
+@dataclass(frozen=True)
+class CollectionMigrationSpec:
+    collection_name: str
+    uuid_fields: tuple[str, ...] = ("oid",)
+    uuid_list_fields: tuple[str, ...] = ()
+    datetime_fields: tuple[str, ...] = ("created_at", "updated_at")
+
+    @property
+    def legacy_query(self) -> dict:
+        conditions = [{name: {"$type": "string"}} for name in (*self.uuid_fields, *self.datetime_fields)]
+        conditions += [{name: {"$elemMatch": {"$type": "string"}}} for name in self.uuid_list_fields]
+        return {"$or": conditions}
+
+
+NATIVE_BSON_MIGRATION_SPECS = (
+    CollectionMigrationSpec("users"),
+    CollectionMigrationSpec("news", datetime_fields=("date", "created_at", "updated_at")),
+    CollectionMigrationSpec("vacancies"),
+    CollectionMigrationSpec("submissions"),
+    CollectionMigrationSpec("portfolio"),
+    CollectionMigrationSpec("products", uuid_list_fields=("portfolio_ids",)),
+    CollectionMigrationSpec("seo_settings"),
+    CollectionMigrationSpec("certificate_groups"),
+    CollectionMigrationSpec("certificates", uuid_fields=("oid", "certificate_group_id")),
+    CollectionMigrationSpec("members"),
+    CollectionMigrationSpec("reviews"),
+)
+
+
+async def native_bson_migration_completed(
+    mongo_database: MongoDatabase,
+    specs: tuple[CollectionMigrationSpec, ...] = NATIVE_BSON_MIGRATION_SPECS,
+) -> bool:
+    """Проверка при старте: есть отметка о миграции или документов старого формата не осталось.
+
+    Во втором случае (новая база, миграция до появления отметки) отметка
+    ставится, и следующие запуски обходятся одним чтением по _id.
+    """
+    migrations = mongo_database.connection[MIGRATIONS_COLLECTION]
+
+    if await migrations.find_one({"_id": NATIVE_BSON_MIGRATION_ID}) is not None:
+        return True
+
+    for spec in specs:
+        legacy_document = await mongo_database.connection[spec.collection_name].find_one(
+            spec.legacy_query,
+            {"_id": 1},
+        )
+
+        if legacy_document is not None:
+            logger.error("Collection %s still has documents in the legacy format", spec.collection_name)
+            return False
+
+    await migrations.update_one(
+        {"_id": NATIVE_BSON_MIGRATION_ID},
+        {"$set": {"completed_at": datetime.now(UTC)}},
+        upsert=True,
+    )
+    return True
+
+
+def convert_legacy_fields(document: dict, spec: CollectionMigrationSpec) -> dict:
+    """Возвращает ``$set`` только для полей, которые хранятся в старом формате."""
+    changes = {}
+
+    for name in spec.uuid_fields:
+        if isinstance(document.get(name), str):
+            changes[name] = uuid_to_document(uuid_from_document(document[name]))
+
+    for name in spec.uuid_list_fields:
+        values = document.get(name) or []
+        if any(isinstance(value, str) for value in values):
+            changes[name] = [uuid_to_document(uuid_from_document(value)) for value in values]
+
+    for name in spec.datetime_fields:
+        if isinstance(document.get(name), str):
+            changes[name] = datetime_to_document(datetime_from_document(document[name]))
+
+    return changes
+
+
+@dataclass
+class MigrationReport:
+    migrated: dict[str, int] = field(default_factory=dict)
+    failed: dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class NativeBsonMigrationRunner:
+    mongo_database: MongoDatabase
+    specs: tuple[CollectionMigrationSpec, ...] = NATIVE_BSON_MIGRATION_SPECS
+    batch_size: int = 500
+    pause_seconds: float = 0.05
+
+    async def run(self) -> MigrationReport:
+        report = MigrationReport()
+
+        for spec in self.specs:
+            migrated, failed = await self.migrate_collection(spec)
+            report.migrated[spec.collection_name] = migrated
+            report.failed[spec.collection_name] = failed
+            logger.info("Коллекция %s: мигрировано %s, ошибок %s", spec.collection_name, migrated, failed)
+
+        return report
+
+    async def migrate_collection(self, spec: CollectionMigrationSpec) -> tuple[int, int]:
+        collection = self.mongo_database.connection[spec.collection_name]
+        migrated = failed = 0
+        last_id = None
+
+        while True:
+            query = spec.legacy_query
+            if last_id is not None:
+                query = {"$and": [query, {"_id": {"$gt": last_id}}]}
+
+            batch = await collection.find(query).sort("_id", 1).limit(self.batch_size).to_list(self.batch_size)
+            if not batch:
+                break
+
+            operations = []
+            for document in batch:
+                try:
+                    changes = convert_legacy_fields(document, spec)
+                except ValueError:
+                    logger.warning("Не удалось мигрировать документ %s в %s", document["_id"], spec.collection_name)
+                    failed += 1
+                    continue
+
+                # Условие на исходные значения защищает от перезаписи параллельных изменений
+                condition = {"_id": document["_id"], **{name: document[name] for name in changes}}
+                operations.append(UpdateOne(condition, {"$set": changes}))
+
+            if operations:
+                result = await collection.bulk_write(operations, ordered=False)
+                migrated += result.modified_count
+
+            last_id = batch[-1]["_id"]
+            await asyncio.sleep(self.pause_seconds)
+
+        return migrated, failed
+
+
+async def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    mongo_database = get_container().resolve(MongoDatabase)
+    await NativeBsonMigrationRunner(mongo_database=mongo_database).run()
+
+    if await native_bson_migration_completed(mongo_database):
+        logger.info("Миграция завершена, отметка в коллекции %s поставлена", MIGRATIONS_COLLECTION)
+    else:
+        logger.error("Остались документы старого формата: API не запустится до их исправления")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
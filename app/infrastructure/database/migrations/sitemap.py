@@ -0,0 +1,28 @@
+"""Первичное заполнение (или полная пересборка) материализованной карты сайта.
+
+В дальнейшем карта поддерживается командами создания, изменения и удаления
+продуктов, новостей и портфолио; пересборка нужна после правок в базе в обход API.
+
+Запуск: ``python -m infrastructure.database.migrations.sitemap``
+"""
+
+import asyncio
+import logging
+
+from application.container import get_container
+from application.mediator import Mediator
+from application.sitemap.commands import RebuildSitemapCommand
+
+
+logger = logging.getLogger(__name__)
+
+
+async def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    mediator: Mediator = get_container().resolve(Mediator)
+    entries_count, *_ = await mediator.handle_command(RebuildSitemapCommand())
+    logger.info("Sitemap rebuilt: %s entries", entries_count)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,14 +1,99 @@
 from abc import ABC
 from dataclasses import dataclass
+from functools import partial
+from typing import Optional
 
 from infrastructure.database.gateways.mongo import MongoDatabase
 
 
+# Методы записи коллекции Motor, принимающие comment
+_WRITE_METHODS = frozenset(
+    {
+        "insert_one",
+        "insert_many",
+        "update_one",
+        "update_many",
+        "replace_one",
+        "delete_one",
+        "delete_many",
+        "bulk_write",
+        "find_one_and_update",
+        "find_one_and_replace",
+        "find_one_and_delete",
+    },
+)
+
+
+class RepositoryCollection:
+    """Обертка над коллекцией Motor, через которую работают репозитории.
+
+    Ко всем командам добавляет comment с методом репозитория: он попадает в
+    мониторинг команд (CommandStatsListener), в лог медленных запросов и
+    профайлер сервера. К чтениям добавляет maxTimeMS: запрос, упершийся в
+    лимит, прерывается сервером (ExecutionTimeout), а не держит соединение
+    пула. Остальные методы проксируются как есть.
+    """
+
+    def __init__(self, collection, max_time_ms: int = 0, comment: Optional[str] = None) -> None:
+        self._collection = collection
+        self._max_time_ms = max_time_ms
+        self._comment = comment
+
+    def __getattr__(self, name: str):
+        attribute = getattr(self._collection, name)
+
+        if self._comment is not None and name in _WRITE_METHODS:
+            return partial(attribute, comment=self._comment)
+
+        return attribute
+
+    def _tag(self, kwargs: dict) -> dict:
+        if self._comment is not None:
+            kwargs.setdefault("comment", self._comment)
+
+        return kwargs
+
+    def find(self, *args, **kwargs):
+        cursor = self._collection.find(*args, **self._tag(kwargs))
+        return cursor.max_time_ms(self._max_time_ms) if self._max_time_ms else cursor
+
+    async def find_one(self, *args, **kwargs):
+        if self._max_time_ms:
+            kwargs.setdefault("max_time_ms", self._max_time_ms)
+
+        return await self._collection.find_one(*args, **self._tag(kwargs))
+
+    async def count_documents(self, *args, **kwargs):
+        if self._max_time_ms:
+            kwargs.setdefault("maxTimeMS", self._max_time_ms)
+
+        return await self._collection.count_documents(*args, **self._tag(kwargs))
+
+    def aggregate(self, *args, **kwargs):
+        if self._max_time_ms:
+            kwargs.setdefault("maxTimeMS", self._max_time_ms)
+
+        return self._collection.aggregate(*args, **self._tag(kwargs))
+
+
 @dataclass
 class BaseMongoRepository(ABC):
     mongo_database: MongoDatabase
     collection_name: str
 
-    @property
-    def collection(self):
-        return self.mongo_database.connection[self.collection_name]
+    def collection_for(
+        self,
+        method_name: str,
+        collection_name: Optional[str] = None,
+        max_time_ms: Optional[int] = None,
+    ) -> RepositoryCollection:
+        """Коллекция репозитория; method_name - метка команд метода в мониторинге.
+
+        max_time_ms заменяет общий лимит чтений, например для потоковых выдач
+        (mongo_database.stream_max_time_ms).
+        """
+        return RepositoryCollection(
+            self.mongo_database.get_collection(collection_name or self.collection_name),
+            max_time_ms=self.mongo_database.max_time_ms if max_time_ms is None else max_time_ms,
+            comment=f"{type(self).__name__}.{method_name}",
+        )
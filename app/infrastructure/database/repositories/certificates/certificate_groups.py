@@ -5,11 +5,16 @@ from uuid import UUID
 
 from domain.certificates.entities.certificate_groups import CertificateGroupEntity
 from domain.certificates.interfaces.repositories.certificate_groups import BaseCertificateGroupRepository
+from infrastructure.database.converters.base.mongo import (
+    datetime_to_document,
+    uuid_document_query,
+)
 from infrastructure.database.converters.certificates.mongo import (
     certificate_group_document_to_entity,
     certificate_group_entity_to_document,
 )
 from infrastructure.database.repositories.base.mongo import BaseMongoRepository
+from infrastructure.database.sorting import sort_spec
 
 
 @dataclass
@@ -18,36 +23,36 @@ class MongoCertificateGroupRepository(BaseMongoRepository, BaseCertificateGroupR
 
     async def add(self, certificate_group: CertificateGroupEntity) -> CertificateGroupEntity:
         document = certificate_group_entity_to_document(certificate_group)
-        await self.collection.insert_one(document)
+        await self.collection_for("add").insert_one(document)
         return certificate_group
 
     async def get_by_id(self, certificate_group_id: UUID) -> CertificateGroupEntity | None:
-        document = await self.collection.find_one({"oid": str(certificate_group_id)})
+        document = await self.collection_for("get_by_id").find_one({"oid": uuid_document_query(certificate_group_id)})
         if not document:
             return None
         return certificate_group_document_to_entity(document)
 
     async def get_by_title(self, title: str, section: str) -> CertificateGroupEntity | None:
-        document = await self.collection.find_one({"title": title, "section": section})
+        document = await self.collection_for("get_by_title").find_one({"title": title, "section": section})
         if not document:
             return None
         return certificate_group_document_to_entity(document)
 
     async def update(self, certificate_group: CertificateGroupEntity) -> None:
         document = certificate_group_entity_to_document(certificate_group)
-        await self.collection.update_one(
-            {"oid": str(certificate_group.oid)},
+        await self.collection_for("update").update_one(
+            {"oid": uuid_document_query(certificate_group.oid)},
             {"$set": document},
         )
 
     async def update_order(self, certificate_group_id: UUID, order: int) -> None:
-        await self.collection.update_one(
-            {"oid": str(certificate_group_id)},
-            {"$set": {"order": order, "updated_at": datetime.now().isoformat()}},
+        await self.collection_for("update_order").update_one(
+            {"oid": uuid_document_query(certificate_group_id)},
+            {"$set": {"order": order, "updated_at": datetime_to_document(datetime.now())}},
         )
 
     async def delete(self, certificate_group_id: UUID) -> None:
-        await self.collection.delete_one({"oid": str(certificate_group_id)})
+        await self.collection_for("delete").delete_one({"oid": uuid_document_query(certificate_group_id)})
 
     def _build_find_query(
         self,
@@ -86,7 +91,13 @@ class MongoCertificateGroupRepository(BaseMongoRepository, BaseCertificateGroupR
         is_active: bool | None = None,
     ) -> AsyncIterable[CertificateGroupEntity]:
         query = self._build_find_query(search, section, is_active)
-        cursor = self.collection.find(query).sort(sort_field, sort_order).skip(offset).limit(limit)
+        cursor = (
+            self.collection_for("find_many")
+            .find(query, allow_disk_use=True)
+            .sort(sort_spec(self.collection_name, sort_field, sort_order))
+            .skip(offset)
+            .limit(limit)
+        )
         async for document in cursor:
             yield certificate_group_document_to_entity(document)
 
@@ -97,4 +108,4 @@ class MongoCertificateGroupRepository(BaseMongoRepository, BaseCertificateGroupR
         is_active: bool | None = None,
     ) -> int:
         query = self._build_find_query(search, section, is_active)
-        return await self.collection.count_documents(query)
+        return await self.collection_for("count_many").count_documents(query)
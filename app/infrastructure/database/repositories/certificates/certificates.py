@@ -5,11 +5,17 @@ from uuid import UUID
 
 from domain.certificates.entities.certificates import CertificateEntity
 from domain.certificates.interfaces.repositories.certificates import BaseCertificateRepository
+from infrastructure.database.converters.base.mongo import (
+    datetime_to_document,
+    uuid_document_query,
+    uuid_from_document,
+)
 from infrastructure.database.converters.certificates.mongo import (
     certificate_document_to_entity,
     certificate_entity_to_document,
 )
 from infrastructure.database.repositories.base.mongo import BaseMongoRepository
+from infrastructure.database.sorting import sort_spec
 
 
 @dataclass
@@ -18,50 +24,60 @@ class MongoCertificateRepository(BaseMongoRepository, BaseCertificateRepository)
 
     async def add(self, certificate: CertificateEntity, certificate_group_id: UUID) -> CertificateEntity:
         document = certificate_entity_to_document(certificate, certificate_group_id)
-        await self.collection.insert_one(document)
+        await self.collection_for("add").insert_one(document)
         return certificate
 
     async def get_by_id(self, certificate_id: UUID) -> CertificateEntity | None:
-        document = await self.collection.find_one({"oid": str(certificate_id)})
+        document = await self.collection_for("get_by_id").find_one({"oid": uuid_document_query(certificate_id)})
         if not document:
             return None
         return certificate_document_to_entity(document)
 
     async def get_by_title(self, title: str, certificate_group_id: UUID) -> CertificateEntity | None:
-        document = await self.collection.find_one({"title": title, "certificate_group_id": str(certificate_group_id)})
+        document = await self.collection_for("get_by_title").find_one(
+            {"title": title, "certificate_group_id": uuid_document_query(certificate_group_id)},
+        )
         if not document:
             return None
         return certificate_document_to_entity(document)
 
     async def get_certificate_group_id_by_certificate_id(self, certificate_id: UUID) -> UUID | None:
-        document = await self.collection.find_one({"oid": str(certificate_id)}, {"certificate_group_id": 1})
+        document = await self.collection_for("get_certificate_group_id_by_certificate_id").find_one(
+            {"oid": uuid_document_query(certificate_id)},
+            {"certificate_group_id": 1},
+        )
         if not document or "certificate_group_id" not in document:
             return None
-        return UUID(document["certificate_group_id"])
+        return uuid_from_document(document["certificate_group_id"])
 
     async def update(self, certificate: CertificateEntity) -> None:
-        existing_doc = await self.collection.find_one({"oid": str(certificate.oid)}, {"certificate_group_id": 1})
+        existing_doc = await self.collection_for("update").find_one(
+            {"oid": uuid_document_query(certificate.oid)},
+            {"certificate_group_id": 1},
+        )
         if not existing_doc:
             raise ValueError(f"Certificate with id {certificate.oid} not found")
 
-        certificate_group_id = UUID(existing_doc["certificate_group_id"])
+        certificate_group_id = uuid_from_document(existing_doc["certificate_group_id"])
         document = certificate_entity_to_document(certificate, certificate_group_id)
-        await self.collection.update_one(
-            {"oid": str(certificate.oid)},
+        await self.collection_for("update").update_one(
+            {"oid": uuid_document_query(certificate.oid)},
             {"$set": document},
         )
 
     async def update_order(self, certificate_id: UUID, order: int) -> None:
-        await self.collection.update_one(
-            {"oid": str(certificate_id)},
-            {"$set": {"order": order, "updated_at": datetime.now().isoformat()}},
+        await self.collection_for("update_order").update_one(
+            {"oid": uuid_document_query(certificate_id)},
+            {"$set": {"order": order, "updated_at": datetime_to_document(datetime.now())}},
         )
 
     async def delete(self, certificate_id: UUID) -> None:
-        await self.collection.delete_one({"oid": str(certificate_id)})
+        await self.collection_for("delete").delete_one({"oid": uuid_document_query(certificate_id)})
 
     async def delete_all_by_certificate_group_id(self, certificate_group_id: UUID) -> None:
-        await self.collection.delete_many({"certificate_group_id": str(certificate_group_id)})
+        await self.collection_for("delete_all_by_certificate_group_id").delete_many(
+            {"certificate_group_id": uuid_document_query(certificate_group_id)},
+        )
 
     def _build_find_query(
         self,
@@ -71,7 +87,7 @@ class MongoCertificateRepository(BaseMongoRepository, BaseCertificateRepository)
         query = {}
 
         if certificate_group_id:
-            query["certificate_group_id"] = str(certificate_group_id)
+            query["certificate_group_id"] = uuid_document_query(certificate_group_id)
 
         if search:
             query["title"] = {"$regex": search, "$options": "i"}
@@ -88,7 +104,13 @@ class MongoCertificateRepository(BaseMongoRepository, BaseCertificateRepository)
         search: str | None = None,
     ) -> AsyncIterable[CertificateEntity]:
         query = self._build_find_query(certificate_group_id, search)
-        cursor = self.collection.find(query).sort(sort_field, sort_order).skip(offset).limit(limit)
+        cursor = (
+            self.collection_for("find_many")
+            .find(query, allow_disk_use=True)
+            .sort(sort_spec(self.collection_name, sort_field, sort_order))
+            .skip(offset)
+            .limit(limit)
+        )
         async for document in cursor:
             yield certificate_document_to_entity(document)
 
@@ -98,4 +120,4 @@ class MongoCertificateRepository(BaseMongoRepository, BaseCertificateRepository)
         search: str | None = None,
     ) -> int:
         query = self._build_find_query(certificate_group_id, search)
-        return await self.collection.count_documents(query)
+        return await self.collection_for("count_many").count_documents(query)
@@ -17,13 +17,13 @@ class DummyInMemoryNewsRepository(BaseNewsRepository):
         self._saved_news.append(news)
         return news
 
-    async def get_by_id(self, news_id: UUID) -> NewsEntity | None:
+    async def get_by_id(self, news_id: UUID, fields: frozenset[str] | None = None) -> NewsEntity | None:
         try:
             return next(news for news in self._saved_news if news.oid == news_id)
         except StopIteration:
             return None
 
-    async def get_by_slug(self, slug: str) -> NewsEntity | None:
+    async def get_by_slug(self, slug: str, fields: frozenset[str] | None = None) -> NewsEntity | None:
         try:
             return next(news for news in self._saved_news if news.slug.as_generic_type() == slug)
         except StopIteration:
@@ -68,6 +68,7 @@ class DummyInMemoryNewsRepository(BaseNewsRepository):
         limit: int,
         search: str | None = None,
         category: str | None = None,
+        fields: frozenset[str] | None = None,
     ) -> AsyncIterable[NewsEntity]:
         filtered_news = self._build_find_query(search, category)
 
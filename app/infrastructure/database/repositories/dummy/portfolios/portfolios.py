@@ -6,6 +6,7 @@ from dataclasses import (
 from uuid import UUID
 
 from domain.portfolios.entities.portfolios import PortfolioEntity
+from domain.portfolios.entities.summaries import PortfolioSummaryEntity
 from domain.portfolios.interfaces.repository import BasePortfolioRepository
 
 
@@ -17,13 +18,13 @@ class DummyInMemoryPortfolioRepository(BasePortfolioRepository):
         self._saved_portfolios.append(portfolio)
         return portfolio
 
-    async def get_by_id(self, portfolio_id: UUID) -> PortfolioEntity | None:
+    async def get_by_id(self, portfolio_id: UUID, fields: frozenset[str] | None = None) -> PortfolioEntity | None:
         try:
             return next(portfolio for portfolio in self._saved_portfolios if portfolio.oid == portfolio_id)
         except StopIteration:
             return None
 
-    async def get_by_slug(self, slug: str) -> PortfolioEntity | None:
+    async def get_by_slug(self, slug: str, fields: frozenset[str] | None = None) -> PortfolioEntity | None:
         try:
             return next(portfolio for portfolio in self._saved_portfolios if portfolio.slug.as_generic_type() == slug)
         except StopIteration:
@@ -72,6 +73,7 @@ class DummyInMemoryPortfolioRepository(BasePortfolioRepository):
         limit: int,
         search: str | None = None,
         year: int | None = None,
+        fields: frozenset[str] | None = None,
     ) -> AsyncIterable[PortfolioEntity]:
         filtered_portfolios = self._build_find_query(search, year)
 
@@ -91,6 +93,28 @@ class DummyInMemoryPortfolioRepository(BasePortfolioRepository):
         for portfolio in paginated_portfolios:
             yield portfolio
 
+    async def find_many_summaries(
+        self,
+        sort_field: str,
+        sort_order: int,
+        offset: int,
+        limit: int,
+        search: str | None = None,
+        year: int | None = None,
+    ) -> AsyncIterable[PortfolioSummaryEntity]:
+        portfolios_iterable = self.find_many(sort_field, sort_order, offset, limit, search, year)
+        async for portfolio in portfolios_iterable:
+            yield PortfolioSummaryEntity(
+                oid=portfolio.oid,
+                name=portfolio.name,
+                slug=portfolio.slug,
+                poster=portfolio.poster,
+                poster_alt=portfolio.poster_alt,
+                year=portfolio.year,
+                created_at=portfolio.created_at,
+                updated_at=portfolio.updated_at,
+            )
+
     async def count_many(self, search: str | None = None, year: int | None = None) -> int:
         filtered_portfolios = self._build_find_query(search, year)
         return len(filtered_portfolios)
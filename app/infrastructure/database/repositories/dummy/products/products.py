@@ -7,7 +7,10 @@ from dataclasses import (
 from datetime import datetime
 from uuid import UUID
 
-from domain.products.entities import ProductEntity
+from domain.products.entities import (
+    ProductEntity,
+    ProductSummaryEntity,
+)
 from domain.products.interfaces.repository import BaseProductRepository
 
 
@@ -19,13 +22,13 @@ class DummyInMemoryProductRepository(BaseProductRepository):
         self._saved_products.append(product)
         return product
 
-    async def get_by_id(self, product_id: UUID) -> ProductEntity | None:
+    async def get_by_id(self, product_id: UUID, fields: frozenset[str] | None = None) -> ProductEntity | None:
         try:
             return next(product for product in self._saved_products if product.oid == product_id)
         except StopIteration:
             return None
 
-    async def get_by_slug(self, slug: str) -> ProductEntity | None:
+    async def get_by_slug(self, slug: str, fields: frozenset[str] | None = None) -> ProductEntity | None:
         try:
             return next(product for product in self._saved_products if product.slug.as_generic_type() == slug)
         except StopIteration:
@@ -87,10 +90,11 @@ class DummyInMemoryProductRepository(BaseProductRepository):
         sort_field: str,
         sort_order: int,
         offset: int,
-        limit: int,
+        limit: int | None,
         search: str | None = None,
         category: str | None = None,
         is_shown: bool | None = None,
+        fields: frozenset[str] | None = None,
     ) -> AsyncIterable[ProductEntity]:
         filtered_products = self._build_find_query(search, category, is_shown)
 
@@ -105,11 +109,36 @@ class DummyInMemoryProductRepository(BaseProductRepository):
         else:
             filtered_products.sort(key=lambda x: x.created_at, reverse=reverse)
 
-        paginated_products = filtered_products[offset : offset + limit]
+        paginated_products = filtered_products[offset:][:limit]
 
         for product in paginated_products:
             yield product
 
+    async def find_many_summaries(
+        self,
+        sort_field: str,
+        sort_order: int,
+        offset: int,
+        limit: int,
+        search: str | None = None,
+        category: str | None = None,
+        is_shown: bool | None = None,
+    ) -> AsyncIterable[ProductSummaryEntity]:
+        products_iterable = self.find_many(sort_field, sort_order, offset, limit, search, category, is_shown)
+        async for product in products_iterable:
+            yield ProductSummaryEntity(
+                oid=product.oid,
+                category=product.category,
+                name=product.name,
+                slug=product.slug,
+                preview_image_url=product.preview_image_url,
+                preview_image_alt=product.preview_image_alt,
+                order=product.order,
+                is_shown=product.is_shown,
+                created_at=product.created_at,
+                updated_at=product.updated_at,
+            )
+
     async def count_many(
         self,
         search: str | None = None,
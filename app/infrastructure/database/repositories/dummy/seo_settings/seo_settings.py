@@ -104,3 +104,14 @@ class DummyInMemorySeoSettingsRepository(BaseSeoSettingsRepository):
     ) -> int:
         filtered_settings = self._build_find_query(search, is_active)
         return len(filtered_settings)
+
+    async def find_all(self) -> AsyncIterable[SeoSettingsEntity]:
+        for settings in self._saved_settings.copy():
+            yield settings
+
+    async def get_version(self) -> str:
+        if not self._saved_settings:
+            return "0"
+
+        updated_at = max(settings.updated_at for settings in self._saved_settings)
+        return f"{len(self._saved_settings)}:{updated_at}"
@@ -0,0 +1,6 @@
+from infrastructure.database.repositories.dummy.sitemap.sitemap import DummyInMemorySitemapRepository
+
+
+__all__ = [
+    "DummyInMemorySitemapRepository",
+]
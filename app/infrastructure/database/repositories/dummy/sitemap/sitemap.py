@@ -0,0 +1,41 @@
+from collections.abc import AsyncIterable
+from dataclasses import (
+    dataclass,
+    field,
+)
+from uuid import (
+    UUID,
+    uuid4,
+)
+
+from domain.sitemap.entities import SitemapEntryEntity
+from domain.sitemap.interfaces.repository import BaseSitemapRepository
+
+
+@dataclass
+class DummyInMemorySitemapRepository(BaseSitemapRepository):
+    _saved_entries: list[SitemapEntryEntity] = field(default_factory=list, kw_only=True)
+    _version: str = field(default="0", init=False)
+
+    async def upsert(self, entry: SitemapEntryEntity) -> None:
+        self._remove(entry.oid)
+        self._saved_entries.append(entry)
+        self._version = uuid4().hex
+
+    async def delete(self, entry_id: UUID) -> None:
+        self._remove(entry_id)
+        self._version = uuid4().hex
+
+    async def replace_all(self, entries: list[SitemapEntryEntity]) -> None:
+        self._saved_entries = list(entries)
+        self._version = uuid4().hex
+
+    async def find_all(self) -> AsyncIterable[SitemapEntryEntity]:
+        for entry in self._saved_entries.copy():
+            yield entry
+
+    async def get_version(self) -> str:
+        return self._version
+
+    def _remove(self, entry_id: UUID) -> None:
+        self._saved_entries = [entry for entry in self._saved_entries if entry.oid != entry_id]
@@ -3,6 +3,7 @@ from dataclasses import (
     dataclass,
     field,
 )
+from datetime import datetime
 from uuid import UUID
 
 from domain.submissions.entities.submissions import SubmissionEntity
@@ -43,7 +44,7 @@ class DummyInMemorySubmissionRepository(BaseSubmissionRepository):
         sort_field: str,
         sort_order: int,
         offset: int,
-        limit: int,
+        limit: int | None,
         form_type: str | None = None,
     ) -> AsyncIterable[SubmissionEntity]:
         filtered_submissions = self._build_find_query(form_type)
@@ -59,7 +60,7 @@ class DummyInMemorySubmissionRepository(BaseSubmissionRepository):
         else:
             filtered_submissions.sort(key=lambda x: x.created_at, reverse=reverse)
 
-        paginated_submissions = filtered_submissions[offset : offset + limit]
+        paginated_submissions = filtered_submissions[offset:][:limit]
 
         for submission in paginated_submissions:
             yield submission
@@ -67,3 +68,20 @@ class DummyInMemorySubmissionRepository(BaseSubmissionRepository):
     async def count_many(self, form_type: str | None = None) -> int:
         filtered_submissions = self._build_find_query(form_type)
         return len(filtered_submissions)
+
+    async def export_many(
+        self,
+        form_type: str | None = None,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+    ) -> AsyncIterable[SubmissionEntity]:
+        filtered_submissions = [
+            submission
+            for submission in self._build_find_query(form_type)
+            if (created_from is None or submission.created_at >= created_from)
+            and (created_to is None or submission.created_at < created_to)
+        ]
+        filtered_submissions.sort(key=lambda x: x.created_at)
+
+        for submission in filtered_submissions:
+            yield submission
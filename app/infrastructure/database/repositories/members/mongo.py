@@ -5,11 +5,16 @@ from uuid import UUID
 
 from domain.members.entities import MemberEntity
 from domain.members.interfaces.repository import BaseMemberRepository
+from infrastructure.database.converters.base.mongo import (
+    datetime_to_document,
+    uuid_document_query,
+)
 from infrastructure.database.converters.members.mongo import (
     member_document_to_entity,
     member_entity_to_document,
 )
 from infrastructure.database.repositories.base.mongo import BaseMongoRepository
+from infrastructure.database.sorting import sort_spec
 
 
 @dataclass
@@ -18,30 +23,30 @@ class MongoMemberRepository(BaseMongoRepository, BaseMemberRepository):
 
     async def add(self, member: MemberEntity) -> MemberEntity:
         document = member_entity_to_document(member)
-        await self.collection.insert_one(document)
+        await self.collection_for("add").insert_one(document)
         return member
 
     async def get_by_id(self, member_id: UUID) -> MemberEntity | None:
-        document = await self.collection.find_one({"oid": str(member_id)})
+        document = await self.collection_for("get_by_id").find_one({"oid": uuid_document_query(member_id)})
         if not document:
             return None
         return member_document_to_entity(document)
 
     async def update(self, member: MemberEntity) -> None:
         document = member_entity_to_document(member)
-        await self.collection.update_one(
-            {"oid": str(member.oid)},
+        await self.collection_for("update").update_one(
+            {"oid": uuid_document_query(member.oid)},
             {"$set": document},
         )
 
     async def update_order(self, member_id: UUID, order: int) -> None:
-        await self.collection.update_one(
-            {"oid": str(member_id)},
-            {"$set": {"order": order, "updated_at": datetime.now().isoformat()}},
+        await self.collection_for("update_order").update_one(
+            {"oid": uuid_document_query(member_id)},
+            {"$set": {"order": order, "updated_at": datetime_to_document(datetime.now())}},
         )
 
     async def delete(self, member_id: UUID) -> None:
-        await self.collection.delete_one({"oid": str(member_id)})
+        await self.collection_for("delete").delete_one({"oid": uuid_document_query(member_id)})
 
     async def find_many(
         self,
@@ -50,9 +55,15 @@ class MongoMemberRepository(BaseMongoRepository, BaseMemberRepository):
         offset: int,
         limit: int,
     ) -> AsyncIterable[MemberEntity]:
-        cursor = self.collection.find({}).sort(sort_field, sort_order).skip(offset).limit(limit)
+        cursor = (
+            self.collection_for("find_many")
+            .find({}, allow_disk_use=True)
+            .sort(sort_spec(self.collection_name, sort_field, sort_order))
+            .skip(offset)
+            .limit(limit)
+        )
         async for document in cursor:
             yield member_document_to_entity(document)
 
     async def count_many(self) -> int:
-        return await self.collection.count_documents({})
+        return await self.collection_for("count_many").count_documents({})
@@ -4,11 +4,16 @@ from uuid import UUID
 
 from domain.news.entities.news import NewsEntity
 from domain.news.interfaces.repository import BaseNewsRepository
+from infrastructure.database.converters.base.mongo import (
+    fields_projection,
+    uuid_document_query,
+)
 from infrastructure.database.converters.news.mongo import (
     news_document_to_entity,
     news_entity_to_document,
 )
 from infrastructure.database.repositories.base.mongo import BaseMongoRepository
+from infrastructure.database.sorting import sort_spec
 
 
 @dataclass
@@ -17,30 +22,33 @@ class MongoNewsRepository(BaseMongoRepository, BaseNewsRepository):
 
     async def add(self, news: NewsEntity) -> NewsEntity:
         document = news_entity_to_document(news)
-        await self.collection.insert_one(document)
+        await self.collection_for("add").insert_one(document)
         return news
 
-    async def get_by_id(self, news_id: UUID) -> NewsEntity | None:
-        document = await self.collection.find_one({"oid": str(news_id)})
+    async def get_by_id(self, news_id: UUID, fields: frozenset[str] | None = None) -> NewsEntity | None:
+        document = await self.collection_for("get_by_id").find_one(
+            {"oid": uuid_document_query(news_id)},
+            fields_projection(fields),
+        )
         if not document:
             return None
         return news_document_to_entity(document)
 
-    async def get_by_slug(self, slug: str) -> NewsEntity | None:
-        document = await self.collection.find_one({"slug": slug})
+    async def get_by_slug(self, slug: str, fields: frozenset[str] | None = None) -> NewsEntity | None:
+        document = await self.collection_for("get_by_slug").find_one({"slug": slug}, fields_projection(fields))
         if not document:
             return None
         return news_document_to_entity(document)
 
     async def update(self, news: NewsEntity) -> None:
         document = news_entity_to_document(news)
-        await self.collection.update_one(
-            {"oid": str(news.oid)},
+        await self.collection_for("update").update_one(
+            {"oid": uuid_document_query(news.oid)},
             {"$set": document},
         )
 
     async def delete(self, news_id: UUID) -> None:
-        await self.collection.delete_one({"oid": str(news_id)})
+        await self.collection_for("delete").delete_one({"oid": uuid_document_query(news_id)})
 
     def _build_find_query(self, search: str | None = None, category: str | None = None) -> dict:
         query = {}
@@ -69,12 +77,19 @@ class MongoNewsRepository(BaseMongoRepository, BaseNewsRepository):
         limit: int,
         search: str | None = None,
         category: str | None = None,
+        fields: frozenset[str] | None = None,
     ) -> AsyncIterable[NewsEntity]:
         query = self._build_find_query(search, category)
-        cursor = self.collection.find(query).sort(sort_field, sort_order).skip(offset).limit(limit)
+        cursor = (
+            self.collection_for("find_many")
+            .find(query, fields_projection(fields), allow_disk_use=True)
+            .sort(sort_spec(self.collection_name, sort_field, sort_order))
+            .skip(offset)
+            .limit(limit)
+        )
         async for document in cursor:
             yield news_document_to_entity(document)
 
     async def count_many(self, search: str | None = None, category: str | None = None) -> int:
         query = self._build_find_query(search, category)
-        return await self.collection.count_documents(query)
+        return await self.collection_for("count_many").count_documents(query)
@@ -3,12 +3,20 @@ from dataclasses import dataclass
 from uuid import UUID
 
 from domain.portfolios.entities.portfolios import PortfolioEntity
+from domain.portfolios.entities.summaries import PortfolioSummaryEntity
 from domain.portfolios.interfaces.repository import BasePortfolioRepository
+from infrastructure.database.converters.base.mongo import (
+    fields_projection,
+    uuid_document_query,
+)
 from infrastructure.database.converters.portfolios.mongo import (
     portfolio_document_to_entity,
     portfolio_entity_to_document,
+    portfolio_summary_document_to_entity,
+    PORTFOLIO_SUMMARY_PROJECTION,
 )
 from infrastructure.database.repositories.base.mongo import BaseMongoRepository
+from infrastructure.database.sorting import sort_spec
 
 
 @dataclass
@@ -17,30 +25,33 @@ class MongoPortfolioRepository(BaseMongoRepository, BasePortfolioRepository):
 
     async def add(self, portfolio: PortfolioEntity) -> PortfolioEntity:
         document = portfolio_entity_to_document(portfolio)
-        await self.collection.insert_one(document)
+        await self.collection_for("add").insert_one(document)
         return portfolio
 
-    async def get_by_id(self, portfolio_id: UUID) -> PortfolioEntity | None:
-        document = await self.collection.find_one({"oid": str(portfolio_id)})
+    async def get_by_id(self, portfolio_id: UUID, fields: frozenset[str] | None = None) -> PortfolioEntity | None:
+        document = await self.collection_for("get_by_id").find_one(
+            {"oid": uuid_document_query(portfolio_id)},
+            fields_projection(fields),
+        )
         if not document:
             return None
         return portfolio_document_to_entity(document)
 
-    async def get_by_slug(self, slug: str) -> PortfolioEntity | None:
-        document = await self.collection.find_one({"slug": slug})
+    async def get_by_slug(self, slug: str, fields: frozenset[str] | None = None) -> PortfolioEntity | None:
+        document = await self.collection_for("get_by_slug").find_one({"slug": slug}, fields_projection(fields))
         if not document:
             return None
         return portfolio_document_to_entity(document)
 
     async def update(self, portfolio: PortfolioEntity) -> None:
         document = portfolio_entity_to_document(portfolio)
-        await self.collection.update_one(
-            {"oid": str(portfolio.oid)},
+        await self.collection_for("update").update_one(
+            {"oid": uuid_document_query(portfolio.oid)},
             {"$set": document},
         )
 
     async def delete(self, portfolio_id: UUID) -> None:
-        await self.collection.delete_one({"oid": str(portfolio_id)})
+        await self.collection_for("delete").delete_one({"oid": uuid_document_query(portfolio_id)})
 
     def _build_find_query(self, search: str | None = None, year: int | None = None) -> dict:
         query = {}
@@ -71,12 +82,39 @@ class MongoPortfolioRepository(BaseMongoRepository, BasePortfolioRepository):
         limit: int,
         search: str | None = None,
         year: int | None = None,
+        fields: frozenset[str] | None = None,
     ) -> AsyncIterable[PortfolioEntity]:
         query = self._build_find_query(search, year)
-        cursor = self.collection.find(query).sort(sort_field, sort_order).skip(offset).limit(limit)
+        cursor = (
+            self.collection_for("find_many")
+            .find(query, fields_projection(fields), allow_disk_use=True)
+            .sort(sort_spec(self.collection_name, sort_field, sort_order))
+            .skip(offset)
+            .limit(limit)
+        )
         async for document in cursor:
             yield portfolio_document_to_entity(document)
 
+    async def find_many_summaries(
+        self,
+        sort_field: str,
+        sort_order: int,
+        offset: int,
+        limit: int,
+        search: str | None = None,
+        year: int | None = None,
+    ) -> AsyncIterable[PortfolioSummaryEntity]:
+        query = self._build_find_query(search, year)
+        cursor = (
+            self.collection_for("find_many_summaries")
+            .find(query, PORTFOLIO_SUMMARY_PROJECTION, allow_disk_use=True)
+            .sort(sort_spec(self.collection_name, sort_field, sort_order))
+            .skip(offset)
+            .limit(limit)
+        )
+        async for document in cursor:
+            yield portfolio_summary_document_to_entity(document)
+
     async def count_many(self, search: str | None = None, year: int | None = None) -> int:
         query = self._build_find_query(search, year)
-        return await self.collection.count_documents(query)
+        return await self.collection_for("count_many").count_documents(query)
@@ -3,13 +3,24 @@ from dataclasses import dataclass
 from datetime import datetime
 from uuid import UUID
 
-from domain.products.entities import ProductEntity
+from domain.products.entities import (
+    ProductEntity,
+    ProductSummaryEntity,
+)
 from domain.products.interfaces.repository import BaseProductRepository
+from infrastructure.database.converters.base.mongo import (
+    datetime_to_document,
+    fields_projection,
+    uuid_document_query,
+)
 from infrastructure.database.converters.products.mongo import (
     product_document_to_entity,
     product_entity_to_document,
+    product_summary_document_to_entity,
+    PRODUCT_SUMMARY_PROJECTION,
 )
 from infrastructure.database.repositories.base.mongo import BaseMongoRepository
+from infrastructure.database.sorting import sort_spec
 
 
 @dataclass
@@ -18,36 +29,39 @@ class MongoProductRepository(BaseMongoRepository, BaseProductRepository):
 
     async def add(self, product: ProductEntity) -> ProductEntity:
         document = product_entity_to_document(product)
-        await self.collection.insert_one(document)
+        await self.collection_for("add").insert_one(document)
         return product
 
-    async def get_by_id(self, product_id: UUID) -> ProductEntity | None:
-        document = await self.collection.find_one({"oid": str(product_id)})
+    async def get_by_id(self, product_id: UUID, fields: frozenset[str] | None = None) -> ProductEntity | None:
+        document = await self.collection_for("get_by_id").find_one(
+            {"oid": uuid_document_query(product_id)},
+            fields_projection(fields),
+        )
         if not document:
             return None
         return product_document_to_entity(document)
 
-    async def get_by_slug(self, slug: str) -> ProductEntity | None:
-        document = await self.collection.find_one({"slug": slug})
+    async def get_by_slug(self, slug: str, fields: frozenset[str] | None = None) -> ProductEntity | None:
+        document = await self.collection_for("get_by_slug").find_one({"slug": slug}, fields_projection(fields))
         if not document:
             return None
         return product_document_to_entity(document)
 
     async def update(self, product: ProductEntity) -> None:
         document = product_entity_to_document(product)
-        await self.collection.update_one(
-            {"oid": str(product.oid)},
+        await self.collection_for("update").update_one(
+            {"oid": uuid_document_query(product.oid)},
             {"$set": document},
         )
 
     async def update_order(self, product_id: UUID, order: int) -> None:
-        await self.collection.update_one(
-            {"oid": str(product_id)},
-            {"$set": {"order": order, "updated_at": datetime.now().isoformat()}},
+        await self.collection_for("update_order").update_one(
+            {"oid": uuid_document_query(product_id)},
+            {"$set": {"order": order, "updated_at": datetime_to_document(datetime.now())}},
         )
 
     async def delete(self, product_id: UUID) -> None:
-        await self.collection.delete_one({"oid": str(product_id)})
+        await self.collection_for("delete").delete_one({"oid": uuid_document_query(product_id)})
 
     def _build_find_query(
         self,
@@ -80,16 +94,47 @@ class MongoProductRepository(BaseMongoRepository, BaseProductRepository):
         sort_field: str,
         sort_order: int,
         offset: int,
-        limit: int,
+        limit: int | None,
         search: str | None = None,
         category: str | None = None,
         is_shown: bool | None = None,
+        fields: frozenset[str] | None = None,
     ) -> AsyncIterable[ProductEntity]:
         query = self._build_find_query(search, category, is_shown)
-        cursor = self.collection.find(query).sort(sort_field, sort_order).skip(offset).limit(limit)
+        # Список без limit отдается потоком (NDJSON): общий лимит времени оборвал бы уже начатый ответ
+        max_time_ms = self.mongo_database.stream_max_time_ms if limit is None else None
+        cursor = (
+            self.collection_for("find_many", max_time_ms=max_time_ms)
+            .find(query, fields_projection(fields), allow_disk_use=True)
+            .sort(sort_spec(self.collection_name, sort_field, sort_order))
+            .skip(offset)
+            # limit 0 в Mongo - без ограничения: потоковый список отдается целиком
+            .limit(limit or 0)
+        )
         async for document in cursor:
             yield product_document_to_entity(document)
 
+    async def find_many_summaries(
+        self,
+        sort_field: str,
+        sort_order: int,
+        offset: int,
+        limit: int,
+        search: str | None = None,
+        category: str | None = None,
+        is_shown: bool | None = None,
+    ) -> AsyncIterable[ProductSummaryEntity]:
+        query = self._build_find_query(search, category, is_shown)
+        cursor = (
+            self.collection_for("find_many_summaries")
+            .find(query, PRODUCT_SUMMARY_PROJECTION, allow_disk_use=True)
+            .sort(sort_spec(self.collection_name, sort_field, sort_order))
+            .skip(offset)
+            .limit(limit)
+        )
+        async for document in cursor:
+            yield product_summary_document_to_entity(document)
+
     async def count_many(
         self,
         search: str | None = None,
@@ -97,4 +142,4 @@ class MongoProductRepository(BaseMongoRepository, BaseProductRepository):
         is_shown: bool | None = None,
     ) -> int:
         query = self._build_find_query(search, category, is_shown)
-        return await self.collection.count_documents(query)
+        return await self.collection_for("count_many").count_documents(query)
@@ -4,11 +4,13 @@ from uuid import UUID
 
 from domain.reviews.entities import ReviewEntity
 from domain.reviews.interfaces.repository import BaseReviewRepository
+from infrastructure.database.converters.base.mongo import uuid_document_query
 from infrastructure.database.converters.reviews.mongo import (
     review_document_to_entity,
     review_entity_to_document,
 )
 from infrastructure.database.repositories.base.mongo import BaseMongoRepository
+from infrastructure.database.sorting import sort_spec
 
 
 @dataclass
@@ -22,24 +24,24 @@ class MongoReviewRepository(BaseMongoRepository, BaseReviewRepository):
 
     async def add(self, review: ReviewEntity) -> ReviewEntity:
         document = review_entity_to_document(review)
-        await self.collection.insert_one(document)
+        await self.collection_for("add").insert_one(document)
         return review
 
     async def get_by_id(self, review_id: UUID) -> ReviewEntity | None:
-        document = await self.collection.find_one({"oid": str(review_id)})
+        document = await self.collection_for("get_by_id").find_one({"oid": uuid_document_query(review_id)})
         if not document:
             return None
         return review_document_to_entity(document)
 
     async def update(self, review: ReviewEntity) -> None:
         document = review_entity_to_document(review)
-        await self.collection.update_one(
-            {"oid": str(review.oid)},
+        await self.collection_for("update").update_one(
+            {"oid": uuid_document_query(review.oid)},
             {"$set": document},
         )
 
     async def delete(self, review_id: UUID) -> None:
-        await self.collection.delete_one({"oid": str(review_id)})
+        await self.collection_for("delete").delete_one({"oid": uuid_document_query(review_id)})
 
     async def find_many(
         self,
@@ -50,10 +52,16 @@ class MongoReviewRepository(BaseMongoRepository, BaseReviewRepository):
         limit: int,
     ) -> AsyncIterable[ReviewEntity]:
         query = self._build_query(category)
-        cursor = self.collection.find(query).sort(sort_field, sort_order).skip(offset).limit(limit)
+        cursor = (
+            self.collection_for("find_many")
+            .find(query, allow_disk_use=True)
+            .sort(sort_spec(self.collection_name, sort_field, sort_order))
+            .skip(offset)
+            .limit(limit)
+        )
         async for document in cursor:
             yield review_document_to_entity(document)
 
     async def count_many(self, category: str | None) -> int:
         query = self._build_query(category)
-        return await self.collection.count_documents(query)
+        return await self.collection_for("count_many").count_documents(query)
@@ -4,11 +4,13 @@ from uuid import UUID
 
 from domain.seo_settings.entities import SeoSettingsEntity
 from domain.seo_settings.interfaces.repository import BaseSeoSettingsRepository
+from infrastructure.database.converters.base.mongo import uuid_document_query
 from infrastructure.database.converters.seo_settings.mongo import (
     seo_settings_document_to_entity,
     seo_settings_entity_to_document,
 )
 from infrastructure.database.repositories.base.mongo import BaseMongoRepository
+from infrastructure.database.sorting import sort_spec
 
 
 @dataclass
@@ -17,30 +19,30 @@ class MongoSeoSettingsRepository(BaseMongoRepository, BaseSeoSettingsRepository)
 
     async def add(self, seo_settings: SeoSettingsEntity) -> SeoSettingsEntity:
         document = seo_settings_entity_to_document(seo_settings)
-        await self.collection.insert_one(document)
+        await self.collection_for("add").insert_one(document)
         return seo_settings
 
     async def get_by_id(self, seo_settings_id: UUID) -> SeoSettingsEntity | None:
-        document = await self.collection.find_one({"oid": str(seo_settings_id)})
+        document = await self.collection_for("get_by_id").find_one({"oid": uuid_document_query(seo_settings_id)})
         if not document:
             return None
         return seo_settings_document_to_entity(document)
 
     async def get_by_path(self, page_path: str) -> SeoSettingsEntity | None:
-        document = await self.collection.find_one({"page_path": page_path})
+        document = await self.collection_for("get_by_path").find_one({"page_path": page_path})
         if not document:
             return None
         return seo_settings_document_to_entity(document)
 
     async def update(self, seo_settings: SeoSettingsEntity) -> None:
         document = seo_settings_entity_to_document(seo_settings)
-        await self.collection.update_one(
-            {"oid": str(seo_settings.oid)},
+        await self.collection_for("update").update_one(
+            {"oid": uuid_document_query(seo_settings.oid)},
             {"$set": document},
         )
 
     async def delete(self, seo_settings_id: UUID) -> None:
-        await self.collection.delete_one({"oid": str(seo_settings_id)})
+        await self.collection_for("delete").delete_one({"oid": uuid_document_query(seo_settings_id)})
 
     def _build_find_query(self, search: str | None = None, is_active: bool | None = None) -> dict:
         query = {}
@@ -71,7 +73,13 @@ class MongoSeoSettingsRepository(BaseMongoRepository, BaseSeoSettingsRepository)
         is_active: bool | None = None,
     ) -> AsyncIterable[SeoSettingsEntity]:
         query = self._build_find_query(search, is_active)
-        cursor = self.collection.find(query).sort(sort_field, sort_order).skip(offset).limit(limit)
+        cursor = (
+            self.collection_for("find_many")
+            .find(query, allow_disk_use=True)
+            .sort(sort_spec(self.collection_name, sort_field, sort_order))
+            .skip(offset)
+            .limit(limit)
+        )
         async for document in cursor:
             yield seo_settings_document_to_entity(document)
 
@@ -81,4 +89,19 @@ class MongoSeoSettingsRepository(BaseMongoRepository, BaseSeoSettingsRepository)
         is_active: bool | None = None,
     ) -> int:
         query = self._build_find_query(search, is_active)
-        return await self.collection.count_documents(query)
+        return await self.collection_for("count_many").count_documents(query)
+
+    async def find_all(self) -> AsyncIterable[SeoSettingsEntity]:
+        async for document in self.collection_for("find_all").find({}):
+            yield seo_settings_document_to_entity(document)
+
+    async def get_version(self) -> str:
+        cursor = self.collection_for("get_version").aggregate(
+            [{"$group": {"_id": None, "count": {"$sum": 1}, "updated_at": {"$max": "$updated_at"}}}],
+        )
+        result = await cursor.to_list(length=1)
+
+        if not result:
+            return "0"
+
+        return f"{result[0]['count']}:{result[0]['updated_at']}"
@@ -0,0 +1,6 @@
+from infrastructure.database.repositories.sitemap.mongo import MongoSitemapRepository
+
+
+__all__ = [
+    "MongoSitemapRepository",
+]
@@ -0,0 +1,86 @@
+from collections.abc import AsyncIterable
+from dataclasses import dataclass
+from uuid import (
+    UUID,
+    uuid4,
+)
+
+from pymongo import ReplaceOne
+
+from domain.sitemap.entities import SitemapEntryEntity
+from domain.sitemap.interfaces.repository import BaseSitemapRepository
+from infrastructure.database.converters.base.mongo import uuid_document_query
+from infrastructure.database.converters.sitemap.mongo import (
+    sitemap_entry_document_to_entity,
+    sitemap_entry_entity_to_document,
+)
+from infrastructure.database.repositories.base.mongo import BaseMongoRepository
+
+
+SITEMAP_VERSION_DOCUMENT_ID = "sitemap_entries"
+
+
+@dataclass
+class MongoSitemapRepository(BaseMongoRepository, BaseSitemapRepository):
+    """Записи карты сайта и документ ее версии.
+
+    Каждая запись меняет версию в отдельной коллекции sitemap_state, поэтому
+    проверка версии перед отдачей документа - чтение одного документа по _id,
+    а не агрегация по всей коллекции записей.
+    """
+
+    collection_name: str = "sitemap_entries"
+    state_collection_name: str = "sitemap_state"
+
+    async def upsert(self, entry: SitemapEntryEntity) -> None:
+        document = sitemap_entry_entity_to_document(entry)
+        await self.collection_for("upsert").replace_one(
+            {"oid": uuid_document_query(entry.oid)},
+            document,
+            upsert=True,
+        )
+        await self._bump_version("upsert")
+
+    async def delete(self, entry_id: UUID) -> None:
+        await self.collection_for("delete").delete_one({"oid": uuid_document_query(entry_id)})
+        await self._bump_version("delete")
+
+    async def replace_all(self, entries: list[SitemapEntryEntity]) -> None:
+        if entries:
+            await self.collection_for("replace_all").bulk_write(
+                [
+                    ReplaceOne(
+                        {"oid": uuid_document_query(entry.oid)},
+                        sitemap_entry_entity_to_document(entry),
+                        upsert=True,
+                    )
+                    for entry in entries
+                ],
+                ordered=False,
+            )
+
+        # Удаляем записи сущностей, которых больше нет среди источников
+        await self.collection_for("replace_all").delete_many(
+            {"oid": {"$nin": [sitemap_entry_entity_to_document(entry)["oid"] for entry in entries]}},
+        )
+        await self._bump_version("replace_all")
+
+    async def find_all(self) -> AsyncIterable[SitemapEntryEntity]:
+        async for document in self.collection_for("find_all").find({}):
+            yield sitemap_entry_document_to_entity(document)
+
+    async def get_version(self) -> str:
+        document = await self.collection_for("get_version", self.state_collection_name).find_one(
+            {"_id": SITEMAP_VERSION_DOCUMENT_ID},
+        )
+
+        # До первой записи после выкладки документа версии еще нет
+        return document["version"] if document is not None else "0"
+
+    async def _bump_version(self, method_name: str) -> None:
+        # Случайная версия, а не счетчик: ETag не совпадет с выданным до очистки базы
+        await self.collection_for(method_name, self.state_collection_name).update_one(
+            {"_id": SITEMAP_VERSION_DOCUMENT_ID},
+            {"$set": {"version": uuid4().hex}},
+            upsert=True,
+        )
@@ -1,40 +1,55 @@
 from collections.abc import AsyncIterable
 from dataclasses import dataclass
+from datetime import datetime
 from uuid import UUID
 
 from domain.submissions.entities.submissions import SubmissionEntity
 from domain.submissions.interfaces.repository import BaseSubmissionRepository
+from infrastructure.database.converters.base.mongo import (
+    datetime_range_document_query,
+    uuid_document_query,
+)
 from infrastructure.database.converters.submissions.mongo import (
     submission_document_to_entity,
     submission_entity_to_document,
 )
 from infrastructure.database.repositories.base.mongo import BaseMongoRepository
+from infrastructure.database.sorting import sort_spec
 
 
 @dataclass
 class MongoSubmissionRepository(BaseMongoRepository, BaseSubmissionRepository):
     collection_name: str = "submissions"
+    # Размер пачки курсора для выгрузок: меньше round-trip'ов, чем у дефолтных 101 документа
+    export_batch_size: int = 1000
 
     async def add(self, submission: SubmissionEntity) -> SubmissionEntity:
         document = submission_entity_to_document(submission)
-        await self.collection.insert_one(document)
+        await self.collection_for("add").insert_one(document)
         return submission
 
     async def get_by_id(self, submission_id: UUID) -> SubmissionEntity | None:
-        document = await self.collection.find_one({"oid": str(submission_id)})
+        document = await self.collection_for("get_by_id").find_one({"oid": uuid_document_query(submission_id)})
         if not document:
             return None
         return submission_document_to_entity(document)
 
     async def delete(self, submission_id: UUID) -> None:
-        await self.collection.delete_one({"oid": str(submission_id)})
+        await self.collection_for("delete").delete_one({"oid": uuid_document_query(submission_id)})
 
-    def _build_find_query(self, form_type: str | None = None) -> dict:
+    def _build_find_query(
+        self,
+        form_type: str | None = None,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+    ) -> dict:
         query = {}
 
         if form_type:
             query["form_type"] = form_type
 
+        query.update(datetime_range_document_query("created_at", created_from, created_to))
+
         return query
 
     async def find_many(
@@ -42,14 +57,40 @@ class MongoSubmissionRepository(BaseMongoRepository, BaseSubmissionRepository):
         sort_field: str,
         sort_order: int,
         offset: int,
-        limit: int,
+        limit: int | None,
         form_type: str | None = None,
     ) -> AsyncIterable[SubmissionEntity]:
         query = self._build_find_query(form_type)
-        cursor = self.collection.find(query).sort(sort_field, sort_order).skip(offset).limit(limit)
+        # Список без limit отдается потоком (NDJSON): общий лимит времени оборвал бы уже начатый ответ
+        max_time_ms = self.mongo_database.stream_max_time_ms if limit is None else None
+        cursor = (
+            self.collection_for("find_many", max_time_ms=max_time_ms)
+            .find(query, allow_disk_use=True)
+            .sort(sort_spec(self.collection_name, sort_field, sort_order))
+            .skip(offset)
+            # limit 0 в Mongo - без ограничения: потоковый список отдается целиком
+            .limit(limit or 0)
+        )
         async for document in cursor:
             yield submission_document_to_entity(document)
 
     async def count_many(self, form_type: str | None = None) -> int:
         query = self._build_find_query(form_type)
-        return await self.collection.count_documents(query)
+        return await self.collection_for("count_many").count_documents(query)
+
+    async def export_many(
+        self,
+        form_type: str | None = None,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+    ) -> AsyncIterable[SubmissionEntity]:
+        query = self._build_find_query(form_type, created_from, created_to)
+        cursor = (
+            # Файл пишется потоком: лимит maxTimeMS суммируется по getMore и оборвал бы выгрузку на середине
+            self.collection_for("export_many", max_time_ms=self.mongo_database.stream_max_time_ms)
+            .find(query)
+            .sort([("created_at", 1), ("oid", 1)])
+            .batch_size(self.export_batch_size)
+        )
+        async for document in cursor:
+            yield submission_document_to_entity(document)
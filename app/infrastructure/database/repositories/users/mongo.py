@@ -3,6 +3,7 @@ from uuid import UUID
 
 from domain.users.entities.users import UserEntity
 from domain.users.interfaces.repository import BaseUserRepository
+from infrastructure.database.converters.base.mongo import uuid_document_query
 from infrastructure.database.converters.users.mongo import (
     user_document_to_entity,
     user_entity_to_document,
@@ -16,16 +17,16 @@ class MongoUserRepository(BaseMongoRepository, BaseUserRepository):
 
     async def add(self, user: UserEntity) -> None:
         document = user_entity_to_document(user)
-        await self.collection.insert_one(document)
+        await self.collection_for("add").insert_one(document)
 
     async def get_by_id(self, user_id: UUID) -> UserEntity | None:
-        document = await self.collection.find_one({"oid": str(user_id)})
+        document = await self.collection_for("get_by_id").find_one({"oid": uuid_document_query(user_id)})
         if not document:
             return None
         return user_document_to_entity(document)
 
     async def get_by_email(self, email: str) -> UserEntity | None:
-        document = await self.collection.find_one({"email": email.lower()})
+        document = await self.collection_for("get_by_email").find_one({"email": email.lower()})
         if not document:
             return None
         return user_document_to_entity(document)
@@ -4,11 +4,13 @@ from uuid import UUID
 
 from domain.vacancies.entities.vacancies import VacancyEntity
 from domain.vacancies.interfaces.repository import BaseVacancyRepository
+from infrastructure.database.converters.base.mongo import uuid_document_query
 from infrastructure.database.converters.vacancies.mongo import (
     vacancy_document_to_entity,
     vacancy_entity_to_document,
 )
 from infrastructure.database.repositories.base.mongo import BaseMongoRepository
+from infrastructure.database.sorting import sort_spec
 
 
 @dataclass
@@ -17,24 +19,24 @@ class MongoVacancyRepository(BaseMongoRepository, BaseVacancyRepository):
 
     async def add(self, vacancy: VacancyEntity) -> VacancyEntity:
         document = vacancy_entity_to_document(vacancy)
-        await self.collection.insert_one(document)
+        await self.collection_for("add").insert_one(document)
         return vacancy
 
     async def get_by_id(self, vacancy_id: UUID) -> VacancyEntity | None:
-        document = await self.collection.find_one({"oid": str(vacancy_id)})
+        document = await self.collection_for("get_by_id").find_one({"oid": uuid_document_query(vacancy_id)})
         if not document:
             return None
         return vacancy_document_to_entity(document)
 
     async def update(self, vacancy: VacancyEntity) -> None:
         document = vacancy_entity_to_document(vacancy)
-        await self.collection.update_one(
-            {"oid": str(vacancy.oid)},
+        await self.collection_for("update").update_one(
+            {"oid": uuid_document_query(vacancy.oid)},
             {"$set": document},
         )
 
     async def delete(self, vacancy_id: UUID) -> None:
-        await self.collection.delete_one({"oid": str(vacancy_id)})
+        await self.collection_for("delete").delete_one({"oid": uuid_document_query(vacancy_id)})
 
     def _build_find_query(self, search: str | None = None, category: str | None = None) -> dict:
         query = {}
@@ -65,10 +67,16 @@ class MongoVacancyRepository(BaseMongoRepository, BaseVacancyRepository):
         category: str | None = None,
     ) -> AsyncIterable[VacancyEntity]:
         query = self._build_find_query(search, category)
-        cursor = self.collection.find(query).sort(sort_field, sort_order).skip(offset).limit(limit)
+        cursor = (
+            self.collection_for("find_many")
+            .find(query, allow_disk_use=True)
+            .sort(sort_spec(self.collection_name, sort_field, sort_order))
+            .skip(offset)
+            .limit(limit)
+        )
         async for document in cursor:
             yield vacancy_document_to_entity(document)
 
     async def count_many(self, search: str | None = None, category: str | None = None) -> int:
         query = self._build_find_query(search, category)
-        return await self.collection.count_documents(query)
+        return await self.collection_for("count_many").count_documents(query)
@@ -0,0 +1,58 @@
+"""Допустимые поля сортировки списков и индексы под них.
+
+Для каждого поля есть составной индекс (поле, oid): сортировка идет по
+индексу, а не в памяти, и порядок стабилен при равных значениях поля, так
+что страницы skip/limit не теряют и не дублируют документы. Направление oid
+совпадает с направлением поля, поэтому обратный порядок читается тем же
+индексом в обратную сторону.
+"""
+
+from pymongo import (
+    ASCENDING,
+    IndexModel,
+)
+
+from domain.base.exceptions import InvalidSortFieldException
+
+
+TIEBREAKER_FIELD = "oid"
+
+SORT_FIELDS: dict[str, tuple[str, ...]] = {
+    "products": ("created_at", "order", "name"),
+    "news": ("created_at", "date", "title", "category"),
+    "portfolio": ("created_at", "year", "name"),
+    "seo_settings": ("created_at", "updated_at", "page_path", "page_name", "title"),
+    "certificates": ("created_at", "order", "title"),
+    "certificate_groups": ("created_at", "order", "title", "section"),
+    "submissions": ("created_at", "name", "form_type"),
+    "reviews": ("created_at", "name", "category"),
+    "vacancies": ("created_at", "title", "category", "salary"),
+    "members": ("order", "created_at", "name", "position"),
+}
+
+
+def sort_index_name(sort_field: str) -> str:
+    return f"{sort_field}_{TIEBREAKER_FIELD}"
+
+
+def sort_indexes(collection_name: str) -> list[IndexModel]:
+    """Индексы (поле, oid) под все допустимые поля сортировки коллекции."""
+    return [
+        IndexModel([(sort_field, ASCENDING), (TIEBREAKER_FIELD, ASCENDING)], name=sort_index_name(sort_field))
+        for sort_field in SORT_FIELDS.get(collection_name, ())
+    ]
+
+
+def validate_sort_field(collection_name: str, sort_field: str) -> str:
+    allowed_fields = SORT_FIELDS[collection_name]
+
+    if sort_field not in allowed_fields:
+        raise InvalidSortFieldException(sort_field=sort_field, allowed_fields=allowed_fields)
+
+    return sort_field
+
+
+def sort_spec(collection_name: str, sort_field: str, sort_order: int) -> list[tuple[str, int]]:
+    """Сортировка для find(): допустимое поле и oid как стабильный тай-брейкер."""
+    validate_sort_field(collection_name, sort_field)
+    return [(sort_field, sort_order), (TIEBREAKER_FIELD, sort_order)]
@@ -6,6 +6,7 @@ from typing import (
 
 import httpx
 
+from infrastructure.metrics.instruments import track_external_call
 from settings.config import Config
 
 
@@ -82,17 +83,18 @@ class BitrixClient:
             },
         }
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                f"{self.webhook_url}/crm.lead.add.json",
-                json=request_data,
-                headers={
-                    "Content-Type": "application/json",
-                },
-            )
-
-            response.raise_for_status()
-            response_data = response.json()
+        with track_external_call("bitrix", "crm.lead.add"):
+            async with httpx.AsyncClient(timeout=self.timeout) as client:
+                response = await client.post(
+                    f"{self.webhook_url}/crm.lead.add.json",
+                    json=request_data,
+                    headers={
+                        "Content-Type": "application/json",
+                    },
+                )
+
+                response.raise_for_status()
+                response_data = response.json()
 
         if response_data and "result" in response_data:
             return response_data["result"]
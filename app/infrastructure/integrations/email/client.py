@@ -3,6 +3,7 @@ from email.mime.text import MIMEText
 
 import aiosmtplib
 
+from infrastructure.metrics.instruments import track_external_call
 from settings.email import EmailConfig
 
 
@@ -31,14 +32,15 @@ class EmailClient:
         await self._send(message)
 
     async def _send(self, message: MIMEMultipart) -> None:
-        await aiosmtplib.send(
-            message,
-            hostname=self.config.smtp_host,
-            port=self.config.smtp_port,
-            username=self.config.smtp_user if self.config.smtp_user else None,
-            password=self.config.smtp_password if self.config.smtp_password else None,
-            use_tls=self.config.smtp_use_tls,
-        )
+        with track_external_call("smtp", "send"):
+            await aiosmtplib.send(
+                message,
+                hostname=self.config.smtp_host,
+                port=self.config.smtp_port,
+                username=self.config.smtp_user if self.config.smtp_user else None,
+                password=self.config.smtp_password if self.config.smtp_password else None,
+                use_tls=self.config.smtp_use_tls,
+            )
 
     @staticmethod
     def _format_email_address(email: str, name: str | None = None) -> str:
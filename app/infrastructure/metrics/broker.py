@@ -0,0 +1,41 @@
+import time
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+)
+
+from faststream import BaseMiddleware
+
+from infrastructure.metrics.instruments import (
+    BROKER_CONSUME_DURATION,
+    BROKER_MESSAGES_CONSUMED,
+    BROKER_MESSAGES_PUBLISHED,
+)
+
+
+class BrokerMetricsMiddleware(BaseMiddleware):
+    """Считает публикации и обработанные сообщения RabbitMQ по очередям; скорость - rate() от счетчиков."""
+
+    async def consume_scope(self, call_next: Callable[[Any], Awaitable[Any]], msg: Any) -> Any:
+        queue = getattr(msg.raw_message, "routing_key", None) or "-"
+        started_at = time.perf_counter()
+        outcome = "error"
+
+        try:
+            result = await call_next(msg)
+            outcome = "ok"
+            return result
+        finally:
+            BROKER_MESSAGES_CONSUMED.labels(queue, outcome).inc()
+            BROKER_CONSUME_DURATION.labels(queue).observe(time.perf_counter() - started_at)
+
+    async def publish_scope(self, call_next: Callable[[Any], Awaitable[Any]], cmd: Any) -> Any:
+        outcome = "error"
+
+        try:
+            result = await call_next(cmd)
+            outcome = "ok"
+            return result
+        finally:
+            BROKER_MESSAGES_PUBLISHED.labels(cmd.destination or "-", outcome).inc()
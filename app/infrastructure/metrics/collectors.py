@@ -0,0 +1,80 @@
+"""Коллекторы: счетчики, которые уже ведутся в другом месте, в формате снимка метрик."""
+
+from typing import Callable
+
+from infrastructure.database.gateways.command_stats import LATENCY_BUCKETS_MS
+from infrastructure.database.gateways.mongo import MongoDatabase
+from infrastructure.metrics.registry import Snapshot
+
+
+_COMMAND_LABELS = ["collection", "command", "method"]
+
+
+def mongo_commands_snapshot(command_stats: list[dict]) -> Snapshot:
+    """Статистика CommandStatsListener: гистограмма задержек в секундах, документы и ошибки."""
+    keys = [[stats["collection"], stats["command"], stats["method"]] for stats in command_stats]
+
+    return {
+        "mongo_command_duration_seconds": {
+            "type": "histogram",
+            "help": "Время выполнения команды Mongo по коллекции, команде и методу репозитория",
+            "labels": _COMMAND_LABELS,
+            "buckets": [bound / 1000 for bound in LATENCY_BUCKETS_MS],
+            "samples": [
+                [key, {"buckets": _bucket_counts(stats["buckets"]), "sum": stats["duration_ms_total"] / 1000}]
+                for key, stats in zip(keys, command_stats)
+            ],
+        },
+        "mongo_command_documents_total": {
+            "type": "counter",
+            "help": "Документы, возвращенные или затронутые командами Mongo",
+            "labels": _COMMAND_LABELS,
+            "samples": [[key, stats["documents_total"]] for key, stats in zip(keys, command_stats)],
+        },
+        "mongo_command_failures_total": {
+            "type": "counter",
+            "help": "Команды Mongo, завершившиеся ошибкой",
+            "labels": _COMMAND_LABELS,
+            "samples": [[key, stats["failed_total"]] for key, stats in zip(keys, command_stats)],
+        },
+    }
+
+
+def _bucket_counts(cumulative: dict[str, int]) -> list[int]:
+    counts = []
+    previous = 0
+
+    for total in cumulative.values():
+        counts.append(total - previous)
+        previous = total
+
+    return counts
+
+
+def mongo_pool_snapshot(pool_stats: dict[str, dict[str, int]]) -> Snapshot:
+    gauges = {
+        "open": "Открытые соединения пула Mongo",
+        "in_use": "Занятые соединения пула Mongo",
+        "waiting": "Запросы, ждущие свободного соединения пула Mongo",
+    }
+
+    return {
+        f"mongo_pool_{name}_connections": {
+            "type": "gauge",
+            "help": documentation,
+            "labels": ["server"],
+            "aggregate": "sum",
+            "samples": [[[address], stats[name]] for address, stats in pool_stats.items()],
+        }
+        for name, documentation in gauges.items()
+    }
+
+
+def mongo_collector(mongo_database: MongoDatabase) -> Callable[[], Snapshot]:
+    def collect() -> Snapshot:
+        return {
+            **mongo_commands_snapshot(mongo_database.command_stats()),
+            **mongo_pool_snapshot(mongo_database.pool_stats()),
+        }
+
+    return collect
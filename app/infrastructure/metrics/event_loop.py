@@ -0,0 +1,50 @@
+import asyncio
+from dataclasses import (
+    dataclass,
+    field,
+)
+from typing import Optional
+
+from infrastructure.metrics.instruments import (
+    EVENT_LOOP_LAG,
+    EVENT_LOOP_LAG_HISTOGRAM,
+)
+
+
+@dataclass
+class EventLoopLagMonitor:
+    """Фоновая задача, измеряющая задержку event loop.
+
+    Засыпает на interval секунд и смотрит, насколько позже проснулась:
+    разница - время, которое loop был занят чужим синхронным кодом.
+    """
+
+    interval: float = 0.5
+    _task: Optional[asyncio.Task] = field(default=None, init=False, repr=False)
+
+    async def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+            self._task = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        while True:
+            started_at = loop.time()
+            await asyncio.sleep(self.interval)
+            self.record(max(loop.time() - started_at - self.interval, 0.0))
+
+    @staticmethod
+    def record(lag: float) -> None:
+        EVENT_LOOP_LAG.set(lag)
+        EVENT_LOOP_LAG_HISTOGRAM.observe(lag)
@@ -0,0 +1,101 @@
+"""Метрики приложения. Имена и единицы - по соглашениям Prometheus (секунды, суффикс _total у счетчиков)."""
+
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+from infrastructure.metrics.registry import (
+    Counter,
+    Gauge,
+    Histogram,
+)
+from infrastructure.tracing.tracer import (
+    SpanKind,
+    TRACER,
+)
+
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Время обработки HTTP запроса по шаблону маршрута",
+    ["method", "route", "status"],
+)
+
+HTTP_REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "HTTP запросы, обрабатываемые сейчас",
+)
+
+MEDIATOR_DISPATCH_DURATION = Histogram(
+    "mediator_dispatch_duration_seconds",
+    "Время выполнения команды или запроса через Mediator по классу",
+    ["kind", "name", "outcome"],
+)
+
+EXTERNAL_CALL_DURATION = Histogram(
+    "external_call_duration_seconds",
+    "Время вызова внешнего сервиса (S3, SMTP, Bitrix)",
+    ["service", "operation", "outcome"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+
+BROKER_MESSAGES_PUBLISHED = Counter(
+    "broker_messages_published_total",
+    "Сообщения, опубликованные в RabbitMQ",
+    ["queue", "outcome"],
+)
+
+BROKER_MESSAGES_CONSUMED = Counter(
+    "broker_messages_consumed_total",
+    "Сообщения, обработанные подписчиком RabbitMQ",
+    ["queue", "outcome"],
+)
+
+BROKER_CONSUME_DURATION = Histogram(
+    "broker_consume_duration_seconds",
+    "Время обработки сообщения подписчиком RabbitMQ",
+    ["queue"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+
+EVENT_LOOP_LAG = Gauge(
+    "event_loop_lag_seconds",
+    "Последняя измеренная задержка event loop",
+    aggregate="max",
+)
+
+EVENT_LOOP_LAG_HISTOGRAM = Histogram(
+    "event_loop_lag_distribution_seconds",
+    "Распределение задержек event loop",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+
+EVENT_LOOP_BLOCKS = Counter(
+    "event_loop_blocks_total",
+    "Блокировки event loop дольше порога по месту в коде, где loop был занят",
+    ["location"],
+)
+
+EVENT_LOOP_BLOCK_DURATION = Histogram(
+    "event_loop_block_duration_seconds",
+    "Длительность блокировок event loop дольше порога",
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+
+
+@contextmanager
+def track_external_call(service: str, operation: str) -> Iterator[None]:
+    """Замеряет вызов внешнего сервиса и пишет его клиентский спан.
+
+    Исключение учитывается с outcome=error и пробрасывается дальше.
+    """
+    started_at = time.perf_counter()
+    outcome = "error"
+
+    try:
+        with TRACER.start_span(f"{service} {operation}", kind=SpanKind.CLIENT, attributes={"peer.service": service}):
+            yield
+
+        outcome = "ok"
+    finally:
+        EXTERNAL_CALL_DURATION.labels(service, operation, outcome).observe(time.perf_counter() - started_at)
@@ -0,0 +1,36 @@
+import time
+from contextlib import (
+    AbstractContextManager,
+    contextmanager,
+)
+from typing import Iterator
+
+from application.base.command import BaseCommand
+from application.base.middleware import BaseMediatorMiddleware
+from application.base.query import BaseQuery
+from infrastructure.metrics.instruments import MEDIATOR_DISPATCH_DURATION
+
+
+class MediatorMetricsMiddleware(BaseMediatorMiddleware):
+    """Время выполнения команд и запросов Mediator по классу.
+
+    Для объединенных запросов учитывается время ожидания каждого вызывающего.
+    """
+
+    def command_scope(self, command: BaseCommand) -> AbstractContextManager[None]:
+        return self._timed("command", type(command).__name__)
+
+    def query_scope(self, query: BaseQuery) -> AbstractContextManager[None]:
+        return self._timed("query", type(query).__name__)
+
+    @staticmethod
+    @contextmanager
+    def _timed(kind: str, name: str) -> Iterator[None]:
+        started_at = time.perf_counter()
+        outcome = "error"
+
+        try:
+            yield
+            outcome = "ok"
+        finally:
+            MEDIATOR_DISPATCH_DURATION.labels(kind, name, outcome).observe(time.perf_counter() - started_at)
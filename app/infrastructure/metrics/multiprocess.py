@@ -0,0 +1,201 @@
+"""Объединение метрик нескольких воркеров uvicorn.
+
+Каждый воркер периодически сохраняет снимок своих метрик в
+METRICS_MULTIPROCESS_DIR/<pid>-<время старта>.json, а воркер, которому
+достался запрос /metrics, складывает все файлы. Счетчики и гистограммы
+суммируются, в том числе у уже завершившихся воркеров, чтобы счетчики не
+шли назад; gauge берутся только у живых процессов и складываются или
+берется максимум. Данные других воркеров отстают не больше чем на интервал
+сохранения.
+
+Время старта в имени файла не дает новому воркеру с тем же pid перезаписать
+файл завершившегося. Каталог очищается перед запуском воркеров:
+
+    python -m infrastructure.metrics.multiprocess && uvicorn ... --workers 4
+"""
+
+import asyncio
+import json
+import logging
+import os
+import shutil
+from dataclasses import (
+    dataclass,
+    field,
+)
+from pathlib import Path
+from typing import Optional
+
+from infrastructure.metrics.registry import (
+    MetricsRegistry,
+    REGISTRY,
+    Snapshot,
+)
+from settings.metrics import MetricsConfig
+
+
+logger = logging.getLogger(__name__)
+
+
+def process_start_time(pid: int) -> Optional[int]:
+    """Время старта процесса в тиках с загрузки системы; None вне Linux или если процесса нет."""
+    try:
+        stat = Path(f"/proc/{pid}/stat").read_text()
+    except OSError:
+        return None
+
+    # Имя процесса в скобках может содержать пробелы: поля отсчитываются после него, starttime - 22-е
+    return int(stat.rsplit(")", 1)[1].split()[19])
+
+
+def process_key(pid: Optional[int] = None) -> str:
+    """Имя файла снимка процесса: pid и время старта, чтобы переиспользованный pid не совпал."""
+    pid = pid or os.getpid()
+    return f"{pid}-{process_start_time(pid) or 0}"
+
+
+def process_alive(key: str) -> bool:
+    pid, started = key.split("-", 1)
+
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+
+    # Жив процесс с тем же pid, но запущенный позже, - это уже другой воркер
+    return str(process_start_time(int(pid)) or 0) == started
+
+
+def write_snapshot(directory: str, snapshot: Snapshot, key: Optional[str] = None) -> None:
+    path = Path(directory) / f"{key or process_key()}.json"
+    temporary_path = path.with_suffix(".tmp")
+    # Запись через временный файл: читающий воркер не увидит файл наполовину
+    temporary_path.write_text(json.dumps(snapshot, ensure_ascii=False))
+    os.replace(temporary_path, path)
+
+
+def read_snapshots(directory: str) -> list[tuple[str, Snapshot]]:
+    snapshots = []
+
+    for path in Path(directory).glob("*-*.json"):
+        try:
+            snapshots.append((path.stem, json.loads(path.read_text())))
+        except (ValueError, OSError):
+            logger.warning("Skipping unreadable metrics file %s", path)
+
+    return snapshots
+
+
+def clear_directory(directory: str) -> None:
+    """Удаляет снимки прошлого запуска; вызывается до старта воркеров, а не из них."""
+    shutil.rmtree(directory, ignore_errors=True)
+    Path(directory).mkdir(parents=True, exist_ok=True)
+
+
+def _merge_value(family: dict, current, value):
+    if current is None:
+        return value
+
+    if family["type"] == "histogram":
+        return {
+            "buckets": [left + right for left, right in zip(current["buckets"], value["buckets"])],
+            "sum": current["sum"] + value["sum"],
+        }
+
+    if family["type"] == "gauge" and family.get("aggregate") == "max":
+        return max(current, value)
+
+    return current + value
+
+
+def merge_snapshots(snapshots: list[tuple[Snapshot, bool]]) -> Snapshot:
+    """Складывает снимки воркеров; второй элемент пары - жив ли процесс."""
+    merged: Snapshot = {}
+    values: dict[str, dict[tuple, object]] = {}
+
+    for snapshot, alive in snapshots:
+        for name, family in snapshot.items():
+            if family["type"] == "gauge" and not alive:
+                continue
+
+            if name not in merged:
+                merged[name] = {**family, "samples": []}
+                values[name] = {}
+
+            samples = values[name]
+
+            for label_values, value in family["samples"]:
+                key = tuple(label_values)
+                samples[key] = _merge_value(family, samples.get(key), value)
+
+    for name, samples in values.items():
+        merged[name]["samples"] = [[list(key), value] for key, value in samples.items()]
+
+    return merged
+
+
+def collect(registry: MetricsRegistry = REGISTRY, directory: Optional[str] = None) -> Snapshot:
+    """Метрики для /metrics: этого процесса или, если задан каталог, всех воркеров."""
+    snapshot = registry.snapshot()
+
+    if not directory:
+        return snapshot
+
+    own_key = process_key()
+    write_snapshot(directory, snapshot, own_key)
+
+    return merge_snapshots(
+        [(snapshot, True)]
+        + [(other, process_alive(key)) for key, other in read_snapshots(directory) if key != own_key],
+    )
+
+
+@dataclass
+class MetricsFlusher:
+    """Фоновая задача воркера, сохраняющая снимок его метрик для объединения."""
+
+    directory: str
+    interval: float = 5.0
+    registry: MetricsRegistry = field(default=REGISTRY)
+    _task: Optional[asyncio.Task] = field(default=None, init=False, repr=False)
+
+    async def start(self) -> None:
+        Path(self.directory).mkdir(parents=True, exist_ok=True)
+        self.flush()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+            self._task = None
+
+        # Последний снимок: счетчики завершившегося воркера остаются в сумме
+        self.flush()
+
+    def flush(self) -> None:
+        try:
+            write_snapshot(self.directory, self.registry.snapshot())
+        except OSError:
+            logger.exception("Failed to write metrics snapshot to %s", self.directory)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            self.flush()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    multiprocess_dir = MetricsConfig().metrics_multiprocess_dir
+
+    if multiprocess_dir:
+        clear_directory(multiprocess_dir)
+        logger.info("Cleared metrics directory %s", multiprocess_dir)
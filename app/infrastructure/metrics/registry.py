@@ -0,0 +1,243 @@
+"""Метрики процесса в текстовом формате Prometheus без внешних зависимостей.
+
+Запись - инкремент под блокировкой метрики, без выделения памяти на горячем
+пути: дочерняя метрика по значениям меток создается один раз и дальше
+берется из словаря. Снимок всех метрик - обычный dict, его же воркеры пишут
+в файлы для объединения (см. multiprocess.py).
+"""
+
+import math
+import threading
+from bisect import bisect_left
+from typing import (
+    Callable,
+    Iterable,
+    Optional,
+)
+
+
+# Границы корзин гистограмм задержек по умолчанию, секунды
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Снимок метрики: {"type", "help", "labels", "samples": [[значения меток, значение]], ...}
+Snapshot = dict[str, dict]
+
+
+class _CounterChild:
+    __slots__ = ("_lock", "value")
+
+    def __init__(self, lock: threading.Lock) -> None:
+        self._lock = lock
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+
+class _GaugeChild(_CounterChild):
+    __slots__ = ()
+
+    def dec(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value -= amount
+
+    def set(self, value: float) -> None:
+        with self._lock:
+            self.value = value
+
+
+class _HistogramChild:
+    __slots__ = ("_lock", "_bounds", "bucket_counts", "sum")
+
+    def __init__(self, lock: threading.Lock, bounds: tuple[float, ...]) -> None:
+        self._lock = lock
+        self._bounds = bounds
+        # Последняя корзина - значения больше всех границ (+Inf)
+        self.bucket_counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self._bounds, value)
+
+        with self._lock:
+            self.bucket_counts[index] += 1
+            self.sum += value
+
+
+class Metric:
+    type = ""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Iterable[str] = (),
+        registry: Optional["MetricsRegistry"] = None,
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._lock = threading.Lock()
+        self._children: dict[tuple[str, ...], object] = {}
+        (registry or REGISTRY).register(self)
+
+    def labels(self, *label_values: str):
+        child = self._children.get(label_values)
+
+        if child is None:
+            if len(label_values) != len(self.label_names):
+                raise ValueError(f"{self.name} expects labels {self.label_names}, got {label_values}")
+
+            with self._lock:
+                child = self._children.setdefault(label_values, self._new_child())
+
+        return child
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def _sample_value(self, child):
+        return child.value
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            samples = [
+                [list(label_values), self._sample_value(child)] for label_values, child in self._children.items()
+            ]
+
+        return {"type": self.type, "help": self.documentation, "labels": list(self.label_names), "samples": samples}
+
+
+class Counter(Metric):
+    type = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild(self._lock)
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+
+class Gauge(Metric):
+    """Текущее значение; aggregate - как объединять значения живых воркеров: sum или max."""
+
+    type = "gauge"
+
+    def __init__(self, *args, aggregate: str = "sum", **kwargs) -> None:
+        if aggregate not in ("sum", "max"):
+            raise ValueError(f"Unknown gauge aggregate: {aggregate}")
+
+        self.aggregate = aggregate
+        super().__init__(*args, **kwargs)
+
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild(self._lock)
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.labels().dec(amount)
+
+    def set(self, value: float) -> None:
+        self.labels().set(value)
+
+    def snapshot(self) -> dict:
+        return {**super().snapshot(), "aggregate": self.aggregate}
+
+
+class Histogram(Metric):
+    type = "histogram"
+
+    def __init__(self, *args, buckets: Iterable[float] = DEFAULT_BUCKETS, **kwargs) -> None:
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(*args, **kwargs)
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self._lock, self.buckets)
+
+    def _sample_value(self, child: _HistogramChild) -> dict:
+        return {"buckets": list(child.bucket_counts), "sum": child.sum}
+
+    def observe(self, value: float) -> None:
+        self.labels().observe(value)
+
+    def snapshot(self) -> dict:
+        return {**super().snapshot(), "buckets": list(self.buckets)}
+
+
+class MetricsRegistry:
+    """Метрики процесса и коллекторы - функции, отдающие снимок чужих счетчиков в момент сбора."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+        self._collectors: dict[str, Callable[[], Snapshot]] = {}
+
+    def register(self, metric: Metric) -> None:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+
+        self._metrics[metric.name] = metric
+
+    def register_collector(self, name: str, collector: Callable[[], Snapshot]) -> None:
+        """Регистрирует коллектор; повторная регистрация с тем же именем заменяет прежний."""
+        self._collectors[name] = collector
+
+    def unregister_collector(self, name: str) -> None:
+        self._collectors.pop(name, None)
+
+    def snapshot(self) -> Snapshot:
+        snapshot = {name: metric.snapshot() for name, metric in self._metrics.items()}
+
+        for collector in list(self._collectors.values()):
+            snapshot.update(collector())
+
+        return snapshot
+
+
+REGISTRY = MetricsRegistry()
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str]) -> str:
+    pairs = ",".join(f'{name}="{_escape(str(value))}"' for name, value in zip(names, values))
+    return f"{{{pairs}}}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+
+    return repr(float(value))
+
+
+def render(snapshot: Snapshot) -> str:
+    """Текстовый формат экспозиции Prometheus 0.0.4."""
+    lines = []
+
+    for name, family in sorted(snapshot.items()):
+        lines.append(f"# HELP {name} {family['help']}")
+        lines.append(f"# TYPE {name} {family['type']}")
+        label_names = family["labels"]
+
+        for label_values, value in family["samples"]:
+            if family["type"] != "histogram":
+                lines.append(f"{name}{_format_labels(label_names, label_values)} {_format_value(value)}")
+                continue
+
+            cumulative = 0
+
+            for bound, count in zip((*family["buckets"], math.inf), value["buckets"]):
+                cumulative += count
+                labels = _format_labels((*label_names, "le"), (*label_values, _format_value(bound)))
+                lines.append(f"{name}_bucket{labels} {_format_value(cumulative)}")
+
+            labels = _format_labels(label_names, label_values)
+            lines.append(f"{name}_sum{labels} {_format_value(value['sum'])}")
+            lines.append(f"{name}_count{labels} {_format_value(cumulative)}")
+
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,127 @@
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from dataclasses import (
+    dataclass,
+    field,
+)
+from pathlib import Path
+from types import FrameType
+from typing import Optional
+
+from infrastructure.metrics.instruments import (
+    EVENT_LOOP_BLOCK_DURATION,
+    EVENT_LOOP_BLOCKS,
+)
+
+
+logger = logging.getLogger(__name__)
+
+APP_ROOT = Path(__file__).resolve().parents[2]
+
+
+def blocking_location(stack: traceback.StackSummary) -> str:
+    """Самый глубокий кадр кода приложения: там вызван синхронный код, державший loop.
+
+    Если приложения в стеке нет (loop занят самим фреймворком) - самый глубокий кадр.
+    """
+    for frame in reversed(stack):
+        path = Path(frame.filename)
+
+        if path.is_relative_to(APP_ROOT) and "site-packages" not in path.parts:
+            return f"{path.relative_to(APP_ROOT)}:{frame.name}"
+
+    if not stack:
+        return "<unknown>"
+
+    return f"{Path(stack[-1].filename).name}:{stack[-1].name}"
+
+
+@dataclass
+class EventLoopWatchdog:
+    """Находит синхронный код, блокирующий event loop, без подключенного профилировщика.
+
+    Задача в loop раз в interval секунд отмечает, что loop жив. Сторожевой
+    поток проверяет отметку: если loop не отвечает дольше threshold, снимает
+    стек потока loop через sys._current_frames - он указывает ровно на
+    блокирующий вызов (bcrypt, рендер шаблона, сериализация). Стек пишется
+    в лог один раз за блокировку, длительность - после ее окончания.
+    """
+
+    threshold: float = 0.25
+    interval: float = 0.05
+    stack_limit: int = 30
+    _task: Optional[asyncio.Task] = field(default=None, init=False, repr=False)
+    _thread: Optional[threading.Thread] = field(default=None, init=False, repr=False)
+    _stopped: threading.Event = field(default_factory=threading.Event, init=False, repr=False)
+    _heartbeat: float = field(default=0.0, init=False, repr=False)
+    _loop_thread_id: int = field(default=0, init=False, repr=False)
+
+    async def start(self) -> None:
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stopped.clear()
+        self._task = asyncio.create_task(self._beat())
+        self._thread = threading.Thread(target=self._watch, name="event-loop-watchdog", daemon=True)
+        self._thread.start()
+
+    async def stop(self) -> None:
+        self._stopped.set()
+
+        if self._task is not None:
+            self._task.cancel()
+
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+            self._task = None
+
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval * 2)
+            self._thread = None
+
+    async def _beat(self) -> None:
+        while True:
+            self._heartbeat = time.monotonic()
+            await asyncio.sleep(self.interval)
+
+    def _watch(self) -> None:
+        blocked_since: Optional[float] = None
+        location = ""
+
+        while not self._stopped.wait(self.interval):
+            heartbeat = self._heartbeat
+
+            if blocked_since is not None and heartbeat != blocked_since:
+                # Отметка сдвинулась - loop освободился; ее период не входит в блокировку
+                duration = heartbeat - blocked_since - self.interval
+                EVENT_LOOP_BLOCK_DURATION.observe(duration)
+                logger.warning("Event loop was blocked for %.3fs at %s", duration, location)
+                blocked_since = None
+
+            if blocked_since is None and time.monotonic() - heartbeat - self.interval >= self.threshold:
+                blocked_since = heartbeat
+                location = self.report(time.monotonic() - heartbeat - self.interval)
+
+    def report(self, blocked_for: float) -> str:
+        frame: Optional[FrameType] = sys._current_frames().get(self._loop_thread_id)
+
+        if frame is None:
+            return "<unknown>"
+
+        stack = traceback.extract_stack(frame, limit=self.stack_limit)
+        location = blocking_location(stack)
+        EVENT_LOOP_BLOCKS.labels(location).inc()
+        logger.warning(
+            "Event loop blocked for more than %.3fs at %s:\n%s",
+            blocked_for,
+            location,
+            "".join(stack.format()),
+        )
+
+        return location
@@ -0,0 +1,132 @@
+import asyncio
+import inspect
+import sys
+import threading
+from collections import Counter
+from contextvars import (
+    ContextVar,
+    Token,
+)
+from pathlib import Path
+from types import (
+    CodeType,
+    FrameType,
+)
+from typing import Optional
+
+
+APP_ROOT = Path(__file__).resolve().parents[2]
+
+# Loop в этот момент не выполняет ни одной корутины: запрос ждет ввода-вывода (Mongo, S3)
+IDLE = "(event loop idle)"
+
+# Loop занят корутинами других запросов этого воркера
+OTHER_TASKS = "(other tasks)"
+
+# Корень стеков задач, порожденных запросом (объединенные запросы Mediator, TaskGroup, фоновое перечитывание кэша)
+CHILD_TASK = "(child task)"
+
+# Профилировщик запроса; задачи, созданные запросом, наследуют его вместе с контекстом
+_profiled_by: ContextVar[Optional["StackSampler"]] = ContextVar("profiled_by", default=None)
+
+_COROUTINE_FLAGS = inspect.CO_COROUTINE | inspect.CO_ITERABLE_COROUTINE | inspect.CO_ASYNC_GENERATOR
+
+
+def frame_label(code: CodeType) -> str:
+    path = Path(code.co_filename)
+
+    if path.is_relative_to(APP_ROOT) and "site-packages" not in path.parts:
+        location = path.relative_to(APP_ROOT)
+    elif "site-packages" in path.parts:
+        location = Path(*path.parts[path.parts.index("site-packages") + 1 :])
+    else:
+        location = path.name
+
+    return f"{code.co_qualname} ({location}:{code.co_firstlineno})"
+
+
+class StackSampler:
+    """Сэмплирующий профилировщик одного запроса, работающий в отдельном потоке.
+
+    Раз в interval секунд снимает стек потока event loop. Стеки, проходящие
+    через кадр root (корутину, ожидающую обработку запроса), и стеки задач,
+    созданных запросом (их контекст несет метку профилировщика), попадают в
+    профиль; одновременные запросы того же воркера учитываются отдельно как
+    OTHER_TASKS, а время ожидания ввода-вывода - как IDLE. Результат -
+    свернутые стеки (folded stacks) для flamegraph.pl и speedscope.
+
+    start и stop вызываются из корутины запроса: метка ставится в ее контекст.
+    """
+
+    def __init__(self, root: FrameType, interval: float = 0.001) -> None:
+        self.root = root
+        self.interval = interval
+        self.samples: Counter[str] = Counter()
+        self._thread_id = threading.get_ident()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._token: Optional[Token] = None
+        self._labels: dict[CodeType, str] = {}
+
+    def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._token = _profiled_by.set(self)
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+        if self._token is not None:
+            _profiled_by.reset(self._token)
+            self._token = None
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            frame = sys._current_frames().get(self._thread_id)
+            task = asyncio.current_task(self._loop)
+
+            if frame is not None:
+                self.samples[self.collapse(frame, task)] += 1
+
+    def collapse(self, frame: Optional[FrameType], task: Optional[asyncio.Task] = None) -> str:
+        codes = []
+        outermost_coroutine = -1
+
+        while frame is not None:
+            if frame is self.root:
+                return ";".join(self._label(code) for code in reversed(codes)) or self._label(frame.f_code)
+
+            codes.append(frame.f_code)
+
+            if frame.f_code.co_flags & _COROUTINE_FLAGS:
+                outermost_coroutine = len(codes) - 1
+
+            frame = frame.f_back
+
+        if outermost_coroutine < 0:
+            return IDLE
+
+        if task is None or task.get_context().get(_profiled_by) is not self:
+            return OTHER_TASKS
+
+        # Кадры под первой корутиной задачи - сам event loop, в профиле они не нужны
+        task_codes = reversed(codes[: outermost_coroutine + 1])
+
+        return ";".join([CHILD_TASK, *(self._label(code) for code in task_codes)])
+
+    def _label(self, code: CodeType) -> str:
+        label = self._labels.get(code)
+
+        if label is None:
+            label = self._labels[code] = frame_label(code)
+
+        return label
+
+    def folded(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.samples.most_common())
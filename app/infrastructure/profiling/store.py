@@ -0,0 +1,61 @@
+import os
+import re
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+
+_PROFILE_ID = re.compile(r"[0-9a-f]{32}")
+
+
+@dataclass
+class ProfileStore:
+    """Профили запросов в общем каталоге воркеров: один файл свернутых стеков на профиль.
+
+    Хранится max_profiles последних профилей, более старые удаляются при
+    сохранении нового.
+    """
+
+    directory: str
+    max_profiles: int = 50
+
+    @staticmethod
+    def new_id() -> str:
+        return uuid.uuid4().hex
+
+    def save(self, profile_id: str, folded: str) -> None:
+        directory = Path(self.directory)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        # Запись через временный файл: читатель не увидит профиль наполовину
+        tmp_path = directory / f".{profile_id}.tmp"
+        tmp_path.write_text(folded)
+        os.replace(tmp_path, directory / f"{profile_id}.folded")
+
+        self._prune(directory)
+
+    def load(self, profile_id: str) -> Optional[str]:
+        # id приходит из URL: все, что не похоже на наш id, в путь не попадает
+        if not _PROFILE_ID.fullmatch(profile_id):
+            return None
+
+        try:
+            return (Path(self.directory) / f"{profile_id}.folded").read_text()
+        except FileNotFoundError:
+            return None
+
+    def _prune(self, directory: Path) -> None:
+        profiles = []
+
+        for path in directory.glob("*.folded"):
+            try:
+                profiles.append((path.stat().st_mtime, path))
+            except FileNotFoundError:
+                # Другой воркер уже удалил его
+                continue
+
+        profiles.sort(reverse=True)
+
+        for _, path in profiles[self.max_profiles :]:
+            path.unlink(missing_ok=True)
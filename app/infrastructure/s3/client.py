@@ -3,6 +3,7 @@ from contextlib import asynccontextmanager
 import aioboto3
 from botocore.exceptions import ClientError
 
+from infrastructure.metrics.instruments import track_external_call
 from settings.config import Config
 
 
@@ -23,6 +24,10 @@ class S3Client:
             yield client
 
     async def upload_fileobj(self, file_obj, object_name: str, bucket_name: str) -> None:
+        with track_external_call("s3", "upload_fileobj"):
+            await self._upload_fileobj(file_obj, object_name, bucket_name)
+
+    async def _upload_fileobj(self, file_obj, object_name: str, bucket_name: str) -> None:
         async with self.get_client() as client:
             try:
                 await client.head_bucket(Bucket=bucket_name)
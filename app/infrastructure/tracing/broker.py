@@ -0,0 +1,42 @@
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+)
+
+from faststream import BaseMiddleware
+
+from infrastructure.tracing.tracer import (
+    extract,
+    inject,
+    SpanKind,
+    TRACER,
+)
+
+
+class BrokerTracingMiddleware(BaseMiddleware):
+    """Спаны публикации и обработки сообщений RabbitMQ; контекст трассы едет в заголовке traceparent.
+
+    Спан обработки у консьюмера - дочерний к спану публикации, поэтому путь
+    заявки от HTTP запроса до SMTP и Bitrix собирается в одну трассу.
+    """
+
+    async def publish_scope(self, call_next: Callable[[Any], Awaitable[Any]], cmd: Any) -> Any:
+        with TRACER.start_span(
+            f"{cmd.destination} publish",
+            kind=SpanKind.PRODUCER,
+            attributes={"messaging.system": "rabbitmq", "messaging.destination.name": cmd.destination},
+        ):
+            cmd.add_headers(inject({}))
+            return await call_next(cmd)
+
+    async def consume_scope(self, call_next: Callable[[Any], Awaitable[Any]], msg: Any) -> Any:
+        queue = getattr(msg.raw_message, "routing_key", None) or "-"
+
+        with TRACER.start_span(
+            f"{queue} process",
+            kind=SpanKind.CONSUMER,
+            attributes={"messaging.system": "rabbitmq", "messaging.destination.name": queue},
+            parent=extract(msg.headers),
+        ):
+            return await call_next(msg)
@@ -0,0 +1,156 @@
+"""Экспорт спанов в формате OTLP/JSON: в коллектор по HTTP или построчно в файл.
+
+Строка файла - тот же запрос ExportTraceServiceRequest, что уходит в
+коллектор, поэтому файл можно дочитать коллектором (otlpjsonfile) или
+разобрать вручную.
+"""
+
+import json
+import logging
+import queue
+import threading
+from pathlib import Path
+from typing import (
+    Any,
+    Protocol,
+)
+
+import httpx
+
+from infrastructure.tracing.tracer import Span
+
+
+logger = logging.getLogger(__name__)
+
+
+class SpanExporter(Protocol):
+    def export(self, service_name: str, spans: list[Span]) -> None: ...
+
+
+def _attribute_value(value: Any) -> dict:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+
+    if isinstance(value, float):
+        return {"doubleValue": value}
+
+    return {"stringValue": str(value)}
+
+
+def _attributes(attributes: dict[str, Any]) -> list[dict]:
+    return [{"key": key, "value": _attribute_value(value)} for key, value in attributes.items()]
+
+
+def spans_to_otlp(service_name: str, spans: list[Span]) -> dict:
+    return {
+        "resourceSpans": [
+            {
+                "resource": {"attributes": _attributes({"service.name": service_name})},
+                "scopeSpans": [
+                    {
+                        "scope": {"name": "sk"},
+                        "spans": [
+                            {
+                                "traceId": span.context.trace_id,
+                                "spanId": span.context.span_id,
+                                "parentSpanId": span.parent_span_id or "",
+                                "name": span.name,
+                                "kind": int(span.kind),
+                                "startTimeUnixNano": str(span.start_time_ns),
+                                "endTimeUnixNano": str(span.end_time_ns),
+                                "attributes": _attributes(span.attributes),
+                                "status": {"code": int(span.status_code), "message": span.status_message},
+                            }
+                            for span in spans
+                        ],
+                    },
+                ],
+            },
+        ],
+    }
+
+
+class FileSpanExporter:
+    def __init__(self, path: str) -> None:
+        self.path = Path(path)
+
+    def export(self, service_name: str, spans: list[Span]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self.path.open("a", encoding="utf-8") as file:
+            file.write(json.dumps(spans_to_otlp(service_name, spans), ensure_ascii=False) + "\n")
+
+
+class OtlpHttpSpanExporter:
+    """Отправка в OTLP/HTTP коллектор (OpenTelemetry Collector, Jaeger, Tempo) на /v1/traces."""
+
+    def __init__(self, endpoint: str, timeout: float = 5.0) -> None:
+        self.endpoint = endpoint
+        self._client = httpx.Client(timeout=timeout)
+
+    def export(self, service_name: str, spans: list[Span]) -> None:
+        response = self._client.post(self.endpoint, json=spans_to_otlp(service_name, spans))
+        response.raise_for_status()
+
+
+class BatchSpanProcessor:
+    """Копит завершенные спаны и отправляет их пачками из фонового потока.
+
+    Запись спана - только put в очередь, сеть и диск не трогают ни event
+    loop, ни потоки Motor. При переполнении очереди (коллектор недоступен)
+    новые спаны отбрасываются, а не копятся в памяти.
+    """
+
+    def __init__(
+        self,
+        exporter: SpanExporter,
+        service_name: str,
+        schedule_delay: float = 2.0,
+        max_batch_size: int = 512,
+        max_queue_size: int = 4096,
+    ) -> None:
+        self.exporter = exporter
+        self.service_name = service_name
+        self.schedule_delay = schedule_delay
+        self.max_batch_size = max_batch_size
+        self.dropped = 0
+        self._queue: queue.Queue[Span] = queue.Queue(maxsize=max_queue_size)
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="span-exporter", daemon=True)
+        self._thread.start()
+
+    def on_end(self, span: Span) -> None:
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            self.dropped += 1
+
+    def shutdown(self) -> None:
+        self._stopped.set()
+        self._thread.join(timeout=self.schedule_delay + 5)
+        self._export_pending()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.schedule_delay):
+            self._export_pending()
+
+    def _export_pending(self) -> None:
+        while True:
+            batch = []
+
+            while len(batch) < self.max_batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            if not batch:
+                return
+
+            try:
+                self.exporter.export(self.service_name, batch)
+            except Exception:
+                logger.exception("Failed to export %s spans", len(batch))
@@ -0,0 +1,16 @@
+from contextlib import AbstractContextManager
+
+from application.base.command import BaseCommand
+from application.base.middleware import BaseMediatorMiddleware
+from application.base.query import BaseQuery
+from infrastructure.tracing.tracer import TRACER
+
+
+class MediatorTracingMiddleware(BaseMediatorMiddleware):
+    """Спан на каждую команду и запрос Mediator; спаны репозиториев и внешних вызовов становятся его дочерними."""
+
+    def command_scope(self, command: BaseCommand) -> AbstractContextManager:
+        return TRACER.start_span(f"command {type(command).__name__}", attributes={"mediator.kind": "command"})
+
+    def query_scope(self, query: BaseQuery) -> AbstractContextManager:
+        return TRACER.start_span(f"query {type(query).__name__}", attributes={"mediator.kind": "query"})
@@ -0,0 +1,69 @@
+import threading
+from typing import Optional
+
+from pymongo import monitoring
+
+from infrastructure.tracing.tracer import (
+    Span,
+    SpanKind,
+    StatusCode,
+    TRACER,
+)
+
+
+class CommandTracingListener(monitoring.CommandListener):
+    """Спан на каждую команду Mongo внутри трассируемого запроса.
+
+    Родитель - спан, текущий в момент вызова Motor: контекст копируется в
+    поток, где драйвер вызывает колбэки. Метод репозитория берется из
+    comment команды (см. RepositoryCollection), поэтому спаны репозиториев
+    не требуют правок в каждом репозитории.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._spans: dict[tuple, Span] = {}
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        if not TRACER.enabled:
+            return
+
+        command = event.command
+        collection = command.get(event.command_name)
+        method = command.get("comment")
+        span = TRACER.create_span(
+            f"{method} {event.command_name}" if isinstance(method, str) else f"mongo {event.command_name}",
+            kind=SpanKind.CLIENT,
+            attributes={
+                "db.system": "mongodb",
+                "db.name": event.database_name,
+                "db.operation": event.command_name,
+                "db.mongodb.collection": collection if isinstance(collection, str) else "",
+                "server.address": f"{event.connection_id[0]}:{event.connection_id[1]}",
+            },
+        )
+
+        if span is not None:
+            with self._lock:
+                self._spans[(event.connection_id, event.request_id)] = span
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        span = self._pop(event)
+
+        if span is not None:
+            TRACER.end_span(span)
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        span = self._pop(event)
+
+        if span is not None:
+            span.status_code = StatusCode.ERROR
+            span.status_message = str(event.failure.get("errmsg", ""))
+            TRACER.end_span(span)
+
+    def _pop(self, event) -> Optional[Span]:
+        if not self._spans:
+            return None
+
+        with self._lock:
+            return self._spans.pop((event.connection_id, event.request_id), None)
@@ -0,0 +1,31 @@
+from infrastructure.tracing.exporters import (
+    BatchSpanProcessor,
+    FileSpanExporter,
+    OtlpHttpSpanExporter,
+    SpanExporter,
+)
+from infrastructure.tracing.tracer import TRACER
+from settings.tracing import TracingConfig
+
+
+def build_exporter(config: TracingConfig) -> SpanExporter:
+    if config.tracing_exporter == "otlp":
+        return OtlpHttpSpanExporter(endpoint=config.tracing_otlp_endpoint)
+
+    if config.tracing_exporter == "file":
+        return FileSpanExporter(path=config.tracing_file_path)
+
+    raise ValueError(f"Unknown tracing exporter: {config.tracing_exporter}")
+
+
+def configure_tracing(config: TracingConfig, role: str) -> None:
+    """Включает трассировку процесса; role отличает процессы одного сервиса (api, consumer)."""
+    if not config.tracing_enabled:
+        return
+
+    service_name = f"{config.tracing_service_name}-{role}"
+    TRACER.configure(
+        service_name=service_name,
+        processor=BatchSpanProcessor(build_exporter(config), service_name=service_name),
+        sample_ratio=config.tracing_sample_ratio,
+    )
@@ -0,0 +1,217 @@
+"""Трассировка в модели OpenTelemetry без SDK: спаны, контекст и W3C traceparent.
+
+Текущий спан хранится в ContextVar, поэтому дочерние спаны видят родителя
+и в задачах asyncio, и в потоках Motor (он копирует контекст). Пока
+трассировка не настроена, start_span сводится к одной проверке.
+"""
+
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import (
+    dataclass,
+    field,
+)
+from enum import IntEnum
+from typing import (
+    Any,
+    Iterator,
+    Mapping,
+    Optional,
+    Protocol,
+)
+
+
+TRACEPARENT_HEADER = "traceparent"
+
+
+class SpanKind(IntEnum):
+    """Значения как в OTLP."""
+
+    INTERNAL = 1
+    SERVER = 2
+    CLIENT = 3
+    PRODUCER = 4
+    CONSUMER = 5
+
+
+class StatusCode(IntEnum):
+    UNSET = 0
+    OK = 1
+    ERROR = 2
+
+
+@dataclass(frozen=True, slots=True)
+class SpanContext:
+    trace_id: str
+    span_id: str
+    sampled: bool = True
+
+
+@dataclass(slots=True)
+class Span:
+    name: str
+    context: SpanContext
+    parent_span_id: Optional[str] = None
+    kind: SpanKind = SpanKind.INTERNAL
+    attributes: dict[str, Any] = field(default_factory=dict)
+    start_time_ns: int = field(default_factory=time.time_ns)
+    end_time_ns: int = 0
+    status_code: StatusCode = StatusCode.UNSET
+    status_message: str = ""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def record_exception(self, error: BaseException) -> None:
+        self.status_code = StatusCode.ERROR
+        self.status_message = str(error)
+        self.attributes["exception.type"] = type(error).__name__
+
+
+class SpanProcessor(Protocol):
+    def on_end(self, span: Span) -> None: ...
+
+    def shutdown(self) -> None: ...
+
+
+_current_context: ContextVar[Optional[SpanContext]] = ContextVar("trace_context", default=None)
+
+
+def _new_id(bits: int) -> str:
+    return f"{random.getrandbits(bits):0{bits // 4}x}"
+
+
+def current_span_context() -> Optional[SpanContext]:
+    return _current_context.get()
+
+
+def inject(headers: dict[str, Any]) -> dict[str, Any]:
+    """Добавляет traceparent текущего спана в заголовки (HTTP, сообщения брокера)."""
+    context = _current_context.get()
+
+    if context is not None:
+        headers[TRACEPARENT_HEADER] = f"00-{context.trace_id}-{context.span_id}-{'01' if context.sampled else '00'}"
+
+    return headers
+
+
+def extract(headers: Optional[Mapping[str, Any]]) -> Optional[SpanContext]:
+    """Родительский контекст из traceparent; None, если заголовка нет или он испорчен."""
+    value = (headers or {}).get(TRACEPARENT_HEADER)
+
+    if not isinstance(value, str):
+        return None
+
+    parts = value.strip().split("-")
+
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16 or parts[1] == "0" * 32:
+        return None
+
+    try:
+        sampled = bool(int(parts[3], 16) & 1)
+    except ValueError:
+        return None
+
+    return SpanContext(trace_id=parts[1], span_id=parts[2], sampled=sampled)
+
+
+class Tracer:
+    """Создает спаны и отдает завершенные процессору (экспорт в коллектор или файл)."""
+
+    def __init__(self) -> None:
+        self.service_name = "sk"
+        self.sample_ratio = 1.0
+        self.processor: Optional[SpanProcessor] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.processor is not None
+
+    def configure(self, service_name: str, processor: SpanProcessor, sample_ratio: float = 1.0) -> None:
+        self.service_name = service_name
+        self.sample_ratio = sample_ratio
+        self.processor = processor
+
+    def shutdown(self) -> None:
+        """Отправляет накопленные спаны и выключает трассировку."""
+        processor, self.processor = self.processor, None
+
+        if processor is not None:
+            processor.shutdown()
+
+    def create_span(
+        self,
+        name: str,
+        kind: SpanKind = SpanKind.INTERNAL,
+        attributes: Optional[dict[str, Any]] = None,
+        parent: Optional[SpanContext] = None,
+    ) -> Optional[Span]:
+        """Спан - дочерний к parent или текущему; не делает его текущим. None, если трасса не пишется."""
+        if self.processor is None:
+            return None
+
+        parent = parent or _current_context.get()
+
+        if parent is not None and not parent.sampled:
+            return None
+
+        if parent is None and random.random() >= self.sample_ratio:
+            return None
+
+        return Span(
+            name=name,
+            context=SpanContext(trace_id=parent.trace_id if parent else _new_id(128), span_id=_new_id(64)),
+            parent_span_id=parent.span_id if parent else None,
+            kind=kind,
+            attributes=attributes or {},
+        )
+
+    def end_span(self, span: Span) -> None:
+        span.end_time_ns = time.time_ns()
+        processor = self.processor
+
+        if processor is not None:
+            processor.on_end(span)
+
+    @contextmanager
+    def start_span(
+        self,
+        name: str,
+        kind: SpanKind = SpanKind.INTERNAL,
+        attributes: Optional[dict[str, Any]] = None,
+        parent: Optional[SpanContext] = None,
+    ) -> Iterator[Optional[Span]]:
+        """Спан на время блока, текущий для вложенного кода; исключение помечает его ошибкой."""
+        if self.processor is None:
+            yield None
+            return
+
+        span = self.create_span(name, kind, attributes, parent)
+
+        if span is None:
+            # Трасса не пишется: решение о сэмплировании наследуют вложенные спаны и получатели сообщений
+            context = parent or _current_context.get() or SpanContext(_new_id(128), _new_id(64), sampled=False)
+            token = _current_context.set(context)
+
+            try:
+                yield None
+            finally:
+                _current_context.reset(token)
+
+            return
+
+        token = _current_context.set(span.context)
+
+        try:
+            yield span
+        except Exception as error:
+            span.record_exception(error)
+            raise
+        finally:
+            _current_context.reset(token)
+            self.end_span(span)
+
+
+TRACER = Tracer()
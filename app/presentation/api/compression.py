@@ -0,0 +1,332 @@
+import zlib
+from dataclasses import dataclass
+from typing import (
+    Callable,
+    Optional,
+    Protocol,
+    Self,
+)
+
+from fastapi import Request
+from fastapi.responses import Response
+from starlette.datastructures import (
+    Headers,
+    MutableHeaders,
+)
+from starlette.types import (
+    ASGIApp,
+    Message,
+    Receive,
+    Scope,
+    Send,
+)
+
+import brotli
+import zstandard
+
+
+COMPRESSION_DISABLED_SCOPE_KEY = "sk.compression.disabled"
+
+COMPRESSIBLE_CONTENT_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "application/xml",
+    "application/javascript",
+    "text/",
+)
+
+UNCOMPRESSIBLE_STATUS_CODES = frozenset({204, 206, 304})
+
+
+class StreamCompressor(Protocol):
+    """Потоковый компрессор одного ответа."""
+
+    def compress(self, data: bytes) -> bytes: ...
+
+    def flush(self) -> bytes: ...
+
+    def finish(self) -> bytes: ...
+
+
+class GzipCompressor:
+    def __init__(self, level: int) -> None:
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        # Z_SYNC_FLUSH отдает клиенту все накопленное, не закрывая поток
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class BrotliCompressor:
+    def __init__(self, quality: int) -> None:
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class ZstdCompressor:
+    def __init__(self, level: int) -> None:
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH)
+
+
+@dataclass(frozen=True)
+class CompressionLevels:
+    gzip: int = 6
+    brotli: int = 4
+    zstd: int = 3
+
+    def compressor_factories(self) -> dict[str, Callable[[], StreamCompressor]]:
+        """Доступные кодировки в порядке предпочтения сервера."""
+        return {
+            "br": lambda: BrotliCompressor(quality=self.brotli),
+            "zstd": lambda: ZstdCompressor(level=self.zstd),
+            "gzip": lambda: GzipCompressor(level=self.gzip),
+        }
+
+
+def select_encoding(accept_encoding: Optional[str], encodings: tuple[str, ...]) -> Optional[str]:
+    """Выбирает кодировку по Accept-Encoding с учетом q-весов.
+
+    При равных весах побеждает порядок encodings (предпочтение сервера).
+    """
+    if not accept_encoding:
+        return None
+
+    weights: dict[str, float] = {}
+
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        coding = coding.strip().lower()
+
+        if not coding:
+            continue
+
+        weight = 1.0
+        name, _, value = params.strip().partition("=")
+
+        if name.strip() == "q":
+            try:
+                weight = float(value)
+            except ValueError:
+                weight = 0.0
+
+        weights[coding] = weight
+
+    wildcard = weights.get("*", 0.0)
+    best_encoding, best_weight = None, 0.0
+
+    for encoding in encodings:
+        weight = weights.get(encoding, wildcard)
+
+        if weight > best_weight:
+            best_encoding, best_weight = encoding, weight
+
+    return best_encoding
+
+
+def is_compressible(content_type: str) -> bool:
+    return content_type.startswith(COMPRESSIBLE_CONTENT_TYPES)
+
+
+def disable_compression(request: Request) -> None:
+    """Зависимость для отключения сжатия ответа конкретного роута.
+
+    Использование: ``@router.get(..., dependencies=[Depends(disable_compression)])``.
+    """
+    request.scope[COMPRESSION_DISABLED_SCOPE_KEY] = True
+
+
+class CompressionMiddleware:
+    """ASGI-middleware сжатия ответов (br, zstd, gzip) по Accept-Encoding.
+
+    Ответ, целиком уместившийся в одно сообщение, сжимается один раз и только если
+    он не меньше minimum_size. Потоковые ответы сжимаются по мере поступления
+    чанков со сбросом буфера компрессора после каждого, чтобы клиент получал
+    данные без задержки. Ответы с уже выставленным Content-Encoding
+    (предварительно сжатые) пропускаются без изменений.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        levels: CompressionLevels = CompressionLevels(),
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.factories = levels.compressor_factories()
+        self.encodings = tuple(self.factories)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = select_encoding(Headers(scope=scope).get("accept-encoding"), self.encodings)
+        responder = _CompressionResponder(
+            send=send,
+            scope=scope,
+            encoding=encoding,
+            factory=self.factories.get(encoding) if encoding else None,
+            minimum_size=self.minimum_size,
+        )
+        await self.app(scope, receive, responder.send)
+
+
+def weaken_etag(headers: MutableHeaders) -> None:
+    """Переводит сильный ETag в слабый: сжатое тело побайтово отличается от исходного."""
+    etag = headers.get("etag")
+
+    if etag is not None and not etag.startswith("W/"):
+        headers["ETag"] = f"W/{etag}"
+
+
+class _CompressionResponder:
+    """Обертка над send одного запроса: решает, сжимать ли ответ, по первому чанку тела."""
+
+    def __init__(
+        self,
+        send: Send,
+        scope: Scope,
+        encoding: Optional[str],
+        factory: Optional[Callable[[], StreamCompressor]],
+        minimum_size: int,
+    ) -> None:
+        self.send_next = send
+        self.scope = scope
+        self.encoding = encoding
+        self.factory = factory
+        self.minimum_size = minimum_size
+        self.start_message: Optional[Message] = None
+        self.compressor: Optional[StreamCompressor] = None
+        self.passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if self.passthrough:
+            await self.send_next(message)
+            return
+
+        if message["type"] == "http.response.start":
+            self.start_message = {**message, "headers": list(message.get("headers", []))}
+            return
+
+        if message["type"] != "http.response.body":
+            await self.send_next(message)
+            return
+
+        if self.compressor is not None:
+            await self._send_compressed_chunk(message)
+            return
+
+        await self._start_body(message)
+
+    async def _start_body(self, message: Message) -> None:
+        headers = MutableHeaders(raw=self.start_message["headers"])
+        body: bytes = message.get("body", b"")
+        more_body: bool = message.get("more_body", False)
+
+        eligible = (
+            not self.scope.get(COMPRESSION_DISABLED_SCOPE_KEY, False)
+            and "content-encoding" not in headers
+            and self.start_message["status"] not in UNCOMPRESSIBLE_STATUS_CODES
+            and is_compressible(headers.get("content-type", ""))
+        )
+
+        if eligible:
+            headers.add_vary_header("Accept-Encoding")
+
+        if more_body:
+            declared_size = headers.get("content-length")
+            too_small = declared_size is not None and int(declared_size) < self.minimum_size
+        else:
+            too_small = len(body) < self.minimum_size
+
+        if not eligible or self.factory is None or too_small:
+            self.passthrough = True
+            await self.send_next(self.start_message)
+            await self.send_next(message)
+            return
+
+        compressor = self.factory()
+        headers["Content-Encoding"] = self.encoding
+        weaken_etag(headers)
+
+        if more_body:
+            del headers["Content-Length"]
+            self.compressor = compressor
+            await self.send_next(self.start_message)
+            await self._send_compressed_chunk(message)
+            return
+
+        compressed = compressor.compress(body) + compressor.finish()
+        headers["Content-Length"] = str(len(compressed))
+        await self.send_next(self.start_message)
+        await self.send_next({"type": "http.response.body", "body": compressed})
+
+    async def _send_compressed_chunk(self, message: Message) -> None:
+        more_body: bool = message.get("more_body", False)
+        chunk = self.compressor.compress(message.get("body", b""))
+        chunk += self.compressor.flush() if more_body else self.compressor.finish()
+
+        await self.send_next({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+
+@dataclass(frozen=True)
+class PrecompressedContent:
+    """Тело ответа, заранее сжатое во все доступные кодировки.
+
+    Предназначено для кэшируемых ответов: сжатие выполняется один раз при
+    формировании записи кэша, а не на каждый запрос. Максимальные уровни
+    сжатия здесь оправданы, так как стоимость платится однократно.
+    """
+
+    identity: bytes
+    variants: dict[str, bytes]
+
+    @classmethod
+    def build(cls, body: bytes) -> Self:
+        levels = CompressionLevels(gzip=9, brotli=11, zstd=19)
+        variants = {}
+
+        for encoding, factory in levels.compressor_factories().items():
+            compressor = factory()
+            variants[encoding] = compressor.compress(body) + compressor.finish()
+
+        return cls(identity=body, variants=variants)
+
+    def response(
+        self,
+        request: Request,
+        media_type: str,
+        headers: Optional[dict[str, str]] = None,
+    ) -> Response:
+        response_headers = {"Vary": "Accept-Encoding", **(headers or {})}
+        encoding = select_encoding(request.headers.get("accept-encoding"), tuple(self.variants))
+
+        if encoding is None:
+            return Response(content=self.identity, media_type=media_type, headers=response_headers)
+
+        response_headers["Content-Encoding"] = encoding
+        return Response(content=self.variants[encoding], media_type=media_type, headers=response_headers)
@@ -7,6 +7,7 @@ from fastapi import (
     status,
 )
 
+from infrastructure.database.gateways.routing import pin_reads_to_primary
 from presentation.api.auth import auth_service
 
 
@@ -24,10 +25,8 @@ async def get_access_token_payload(
     return await auth_service.access_token_required(request)
 
 
-async def get_current_user_id(
-    token_payload: dict = Depends(get_access_token_payload),
-) -> UUID:
-    """Dependency для получения текущего user_id из токена."""
+def user_id_from_payload(token_payload) -> UUID:
+    """user_id из payload access токена; без побочных эффектов, в отличие от get_current_user_id."""
     user_id_str = token_payload.sub
     if not user_id_str:
         raise HTTPException(
@@ -41,3 +40,15 @@ async def get_current_user_id(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid user ID format in token",
         )
+
+
+async def get_current_user_id(
+    token_payload: dict = Depends(get_access_token_payload),
+) -> UUID:
+    """Dependency для получения текущего user_id из токена."""
+    user_id = user_id_from_payload(token_payload)
+
+    # Админская сессия читает из primary: только что сохраненные изменения видны сразу (read-your-writes)
+    pin_reads_to_primary()
+
+    return user_id
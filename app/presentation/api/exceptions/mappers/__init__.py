@@ -1,6 +1,9 @@
 from fastapi import status
 
-from domain.base.exceptions import DomainException
+from domain.base.exceptions import (
+    DomainException,
+    InvalidSortFieldException,
+)
 from domain.certificates.exceptions.certificate_groups import CertificateGroupException
 from domain.certificates.exceptions.certificates import CertificateException
 from domain.members.exceptions.members import MemberException
@@ -28,6 +31,8 @@ from presentation.api.exceptions.mappers.vacancies import map_vacancy_exception_
 
 
 def map_domain_exception_to_status_code(exc: DomainException) -> int:
+    if isinstance(exc, InvalidSortFieldException):
+        return status.HTTP_422_UNPROCESSABLE_CONTENT
     if isinstance(exc, UserException):
         return map_user_exception_to_status_code(exc)
     if isinstance(exc, NewsException):
@@ -0,0 +1,165 @@
+import csv
+import io
+import re
+import zipfile
+from enum import Enum
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Sequence,
+)
+from xml.sax.saxutils import escape
+
+
+CSV_MEDIA_TYPE = "text/csv; charset=utf-8"
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+# Строки копятся до этого размера перед отправкой клиенту
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+# Ячейки, начинающиеся с этих символов, Excel исполняет как формулы (CSV injection)
+_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+# Управляющие символы, недопустимые в XML 1.0
+_ILLEGAL_XML_CHARS = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+_CONTENT_TYPES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    "</Types>"
+)
+
+_ROOT_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/>'
+    "</Relationships>"
+)
+
+_WORKBOOK_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+    'Target="worksheets/sheet1.xml"/>'
+    "</Relationships>"
+)
+
+_WORKSHEET_HEADER_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+)
+
+_WORKSHEET_FOOTER_XML = "</sheetData></worksheet>"
+
+
+class ExportFormat(str, Enum):
+    CSV = "csv"
+    XLSX = "xlsx"
+
+
+def _csv_cell(value: str) -> str:
+    return f"'{value}" if value.startswith(_FORMULA_PREFIXES) else value
+
+
+def _workbook_xml(sheet_name: str) -> str:
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        f'<sheets><sheet name="{escape(sheet_name)}" sheetId="1" r:id="rId1"/></sheets>'
+        "</workbook>"
+    )
+
+
+def _xlsx_row(values: Sequence[str]) -> str:
+    cells = "".join(
+        f'<c t="inlineStr"><is><t xml:space="preserve">{escape(_ILLEGAL_XML_CHARS.sub("", value))}</t></is></c>'
+        for value in values
+    )
+    return f"<row>{cells}</row>"
+
+
+async def csv_chunks(
+    header: Sequence[str],
+    rows: AsyncIterable[Sequence[str]],
+) -> AsyncIterator[bytes]:
+    """CSV с BOM и разделителем ``;`` — в таком виде его без мастера импорта открывает русский Excel."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, delimiter=";")
+
+    buffer.write("\ufeff")
+    writer.writerow(header)
+    yield buffer.getvalue().encode()
+    buffer.seek(0)
+    buffer.truncate()
+
+    async for row in rows:
+        writer.writerow([_csv_cell(value) for value in row])
+
+        if buffer.tell() >= EXPORT_CHUNK_SIZE:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+class _ChunkSink(io.RawIOBase):
+    """Приемник без seek для ZipFile: архив пишется потоком, размеры файлов уходят в data descriptor'ы."""
+
+    def __init__(self) -> None:
+        self.buffer = bytearray()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: bytes) -> int:
+        self.buffer += data
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = bytes(self.buffer)
+        self.buffer.clear()
+        return data
+
+
+async def xlsx_chunks(
+    header: Sequence[str],
+    rows: AsyncIterable[Sequence[str]],
+    sheet_name: str = "Лист1",
+) -> AsyncIterator[bytes]:
+    """Минимальная XLSX-книга с одним листом, записываемая инкрементально.
+
+    Ячейки пишутся inline-строками, поэтому не нужна таблица sharedStrings,
+    которую пришлось бы держать в памяти целиком до конца выгрузки.
+    """
+    sink = _ChunkSink()
+
+    with zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("[Content_Types].xml", _CONTENT_TYPES_XML)
+        archive.writestr("_rels/.rels", _ROOT_RELS_XML)
+        archive.writestr("xl/workbook.xml", _workbook_xml(sheet_name))
+        archive.writestr("xl/_rels/workbook.xml.rels", _WORKBOOK_RELS_XML)
+
+        with archive.open("xl/worksheets/sheet1.xml", mode="w", force_zip64=True) as sheet:
+            sheet.write((_WORKSHEET_HEADER_XML + _xlsx_row(header)).encode())
+
+            async for row in rows:
+                sheet.write(_xlsx_row(row).encode())
+
+                if len(sink.buffer) >= EXPORT_CHUNK_SIZE:
+                    yield sink.drain()
+
+            sheet.write(_WORKSHEET_FOOTER_XML.encode())
+
+    yield sink.drain()
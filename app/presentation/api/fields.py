@@ -0,0 +1,51 @@
+from typing import Any
+
+from fastapi import Query
+from fastapi.exceptions import RequestValidationError
+
+from pydantic import BaseModel
+
+from domain.base.value_object import BaseValueObject
+from presentation.api.responses import FastJSONResponse
+from presentation.api.schemas import ApiResponse
+
+
+class FieldsQuery:
+    """Dependency для sparse fieldsets: `?fields=name,slug` по полям схемы ответа."""
+
+    def __init__(self, schema: type[BaseModel]):
+        self.allowed_fields = frozenset(schema.model_fields)
+
+    def __call__(
+        self,
+        fields: str | None = Query(None, description="Поля ответа через запятую, по умолчанию все"),
+    ) -> frozenset[str] | None:
+        if fields is None or not fields.strip():
+            return None
+
+        requested = frozenset(field.strip() for field in fields.split(",") if field.strip())
+        unknown = requested - self.allowed_fields
+
+        if unknown:
+            raise RequestValidationError(
+                [
+                    {
+                        "type": "value_error",
+                        "loc": ("query", "fields"),
+                        "msg": f"Unknown fields: {', '.join(sorted(unknown))}",
+                        "input": fields,
+                    },
+                ],
+            )
+
+        return requested
+
+
+def generic_value(value_object: BaseValueObject | None) -> Any:
+    # У частичной сущности непрочитанные value objects равны None
+    return value_object.as_generic_type() if value_object is not None else None
+
+
+def fields_response(data: Any) -> FastJSONResponse:
+    # Частичные объекты не пройдут response_model, поэтому отдаем их напрямую
+    return FastJSONResponse(ApiResponse(data=data))
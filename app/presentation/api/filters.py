@@ -1,8 +1,24 @@
+from typing import (
+    Callable,
+    Optional,
+)
+
+from fastapi import (
+    Depends,
+    Query,
+    Request,
+)
+
 from pydantic import (
     BaseModel,
     Field,
 )
 
+from infrastructure.database.sorting import (
+    SORT_FIELDS,
+    validate_sort_field,
+)
+
 
 class PaginationOut(BaseModel):
     limit: int
@@ -13,3 +29,24 @@ class PaginationOut(BaseModel):
 class PaginationIn(BaseModel):
     limit: int = Field(default=10)
     offset: int = Field(default=0)
+
+
+def stream_limit(request: Request, pagination: PaginationIn = Depends()) -> Optional[int]:
+    """limit для потоковой выдачи: только явно переданный клиентом, без него поток отдает весь список."""
+    return pagination.limit if "limit" in request.query_params else None
+
+
+def sort_field_query(collection_name: str, default: str) -> Callable[[str], str]:
+    """Зависимость для параметра sort_field: неподдерживаемое поле отклоняется с 422 до выполнения запроса."""
+    allowed_fields = SORT_FIELDS[collection_name]
+
+    def get_sort_field(
+        sort_field: str = Query(
+            default,
+            description=f"Поле для сортировки: {', '.join(allowed_fields)}",
+            json_schema_extra={"enum": list(allowed_fields)},
+        ),
+    ) -> str:
+        return validate_sort_field(collection_name, sort_field)
+
+    return get_sort_field
@@ -1,10 +1,24 @@
+from dataclasses import asdict
+
 from fastapi import (
     APIRouter,
+    Depends,
+    Request,
     status,
 )
+from fastapi.responses import Response
 
+from application.container import get_container
+from infrastructure.database.gateways.mongo import MongoDatabase
+from presentation.api.compression import disable_compression
+from presentation.api.dependencies import get_current_user_id
+from presentation.api.responses import FastJSONResponse
 from presentation.api.schemas import (
     ApiResponse,
+    MongoCommandsReportSchema,
+    MongoCommandStatsSchema,
+    MongoPoolStatsSchema,
+    MongoSlowCommandSchema,
     PingResponseSchema,
 )
 
@@ -12,6 +26,8 @@ from presentation.api.schemas import (
 healthcheck_router = APIRouter(
     prefix="/healthcheck",
     tags=["healthcheck"],
+    # Пробы дергают эндпоинт постоянно, сжимать крошечный ответ незачем
+    dependencies=[Depends(disable_compression)],
 )
 
 
@@ -20,3 +36,48 @@ async def get_status() -> ApiResponse[PingResponseSchema]:
     return ApiResponse[PingResponseSchema](
         data=PingResponseSchema(result=True),
     )
+
+
+@healthcheck_router.get(
+    "/ready",
+    status_code=status.HTTP_200_OK,
+    responses={status.HTTP_503_SERVICE_UNAVAILABLE: {"model": ApiResponse[PingResponseSchema]}},
+)
+async def get_readiness(request: Request) -> Response:
+    """Готовность принимать трафик: true только после прогрева на старте и до начала остановки."""
+    ready = getattr(request.app.state, "ready", False)
+
+    return FastJSONResponse(
+        ApiResponse[PingResponseSchema](data=PingResponseSchema(result=ready)),
+        status_code=status.HTTP_200_OK if ready else status.HTTP_503_SERVICE_UNAVAILABLE,
+    )
+
+
+@healthcheck_router.get("/mongo-pool", status_code=status.HTTP_200_OK)
+async def get_mongo_pool_stats(
+    _=Depends(get_current_user_id),
+    container=Depends(get_container),
+) -> ApiResponse[dict[str, MongoPoolStatsSchema]]:
+    """Пул соединений Mongo этого воркера по серверам: для подбора MONGO_MAX_POOL_SIZE."""
+    mongo_database: MongoDatabase = container.resolve(MongoDatabase)
+
+    return ApiResponse[dict[str, MongoPoolStatsSchema]](
+        data={address: MongoPoolStatsSchema(**stats) for address, stats in mongo_database.pool_stats().items()},
+    )
+
+
+@healthcheck_router.get("/mongo-commands", status_code=status.HTTP_200_OK)
+async def get_mongo_command_stats(
+    _=Depends(get_current_user_id),
+    container=Depends(get_container),
+) -> ApiResponse[MongoCommandsReportSchema]:
+    """Задержки команд Mongo этого воркера по коллекциям и методам репозиториев и самые медленные формы запросов."""
+    mongo_database: MongoDatabase = container.resolve(MongoDatabase)
+    slow_commands = await mongo_database.slow_commands()
+
+    return ApiResponse[MongoCommandsReportSchema](
+        data=MongoCommandsReportSchema(
+            commands=[MongoCommandStatsSchema(**stats) for stats in mongo_database.command_stats()],
+            slow_commands=[MongoSlowCommandSchema(**asdict(shape)) for shape in slow_commands],
+        ),
+    )
@@ -0,0 +1,149 @@
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from fastapi import FastAPI
+
+from application.cache_invalidation.commands import InvalidateCachesCommand
+from application.container import get_container
+from application.mediator import Mediator
+from application.warmup.commands import WarmUpCachesCommand
+from infrastructure.database.change_streams import (
+    ChangeEvent,
+    ChangeStreamWatcher,
+)
+from infrastructure.database.gateways.mongo import MongoDatabase
+from infrastructure.database.indexes import ensure_indexes
+from infrastructure.database.migrations.native_bson import native_bson_migration_completed
+from infrastructure.metrics.collectors import mongo_collector
+from infrastructure.metrics.event_loop import EventLoopLagMonitor
+from infrastructure.metrics.multiprocess import MetricsFlusher
+from infrastructure.metrics.registry import REGISTRY
+from infrastructure.metrics.watchdog import EventLoopWatchdog
+from infrastructure.s3.base import BaseFileStorage
+from infrastructure.tracing.setup import configure_tracing
+from infrastructure.tracing.tracer import TRACER
+from settings.config import Config
+
+
+logger = logging.getLogger(__name__)
+
+
+async def warm_up(app: FastAPI) -> None:
+    """Готовит процесс к трафику: синглтоны, пул Mongo, индексы, change stream и горячие кэши.
+
+    Недоступная Mongo роняет запуск (оркестратор перезапустит под), а сбой
+    индексов или кэшей только логируется: приложение работоспособно и без них.
+    """
+    started_at = time.perf_counter()
+    container = app.dependency_overrides.get(get_container, get_container)()
+    config: Config = container.resolve(Config)
+    configure_tracing(config, role="api")
+
+    # Медиатор тянет за собой все хендлеры, сервисы и репозитории
+    mediator: Mediator = container.resolve(Mediator)
+    container.resolve(BaseFileStorage)
+
+    mongo_database: MongoDatabase = container.resolve(MongoDatabase)
+    await mongo_database.warm_up(connections=config.warmup_mongo_connections)
+    await ensure_indexes(mongo_database)
+
+    # Даты-строки старого формата не попадают в фильтры по диапазону и сортируются отдельно
+    # Приложение читает оба формата, но пока миграция идет, сортировка по датам смешивает старые и новые документы
+    if not await native_bson_migration_completed(mongo_database):
+        logger.warning("Documents in the legacy format remain: run `make migrate-native-bson`")
+
+    if config.metrics_enabled:
+        await start_metrics(app, mongo_database, config)
+
+    if config.event_loop_watchdog_enabled:
+        app.state.event_loop_watchdog = EventLoopWatchdog(threshold=config.event_loop_watchdog_threshold)
+        await app.state.event_loop_watchdog.start()
+
+    if config.change_streams_enabled:
+        # Поток открывается до заполнения кэшей, чтобы не пропустить записи, сделанные во время прогрева
+        app.state.change_stream_watcher = await start_change_stream_watcher(mongo_database, mediator, config)
+
+    try:
+        result, *_ = await mediator.handle_command(
+            WarmUpCachesCommand(
+                products_limit=config.warmup_products_limit,
+                news_limit=config.warmup_news_limit,
+            ),
+        )
+        logger.info("Caches warmed up: %s products, %s news", result.products, result.news)
+    except Exception:
+        logger.exception("Failed to warm up caches")
+
+    logger.info("Application warmed up in %.2fs", time.perf_counter() - started_at)
+
+
+async def start_metrics(app: FastAPI, mongo_database: MongoDatabase, config: Config) -> None:
+    """Фоновые задачи метрик процесса: задержка event loop и сохранение снимка для объединения воркеров."""
+    REGISTRY.register_collector("mongo", mongo_collector(mongo_database))
+
+    app.state.event_loop_lag_monitor = EventLoopLagMonitor(interval=config.metrics_event_loop_lag_interval)
+    await app.state.event_loop_lag_monitor.start()
+
+    if config.metrics_multiprocess_dir:
+        app.state.metrics_flusher = MetricsFlusher(
+            directory=config.metrics_multiprocess_dir,
+            interval=config.metrics_flush_interval,
+        )
+        await app.state.metrics_flusher.start()
+
+
+async def start_change_stream_watcher(
+    mongo_database: MongoDatabase,
+    mediator: Mediator,
+    config: Config,
+) -> ChangeStreamWatcher:
+    """Запускает сброс кэшей процесса по изменениям, сделанным любым воркером, скриптом или миграцией."""
+
+    async def publish(event: ChangeEvent) -> None:
+        await mediator.handle_command(
+            InvalidateCachesCommand(collection_name=event.collection_name, oid=event.oid, slugs=event.slugs),
+        )
+
+    watcher = ChangeStreamWatcher(
+        mongo_database=mongo_database,
+        publish=publish,
+        retry_delay=config.change_streams_retry_delay,
+    )
+    await watcher.start()
+
+    return watcher
+
+
+async def shutdown(app: FastAPI) -> None:
+    for name in (
+        "change_stream_watcher",
+        "event_loop_lag_monitor",
+        "event_loop_watchdog",
+        "metrics_flusher",
+    ):
+        background_task = getattr(app.state, name, None)
+
+        if background_task is not None:
+            await background_task.stop()
+
+    REGISTRY.unregister_collector("mongo")
+
+    container = app.dependency_overrides.get(get_container, get_container)()
+    container.resolve(MongoDatabase).close()
+    TRACER.shutdown()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    app.state.ready = False
+    await warm_up(app)
+    app.state.ready = True
+
+    try:
+        yield
+    finally:
+        # Снимаем готовность до закрытия клиентов, чтобы балансировщик перестал слать запросы
+        app.state.ready = False
+        await shutdown(app)
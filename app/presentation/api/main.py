@@ -1,21 +1,58 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from application.container import get_container
+from infrastructure.profiling.store import ProfileStore
+from presentation.api.compression import (
+    CompressionLevels,
+    CompressionMiddleware,
+)
 from presentation.api.exceptions import setup_exception_handlers
 from presentation.api.healthcheck import healthcheck_router
+from presentation.api.lifespan import lifespan
+from presentation.api.metrics import (
+    metrics_router,
+    MetricsMiddleware,
+)
+from presentation.api.profiling import (
+    profiling_router,
+    ProfilingMiddleware,
+)
+from presentation.api.read_routing import ReadYourWritesMiddleware
+from presentation.api.responses import FastJSONResponse
+from presentation.api.tracing import TracingMiddleware
 from presentation.api.v1 import v1_router
+from settings.config import Config
 
 
 def create_app() -> FastAPI:
+    config = get_container().resolve(Config)
+
     app = FastAPI(
         title="sk API",
         description="A RESTful API for sk applications, offering authentication and user management.",
         docs_url="/api/docs",
         debug=True,
+        default_response_class=FastJSONResponse,
+        lifespan=lifespan,
     )
 
     setup_exception_handlers(app)
 
+    if config.mongo_query_read_preference != "primary":
+        # Внутри остальных middleware: отметку о команде ставит обработчик в том же контексте
+        app.add_middleware(ReadYourWritesMiddleware, window=config.mongo_read_your_writes_seconds)
+
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=config.compression_minimum_size,
+        levels=CompressionLevels(
+            gzip=config.compression_gzip_level,
+            brotli=config.compression_brotli_quality,
+            zstd=config.compression_zstd_level,
+        ),
+    )
+
     app.add_middleware(
         CORSMiddleware,
         allow_origins=["http://localhost:3000", "http://localhost:3001"],
@@ -25,6 +62,26 @@ def create_app() -> FastAPI:
         expose_headers=["*"],
     )
 
+    if config.profiling_enabled:
+        app.state.profile_store = ProfileStore(
+            directory=config.profiling_dir,
+            max_profiles=config.profiling_max_profiles,
+        )
+        app.add_middleware(
+            ProfilingMiddleware,
+            store=app.state.profile_store,
+            interval=config.profiling_sample_interval,
+        )
+        app.include_router(profiling_router)
+
+    if config.tracing_enabled:
+        app.add_middleware(TracingMiddleware)
+
+    if config.metrics_enabled:
+        # Снаружи всех middleware, в том числе трассировки: в задержку входят CORS, сжатие ответа и экспорт спана
+        app.add_middleware(MetricsMiddleware)
+        app.include_router(metrics_router)
+
     app.include_router(healthcheck_router)
     app.include_router(v1_router, prefix="/api/v1")
     return app
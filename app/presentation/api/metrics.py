@@ -0,0 +1,78 @@
+import time
+
+from fastapi import (
+    APIRouter,
+    Depends,
+)
+from fastapi.responses import Response
+from starlette.types import (
+    ASGIApp,
+    Message,
+    Receive,
+    Scope,
+    Send,
+)
+
+from application.container import get_container
+from infrastructure.metrics.instruments import (
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS_IN_FLIGHT,
+)
+from infrastructure.metrics.multiprocess import collect
+from infrastructure.metrics.registry import render
+from infrastructure.metrics.server import CONTENT_TYPE
+from settings.config import Config
+
+
+# Метка запросов, не попавших ни в один маршрут: путь в метку не идет, иначе сканеры раздуют число рядов
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class MetricsMiddleware:
+    """Время обработки HTTP запросов по шаблону маршрута (/api/v1/products/{slug}) и число запросов в работе.
+
+    Шаблон берется из scope["route"], который роутер FastAPI заполняет при
+    сопоставлении, поэтому разбор пути повторно не делается.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started_at = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+
+            await send(message)
+
+        in_flight = HTTP_REQUESTS_IN_FLIGHT.labels()
+        in_flight.inc()
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            in_flight.dec()
+            route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+            HTTP_REQUEST_DURATION.labels(scope["method"], route, str(status_code)).observe(
+                time.perf_counter() - started_at,
+            )
+
+
+metrics_router = APIRouter(tags=["metrics"])
+
+
+@metrics_router.get("/metrics", include_in_schema=False)
+async def get_metrics(container=Depends(get_container)) -> Response:
+    """Метрики в текстовом формате Prometheus; при METRICS_MULTIPROCESS_DIR - сумма по всем воркерам."""
+    config: Config = container.resolve(Config)
+
+    return Response(render(collect(directory=config.metrics_multiprocess_dir)), media_type=CONTENT_TYPE)
@@ -0,0 +1,124 @@
+import logging
+import sys
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Request,
+    status,
+)
+from fastapi.responses import PlainTextResponse
+from starlette.datastructures import MutableHeaders
+from starlette.types import (
+    ASGIApp,
+    Message,
+    Receive,
+    Scope,
+    Send,
+)
+
+from authx.exceptions import AuthXException
+
+from infrastructure.profiling.sampler import StackSampler
+from infrastructure.profiling.store import ProfileStore
+from presentation.api.dependencies import (
+    get_access_token_payload,
+    get_current_user_id,
+    user_id_from_payload,
+)
+
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = b"x-profile"
+PROFILE_ID_HEADER = "X-Profile-Id"
+
+
+async def is_admin_request(scope: Scope) -> bool:
+    """Та же проверка access токена, что и у защищенных эндпоинтов, но без ответа 401.
+
+    Чтения при этом не закрепляются за primary (в отличие от get_current_user_id):
+    профилируемый запрос должен идти тем же путем, что и обычный.
+    """
+    try:
+        user_id_from_payload(await get_access_token_payload(Request(scope)))
+    except (AuthXException, HTTPException):
+        return False
+
+    return True
+
+
+class ProfilingMiddleware:
+    """Профилирует один запрос по заголовку X-Profile от авторизованного администратора.
+
+    Без заголовка запрос проходит дальше после просмотра списка заголовков:
+    ни проверки токена, ни потока профилировщика. Id профиля возвращается в
+    заголовке X-Profile-Id, сам профиль - GET /profiles/{id}. Запрос с
+    заголовком, но без валидного токена обрабатывается как обычный.
+    """
+
+    def __init__(self, app: ASGIApp, store: ProfileStore, interval: float = 0.001) -> None:
+        self.app = app
+        self.store = store
+        self.interval = interval
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or not any(name == PROFILE_HEADER for name, _ in scope["headers"])
+            or not await is_admin_request(scope)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = self.store.new_id()
+
+        async def send_with_profile_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append(PROFILE_ID_HEADER, profile_id)
+
+            await send(message)
+
+        # Кадр этой корутины - корень стеков запроса: все, что он ожидает, выполняется поверх него
+        sampler = StackSampler(root=sys._getframe(), interval=self.interval)
+        sampler.start()
+
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            sampler.stop()
+            self.store.save(profile_id, sampler.folded())
+            logger.info(
+                "Profiled %s %s as %s: %s samples",
+                scope["method"],
+                scope["path"],
+                profile_id,
+                sampler.samples.total(),
+            )
+
+
+profiling_router = APIRouter(prefix="/profiles", tags=["profiling"])
+
+
+@profiling_router.get(
+    "/{profile_id}",
+    status_code=status.HTTP_200_OK,
+    response_class=PlainTextResponse,
+)
+async def get_profile(
+    profile_id: str,
+    request: Request,
+    _=Depends(get_current_user_id),
+) -> PlainTextResponse:
+    """Профиль запроса в формате свернутых стеков: flamegraph.pl, speedscope, inferno."""
+    store: ProfileStore = request.app.state.profile_store
+    folded = store.load(profile_id)
+
+    if folded is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Profile not found",
+        )
+
+    return PlainTextResponse(folded)
@@ -0,0 +1,75 @@
+import time
+from http.cookies import SimpleCookie
+
+from starlette.datastructures import (
+    Headers,
+    MutableHeaders,
+)
+from starlette.types import (
+    ASGIApp,
+    Message,
+    Receive,
+    Scope,
+    Send,
+)
+
+from infrastructure.database.gateways.routing import (
+    pin_reads_to_primary,
+    write_recorded,
+)
+
+
+READ_PRIMARY_COOKIE = "read_primary_until"
+
+
+class ReadYourWritesMiddleware:
+    """Закрепляет чтения клиента за primary на window секунд после его команды.
+
+    Ответ на запрос с командой ставит cookie read_primary_until (unix-время),
+    и пока оно не прошло, все запросы клиента, в том числе публичные GET без
+    авторизации, читают из primary: сохраненное администратором видно сразу,
+    даже если реплики еще не догнали запись.
+
+    Добавляется только при чтениях с реплик (MONGO_QUERY_READ_PREFERENCE не
+    primary) и должен быть внутри остальных middleware: отметка о команде -
+    ContextVar того же запроса.
+    """
+
+    def __init__(self, app: ASGIApp, window: int) -> None:
+        self.app = app
+        self.window = window
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if self._pinned_until(scope) > time.time():
+            pin_reads_to_primary()
+
+        async def send_with_cookie(message: Message) -> None:
+            if message["type"] == "http.response.start" and write_recorded():
+                cookie = SimpleCookie()
+                cookie[READ_PRIMARY_COOKIE] = str(int(time.time()) + self.window)
+                cookie[READ_PRIMARY_COOKIE].update(
+                    {"max-age": str(self.window), "path": "/", "httponly": True, "samesite": "lax"},
+                )
+                MutableHeaders(scope=message).append("set-cookie", cookie.output(header="").strip())
+
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
+
+    @staticmethod
+    def _pinned_until(scope: Scope) -> float:
+        cookie_header = Headers(scope=scope).get("cookie")
+
+        if not cookie_header or READ_PRIMARY_COOKIE not in cookie_header:
+            return 0.0
+
+        morsel = SimpleCookie(cookie_header).get(READ_PRIMARY_COOKIE)
+
+        try:
+            return float(morsel.value) if morsel is not None else 0.0
+        except ValueError:
+            return 0.0
@@ -0,0 +1,126 @@
+import hashlib
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Optional,
+    TypeVar,
+)
+
+from fastapi import (
+    Header,
+    Request,
+    status,
+)
+from fastapi.responses import (
+    JSONResponse,
+    Response,
+    StreamingResponse,
+)
+
+from pydantic_core import to_json
+
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Строки копятся до этого размера перед отправкой, чтобы не дробить ответ на
+# тысячи мелких ASGI-сообщений (и сбросов компрессора)
+NDJSON_CHUNK_SIZE = 64 * 1024
+
+ItemType = TypeVar("ItemType")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON-ответ, сериализуемый Rust-ядром pydantic напрямую в байты.
+
+    Хендлер, вернувший готовый Response, минует повторную валидацию по
+    response_model и jsonable_encoder; схема в OpenAPI по-прежнему берется
+    из response_model декоратора.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
+class NDJSONResponse(StreamingResponse):
+    """Потоковый ответ application/x-ndjson: один JSON-объект на строку.
+
+    Элементы сериализуются по мере чтения async-итератора репозитория, поэтому
+    память не зависит от размера выборки, а первая строка уходит клиенту сразу.
+    """
+
+    media_type = NDJSON_MEDIA_TYPE
+
+    def __init__(
+        self,
+        items: AsyncIterable[ItemType],
+        convert: Callable[[ItemType], Any],
+    ) -> None:
+        super().__init__(content=ndjson_chunks(items, convert))
+
+
+async def ndjson_chunks(
+    items: AsyncIterable[ItemType],
+    convert: Callable[[ItemType], Any],
+) -> AsyncIterator[bytes]:
+    buffer = bytearray()
+    first = True
+
+    async for item in items:
+        buffer += to_json(convert(item))
+        buffer += b"\n"
+
+        if first or len(buffer) >= NDJSON_CHUNK_SIZE:
+            yield bytes(buffer)
+            buffer.clear()
+            first = False
+
+    if buffer:
+        yield bytes(buffer)
+
+
+def accepts_ndjson(accept: str | None = Header(None, include_in_schema=False)) -> bool:
+    """Клиент запросил потоковый список через ``Accept: application/x-ndjson``."""
+    return accept is not None and NDJSON_MEDIA_TYPE in accept
+
+
+NDJSON_OPENAPI_CONTENT = {
+    NDJSON_MEDIA_TYPE: {
+        "schema": {"type": "string", "description": "JSON-объекты элементов списка, по одному на строку"},
+    },
+}
+
+
+def cacheable_response(
+    request: Request,
+    response: Response,
+    max_age: int,
+    etag: Optional[str] = None,
+) -> Response:
+    """Проставляет ETag и Cache-Control; на совпавший If-None-Match отдает 304 без тела.
+
+    Без явного etag он считается по телу ответа. Слабые валидаторы (W/)
+    сравниваются без учета префикса, как того требует If-None-Match.
+    """
+    etag = etag or f'"{hashlib.blake2b(response.body, digest_size=16).hexdigest()}"'
+
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={max_age}",
+    }
+
+    if is_not_modified(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
+    return response
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+
+    if not if_none_match:
+        return False
+
+    return etag.removeprefix("W/") in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
@@ -20,6 +20,44 @@ class PingResponseSchema(BaseModel):
     result: bool
 
 
+class MongoPoolStatsSchema(BaseModel):
+    open: int
+    in_use: int
+    waiting: int
+    created_total: int
+    closed_total: int
+    checked_out_total: int
+    checkout_failed_total: int
+    cleared_total: int
+
+
+class MongoCommandStatsSchema(BaseModel):
+    collection: str
+    command: str
+    method: str
+    count: int
+    failed_total: int
+    documents_total: int
+    duration_ms_total: float
+    max_duration_ms: float
+    buckets: dict[str, int] = Field(description="Накопительная гистограмма: число команд не дольше le мс")
+
+
+class MongoSlowCommandSchema(BaseModel):
+    collection: str
+    command: str
+    method: str
+    filter: Any = Field(description="Фильтр команды без литералов")
+    count: int
+    max_duration_ms: float
+    explain: dict | None = None
+
+
+class MongoCommandsReportSchema(BaseModel):
+    commands: list[MongoCommandStatsSchema]
+    slow_commands: list[MongoSlowCommandSchema]
+
+
 class ListPaginatedResponse(BaseModel, Generic[TListItem]):
     items: list[TListItem]
     pagination: PaginationOut
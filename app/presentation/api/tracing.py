@@ -0,0 +1,52 @@
+from starlette.datastructures import Headers
+from starlette.types import (
+    ASGIApp,
+    Message,
+    Receive,
+    Scope,
+    Send,
+)
+
+from infrastructure.tracing.tracer import (
+    extract,
+    SpanKind,
+    TRACER,
+)
+
+
+class TracingMiddleware:
+    """Корневой спан HTTP запроса; traceparent входящего запроса делает его продолжением чужой трассы.
+
+    Имя спана - шаблон маршрута, он известен только после сопоставления,
+    поэтому задается в конце запроса.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not TRACER.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        with TRACER.start_span(
+            f"{scope['method']} {scope['path']}",
+            kind=SpanKind.SERVER,
+            attributes={"http.request.method": scope["method"], "url.path": scope["path"]},
+            parent=extract(Headers(scope=scope)),
+        ) as span:
+
+            async def send_with_status(message: Message) -> None:
+                if span is not None and message["type"] == "http.response.start":
+                    span.set_attribute("http.response.status_code", message["status"])
+
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                route = getattr(scope.get("route"), "path", None)
+
+                if span is not None and route is not None:
+                    span.name = f"{scope['method']} {route}"
+                    span.set_attribute("http.route", route)
@@ -5,10 +5,12 @@ from presentation.api.v1.certificates.handlers import router as certificates_rou
 from presentation.api.v1.media.handlers import router as media_router
 from presentation.api.v1.members.handlers import router as members_router
 from presentation.api.v1.news.handlers import router as news_router
+from presentation.api.v1.pages.handlers import router as pages_router
 from presentation.api.v1.portfolios.handlers import router as portfolios_router
 from presentation.api.v1.products.handlers import router as products_router
 from presentation.api.v1.reviews.handlers import router as reviews_router
 from presentation.api.v1.seo_settings.handlers import router as seo_settings_router
+from presentation.api.v1.sitemap.handlers import router as sitemap_router
 from presentation.api.v1.submissions.handlers import router as submissions_router
 from presentation.api.v1.users.handlers import router as users_router
 from presentation.api.v1.vacancies.handlers import router as vacancies_router
@@ -28,3 +30,5 @@ v1_router.include_router(portfolios_router)
 v1_router.include_router(products_router)
 v1_router.include_router(seo_settings_router)
 v1_router.include_router(certificates_router)
+v1_router.include_router(pages_router)
+v1_router.include_router(sitemap_router)
@@ -23,7 +23,9 @@ from presentation.api.dependencies import get_current_user_id
 from presentation.api.filters import (
     PaginationIn,
     PaginationOut,
+    sort_field_query,
 )
+from presentation.api.responses import FastJSONResponse
 from presentation.api.schemas import (
     ApiResponse,
     ErrorResponseSchema,
@@ -53,10 +55,10 @@ async def get_certificate_groups_list(
     section: str | None = Query(None, description="Фильтр по секции"),
     is_active: bool | None = Query(None, description="Фильтр по активности"),
     search: str | None = Query(None, description="Поиск по тексту"),
-    sort_field: str = Query("created_at", description="Поле для сортировки"),
+    sort_field: str = Depends(sort_field_query("certificate_groups", "created_at")),
     sort_order: int = Query(-1, description="Порядок сортировки: 1 - по возрастанию, -1 - по убыванию"),
     container=Depends(get_container),
-) -> ApiResponse[ListPaginatedResponse[CertificateGroupResponseSchema]]:
+) -> FastJSONResponse:
     """Получение списка групп сертификатов с фильтрацией и пагинацией."""
     mediator: Mediator = container.resolve(Mediator)
 
@@ -72,16 +74,18 @@ async def get_certificate_groups_list(
 
     certificate_groups_list, total = await mediator.handle_query(query)
 
-    return ApiResponse[ListPaginatedResponse[CertificateGroupResponseSchema]](
-        data=ListPaginatedResponse[CertificateGroupResponseSchema](
-            items=[
-                CertificateGroupResponseSchema.from_entity(certificate_group)
-                for certificate_group in certificate_groups_list
-            ],
-            pagination=PaginationOut(
-                limit=pagination.limit,
-                offset=pagination.offset,
-                total=total,
+    return FastJSONResponse(
+        ApiResponse[ListPaginatedResponse[CertificateGroupResponseSchema]](
+            data=ListPaginatedResponse[CertificateGroupResponseSchema](
+                items=[
+                    CertificateGroupResponseSchema.from_entity(certificate_group)
+                    for certificate_group in certificate_groups_list
+                ],
+                pagination=PaginationOut(
+                    limit=pagination.limit,
+                    offset=pagination.offset,
+                    total=total,
+                ),
             ),
         ),
     )
@@ -100,15 +104,17 @@ async def get_certificate_groups_list(
 async def get_certificate_group_by_id(
     certificate_group_id: UUID,
     container=Depends(get_container),
-) -> ApiResponse[CertificateGroupResponseSchema]:
+) -> FastJSONResponse:
     """Получение группы сертификатов по ID."""
     mediator: Mediator = container.resolve(Mediator)
 
     query = GetCertificateGroupByIdQuery(certificate_group_id=certificate_group_id)
     certificate_group = await mediator.handle_query(query)
 
-    return ApiResponse[CertificateGroupResponseSchema](
-        data=CertificateGroupResponseSchema.from_entity(certificate_group),
+    return FastJSONResponse(
+        ApiResponse[CertificateGroupResponseSchema](
+            data=CertificateGroupResponseSchema.from_entity(certificate_group),
+        ),
     )
 
 
@@ -23,7 +23,9 @@ from presentation.api.dependencies import get_current_user_id
 from presentation.api.filters import (
     PaginationIn,
     PaginationOut,
+    sort_field_query,
 )
+from presentation.api.responses import FastJSONResponse
 from presentation.api.schemas import (
     ApiResponse,
     ErrorResponseSchema,
@@ -52,10 +54,10 @@ async def get_certificates_list(
     pagination: PaginationIn = Depends(),
     certificate_group_id: UUID | None = Query(None, description="Фильтр по группе сертификатов"),
     search: str | None = Query(None, description="Поиск по тексту"),
-    sort_field: str = Query("created_at", description="Поле для сортировки"),
+    sort_field: str = Depends(sort_field_query("certificates", "created_at")),
     sort_order: int = Query(-1, description="Порядок сортировки: 1 - по возрастанию, -1 - по убыванию"),
     container=Depends(get_container),
-) -> ApiResponse[ListPaginatedResponse[CertificateResponseSchema]]:
+) -> FastJSONResponse:
     """Получение списка сертификатов с фильтрацией и пагинацией."""
     mediator: Mediator = container.resolve(Mediator)
 
@@ -70,13 +72,15 @@ async def get_certificates_list(
 
     certificates_list, total = await mediator.handle_query(query)
 
-    return ApiResponse[ListPaginatedResponse[CertificateResponseSchema]](
-        data=ListPaginatedResponse[CertificateResponseSchema](
-            items=[CertificateResponseSchema.from_entity(certificate) for certificate in certificates_list],
-            pagination=PaginationOut(
-                limit=pagination.limit,
-                offset=pagination.offset,
-                total=total,
+    return FastJSONResponse(
+        ApiResponse[ListPaginatedResponse[CertificateResponseSchema]](
+            data=ListPaginatedResponse[CertificateResponseSchema](
+                items=[CertificateResponseSchema.from_entity(certificate) for certificate in certificates_list],
+                pagination=PaginationOut(
+                    limit=pagination.limit,
+                    offset=pagination.offset,
+                    total=total,
+                ),
             ),
         ),
     )
@@ -95,15 +99,17 @@ async def get_certificates_list(
 async def get_certificate_by_id(
     certificate_id: UUID,
     container=Depends(get_container),
-) -> ApiResponse[CertificateResponseSchema]:
+) -> FastJSONResponse:
     """Получение сертификата по ID."""
     mediator: Mediator = container.resolve(Mediator)
 
     query = GetCertificateByIdQuery(certificate_id=certificate_id)
     certificate = await mediator.handle_query(query)
 
-    return ApiResponse[CertificateResponseSchema](
-        data=CertificateResponseSchema.from_entity(certificate),
+    return FastJSONResponse(
+        ApiResponse[CertificateResponseSchema](
+            data=CertificateResponseSchema.from_entity(certificate),
+        ),
     )
 
 
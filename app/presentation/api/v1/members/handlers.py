@@ -23,7 +23,9 @@ from presentation.api.dependencies import get_current_user_id
 from presentation.api.filters import (
     PaginationIn,
     PaginationOut,
+    sort_field_query,
 )
+from presentation.api.responses import FastJSONResponse
 from presentation.api.schemas import (
     ApiResponse,
     ErrorResponseSchema,
@@ -50,10 +52,10 @@ router = APIRouter(prefix="/members", tags=["members"])
 )
 async def get_members_list(
     pagination: PaginationIn = Depends(),
-    sort_field: str = Query("order", description="Поле для сортировки"),
+    sort_field: str = Depends(sort_field_query("members", "order")),
     sort_order: int = Query(1, description="Порядок сортировки: 1 - по возрастанию, -1 - по убыванию"),
     container=Depends(get_container),
-) -> ApiResponse[ListPaginatedResponse[MemberResponseSchema]]:
+) -> FastJSONResponse:
     """Получение списка членов команды с пагинацией."""
     mediator: Mediator = container.resolve(Mediator)
 
@@ -66,13 +68,15 @@ async def get_members_list(
 
     members_list, total = await mediator.handle_query(query)
 
-    return ApiResponse[ListPaginatedResponse[MemberResponseSchema]](
-        data=ListPaginatedResponse[MemberResponseSchema](
-            items=[MemberResponseSchema.from_entity(member) for member in members_list],
-            pagination=PaginationOut(
-                limit=pagination.limit,
-                offset=pagination.offset,
-                total=total,
+    return FastJSONResponse(
+        ApiResponse[ListPaginatedResponse[MemberResponseSchema]](
+            data=ListPaginatedResponse[MemberResponseSchema](
+                items=[MemberResponseSchema.from_entity(member) for member in members_list],
+                pagination=PaginationOut(
+                    limit=pagination.limit,
+                    offset=pagination.offset,
+                    total=total,
+                ),
             ),
         ),
     )
@@ -91,15 +95,17 @@ async def get_members_list(
 async def get_member_by_id(
     member_id: UUID,
     container=Depends(get_container),
-) -> ApiResponse[MemberResponseSchema]:
+) -> FastJSONResponse:
     """Получение члена команды по ID."""
     mediator: Mediator = container.resolve(Mediator)
 
     query = GetMemberByIdQuery(member_id=member_id)
     member = await mediator.handle_query(query)
 
-    return ApiResponse[MemberResponseSchema](
-        data=MemberResponseSchema.from_entity(member),
+    return FastJSONResponse(
+        ApiResponse[MemberResponseSchema](
+            data=MemberResponseSchema.from_entity(member),
+        ),
     )
 
 
@@ -20,10 +20,16 @@ from application.news.queries import (
     GetNewsListQuery,
 )
 from presentation.api.dependencies import get_current_user_id
+from presentation.api.fields import (
+    fields_response,
+    FieldsQuery,
+)
 from presentation.api.filters import (
     PaginationIn,
     PaginationOut,
+    sort_field_query,
 )
+from presentation.api.responses import FastJSONResponse
 from presentation.api.schemas import (
     ApiResponse,
     ErrorResponseSchema,
@@ -51,10 +57,11 @@ async def get_news_list(
     pagination: PaginationIn = Depends(),
     category: str | None = Query(None, description="Фильтр по категории"),
     search: str | None = Query(None, description="Поиск по тексту"),
-    sort_field: str = Query("created_at", description="Поле для сортировки"),
+    sort_field: str = Depends(sort_field_query("news", "created_at")),
     sort_order: int = Query(-1, description="Порядок сортировки: 1 - по возрастанию, -1 - по убыванию"),
+    fields: frozenset[str] | None = Depends(FieldsQuery(NewsResponseSchema)),
     container=Depends(get_container),
-) -> ApiResponse[ListPaginatedResponse[NewsResponseSchema]]:
+) -> FastJSONResponse:
     """Получение списка новостей с фильтрацией и пагинацией."""
     mediator: Mediator = container.resolve(Mediator)
 
@@ -65,17 +72,32 @@ async def get_news_list(
         limit=pagination.limit,
         search=search,
         category=category,
+        fields=fields,
     )
 
     news_list, total = await mediator.handle_query(query)
 
-    return ApiResponse[ListPaginatedResponse[NewsResponseSchema]](
-        data=ListPaginatedResponse[NewsResponseSchema](
-            items=[NewsResponseSchema.from_entity(news) for news in news_list],
-            pagination=PaginationOut(
-                limit=pagination.limit,
-                offset=pagination.offset,
-                total=total,
+    if fields is not None:
+        return fields_response(
+            ListPaginatedResponse[dict](
+                items=[NewsResponseSchema.fields_from_entity(news, fields) for news in news_list],
+                pagination=PaginationOut(
+                    limit=pagination.limit,
+                    offset=pagination.offset,
+                    total=total,
+                ),
+            ),
+        )
+
+    return FastJSONResponse(
+        ApiResponse[ListPaginatedResponse[NewsResponseSchema]](
+            data=ListPaginatedResponse[NewsResponseSchema](
+                items=[NewsResponseSchema.from_entity(news) for news in news_list],
+                pagination=PaginationOut(
+                    limit=pagination.limit,
+                    offset=pagination.offset,
+                    total=total,
+                ),
             ),
         ),
     )
@@ -93,16 +115,22 @@ async def get_news_list(
 )
 async def get_news_by_id(
     news_id: UUID,
+    fields: frozenset[str] | None = Depends(FieldsQuery(NewsResponseSchema)),
     container=Depends(get_container),
-) -> ApiResponse[NewsResponseSchema]:
+) -> FastJSONResponse:
     """Получение новости по ID."""
     mediator: Mediator = container.resolve(Mediator)
 
-    query = GetNewsByIdQuery(news_id=news_id)
+    query = GetNewsByIdQuery(news_id=news_id, fields=fields)
     news = await mediator.handle_query(query)
 
-    return ApiResponse[NewsResponseSchema](
-        data=NewsResponseSchema.from_entity(news),
+    if fields is not None:
+        return fields_response(NewsResponseSchema.fields_from_entity(news, fields))
+
+    return FastJSONResponse(
+        ApiResponse[NewsResponseSchema](
+            data=NewsResponseSchema.from_entity(news),
+        ),
     )
 
 
@@ -118,16 +146,22 @@ async def get_news_by_id(
 )
 async def get_news_by_slug(
     slug: str,
+    fields: frozenset[str] | None = Depends(FieldsQuery(NewsResponseSchema)),
     container=Depends(get_container),
-) -> ApiResponse[NewsResponseSchema]:
+) -> FastJSONResponse:
     """Получение новости по slug."""
     mediator: Mediator = container.resolve(Mediator)
 
-    query = GetNewsBySlugQuery(slug=slug)
+    query = GetNewsBySlugQuery(slug=slug, fields=fields)
     news = await mediator.handle_query(query)
 
-    return ApiResponse[NewsResponseSchema](
-        data=NewsResponseSchema.from_entity(news),
+    if fields is not None:
+        return fields_response(NewsResponseSchema.fields_from_entity(news, fields))
+
+    return FastJSONResponse(
+        ApiResponse[NewsResponseSchema](
+            data=NewsResponseSchema.from_entity(news),
+        ),
     )
 
 
@@ -15,6 +15,7 @@ from domain.news.value_objects.news import (
     SlugValueObject,
     TitleValueObject,
 )
+from presentation.api.fields import generic_value
 
 
 class NewsResponseSchema(BaseModel):
@@ -33,16 +34,25 @@ class NewsResponseSchema(BaseModel):
 
     @classmethod
     def from_entity(cls, entity: NewsEntity) -> "NewsResponseSchema":
-        return cls(
+        return cls(**cls._values_from_entity(entity))
+
+    @classmethod
+    def fields_from_entity(cls, entity: NewsEntity, fields: frozenset[str]) -> dict:
+        # Сущность может быть частичной: непрочитанные поля не валидируются и не попадают в ответ
+        return cls.model_construct(**cls._values_from_entity(entity)).model_dump(mode="json", include=set(fields))
+
+    @staticmethod
+    def _values_from_entity(entity: NewsEntity) -> dict:
+        return dict(
             oid=entity.oid,
-            category=entity.category.as_generic_type(),
-            title=entity.title.as_generic_type(),
-            slug=entity.slug.as_generic_type(),
-            content=entity.content.as_generic_type(),
-            short_content=entity.short_content.as_generic_type(),
-            image_url=entity.image_url.as_generic_type(),
-            alt=entity.alt.as_generic_type(),
-            reading_time=entity.reading_time.as_generic_type(),
+            category=generic_value(entity.category),
+            title=generic_value(entity.title),
+            slug=generic_value(entity.slug),
+            content=generic_value(entity.content),
+            short_content=generic_value(entity.short_content),
+            image_url=generic_value(entity.image_url),
+            alt=generic_value(entity.alt),
+            reading_time=generic_value(entity.reading_time),
             date=entity.date,
             created_at=entity.created_at,
             updated_at=entity.updated_at,
@@ -0,0 +1,153 @@
+from typing import (
+    Any,
+    Callable,
+)
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    Query,
+    Request,
+    status,
+)
+from fastapi.responses import Response
+
+from pydantic import BaseModel
+
+from application.certificates.queries import GetCertificatesListQuery
+from application.container import get_container
+from application.mediator import Mediator
+from application.members.queries import GetMemberListQuery
+from application.news.queries import GetNewsListQuery
+from application.pages.queries import (
+    GetPageBundleQuery,
+    PageSection,
+)
+from application.products.queries import GetProductSummaryListQuery
+from application.reviews.queries import GetReviewsListQuery
+from application.seo_settings.queries import GetSeoSettingsByPathQuery
+from presentation.api.filters import PaginationOut
+from presentation.api.responses import (
+    cacheable_response,
+    FastJSONResponse,
+)
+from presentation.api.schemas import (
+    ApiResponse,
+    ErrorResponseSchema,
+    ListPaginatedResponse,
+)
+from presentation.api.v1.certificates.schemas import CertificateResponseSchema
+from presentation.api.v1.members.schemas import MemberResponseSchema
+from presentation.api.v1.news.schemas import NewsResponseSchema
+from presentation.api.v1.pages.schemas import HomePageBundleResponseSchema
+from presentation.api.v1.products.schemas import ProductSummaryResponseSchema
+from presentation.api.v1.reviews.schemas import ReviewResponseSchema
+from presentation.api.v1.seo_settings.schemas import SeoSettingsResponseSchema
+
+
+router = APIRouter(prefix="/pages", tags=["pages"])
+
+# Главная собирается из публичных данных, поэтому ее можно кэшировать на клиенте и в CDN
+HOME_PAGE_MAX_AGE = 60
+
+
+def _paginated(schema: type[BaseModel], limit: int) -> Callable[[tuple[list, int]], ListPaginatedResponse]:
+    def convert(result: tuple[list, int]) -> ListPaginatedResponse:
+        entities, total = result
+        return ListPaginatedResponse[schema](
+            items=[schema.from_entity(entity) for entity in entities],
+            pagination=PaginationOut(limit=limit, offset=0, total=total),
+        )
+
+    return convert
+
+
+def _home_page_sections(page_path: str, limit: int) -> tuple[PageSection, ...]:
+    return (
+        PageSection(
+            name="seo_settings",
+            query=GetSeoSettingsByPathQuery(page_path=page_path),
+            optional=True,
+        ),
+        PageSection(
+            name="news",
+            query=GetNewsListQuery(sort_field="created_at", sort_order=-1, offset=0, limit=limit),
+        ),
+        PageSection(
+            name="reviews",
+            query=GetReviewsListQuery(category=None, sort_field="created_at", sort_order=-1, offset=0, limit=limit),
+        ),
+        PageSection(
+            name="members",
+            query=GetMemberListQuery(sort_field="order", sort_order=1, offset=0, limit=limit),
+        ),
+        PageSection(
+            name="products",
+            query=GetProductSummaryListQuery(
+                sort_field="created_at",
+                sort_order=-1,
+                offset=0,
+                limit=limit,
+                is_shown=True,
+            ),
+        ),
+        PageSection(
+            name="certificates",
+            query=GetCertificatesListQuery(sort_field="created_at", sort_order=-1, offset=0, limit=limit),
+        ),
+    )
+
+
+def _home_page_converters(limit: int) -> dict[str, Callable[[Any], Any]]:
+    return {
+        "seo_settings": lambda entity: SeoSettingsResponseSchema.from_entity(entity) if entity else None,
+        "news": _paginated(NewsResponseSchema, limit),
+        "reviews": _paginated(ReviewResponseSchema, limit),
+        "members": _paginated(MemberResponseSchema, limit),
+        "products": _paginated(ProductSummaryResponseSchema, limit),
+        "certificates": _paginated(CertificateResponseSchema, limit),
+    }
+
+
+@router.get(
+    "/home",
+    status_code=status.HTTP_200_OK,
+    response_model=ApiResponse[HomePageBundleResponseSchema],
+    responses={
+        status.HTTP_200_OK: {"model": ApiResponse[HomePageBundleResponseSchema]},
+        status.HTTP_304_NOT_MODIFIED: {"description": "Данные не изменились с последнего запроса (If-None-Match)"},
+        status.HTTP_422_UNPROCESSABLE_CONTENT: {"model": ErrorResponseSchema},
+    },
+)
+async def get_home_page_bundle(
+    request: Request,
+    page_path: str = Query("/", description="Путь страницы для SEO настроек"),
+    limit: int = Query(10, ge=1, le=100, description="Количество элементов в каждом списке"),
+    container=Depends(get_container),
+) -> Response:
+    """Все данные главной страницы одним запросом.
+
+    Подзапросы (SEO, новости, отзывы, сотрудники, продукты, сертификаты) выполняются
+    на сервере параллельно. Отсутствие SEO настроек не считается ошибкой: секция
+    будет пустой, а причина попадет в errors.
+    """
+    mediator: Mediator = container.resolve(Mediator)
+
+    bundle = await mediator.handle_query(
+        GetPageBundleQuery(sections=_home_page_sections(page_path=page_path, limit=limit)),
+    )
+    converters = _home_page_converters(limit)
+
+    response = FastJSONResponse(
+        ApiResponse[HomePageBundleResponseSchema](
+            data=HomePageBundleResponseSchema(
+                **{name: converters[name](result) for name, result in bundle.results.items()},
+            ),
+            errors=[
+                {"message": exception.message, "type": exception.__class__.__name__, "section": name}
+                for name, exception in bundle.errors.items()
+            ],
+        ),
+    )
+
+    return cacheable_response(request, response, max_age=HOME_PAGE_MAX_AGE)
@@ -0,0 +1,20 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+from presentation.api.schemas import ListPaginatedResponse
+from presentation.api.v1.certificates.schemas import CertificateResponseSchema
+from presentation.api.v1.members.schemas import MemberResponseSchema
+from presentation.api.v1.news.schemas import NewsResponseSchema
+from presentation.api.v1.products.schemas import ProductSummaryResponseSchema
+from presentation.api.v1.reviews.schemas import ReviewResponseSchema
+from presentation.api.v1.seo_settings.schemas import SeoSettingsResponseSchema
+
+
+class HomePageBundleResponseSchema(BaseModel):
+    seo_settings: Optional[SeoSettingsResponseSchema] = None
+    news: ListPaginatedResponse[NewsResponseSchema]
+    reviews: ListPaginatedResponse[ReviewResponseSchema]
+    members: ListPaginatedResponse[MemberResponseSchema]
+    products: ListPaginatedResponse[ProductSummaryResponseSchema]
+    certificates: ListPaginatedResponse[CertificateResponseSchema]
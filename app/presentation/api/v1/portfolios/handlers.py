@@ -18,12 +18,19 @@ from application.portfolios.queries import (
     GetPortfolioByIdQuery,
     GetPortfolioBySlugQuery,
     GetPortfolioListQuery,
+    GetPortfolioSummaryListQuery,
 )
 from presentation.api.dependencies import get_current_user_id
+from presentation.api.fields import (
+    fields_response,
+    FieldsQuery,
+)
 from presentation.api.filters import (
     PaginationIn,
     PaginationOut,
+    sort_field_query,
 )
+from presentation.api.responses import FastJSONResponse
 from presentation.api.schemas import (
     ApiResponse,
     ErrorResponseSchema,
@@ -32,6 +39,7 @@ from presentation.api.schemas import (
 from presentation.api.v1.portfolios.schemas import (
     PortfolioRequestSchema,
     PortfolioResponseSchema,
+    PortfolioSummaryResponseSchema,
 )
 
 
@@ -51,10 +59,11 @@ async def get_portfolios_list(
     pagination: PaginationIn = Depends(),
     year: int | None = Query(None, description="Фильтр по году"),
     search: str | None = Query(None, description="Поиск по тексту"),
-    sort_field: str = Query("created_at", description="Поле для сортировки"),
+    sort_field: str = Depends(sort_field_query("portfolio", "created_at")),
     sort_order: int = Query(-1, description="Порядок сортировки: 1 - по возрастанию, -1 - по убыванию"),
+    fields: frozenset[str] | None = Depends(FieldsQuery(PortfolioResponseSchema)),
     container=Depends(get_container),
-) -> ApiResponse[ListPaginatedResponse[PortfolioResponseSchema]]:
+) -> FastJSONResponse:
     """Получение списка портфолио с фильтрацией и пагинацией."""
     mediator: Mediator = container.resolve(Mediator)
 
@@ -65,17 +74,77 @@ async def get_portfolios_list(
         limit=pagination.limit,
         search=search,
         year=year,
+        fields=fields,
     )
 
     portfolios_list, total = await mediator.handle_query(query)
 
-    return ApiResponse[ListPaginatedResponse[PortfolioResponseSchema]](
-        data=ListPaginatedResponse[PortfolioResponseSchema](
-            items=[PortfolioResponseSchema.from_entity(portfolio) for portfolio in portfolios_list],
-            pagination=PaginationOut(
-                limit=pagination.limit,
-                offset=pagination.offset,
-                total=total,
+    if fields is not None:
+        return fields_response(
+            ListPaginatedResponse[dict](
+                items=[PortfolioResponseSchema.fields_from_entity(portfolio, fields) for portfolio in portfolios_list],
+                pagination=PaginationOut(
+                    limit=pagination.limit,
+                    offset=pagination.offset,
+                    total=total,
+                ),
+            ),
+        )
+
+    return FastJSONResponse(
+        ApiResponse[ListPaginatedResponse[PortfolioResponseSchema]](
+            data=ListPaginatedResponse[PortfolioResponseSchema](
+                items=[PortfolioResponseSchema.from_entity(portfolio) for portfolio in portfolios_list],
+                pagination=PaginationOut(
+                    limit=pagination.limit,
+                    offset=pagination.offset,
+                    total=total,
+                ),
+            ),
+        ),
+    )
+
+
+@router.get(
+    "/summary",
+    status_code=status.HTTP_200_OK,
+    response_model=ApiResponse[ListPaginatedResponse[PortfolioSummaryResponseSchema]],
+    responses={
+        status.HTTP_200_OK: {"model": ApiResponse[ListPaginatedResponse[PortfolioSummaryResponseSchema]]},
+        status.HTTP_422_UNPROCESSABLE_CONTENT: {"model": ErrorResponseSchema},
+    },
+)
+async def get_portfolios_summary_list(
+    pagination: PaginationIn = Depends(),
+    year: int | None = Query(None, description="Фильтр по году"),
+    search: str | None = Query(None, description="Поиск по тексту"),
+    sort_field: str = Depends(sort_field_query("portfolio", "created_at")),
+    sort_order: int = Query(-1, description="Порядок сортировки: 1 - по возрастанию, -1 - по убыванию"),
+    container=Depends(get_container),
+) -> FastJSONResponse:
+    """Получение облегченного списка портфолио."""
+    mediator: Mediator = container.resolve(Mediator)
+
+    query = GetPortfolioSummaryListQuery(
+        sort_field=sort_field,
+        sort_order=sort_order,
+        offset=pagination.offset,
+        limit=pagination.limit,
+        search=search,
+        year=year,
+    )
+
+    summaries, total = await mediator.handle_query(query)
+
+    return FastJSONResponse(
+        ApiResponse[ListPaginatedResponse[PortfolioSummaryResponseSchema]](
+            data=ListPaginatedResponse[PortfolioSummaryResponseSchema](
+                items=[PortfolioSummaryResponseSchema.from_entity(summary) for summary in summaries],
+                pagination=PaginationOut(
+                    limit=pagination.limit,
+                    offset=pagination.offset,
+                    total=total,
+                ),
             ),
         ),
     )
@@ -93,16 +162,22 @@ async def get_portfolios_list(
 )
 async def get_portfolio_by_id(
     portfolio_id: UUID,
+    fields: frozenset[str] | None = Depends(FieldsQuery(PortfolioResponseSchema)),
     container=Depends(get_container),
-) -> ApiResponse[PortfolioResponseSchema]:
+) -> FastJSONResponse:
     """Получение портфолио по ID."""
     mediator: Mediator = container.resolve(Mediator)
 
-    query = GetPortfolioByIdQuery(portfolio_id=portfolio_id)
+    query = GetPortfolioByIdQuery(portfolio_id=portfolio_id, fields=fields)
     portfolio = await mediator.handle_query(query)
 
-    return ApiResponse[PortfolioResponseSchema](
-        data=PortfolioResponseSchema.from_entity(portfolio),
+    if fields is not None:
+        return fields_response(PortfolioResponseSchema.fields_from_entity(portfolio, fields))
+
+    return FastJSONResponse(
+        ApiResponse[PortfolioResponseSchema](
+            data=PortfolioResponseSchema.from_entity(portfolio),
+        ),
     )
 
 
@@ -118,16 +193,22 @@ async def get_portfolio_by_id(
 )
 async def get_portfolio_by_slug(
     slug: str,
+    fields: frozenset[str] | None = Depends(FieldsQuery(PortfolioResponseSchema)),
     container=Depends(get_container),
-) -> ApiResponse[PortfolioResponseSchema]:
+) -> FastJSONResponse:
     """Получение портфолио по slug."""
     mediator: Mediator = container.resolve(Mediator)
 
-    query = GetPortfolioBySlugQuery(slug=slug)
+    query = GetPortfolioBySlugQuery(slug=slug, fields=fields)
     portfolio = await mediator.handle_query(query)
 
-    return ApiResponse[PortfolioResponseSchema](
-        data=PortfolioResponseSchema.from_entity(portfolio),
+    if fields is not None:
+        return fields_response(PortfolioResponseSchema.fields_from_entity(portfolio, fields))
+
+    return FastJSONResponse(
+        ApiResponse[PortfolioResponseSchema](
+            data=PortfolioResponseSchema.from_entity(portfolio),
+        ),
     )
 
 
@@ -5,6 +5,7 @@ from uuid import UUID
 from pydantic import BaseModel
 
 from domain.portfolios.entities.portfolios import PortfolioEntity
+from domain.portfolios.entities.summaries import PortfolioSummaryEntity
 from domain.portfolios.value_objects.portfolios import (
     DescriptionValueObject,
     ImageAltValueObject,
@@ -25,6 +26,7 @@ from domain.portfolios.value_objects.portfolios import (
     TaskTitleValueObject,
     YearValueObject,
 )
+from presentation.api.fields import generic_value
 
 
 class PortfolioResponseSchema(BaseModel):
@@ -56,24 +58,33 @@ class PortfolioResponseSchema(BaseModel):
 
     @classmethod
     def from_entity(cls, entity: PortfolioEntity) -> "PortfolioResponseSchema":
-        return cls(
+        return cls(**cls._values_from_entity(entity))
+
+    @classmethod
+    def fields_from_entity(cls, entity: PortfolioEntity, fields: frozenset[str]) -> dict:
+        # Сущность может быть частичной: непрочитанные поля не валидируются и не попадают в ответ
+        return cls.model_construct(**cls._values_from_entity(entity)).model_dump(mode="json", include=set(fields))
+
+    @staticmethod
+    def _values_from_entity(entity: PortfolioEntity) -> dict:
+        return dict(
             oid=entity.oid,
-            name=entity.name.as_generic_type(),
-            slug=entity.slug.as_generic_type(),
-            poster=entity.poster.as_generic_type(),
-            poster_alt=entity.poster_alt.as_generic_type(),
-            year=entity.year.as_generic_type(),
-            description=entity.description.as_generic_type(),
-            task_title=entity.task_title.as_generic_type(),
-            task_description=entity.task_description.as_generic_type(),
-            solution_title=entity.solution_title.as_generic_type(),
-            solution_description=entity.solution_description.as_generic_type(),
-            solution_subtitle=entity.solution_subtitle.as_generic_type(),
-            solution_subdescription=entity.solution_subdescription.as_generic_type(),
-            solution_image_left=entity.solution_image_left.as_generic_type(),
-            solution_image_left_alt=entity.solution_image_left_alt.as_generic_type(),
-            solution_image_right=entity.solution_image_right.as_generic_type(),
-            solution_image_right_alt=entity.solution_image_right_alt.as_generic_type(),
+            name=generic_value(entity.name),
+            slug=generic_value(entity.slug),
+            poster=generic_value(entity.poster),
+            poster_alt=generic_value(entity.poster_alt),
+            year=generic_value(entity.year),
+            description=generic_value(entity.description),
+            task_title=generic_value(entity.task_title),
+            task_description=generic_value(entity.task_description),
+            solution_title=generic_value(entity.solution_title),
+            solution_description=generic_value(entity.solution_description),
+            solution_subtitle=generic_value(entity.solution_subtitle),
+            solution_subdescription=generic_value(entity.solution_subdescription),
+            solution_image_left=generic_value(entity.solution_image_left),
+            solution_image_left_alt=generic_value(entity.solution_image_left_alt),
+            solution_image_right=generic_value(entity.solution_image_right),
+            solution_image_right_alt=generic_value(entity.solution_image_right_alt),
             has_review=entity.has_review,
             review_title=entity.review_title.as_generic_type() if entity.review_title else None,
             review_text=entity.review_text.as_generic_type() if entity.review_text else None,
@@ -85,6 +96,30 @@ class PortfolioResponseSchema(BaseModel):
         )
 
 
+class PortfolioSummaryResponseSchema(BaseModel):
+    oid: UUID
+    name: str
+    slug: str
+    poster: str
+    poster_alt: str
+    year: int
+    created_at: datetime
+    updated_at: datetime
+
+    @classmethod
+    def from_entity(cls, entity: PortfolioSummaryEntity) -> "PortfolioSummaryResponseSchema":
+        return cls(
+            oid=entity.oid,
+            name=entity.name.as_generic_type(),
+            slug=entity.slug.as_generic_type(),
+            poster=entity.poster.as_generic_type(),
+            poster_alt=entity.poster_alt.as_generic_type(),
+            year=entity.year.as_generic_type(),
+            created_at=entity.created_at,
+            updated_at=entity.updated_at,
+        )
+
+
 class PortfolioRequestSchema(BaseModel):
     name: str
     slug: str
@@ -19,11 +19,25 @@ from application.products.queries import (
     GetProductByIdQuery,
     GetProductBySlugQuery,
     GetProductListQuery,
+    GetProductSummaryListQuery,
+    StreamProductListQuery,
 )
 from presentation.api.dependencies import get_current_user_id
+from presentation.api.fields import (
+    fields_response,
+    FieldsQuery,
+)
 from presentation.api.filters import (
     PaginationIn,
     PaginationOut,
+    sort_field_query,
+    stream_limit,
+)
+from presentation.api.responses import (
+    accepts_ndjson,
+    FastJSONResponse,
+    NDJSON_OPENAPI_CONTENT,
+    NDJSONResponse,
 )
 from presentation.api.schemas import (
     ApiResponse,
@@ -34,6 +48,7 @@ from presentation.api.v1.products.schemas import (
     ProductOrderPatchSchema,
     ProductRequestSchema,
     ProductResponseSchema,
+    ProductSummaryResponseSchema,
 )
 
 
@@ -45,22 +60,54 @@ router = APIRouter(prefix="/products", tags=["products"])
     status_code=status.HTTP_200_OK,
     response_model=ApiResponse[ListPaginatedResponse[ProductResponseSchema]],
     responses={
-        status.HTTP_200_OK: {"model": ApiResponse[ListPaginatedResponse[ProductResponseSchema]]},
+        status.HTTP_200_OK: {
+            "model": ApiResponse[ListPaginatedResponse[ProductResponseSchema]],
+            "content": NDJSON_OPENAPI_CONTENT,
+        },
         status.HTTP_422_UNPROCESSABLE_CONTENT: {"model": ErrorResponseSchema},
     },
 )
 async def get_products_list(
     pagination: PaginationIn = Depends(),
+    limit: int | None = Depends(stream_limit),
     category: str | None = Query(None, description="Фильтр по категории"),
     search: str | None = Query(None, description="Поиск по тексту"),
     is_shown: bool | None = Query(None, description="Фильтр по видимости"),
-    sort_field: str = Query("created_at", description="Поле для сортировки"),
+    sort_field: str = Depends(sort_field_query("products", "created_at")),
     sort_order: int = Query(-1, description="Порядок сортировки: 1 - по возрастанию, -1 - по убыванию"),
+    fields: frozenset[str] | None = Depends(FieldsQuery(ProductResponseSchema)),
+    ndjson: bool = Depends(accepts_ndjson),
     container=Depends(get_container),
-) -> ApiResponse[ListPaginatedResponse[ProductResponseSchema]]:
-    """Получение списка продуктов с фильтрацией и пагинацией."""
+) -> FastJSONResponse | NDJSONResponse:
+    """Получение списка продуктов с фильтрацией и пагинацией.
+
+    С заголовком ``Accept: application/x-ndjson`` продукты отдаются потоком, по одному на строку:
+    начиная с offset, не больше limit, если он передан явно, иначе весь список.
+    """
     mediator: Mediator = container.resolve(Mediator)
 
+    if ndjson:
+        products_stream = await mediator.handle_query(
+            StreamProductListQuery(
+                sort_field=sort_field,
+                sort_order=sort_order,
+                offset=pagination.offset,
+                limit=limit,
+                search=search,
+                category=category,
+                is_shown=is_shown,
+                fields=fields,
+            ),
+        )
+
+        if fields is not None:
+            return NDJSONResponse(
+                products_stream,
+                lambda product: ProductResponseSchema.fields_from_entity(product, fields),
+            )
+
+        return NDJSONResponse(products_stream, ProductResponseSchema.from_entity)
+
     query = GetProductListQuery(
         sort_field=sort_field,
         sort_order=sort_order,
@@ -69,17 +116,79 @@ async def get_products_list(
         search=search,
         category=category,
         is_shown=is_shown,
+        fields=fields,
     )
 
     products_list, total = await mediator.handle_query(query)
 
-    return ApiResponse[ListPaginatedResponse[ProductResponseSchema]](
-        data=ListPaginatedResponse[ProductResponseSchema](
-            items=[ProductResponseSchema.from_entity(product) for product in products_list],
-            pagination=PaginationOut(
-                limit=pagination.limit,
-                offset=pagination.offset,
-                total=total,
+    if fields is not None:
+        return fields_response(
+            ListPaginatedResponse[dict](
+                items=[ProductResponseSchema.fields_from_entity(product, fields) for product in products_list],
+                pagination=PaginationOut(
+                    limit=pagination.limit,
+                    offset=pagination.offset,
+                    total=total,
+                ),
+            ),
+        )
+
+    return FastJSONResponse(
+        ApiResponse[ListPaginatedResponse[ProductResponseSchema]](
+            data=ListPaginatedResponse[ProductResponseSchema](
+                items=[ProductResponseSchema.from_entity(product) for product in products_list],
+                pagination=PaginationOut(
+                    limit=pagination.limit,
+                    offset=pagination.offset,
+                    total=total,
+                ),
+            ),
+        ),
+    )
+
+
+@router.get(
+    "/summary",
+    status_code=status.HTTP_200_OK,
+    response_model=ApiResponse[ListPaginatedResponse[ProductSummaryResponseSchema]],
+    responses={
+        status.HTTP_200_OK: {"model": ApiResponse[ListPaginatedResponse[ProductSummaryResponseSchema]]},
+        status.HTTP_422_UNPROCESSABLE_CONTENT: {"model": ErrorResponseSchema},
+    },
+)
+async def get_products_summary_list(
+    pagination: PaginationIn = Depends(),
+    category: str | None = Query(None, description="Фильтр по категории"),
+    search: str | None = Query(None, description="Поиск по тексту"),
+    is_shown: bool | None = Query(None, description="Фильтр по видимости"),
+    sort_field: str = Depends(sort_field_query("products", "created_at")),
+    sort_order: int = Query(-1, description="Порядок сортировки: 1 - по возрастанию, -1 - по убыванию"),
+    container=Depends(get_container),
+) -> FastJSONResponse:
+    """Получение облегченного списка продуктов для каталога."""
+    mediator: Mediator = container.resolve(Mediator)
+
+    query = GetProductSummaryListQuery(
+        sort_field=sort_field,
+        sort_order=sort_order,
+        offset=pagination.offset,
+        limit=pagination.limit,
+        search=search,
+        category=category,
+        is_shown=is_shown,
+    )
+
+    summaries, total = await mediator.handle_query(query)
+
+    return FastJSONResponse(
+        ApiResponse[ListPaginatedResponse[ProductSummaryResponseSchema]](
+            data=ListPaginatedResponse[ProductSummaryResponseSchema](
+                items=[ProductSummaryResponseSchema.from_entity(summary) for summary in summaries],
+                pagination=PaginationOut(
+                    limit=pagination.limit,
+                    offset=pagination.offset,
+                    total=total,
+                ),
             ),
         ),
     )
@@ -97,16 +206,22 @@ async def get_products_list(
 )
 async def get_product_by_id(
     product_id: UUID,
+    fields: frozenset[str] | None = Depends(FieldsQuery(ProductResponseSchema)),
     container=Depends(get_container),
-) -> ApiResponse[ProductResponseSchema]:
+) -> FastJSONResponse:
     """Получение продукта по ID."""
     mediator: Mediator = container.resolve(Mediator)
 
-    query = GetProductByIdQuery(product_id=product_id)
+    query = GetProductByIdQuery(product_id=product_id, fields=fields)
     product = await mediator.handle_query(query)
 
-    return ApiResponse[ProductResponseSchema](
-        data=ProductResponseSchema.from_entity(product),
+    if fields is not None:
+        return fields_response(ProductResponseSchema.fields_from_entity(product, fields))
+
+    return FastJSONResponse(
+        ApiResponse[ProductResponseSchema](
+            data=ProductResponseSchema.from_entity(product),
+        ),
     )
 
 
@@ -122,16 +237,22 @@ async def get_product_by_id(
 )
 async def get_product_by_slug(
     slug: str,
+    fields: frozenset[str] | None = Depends(FieldsQuery(ProductResponseSchema)),
     container=Depends(get_container),
-) -> ApiResponse[ProductResponseSchema]:
+) -> FastJSONResponse:
     """Получение продукта по slug."""
     mediator: Mediator = container.resolve(Mediator)
 
-    query = GetProductBySlugQuery(slug=slug)
+    query = GetProductBySlugQuery(slug=slug, fields=fields)
     product = await mediator.handle_query(query)
 
-    return ApiResponse[ProductResponseSchema](
-        data=ProductResponseSchema.from_entity(product),
+    if fields is not None:
+        return fields_response(ProductResponseSchema.fields_from_entity(product, fields))
+
+    return FastJSONResponse(
+        ApiResponse[ProductResponseSchema](
+            data=ProductResponseSchema.from_entity(product),
+        ),
     )
 
 
@@ -11,6 +11,7 @@ from domain.products.entities import (
     ImportantCharacteristicEntity,
     ImportantCharacteristicUnit,
     ProductEntity,
+    ProductSummaryEntity,
     SimpleDescriptionEntity,
 )
 from domain.products.value_objects import (
@@ -21,6 +22,7 @@ from domain.products.value_objects import (
     PreviewImageUrlValueObject,
     SlugValueObject,
 )
+from presentation.api.fields import generic_value
 
 
 class ImportantCharacteristicUnitSchema(BaseModel):
@@ -78,13 +80,22 @@ class ProductResponseSchema(BaseModel):
 
     @classmethod
     def from_entity(cls, entity: ProductEntity) -> "ProductResponseSchema":
-        return cls(
+        return cls(**cls._values_from_entity(entity))
+
+    @classmethod
+    def fields_from_entity(cls, entity: ProductEntity, fields: frozenset[str]) -> dict:
+        # Сущность может быть частичной: непрочитанные поля не валидируются и не попадают в ответ
+        return cls.model_construct(**cls._values_from_entity(entity)).model_dump(mode="json", include=set(fields))
+
+    @staticmethod
+    def _values_from_entity(entity: ProductEntity) -> dict:
+        return dict(
             oid=entity.oid,
-            category=entity.category.as_generic_type(),
-            name=entity.name.as_generic_type(),
-            slug=entity.slug.as_generic_type(),
-            description=entity.description.as_generic_type(),
-            preview_image_url=entity.preview_image_url.as_generic_type(),
+            category=generic_value(entity.category),
+            name=generic_value(entity.name),
+            slug=generic_value(entity.slug),
+            description=generic_value(entity.description),
+            preview_image_url=generic_value(entity.preview_image_url),
             preview_image_alt=entity.preview_image_alt.as_generic_type() if entity.preview_image_alt else None,
             important_characteristics=[
                 ImportantCharacteristicSchema(
@@ -123,6 +134,34 @@ class ProductResponseSchema(BaseModel):
         )
 
 
+class ProductSummaryResponseSchema(BaseModel):
+    oid: UUID
+    category: str
+    name: str
+    slug: str
+    preview_image_url: str
+    preview_image_alt: Optional[str] = None
+    order: int
+    is_shown: bool
+    created_at: datetime
+    updated_at: datetime
+
+    @classmethod
+    def from_entity(cls, entity: ProductSummaryEntity) -> "ProductSummaryResponseSchema":
+        return cls(
+            oid=entity.oid,
+            category=entity.category.as_generic_type(),
+            name=entity.name.as_generic_type(),
+            slug=entity.slug.as_generic_type(),
+            preview_image_url=entity.preview_image_url.as_generic_type(),
+            preview_image_alt=entity.preview_image_alt.as_generic_type() if entity.preview_image_alt else None,
+            order=entity.order,
+            is_shown=entity.is_shown,
+            created_at=entity.created_at,
+            updated_at=entity.updated_at,
+        )
+
+
 class ProductOrderPatchSchema(BaseModel):
     order: int
 
@@ -22,7 +22,9 @@ from presentation.api.dependencies import get_current_user_id
 from presentation.api.filters import (
     PaginationIn,
     PaginationOut,
+    sort_field_query,
 )
+from presentation.api.responses import FastJSONResponse
 from presentation.api.schemas import (
     ApiResponse,
     ErrorResponseSchema,
@@ -49,10 +51,10 @@ router = APIRouter(prefix="/reviews", tags=["reviews"])
 async def get_reviews_list(
     pagination: PaginationIn = Depends(),
     category: str | None = Query(None, description="Категория: Сотрудники | Клиенты"),
-    sort_field: str = Query("created_at", description="Поле для сортировки"),
+    sort_field: str = Depends(sort_field_query("reviews", "created_at")),
     sort_order: int = Query(1, description="Порядок: 1 - по возрастанию, -1 - по убыванию"),
     container=Depends(get_container),
-) -> ApiResponse[ListPaginatedResponse[ReviewResponseSchema]]:
+) -> FastJSONResponse:
     mediator: Mediator = container.resolve(Mediator)
 
     query = GetReviewsListQuery(
@@ -65,13 +67,15 @@ async def get_reviews_list(
 
     reviews_list, total = await mediator.handle_query(query)
 
-    return ApiResponse[ListPaginatedResponse[ReviewResponseSchema]](
-        data=ListPaginatedResponse[ReviewResponseSchema](
-            items=[ReviewResponseSchema.from_entity(review) for review in reviews_list],
-            pagination=PaginationOut(
-                limit=pagination.limit,
-                offset=pagination.offset,
-                total=total,
+    return FastJSONResponse(
+        ApiResponse[ListPaginatedResponse[ReviewResponseSchema]](
+            data=ListPaginatedResponse[ReviewResponseSchema](
+                items=[ReviewResponseSchema.from_entity(review) for review in reviews_list],
+                pagination=PaginationOut(
+                    limit=pagination.limit,
+                    offset=pagination.offset,
+                    total=total,
+                ),
             ),
         ),
     )
@@ -90,14 +94,16 @@ async def get_reviews_list(
 async def get_review_by_id(
     review_id: UUID,
     container=Depends(get_container),
-) -> ApiResponse[ReviewResponseSchema]:
+) -> FastJSONResponse:
     mediator: Mediator = container.resolve(Mediator)
 
     query = GetReviewByIdQuery(review_id=review_id)
     review = await mediator.handle_query(query)
 
-    return ApiResponse[ReviewResponseSchema](
-        data=ReviewResponseSchema.from_entity(review),
+    return FastJSONResponse(
+        ApiResponse[ReviewResponseSchema](
+            data=ReviewResponseSchema.from_entity(review),
+        ),
     )
 
 
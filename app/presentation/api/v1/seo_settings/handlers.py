@@ -23,7 +23,9 @@ from presentation.api.dependencies import get_current_user_id
 from presentation.api.filters import (
     PaginationIn,
     PaginationOut,
+    sort_field_query,
 )
+from presentation.api.responses import FastJSONResponse
 from presentation.api.schemas import (
     ApiResponse,
     ErrorResponseSchema,
@@ -51,10 +53,10 @@ async def get_seo_settings_list(
     pagination: PaginationIn = Depends(),
     search: str | None = Query(None, description="Поиск по тексту"),
     is_active: bool | None = Query(None, description="Фильтр по активности"),
-    sort_field: str = Query("created_at", description="Поле для сортировки"),
+    sort_field: str = Depends(sort_field_query("seo_settings", "created_at")),
     sort_order: int = Query(-1, description="Порядок сортировки: 1 - по возрастанию, -1 - по убыванию"),
     container=Depends(get_container),
-) -> ApiResponse[ListPaginatedResponse[SeoSettingsResponseSchema]]:
+) -> FastJSONResponse:
     """Получение списка SEO настроек с фильтрацией и пагинацией."""
     mediator: Mediator = container.resolve(Mediator)
 
@@ -69,13 +71,15 @@ async def get_seo_settings_list(
 
     settings_list, total = await mediator.handle_query(query)
 
-    return ApiResponse[ListPaginatedResponse[SeoSettingsResponseSchema]](
-        data=ListPaginatedResponse[SeoSettingsResponseSchema](
-            items=[SeoSettingsResponseSchema.from_entity(settings) for settings in settings_list],
-            pagination=PaginationOut(
-                limit=pagination.limit,
-                offset=pagination.offset,
-                total=total,
+    return FastJSONResponse(
+        ApiResponse[ListPaginatedResponse[SeoSettingsResponseSchema]](
+            data=ListPaginatedResponse[SeoSettingsResponseSchema](
+                items=[SeoSettingsResponseSchema.from_entity(settings) for settings in settings_list],
+                pagination=PaginationOut(
+                    limit=pagination.limit,
+                    offset=pagination.offset,
+                    total=total,
+                ),
             ),
         ),
     )
@@ -94,15 +98,17 @@ async def get_seo_settings_list(
 async def get_seo_settings_by_id(
     seo_settings_id: UUID,
     container=Depends(get_container),
-) -> ApiResponse[SeoSettingsResponseSchema]:
+) -> FastJSONResponse:
     """Получение SEO настроек по ID."""
     mediator: Mediator = container.resolve(Mediator)
 
     query = GetSeoSettingsByIdQuery(seo_settings_id=seo_settings_id)
     settings = await mediator.handle_query(query)
 
-    return ApiResponse[SeoSettingsResponseSchema](
-        data=SeoSettingsResponseSchema.from_entity(settings),
+    return FastJSONResponse(
+        ApiResponse[SeoSettingsResponseSchema](
+            data=SeoSettingsResponseSchema.from_entity(settings),
+        ),
     )
 
 
@@ -119,15 +125,17 @@ async def get_seo_settings_by_id(
 async def get_seo_settings_by_path(
     page_path: str,
     container=Depends(get_container),
-) -> ApiResponse[SeoSettingsResponseSchema]:
+) -> FastJSONResponse:
     """Получение SEO настроек по пути страницы."""
     mediator: Mediator = container.resolve(Mediator)
 
     query = GetSeoSettingsByPathQuery(page_path=page_path)
     settings = await mediator.handle_query(query)
 
-    return ApiResponse[SeoSettingsResponseSchema](
-        data=SeoSettingsResponseSchema.from_entity(settings),
+    return FastJSONResponse(
+        ApiResponse[SeoSettingsResponseSchema](
+            data=SeoSettingsResponseSchema.from_entity(settings),
+        ),
     )
 
 
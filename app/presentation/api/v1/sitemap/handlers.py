@@ -0,0 +1,132 @@
+import asyncio
+import hashlib
+from typing import Callable
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    Request,
+    status,
+)
+from fastapi.responses import Response
+
+from application.container import get_container
+from application.mediator import Mediator
+from application.sitemap.documents import (
+    RenderedSitemapDocument,
+    SitemapDocumentCache,
+)
+from application.sitemap.queries import (
+    GetSitemapQuery,
+    GetSitemapVersionQuery,
+    Sitemap,
+)
+from presentation.api.compression import PrecompressedContent
+from presentation.api.responses import (
+    cacheable_response,
+    is_not_modified,
+)
+from presentation.api.schemas import ApiResponse
+from presentation.api.v1.sitemap.render import (
+    render_sitemap_bundle,
+    render_sitemap_xml,
+)
+from presentation.api.v1.sitemap.schemas import SitemapBundleResponseSchema
+from settings.config import Config
+
+
+router = APIRouter(tags=["sitemap"])
+
+SITEMAP_MAX_AGE = 300
+XML_MEDIA_TYPE = "application/xml"
+JSON_MEDIA_TYPE = "application/json"
+
+
+def _etag(kind: str, version: str) -> str:
+    # Слабый валидатор: один и тот же документ отдается в разных Content-Encoding
+    return f'W/"{kind}-{hashlib.blake2b(version.encode(), digest_size=16).hexdigest()}"'
+
+
+async def _document_response(
+    request: Request,
+    mediator: Mediator,
+    documents: SitemapDocumentCache,
+    kind: str,
+    media_type: str,
+    render: Callable[[Sitemap], bytes],
+) -> Response:
+    version = await mediator.handle_query(GetSitemapVersionQuery())
+    etag = _etag(kind, version)
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={SITEMAP_MAX_AGE}"}
+
+    if is_not_modified(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    document = documents.get(kind, version)
+
+    if document is None:
+        sitemap = await mediator.handle_query(GetSitemapQuery())
+        # Сжатие на максимальных уровнях занимает заметное время, поэтому уходит из event loop
+        content = await asyncio.to_thread(lambda: PrecompressedContent.build(render(sitemap)))
+        document = RenderedSitemapDocument(version=sitemap.version, content=content)
+        documents.put(kind, document)
+
+    response = document.content.response(request, media_type=media_type)
+    return cacheable_response(request, response, max_age=SITEMAP_MAX_AGE, etag=_etag(kind, document.version))
+
+
+@router.get(
+    "/sitemap.xml",
+    status_code=status.HTTP_200_OK,
+    response_class=Response,
+    responses={
+        status.HTTP_200_OK: {"content": {XML_MEDIA_TYPE: {}}, "description": "Карта сайта в формате sitemaps.org"},
+        status.HTTP_304_NOT_MODIFIED: {"description": "Карта сайта не изменилась (If-None-Match)"},
+    },
+)
+async def get_sitemap_xml(
+    request: Request,
+    container=Depends(get_container),
+) -> Response:
+    """Карта сайта для поисковых роботов: продукты, новости, портфолио и страницы с SEO настройками."""
+    mediator: Mediator = container.resolve(Mediator)
+    config: Config = container.resolve(Config)
+
+    return await _document_response(
+        request,
+        mediator,
+        container.resolve(SitemapDocumentCache),
+        kind="xml",
+        media_type=XML_MEDIA_TYPE,
+        render=lambda sitemap: render_sitemap_xml(sitemap, site_url=config.site_url),
+    )
+
+
+@router.get(
+    "/sitemap",
+    status_code=status.HTTP_200_OK,
+    response_model=ApiResponse[SitemapBundleResponseSchema],
+    responses={
+        status.HTTP_200_OK: {"model": ApiResponse[SitemapBundleResponseSchema]},
+        status.HTTP_304_NOT_MODIFIED: {"description": "Карта сайта не изменилась (If-None-Match)"},
+    },
+)
+async def get_sitemap_bundle(
+    request: Request,
+    container=Depends(get_container),
+) -> Response:
+    """Все публичные страницы сайта вместе с SEO настройками одним документом.
+
+    Документ материализуется при изменении продуктов, новостей и портфолио,
+    а между изменениями отдается заранее сжатым из памяти процесса.
+    """
+    mediator: Mediator = container.resolve(Mediator)
+
+    return await _document_response(
+        request,
+        mediator,
+        container.resolve(SitemapDocumentCache),
+        kind="json",
+        media_type=JSON_MEDIA_TYPE,
+        render=render_sitemap_bundle,
+    )
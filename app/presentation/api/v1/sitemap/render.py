@@ -0,0 +1,77 @@
+from urllib.parse import quote
+from xml.sax.saxutils import escape
+
+from pydantic_core import to_json
+
+from application.sitemap.queries import Sitemap
+from domain.seo_settings.entities import SeoSettingsEntity
+from presentation.api.schemas import ApiResponse
+from presentation.api.v1.seo_settings.schemas import SeoSettingsResponseSchema
+from presentation.api.v1.sitemap.schemas import (
+    SitemapBundleResponseSchema,
+    SitemapPageSchema,
+)
+
+
+# Страницы без сущности-источника (главная, "о компании" и т.п.) известны только по точным SEO настройкам
+STATIC_PAGE_SOURCE = "pages"
+
+_XML_HEADER = '<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+_XML_FOOTER = "</urlset>\n"
+
+
+def sitemap_pages(sitemap: Sitemap) -> list[SitemapPageSchema]:
+    """Все публичные страницы сайта, каждая со своими активными SEO настройками (или дефолтом префикса)."""
+
+    def active_seo(page_path: str) -> SeoSettingsResponseSchema | None:
+        settings = sitemap.seo_index.lookup(page_path)
+        return SeoSettingsResponseSchema.from_entity(settings) if settings and settings.is_active else None
+
+    pages = [
+        SitemapPageSchema(
+            path=entry.page_path,
+            source=entry.source,
+            lastmod=entry.lastmod,
+            seo=active_seo(entry.page_path),
+        )
+        for entry in sitemap.entries
+    ]
+    entry_paths = {page.path for page in pages}
+
+    static_settings: list[SeoSettingsEntity] = sorted(
+        (
+            settings
+            for page_path, settings in sitemap.seo_index.exact.items()
+            if settings.is_active and page_path not in entry_paths
+        ),
+        key=lambda settings: settings.page_path.as_generic_type(),
+    )
+    pages.extend(
+        SitemapPageSchema(
+            path=settings.page_path.as_generic_type(),
+            source=STATIC_PAGE_SOURCE,
+            lastmod=settings.updated_at,
+            seo=SeoSettingsResponseSchema.from_entity(settings),
+        )
+        for settings in static_settings
+    )
+
+    return pages
+
+
+def render_sitemap_bundle(sitemap: Sitemap) -> bytes:
+    return to_json(
+        ApiResponse[SitemapBundleResponseSchema](
+            data=SitemapBundleResponseSchema(version=sitemap.version, pages=sitemap_pages(sitemap)),
+        ),
+    )
+
+
+def render_sitemap_xml(sitemap: Sitemap, site_url: str) -> bytes:
+    base_url = site_url.rstrip("/")
+    urls = "".join(
+        f"<url><loc>{escape(base_url + quote(page.path, safe='/'))}</loc>"
+        f"<lastmod>{page.lastmod.date().isoformat()}</lastmod></url>\n"
+        for page in sitemap_pages(sitemap)
+    )
+    return (_XML_HEADER + urls + _XML_FOOTER).encode()
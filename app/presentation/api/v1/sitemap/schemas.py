@@ -0,0 +1,18 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel
+
+from presentation.api.v1.seo_settings.schemas import SeoSettingsResponseSchema
+
+
+class SitemapPageSchema(BaseModel):
+    path: str
+    source: str
+    lastmod: datetime
+    seo: Optional[SeoSettingsResponseSchema] = None
+
+
+class SitemapBundleResponseSchema(BaseModel):
+    version: str
+    pages: list[SitemapPageSchema]
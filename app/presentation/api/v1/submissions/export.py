@@ -0,0 +1,38 @@
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+)
+
+from domain.submissions.entities.submissions import SubmissionEntity
+
+
+SUBMISSIONS_EXPORT_HEADER = (
+    "Дата",
+    "Тип формы",
+    "Имя",
+    "Email",
+    "Телефон",
+    "Комментарий",
+    "Файлы",
+    "Опросный лист",
+    "ID",
+)
+
+
+def submission_to_export_row(submission: SubmissionEntity) -> list[str]:
+    return [
+        submission.created_at.strftime("%Y-%m-%d %H:%M:%S"),
+        submission.form_type.as_generic_type(),
+        submission.name.as_generic_type(),
+        (submission.email.as_generic_type() if submission.email else None) or "",
+        (submission.phone.as_generic_type() if submission.phone else None) or "",
+        (submission.comments.as_generic_type() if submission.comments else None) or "",
+        "\n".join(submission.files),
+        submission.answers_file_url or "",
+        str(submission.oid),
+    ]
+
+
+async def submissions_export_rows(submissions: AsyncIterable[SubmissionEntity]) -> AsyncIterator[list[str]]:
+    async for submission in submissions:
+        yield submission_to_export_row(submission)
@@ -1,10 +1,14 @@
+from datetime import datetime
 from uuid import UUID
 
 from fastapi import (
     Depends,
     Query,
+    Request,
     status,
 )
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import StreamingResponse
 
 from faststream.rabbit.fastapi import RabbitRouter
 
@@ -15,19 +19,45 @@ from application.submissions.commands import (
     DeleteSubmissionCommand,
 )
 from application.submissions.queries import (
+    ExportSubmissionsQuery,
     GetSubmissionByIdQuery,
     GetSubmissionListQuery,
+    StreamSubmissionListQuery,
+)
+from infrastructure.metrics.broker import BrokerMetricsMiddleware
+from infrastructure.tracing.broker import BrokerTracingMiddleware
+from presentation.api.dependencies import (
+    get_access_token_payload,
+    get_current_user_id,
+)
+from presentation.api.export import (
+    csv_chunks,
+    CSV_MEDIA_TYPE,
+    ExportFormat,
+    xlsx_chunks,
+    XLSX_MEDIA_TYPE,
 )
-from presentation.api.dependencies import get_current_user_id
 from presentation.api.filters import (
     PaginationIn,
     PaginationOut,
+    sort_field_query,
+    stream_limit,
+)
+from presentation.api.responses import (
+    accepts_ndjson,
+    FastJSONResponse,
+    NDJSON_OPENAPI_CONTENT,
+    NDJSONResponse,
 )
 from presentation.api.schemas import (
     ApiResponse,
     ErrorResponseSchema,
     ListPaginatedResponse,
 )
+from presentation.api.v1.submissions.export import (
+    SUBMISSIONS_EXPORT_HEADER,
+    submissions_export_rows,
+)
 from presentation.api.v1.submissions.schemas import (
     SubmissionCreatedEventSchema,
     SubmissionRequestSchema,
@@ -44,28 +74,64 @@ router = RabbitRouter(
     schema_url=None,
     prefix="/submissions",
     tags=["submissions"],
+    middlewares=[BrokerTracingMiddleware, BrokerMetricsMiddleware],
 )
 
 
+async def ndjson_for_current_user(
+    request: Request,
+    ndjson: bool = Depends(accepts_ndjson),
+) -> bool:
+    """Потоковый список отдает все заявки разом, поэтому требует access токен; обычный список - нет."""
+    if ndjson:
+        await get_current_user_id(await get_access_token_payload(request))
+
+    return ndjson
+
+
 @router.get(
     "",
     status_code=status.HTTP_200_OK,
     response_model=ApiResponse[ListPaginatedResponse[SubmissionResponseSchema]],
     responses={
-        status.HTTP_200_OK: {"model": ApiResponse[ListPaginatedResponse[SubmissionResponseSchema]]},
+        status.HTTP_200_OK: {
+            "model": ApiResponse[ListPaginatedResponse[SubmissionResponseSchema]],
+            "content": NDJSON_OPENAPI_CONTENT,
+        },
+        status.HTTP_401_UNAUTHORIZED: {"model": ErrorResponseSchema},
         status.HTTP_422_UNPROCESSABLE_CONTENT: {"model": ErrorResponseSchema},
     },
 )
 async def get_submissions_list(
     pagination: PaginationIn = Depends(),
+    limit: int | None = Depends(stream_limit),
     form_type: str | None = Query(None, description="Фильтр по типу формы"),
-    sort_field: str = Query("created_at", description="Поле для сортировки"),
+    sort_field: str = Depends(sort_field_query("submissions", "created_at")),
     sort_order: int = Query(-1, description="Порядок сортировки: 1 - по возрастанию, -1 - по убыванию"),
+    ndjson: bool = Depends(ndjson_for_current_user),
     container=Depends(get_container),
-) -> ApiResponse[ListPaginatedResponse[SubmissionResponseSchema]]:
-    """Получение списка заявок с фильтрацией и пагинацией."""
+) -> FastJSONResponse | NDJSONResponse:
+    """Получение списка заявок с фильтрацией и пагинацией.
+
+    С заголовком ``Accept: application/x-ndjson`` заявки отдаются потоком, по одной на строку:
+    начиная с offset, не больше limit, если он передан явно, иначе весь список. Поток доступен
+    только авторизованным пользователям.
+    """
     mediator: Mediator = container.resolve(Mediator)
 
+    if ndjson:
+        submissions_stream = await mediator.handle_query(
+            StreamSubmissionListQuery(
+                sort_field=sort_field,
+                sort_order=sort_order,
+                offset=pagination.offset,
+                limit=limit,
+                form_type=form_type,
+            ),
+        )
+
+        return NDJSONResponse(submissions_stream, SubmissionResponseSchema.from_entity)
+
     query = GetSubmissionListQuery(
         sort_field=sort_field,
         sort_order=sort_order,
@@ -76,18 +142,95 @@ async def get_submissions_list(
 
     submissions_list, total = await mediator.handle_query(query)
 
-    return ApiResponse[ListPaginatedResponse[SubmissionResponseSchema]](
-        data=ListPaginatedResponse[SubmissionResponseSchema](
-            items=[SubmissionResponseSchema.from_entity(submission) for submission in submissions_list],
-            pagination=PaginationOut(
-                limit=pagination.limit,
-                offset=pagination.offset,
-                total=total,
+    return FastJSONResponse(
+        ApiResponse[ListPaginatedResponse[SubmissionResponseSchema]](
+            data=ListPaginatedResponse[SubmissionResponseSchema](
+                items=[SubmissionResponseSchema.from_entity(submission) for submission in submissions_list],
+                pagination=PaginationOut(
+                    limit=pagination.limit,
+                    offset=pagination.offset,
+                    total=total,
+                ),
             ),
         ),
     )
 
 
+def _as_local_naive(value: datetime | None) -> datetime | None:
+    # created_at хранится в локальном времени без таймзоны
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone().replace(tzinfo=None)
+
+
+@router.get(
+    "/export",
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+    responses={
+        status.HTTP_200_OK: {
+            "content": {
+                CSV_MEDIA_TYPE: {"schema": {"type": "string"}},
+                XLSX_MEDIA_TYPE: {"schema": {"type": "string", "format": "binary"}},
+            },
+        },
+        status.HTTP_401_UNAUTHORIZED: {"model": ErrorResponseSchema},
+        status.HTTP_422_UNPROCESSABLE_CONTENT: {"model": ErrorResponseSchema},
+    },
+)
+async def export_submissions(
+    export_format: ExportFormat = Query(ExportFormat.CSV, alias="format", description="Формат выгрузки"),
+    form_type: str | None = Query(None, description="Фильтр по типу формы"),
+    created_from: datetime | None = Query(None, description="Начало периода (включительно)"),
+    created_to: datetime | None = Query(None, description="Конец периода (не включительно)"),
+    _=Depends(get_current_user_id),
+    container=Depends(get_container),
+) -> StreamingResponse:
+    """Выгрузка заявок за период в CSV или XLSX.
+
+    Файл пишется потоком прямо из курсора MongoDB, поэтому размер выгрузки не ограничен памятью.
+    """
+    created_from = _as_local_naive(created_from)
+    created_to = _as_local_naive(created_to)
+
+    if created_from is not None and created_to is not None and created_from >= created_to:
+        raise RequestValidationError(
+            [
+                {
+                    "type": "value_error",
+                    "loc": ("query", "created_to"),
+                    "msg": "created_to must be later than created_from",
+                    "input": created_to,
+                },
+            ],
+        )
+
+    mediator: Mediator = container.resolve(Mediator)
+
+    submissions = await mediator.handle_query(
+        ExportSubmissionsQuery(
+            form_type=form_type,
+            created_from=created_from,
+            created_to=created_to,
+        ),
+    )
+    rows = submissions_export_rows(submissions)
+    filename = f"submissions_{datetime.now():%Y%m%d_%H%M%S}.{export_format.value}"
+
+    if export_format == ExportFormat.XLSX:
+        content = xlsx_chunks(SUBMISSIONS_EXPORT_HEADER, rows, sheet_name="Заявки")
+        media_type = XLSX_MEDIA_TYPE
+    else:
+        content = csv_chunks(SUBMISSIONS_EXPORT_HEADER, rows)
+        media_type = CSV_MEDIA_TYPE
+
+    return StreamingResponse(
+        content=content,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
 @router.get(
     "/{submission_id}",
     status_code=status.HTTP_200_OK,
@@ -101,15 +244,17 @@ async def get_submissions_list(
 async def get_submission_by_id(
     submission_id: UUID,
     container=Depends(get_container),
-) -> ApiResponse[SubmissionResponseSchema]:
+) -> FastJSONResponse:
     """Получение заявки по ID."""
     mediator: Mediator = container.resolve(Mediator)
 
     query = GetSubmissionByIdQuery(submission_id=submission_id)
     submission = await mediator.handle_query(query)
 
-    return ApiResponse[SubmissionResponseSchema](
-        data=SubmissionResponseSchema.from_entity(submission),
+    return FastJSONResponse(
+        ApiResponse[SubmissionResponseSchema](
+            data=SubmissionResponseSchema.from_entity(submission),
+        ),
     )
 
 
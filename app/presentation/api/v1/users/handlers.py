@@ -10,6 +10,7 @@ from application.container import get_container
 from application.mediator import Mediator
 from application.users.queries import GetUserByIdQuery
 from presentation.api.dependencies import get_current_user_id
+from presentation.api.responses import FastJSONResponse
 from presentation.api.schemas import (
     ApiResponse,
     ErrorResponseSchema,
@@ -32,13 +33,15 @@ router = APIRouter(prefix="/users", tags=["users"])
 async def get_current_user(
     user_id: UUID = Depends(get_current_user_id),
     container=Depends(get_container),
-) -> ApiResponse[UserResponseSchema]:
+) -> FastJSONResponse:
     """Получение информации о текущем пользователе."""
     mediator: Mediator = container.resolve(Mediator)
 
     query = GetUserByIdQuery(user_id=user_id)
     user = await mediator.handle_query(query)
 
-    return ApiResponse[UserResponseSchema](
-        data=UserResponseSchema.from_entity(user),
+    return FastJSONResponse(
+        ApiResponse[UserResponseSchema](
+            data=UserResponseSchema.from_entity(user),
+        ),
     )
@@ -22,7 +22,9 @@ from presentation.api.dependencies import get_current_user_id
 from presentation.api.filters import (
     PaginationIn,
     PaginationOut,
+    sort_field_query,
 )
+from presentation.api.responses import FastJSONResponse
 from presentation.api.schemas import (
     ApiResponse,
     ErrorResponseSchema,
@@ -50,10 +52,10 @@ async def get_vacancies_list(
     pagination: PaginationIn = Depends(),
     category: str | None = Query(None, description="Фильтр по категории"),
     search: str | None = Query(None, description="Поиск по тексту"),
-    sort_field: str = Query("created_at", description="Поле для сортировки"),
+    sort_field: str = Depends(sort_field_query("vacancies", "created_at")),
     sort_order: int = Query(-1, description="Порядок сортировки: 1 - по возрастанию, -1 - по убыванию"),
     container=Depends(get_container),
-) -> ApiResponse[ListPaginatedResponse[VacancyResponseSchema]]:
+) -> FastJSONResponse:
     """Получение списка вакансий с фильтрацией и пагинацией."""
     mediator: Mediator = container.resolve(Mediator)
 
@@ -68,13 +70,15 @@ async def get_vacancies_list(
 
     vacancies_list, total = await mediator.handle_query(query)
 
-    return ApiResponse[ListPaginatedResponse[VacancyResponseSchema]](
-        data=ListPaginatedResponse[VacancyResponseSchema](
-            items=[VacancyResponseSchema.from_entity(vacancy) for vacancy in vacancies_list],
-            pagination=PaginationOut(
-                limit=pagination.limit,
-                offset=pagination.offset,
-                total=total,
+    return FastJSONResponse(
+        ApiResponse[ListPaginatedResponse[VacancyResponseSchema]](
+            data=ListPaginatedResponse[VacancyResponseSchema](
+                items=[VacancyResponseSchema.from_entity(vacancy) for vacancy in vacancies_list],
+                pagination=PaginationOut(
+                    limit=pagination.limit,
+                    offset=pagination.offset,
+                    total=total,
+                ),
             ),
         ),
     )
@@ -93,15 +97,17 @@ async def get_vacancies_list(
 async def get_vacancy_by_id(
     vacancy_id: UUID,
     container=Depends(get_container),
-) -> ApiResponse[VacancyResponseSchema]:
+) -> FastJSONResponse:
     """Получение вакансии по ID."""
     mediator: Mediator = container.resolve(Mediator)
 
     query = GetVacancyByIdQuery(vacancy_id=vacancy_id)
     vacancy = await mediator.handle_query(query)
 
-    return ApiResponse[VacancyResponseSchema](
-        data=VacancyResponseSchema.from_entity(vacancy),
+    return FastJSONResponse(
+        ApiResponse[VacancyResponseSchema](
+            data=VacancyResponseSchema.from_entity(vacancy),
+        ),
     )
 
 
@@ -7,6 +7,13 @@ from application.container import get_container
 from infrastructure.integrations.bitrix.client import BitrixClient
 from infrastructure.integrations.email.client import EmailClient
 from infrastructure.integrations.email.templates_service import EmailTemplatesService
+from infrastructure.metrics.broker import BrokerMetricsMiddleware
+from infrastructure.metrics.event_loop import EventLoopLagMonitor
+from infrastructure.metrics.server import start_metrics_server
+from infrastructure.metrics.watchdog import EventLoopWatchdog
+from infrastructure.tracing.broker import BrokerTracingMiddleware
+from infrastructure.tracing.setup import configure_tracing
+from infrastructure.tracing.tracer import TRACER
 from presentation.api.v1.submissions.schemas import SubmissionCreatedEventSchema
 from presentation.consumer.converter import convert_event_to_lead_data
 from settings.config import Config
@@ -15,7 +22,7 @@ from settings.config import Config
 container = get_container()
 config = container.resolve(Config)
 
-broker = RabbitBroker(config.rabbitmq_url)
+broker = RabbitBroker(config.rabbitmq_url, middlewares=[BrokerTracingMiddleware, BrokerMetricsMiddleware])
 
 email_client = EmailClient(config=config)
 email_templates_service = EmailTemplatesService()
@@ -42,6 +49,32 @@ async def submission_created_consumer(message: dict) -> None:
         print(e)
 
 
+async def main() -> None:
+    configure_tracing(config, role="consumer")
+    metrics_server = None
+    event_loop_lag_monitor = EventLoopLagMonitor(interval=config.metrics_event_loop_lag_interval)
+    event_loop_watchdog = EventLoopWatchdog(threshold=config.event_loop_watchdog_threshold)
+
+    if config.metrics_enabled:
+        if config.consumer_metrics_port:
+            metrics_server = start_metrics_server(config.consumer_metrics_port)
+
+        await event_loop_lag_monitor.start()
+
+    if config.event_loop_watchdog_enabled:
+        await event_loop_watchdog.start()
+
+    try:
+        await FastStream(broker).run()
+    finally:
+        await event_loop_lag_monitor.stop()
+        await event_loop_watchdog.stop()
+
+        if metrics_server is not None:
+            metrics_server.shutdown()
+
+        TRACER.shutdown()
+
+
 if __name__ == "__main__":
-    app = FastStream(broker)
-    asyncio.run(app.run())
+    asyncio.run(main())
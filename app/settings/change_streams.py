@@ -0,0 +1,28 @@
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class ChangeStreamsConfig(BaseSettings):
+    """Change stream driven cache invalidation settings (requires a replica set)."""
+
+    change_streams_enabled: bool = Field(
+        default=False,
+        alias="CHANGE_STREAMS_ENABLED",
+    )
+
+    # Пауза перед переподключением после ошибки потока
+    change_streams_retry_delay: float = Field(
+        default=5.0,
+        alias="CHANGE_STREAMS_RETRY_DELAY",
+    )
+
+    # Сброс кэшей по событиям делает безопасными длинные TTL: чужие записи видны сразу
+    change_streams_slug_cache_fresh_ttl: float = Field(
+        default=600.0,
+        alias="CHANGE_STREAMS_SLUG_CACHE_FRESH_TTL",
+    )
+
+    change_streams_slug_cache_negative_ttl: float = Field(
+        default=300.0,
+        alias="CHANGE_STREAMS_SLUG_CACHE_NEGATIVE_TTL",
+    )
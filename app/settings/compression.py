@@ -0,0 +1,26 @@
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class CompressionConfig(BaseSettings):
+    """HTTP response compression settings."""
+
+    compression_minimum_size: int = Field(
+        default=1024,
+        alias="COMPRESSION_MINIMUM_SIZE",
+    )
+
+    compression_gzip_level: int = Field(
+        default=6,
+        alias="COMPRESSION_GZIP_LEVEL",
+    )
+
+    compression_brotli_quality: int = Field(
+        default=4,
+        alias="COMPRESSION_BROTLI_QUALITY",
+    )
+
+    compression_zstd_level: int = Field(
+        default=3,
+        alias="COMPRESSION_ZSTD_LEVEL",
+    )
@@ -2,13 +2,31 @@ from pydantic import Field
 from pydantic_settings import SettingsConfigDict
 
 from settings.bitrix import BitrixConfig
+from settings.change_streams import ChangeStreamsConfig
+from settings.compression import CompressionConfig
 from settings.email import EmailConfig
+from settings.metrics import MetricsConfig
 from settings.mongo import MongoConfig
+from settings.profiling import ProfilingConfig
 from settings.rabbitmq import RabbitMQConfig
 from settings.s3 import S3Config
+from settings.tracing import TracingConfig
+from settings.warmup import WarmupConfig
 
 
-class Config(S3Config, MongoConfig, RabbitMQConfig, EmailConfig, BitrixConfig):
+class Config(
+    S3Config,
+    MongoConfig,
+    RabbitMQConfig,
+    EmailConfig,
+    BitrixConfig,
+    CompressionConfig,
+    WarmupConfig,
+    ChangeStreamsConfig,
+    MetricsConfig,
+    TracingConfig,
+    ProfilingConfig,
+):
     """Main application configuration."""
 
     jwt_secret_key: str = Field(
@@ -16,6 +34,12 @@ class Config(S3Config, MongoConfig, RabbitMQConfig, EmailConfig, BitrixConfig):
         default="secret-key",
     )
 
+    # Публичный адрес сайта: из него строятся абсолютные ссылки в sitemap.xml
+    site_url: str = Field(
+        alias="SITE_URL",
+        default="http://localhost:3000",
+    )
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
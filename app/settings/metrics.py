@@ -0,0 +1,47 @@
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class MetricsConfig(BaseSettings):
+    """Prometheus metrics settings."""
+
+    # /metrics отдается на порту API без авторизации: включать, только если путь закрыт снаружи (прокси, сеть)
+    metrics_enabled: bool = Field(
+        default=False,
+        alias="METRICS_ENABLED",
+    )
+
+    # Общий каталог воркеров uvicorn для объединения метрик; пусто - /metrics отдает метрики одного процесса
+    metrics_multiprocess_dir: str = Field(
+        default="",
+        alias="METRICS_MULTIPROCESS_DIR",
+    )
+
+    metrics_flush_interval: float = Field(
+        default=5.0,
+        alias="METRICS_FLUSH_INTERVAL",
+    )
+
+    # Как часто измеряется задержка event loop, секунды
+    metrics_event_loop_lag_interval: float = Field(
+        default=0.5,
+        alias="METRICS_EVENT_LOOP_LAG_INTERVAL",
+    )
+
+    # Сторожевой поток, снимающий стек loop, занятого синхронным кодом дольше порога
+    event_loop_watchdog_enabled: bool = Field(
+        default=False,
+        alias="EVENT_LOOP_WATCHDOG_ENABLED",
+    )
+
+    # Порог блокировки event loop, секунды
+    event_loop_watchdog_threshold: float = Field(
+        default=0.25,
+        alias="EVENT_LOOP_WATCHDOG_THRESHOLD",
+    )
+
+    # Порт /metrics консьюмера (у него нет своего HTTP сервера); 0 - не поднимать
+    consumer_metrics_port: int = Field(
+        default=9100,
+        alias="CONSUMER_METRICS_PORT",
+    )
@@ -1,7 +1,24 @@
+from importlib.util import find_spec
+
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
 
+# Модуль, без которого драйвер не умеет сжатие; zlib есть в стандартной библиотеке
+_COMPRESSOR_MODULES = {
+    "zstd": "zstandard",
+    "snappy": "snappy",
+}
+
+
+def available_compressors(compressors: str) -> str:
+    """Оставляет из списка алгоритмы, доступные в окружении, чтобы драйвер не ругался на каждом клиенте."""
+    names = [name.strip() for name in compressors.split(",") if name.strip()]
+    return ",".join(
+        name for name in names if name not in _COMPRESSOR_MODULES or find_spec(_COMPRESSOR_MODULES[name]) is not None
+    )
+
+
 class MongoConfig(BaseSettings):
     """MongoDB configuration settings."""
 
@@ -30,6 +47,128 @@ class MongoConfig(BaseSettings):
         alias="MONGO_DATABASE",
     )
 
+    # Пул на один воркер: при N воркерах uvicorn на сервер приходится до N * max соединений
+    mongo_max_pool_size: int = Field(
+        default=50,
+        alias="MONGO_MAX_POOL_SIZE",
+    )
+
+    mongo_min_pool_size: int = Field(
+        default=5,
+        alias="MONGO_MIN_POOL_SIZE",
+    )
+
+    mongo_max_idle_time_ms: int = Field(
+        default=60_000,
+        alias="MONGO_MAX_IDLE_TIME_MS",
+    )
+
+    mongo_max_connecting: int = Field(
+        default=2,
+        alias="MONGO_MAX_CONNECTING",
+    )
+
+    # Порядок предпочтения; алгоритмы без установленного пакета (zstandard, python-snappy) пропускаются
+    mongo_compressors: str = Field(
+        default="zstd,snappy,zlib",
+        alias="MONGO_COMPRESSORS",
+    )
+
+    mongo_server_selection_timeout_ms: int = Field(
+        default=5_000,
+        alias="MONGO_SERVER_SELECTION_TIMEOUT_MS",
+    )
+
+    mongo_connect_timeout_ms: int = Field(
+        default=5_000,
+        alias="MONGO_CONNECT_TIMEOUT_MS",
+    )
+
+    mongo_socket_timeout_ms: int = Field(
+        default=30_000,
+        alias="MONGO_SOCKET_TIMEOUT_MS",
+    )
+
+    mongo_wait_queue_timeout_ms: int = Field(
+        default=5_000,
+        alias="MONGO_WAIT_QUEUE_TIMEOUT_MS",
+    )
+
+    mongo_retry_reads: bool = Field(
+        default=True,
+        alias="MONGO_RETRY_READS",
+    )
+
+    mongo_retry_writes: bool = Field(
+        default=True,
+        alias="MONGO_RETRY_WRITES",
+    )
+
+    # Куда уходят чтения запросов (CQRS query): primary, primaryPreferred, secondary, secondaryPreferred, nearest.
+    # По умолчанию primary: чтения с реплик включаются явно. Команды и админская сессия всегда читают из primary
+    mongo_query_read_preference: str = Field(
+        default="primary",
+        alias="MONGO_QUERY_READ_PREFERENCE",
+    )
+
+    # Максимальное отставание реплики для чтений запросов; не меньше 90 секунд, -1 - без ограничения
+    mongo_max_staleness_seconds: int = Field(
+        default=90,
+        alias="MONGO_MAX_STALENESS_SECONDS",
+    )
+
+    # Сколько секунд после команды клиент читает из primary (cookie read_primary_until); не меньше отставания реплик
+    mongo_read_your_writes_seconds: int = Field(
+        default=90,
+        alias="MONGO_READ_YOUR_WRITES_SECONDS",
+    )
+
+    # maxTimeMS для чтений репозиториев; 0 - без ограничения
+    mongo_max_time_ms: int = Field(
+        default=10_000,
+        alias="MONGO_MAX_TIME_MS",
+    )
+
+    # maxTimeMS для потоковых списков (NDJSON) и выгрузок; 0 - без ограничения.
+    # Лимит считается по всему курсору, а ответ к его срабатыванию уже начат
+    mongo_stream_max_time_ms: int = Field(
+        default=0,
+        alias="MONGO_STREAM_MAX_TIME_MS",
+    )
+
+    # Команды дольше порога пишутся в лог с фильтром без литералов; 0 - не отслеживать
+    mongo_slow_command_ms: int = Field(
+        default=100,
+        alias="MONGO_SLOW_COMMAND_MS",
+    )
+
+    # Снимать план (explain queryPlanner) самых медленных форм команд при запросе статистики
+    mongo_explain_slow_commands: bool = Field(
+        default=False,
+        alias="MONGO_EXPLAIN_SLOW_COMMANDS",
+    )
+
+    @property
+    def mongo_client_options(self) -> dict:
+        options = {
+            "maxPoolSize": self.mongo_max_pool_size,
+            "minPoolSize": self.mongo_min_pool_size,
+            "maxIdleTimeMS": self.mongo_max_idle_time_ms,
+            "maxConnecting": self.mongo_max_connecting,
+            "compressors": available_compressors(self.mongo_compressors),
+            "serverSelectionTimeoutMS": self.mongo_server_selection_timeout_ms,
+            "connectTimeoutMS": self.mongo_connect_timeout_ms,
+            "socketTimeoutMS": self.mongo_socket_timeout_ms,
+            "waitQueueTimeoutMS": self.mongo_wait_queue_timeout_ms,
+            "retryReads": self.mongo_retry_reads,
+            "retryWrites": self.mongo_retry_writes,
+        }
+
+        if not options["compressors"]:
+            del options["compressors"]
+
+        return options
+
     @property
     def mongo_connection_url(self) -> str:
         return f"mongodb://{self.mongo_user}:{self.mongo_password}@{self.mongo_host}:{self.mongo_port}/{self.mongo_database}?authSource=admin"
@@ -0,0 +1,30 @@
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class ProfilingConfig(BaseSettings):
+    """On-demand request profiling settings."""
+
+    # Профилирование запроса по заголовку X-Profile от авторизованного администратора
+    profiling_enabled: bool = Field(
+        default=False,
+        alias="PROFILING_ENABLED",
+    )
+
+    # Общий каталог воркеров: профиль доступен по id, какой бы воркер ни обработал запрос
+    profiling_dir: str = Field(
+        default="/tmp/sk-profiles",
+        alias="PROFILING_DIR",
+    )
+
+    # Период снятия стека, секунды
+    profiling_sample_interval: float = Field(
+        default=0.001,
+        alias="PROFILING_SAMPLE_INTERVAL",
+    )
+
+    # Сколько последних профилей хранить; старые удаляются
+    profiling_max_profiles: int = Field(
+        default=50,
+        alias="PROFILING_MAX_PROFILES",
+    )
@@ -0,0 +1,39 @@
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class TracingConfig(BaseSettings):
+    """Distributed tracing settings."""
+
+    tracing_enabled: bool = Field(
+        default=False,
+        alias="TRACING_ENABLED",
+    )
+
+    # К имени добавляется роль процесса: sk-api, sk-consumer
+    tracing_service_name: str = Field(
+        default="sk",
+        alias="TRACING_SERVICE_NAME",
+    )
+
+    # otlp - в коллектор по OTLP/HTTP (make tracing поднимает Jaeger), file - JSON строками в файл
+    tracing_exporter: str = Field(
+        default="otlp",
+        alias="TRACING_EXPORTER",
+    )
+
+    tracing_otlp_endpoint: str = Field(
+        default="http://localhost:4318/v1/traces",
+        alias="TRACING_OTLP_ENDPOINT",
+    )
+
+    tracing_file_path: str = Field(
+        default="traces.jsonl",
+        alias="TRACING_FILE_PATH",
+    )
+
+    # Доля записываемых трасс; решение принимается на входе запроса и передается дальше в сообщениях
+    tracing_sample_ratio: float = Field(
+        default=1.0,
+        alias="TRACING_SAMPLE_RATIO",
+    )
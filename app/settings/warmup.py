@@ -0,0 +1,21 @@
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class WarmupConfig(BaseSettings):
+    """Application startup warm-up settings."""
+
+    warmup_mongo_connections: int = Field(
+        default=10,
+        alias="WARMUP_MONGO_CONNECTIONS",
+    )
+
+    warmup_products_limit: int = Field(
+        default=200,
+        alias="WARMUP_PRODUCTS_LIMIT",
+    )
+
+    warmup_news_limit: int = Field(
+        default=50,
+        alias="WARMUP_NEWS_LIMIT",
+    )
@@ -0,0 +1,104 @@
+import pytest
+from punq import Container
+
+from application.cache_invalidation.commands import InvalidateCachesCommand
+from application.mediator import Mediator
+from domain.products.entities import ProductEntity
+from domain.products.services import ProductSlugCache
+from domain.seo_settings.entities import SeoSettingsEntity
+from domain.seo_settings.interfaces.repository import BaseSeoSettingsRepository
+from domain.seo_settings.services import SeoSettingsSnapshot
+
+
+@pytest.fixture
+def product_slug_cache(container: Container, valid_product_entity: ProductEntity) -> ProductSlugCache:
+    slug_cache = container.resolve(ProductSlugCache)
+    slug_cache.prime(valid_product_entity.slug.as_generic_type(), None, valid_product_entity)
+    slug_cache.prime("other-product", None, None)
+    return slug_cache
+
+
+async def _is_cached(slug_cache: ProductSlugCache, slug: str) -> bool:
+    async def loader():
+        raise LookupError(slug)
+
+    try:
+        await slug_cache.get(slug, None, loader)
+    except LookupError:
+        return False
+
+    return True
+
+
+@pytest.mark.asyncio
+async def test_invalidate_caches_by_oid_drops_renamed_product(
+    mediator: Mediator,
+    product_slug_cache: ProductSlugCache,
+    valid_product_entity: ProductEntity,
+):
+    # Slug сменили в другом процессе: событие несет новый slug, старый находится по oid
+    await mediator.handle_command(
+        InvalidateCachesCommand(
+            collection_name="products",
+            oid=valid_product_entity.oid,
+            slugs=frozenset({"renamed-product"}),
+        ),
+    )
+
+    assert not await _is_cached(product_slug_cache, valid_product_entity.slug.as_generic_type())
+    assert await _is_cached(product_slug_cache, "other-product")
+
+
+@pytest.mark.asyncio
+async def test_invalidate_caches_by_slug_drops_negative_entry(
+    mediator: Mediator,
+    product_slug_cache: ProductSlugCache,
+    valid_product_entity: ProductEntity,
+):
+    await mediator.handle_command(
+        InvalidateCachesCommand(collection_name="products", slugs=frozenset({"other-product"})),
+    )
+
+    assert await _is_cached(product_slug_cache, valid_product_entity.slug.as_generic_type())
+    assert not await _is_cached(product_slug_cache, "other-product")
+
+
+@pytest.mark.asyncio
+async def test_invalidate_caches_without_document_clears_collection_cache(
+    mediator: Mediator,
+    product_slug_cache: ProductSlugCache,
+    valid_product_entity: ProductEntity,
+):
+    await mediator.handle_command(InvalidateCachesCommand(collection_name="products"))
+
+    assert not await _is_cached(product_slug_cache, valid_product_entity.slug.as_generic_type())
+    assert not await _is_cached(product_slug_cache, "other-product")
+
+
+@pytest.mark.asyncio
+async def test_invalidate_caches_refreshes_seo_settings_snapshot(
+    mediator: Mediator,
+    container: Container,
+    valid_seo_settings_entity: SeoSettingsEntity,
+):
+    snapshot = container.resolve(SeoSettingsSnapshot)
+    repository = container.resolve(BaseSeoSettingsRepository)
+    await snapshot.refresh(repository)
+
+    # Запись другим процессом, о которой и сообщает событие инвалидации
+    await repository.add(valid_seo_settings_entity)
+    await mediator.handle_command(InvalidateCachesCommand(collection_name="seo_settings"))
+
+    assert snapshot.index.lookup(valid_seo_settings_entity.page_path.as_generic_type()) is not None
+
+
+@pytest.mark.asyncio
+async def test_invalidate_caches_ignores_collections_without_caches(
+    mediator: Mediator,
+    product_slug_cache: ProductSlugCache,
+    valid_product_entity: ProductEntity,
+):
+    await mediator.handle_command(InvalidateCachesCommand(collection_name="certificates"))
+
+    assert await _is_cached(product_slug_cache, valid_product_entity.slug.as_generic_type())
+    assert await _is_cached(product_slug_cache, "other-product")
@@ -0,0 +1,41 @@
+import pytest
+from faker import Faker
+
+from domain.products.entities import ProductEntity
+from domain.products.value_objects import (
+    CategoryValueObject,
+    DescriptionValueObject,
+    NameValueObject,
+    PreviewImageAltValueObject,
+    PreviewImageUrlValueObject,
+    SlugValueObject,
+)
+from domain.seo_settings.entities import SeoSettingsEntity
+from domain.seo_settings.value_objects import (
+    DescriptionValueObject as SeoDescriptionValueObject,
+    PageNameValueObject,
+    PagePathValueObject,
+    TitleValueObject,
+)
+
+
+@pytest.fixture
+def valid_product_entity(faker: Faker) -> ProductEntity:
+    return ProductEntity(
+        category=CategoryValueObject(value="Трансформаторные подстанции"),
+        name=NameValueObject(value=faker.sentence(nb_words=5)),
+        slug=SlugValueObject(value=faker.slug()),
+        description=DescriptionValueObject(value=faker.text(max_nb_chars=500)),
+        preview_image_url=PreviewImageUrlValueObject(value=faker.image_url()),
+        preview_image_alt=PreviewImageAltValueObject(value=faker.sentence(nb_words=3)),
+    )
+
+
+@pytest.fixture
+def valid_seo_settings_entity(faker: Faker) -> SeoSettingsEntity:
+    return SeoSettingsEntity(
+        page_path=PagePathValueObject(value=f"/{faker.slug()}"),
+        page_name=PageNameValueObject(value=faker.sentence(nb_words=3)),
+        title=TitleValueObject(value=faker.sentence(nb_words=5)),
+        description=SeoDescriptionValueObject(value=faker.text(max_nb_chars=500)),
+    )
@@ -40,3 +40,20 @@ async def test_get_news_by_slug_not_found(
         )
 
     assert exc_info.value.slug == non_existent_slug
+
+
+@pytest.mark.asyncio
+async def test_get_news_by_slug_cached_miss_invalidated_by_create(
+    mediator: Mediator,
+    valid_news_entity: NewsEntity,
+):
+    slug = valid_news_entity.slug.as_generic_type()
+
+    with pytest.raises(NewsNotFoundBySlugException):
+        await mediator.handle_query(GetNewsBySlugQuery(slug=slug))
+
+    await mediator.handle_command(CreateNewsCommand(news=valid_news_entity))
+
+    retrieved_news = await mediator.handle_query(GetNewsBySlugQuery(slug=slug))
+
+    assert retrieved_news.oid == valid_news_entity.oid
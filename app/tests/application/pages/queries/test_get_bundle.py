@@ -0,0 +1,81 @@
+import asyncio
+from dataclasses import dataclass
+
+import pytest
+
+from application.base.query import (
+    BaseQuery,
+    BaseQueryHandler,
+)
+from application.mediator import Mediator
+from application.news.queries import GetNewsListQuery
+from application.pages.queries import (
+    GetPageBundleQuery,
+    PageSection,
+)
+from application.seo_settings.queries import GetSeoSettingsByPathQuery
+from domain.seo_settings.exceptions import SeoSettingsNotFoundByPathException
+
+
+@dataclass(frozen=True)
+class WaitForPeerQuery(BaseQuery):
+    own: asyncio.Event
+    peer: asyncio.Event
+
+
+@dataclass(frozen=True)
+class WaitForPeerQueryHandler(BaseQueryHandler[WaitForPeerQuery, str]):
+    async def handle(self, query: WaitForPeerQuery) -> str:
+        query.own.set()
+        await query.peer.wait()
+        return "done"
+
+
+@pytest.mark.asyncio
+async def test_get_page_bundle_runs_sections_concurrently(mediator: Mediator):
+    mediator.register_query(WaitForPeerQuery, WaitForPeerQueryHandler())
+    first, second = asyncio.Event(), asyncio.Event()
+
+    # При последовательном выполнении первая секция ждала бы вторую вечно
+    bundle = await asyncio.wait_for(
+        mediator.handle_query(
+            GetPageBundleQuery(
+                sections=(
+                    PageSection(name="first", query=WaitForPeerQuery(own=first, peer=second)),
+                    PageSection(name="second", query=WaitForPeerQuery(own=second, peer=first)),
+                ),
+            ),
+        ),
+        timeout=1,
+    )
+
+    assert bundle.results == {"first": "done", "second": "done"}
+    assert bundle.errors == {}
+
+
+@pytest.mark.asyncio
+async def test_get_page_bundle_optional_section_error(mediator: Mediator):
+    bundle = await mediator.handle_query(
+        GetPageBundleQuery(
+            sections=(
+                PageSection(name="seo_settings", query=GetSeoSettingsByPathQuery(page_path="/"), optional=True),
+                PageSection(
+                    name="news",
+                    query=GetNewsListQuery(sort_field="created_at", sort_order=-1, offset=0, limit=3),
+                ),
+            ),
+        ),
+    )
+
+    assert bundle.results == {"seo_settings": None, "news": ([], 0)}
+    assert isinstance(bundle.errors["seo_settings"], SeoSettingsNotFoundByPathException)
+
+
+@pytest.mark.asyncio
+async def test_get_page_bundle_required_section_error(mediator: Mediator):
+    with pytest.raises(SeoSettingsNotFoundByPathException):
+        await mediator.handle_query(
+            GetPageBundleQuery(
+                sections=(PageSection(name="seo_settings", query=GetSeoSettingsByPathQuery(page_path="/")),),
+            ),
+        )
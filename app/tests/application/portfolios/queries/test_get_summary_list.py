@@ -0,0 +1,61 @@
+import pytest
+
+from application.mediator import Mediator
+from application.portfolios.commands import CreatePortfolioCommand
+from application.portfolios.queries import GetPortfolioSummaryListQuery
+from domain.portfolios.entities import PortfolioSummaryEntity
+
+
+@pytest.mark.asyncio
+async def test_get_portfolio_summary_list_query_success(
+    mediator: Mediator,
+    valid_portfolio_entity_with_year,
+):
+    portfolios = []
+    for _ in range(5):
+        portfolio = valid_portfolio_entity_with_year()
+        await mediator.handle_command(
+            CreatePortfolioCommand(portfolio=portfolio),
+        )
+        portfolios.append(portfolio)
+
+    summaries, total = await mediator.handle_query(
+        GetPortfolioSummaryListQuery(
+            sort_field="created_at",
+            sort_order=1,
+            offset=0,
+            limit=10,
+        ),
+    )
+
+    assert len(summaries) == 5
+    assert total == 5
+    assert all(isinstance(summary, PortfolioSummaryEntity) for summary in summaries)
+    assert [summary.oid for summary in summaries] == [portfolio.oid for portfolio in portfolios]
+    assert summaries[0].poster == portfolios[0].poster
+    assert summaries[0].year == portfolios[0].year
+
+
+@pytest.mark.asyncio
+async def test_get_portfolio_summary_list_query_with_year_filter(
+    mediator: Mediator,
+    valid_portfolio_entity_with_year,
+):
+    for year in (2020, 2020, 2023):
+        await mediator.handle_command(
+            CreatePortfolioCommand(portfolio=valid_portfolio_entity_with_year(year)),
+        )
+
+    summaries, total = await mediator.handle_query(
+        GetPortfolioSummaryListQuery(
+            sort_field="created_at",
+            sort_order=-1,
+            offset=0,
+            limit=10,
+            year=2020,
+        ),
+    )
+
+    assert len(summaries) == 2
+    assert total == 2
+    assert all(summary.year.as_generic_type() == 2020 for summary in summaries)
@@ -2,10 +2,15 @@ import pytest
 from faker import Faker
 
 from application.mediator import Mediator
-from application.products.commands import CreateProductCommand
+from application.products.commands import (
+    CreateProductCommand,
+    DeleteProductCommand,
+    UpdateProductCommand,
+)
 from application.products.queries import GetProductBySlugQuery
 from domain.products.entities.products import ProductEntity
 from domain.products.exceptions.products import ProductNotFoundBySlugException
+from domain.products.value_objects import SlugValueObject
 
 
 @pytest.mark.asyncio
@@ -40,3 +45,60 @@ async def test_get_product_by_slug_not_found(
         )
 
     assert exc_info.value.slug == non_existent_slug
+
+
+@pytest.mark.asyncio
+async def test_get_product_by_slug_cached_miss_invalidated_by_create(
+    mediator: Mediator,
+    valid_product_entity: ProductEntity,
+):
+    slug = valid_product_entity.slug.as_generic_type()
+
+    with pytest.raises(ProductNotFoundBySlugException):
+        await mediator.handle_query(GetProductBySlugQuery(slug=slug))
+
+    await mediator.handle_command(
+        CreateProductCommand(product=valid_product_entity),
+    )
+
+    retrieved_product = await mediator.handle_query(
+        GetProductBySlugQuery(slug=slug),
+    )
+
+    assert retrieved_product.oid == valid_product_entity.oid
+
+
+@pytest.mark.asyncio
+async def test_get_product_by_slug_after_update_and_delete(
+    mediator: Mediator,
+    valid_product_entity: ProductEntity,
+    faker: Faker,
+):
+    old_slug = valid_product_entity.slug.as_generic_type()
+
+    await mediator.handle_command(CreateProductCommand(product=valid_product_entity))
+    await mediator.handle_query(GetProductBySlugQuery(slug=old_slug))
+
+    new_slug = faker.slug()
+    updated_product = ProductEntity(
+        category=valid_product_entity.category,
+        name=valid_product_entity.name,
+        slug=SlugValueObject(value=new_slug),
+        description=valid_product_entity.description,
+        preview_image_url=valid_product_entity.preview_image_url,
+        preview_image_alt=valid_product_entity.preview_image_alt,
+    )
+    await mediator.handle_command(
+        UpdateProductCommand(product_id=valid_product_entity.oid, product=updated_product),
+    )
+
+    with pytest.raises(ProductNotFoundBySlugException):
+        await mediator.handle_query(GetProductBySlugQuery(slug=old_slug))
+
+    retrieved_product = await mediator.handle_query(GetProductBySlugQuery(slug=new_slug))
+    assert retrieved_product.oid == valid_product_entity.oid
+
+    await mediator.handle_command(DeleteProductCommand(product_id=valid_product_entity.oid))
+
+    with pytest.raises(ProductNotFoundBySlugException):
+        await mediator.handle_query(GetProductBySlugQuery(slug=new_slug))
@@ -0,0 +1,64 @@
+import pytest
+
+from application.mediator import Mediator
+from application.products.commands import CreateProductCommand
+from application.products.queries import GetProductSummaryListQuery
+from domain.products.entities import ProductSummaryEntity
+
+
+@pytest.mark.asyncio
+async def test_get_product_summary_list_query_success(
+    mediator: Mediator,
+    valid_product_entity_with_category,
+):
+    products = []
+    for _ in range(5):
+        product = valid_product_entity_with_category("Трансформаторные подстанции")
+        await mediator.handle_command(
+            CreateProductCommand(product=product),
+        )
+        products.append(product)
+
+    summaries, total = await mediator.handle_query(
+        GetProductSummaryListQuery(
+            sort_field="created_at",
+            sort_order=1,
+            offset=0,
+            limit=10,
+        ),
+    )
+
+    assert len(summaries) == 5
+    assert total == 5
+    assert all(isinstance(summary, ProductSummaryEntity) for summary in summaries)
+    assert [summary.oid for summary in summaries] == [product.oid for product in products]
+    assert summaries[0].slug == products[0].slug
+    assert summaries[0].preview_image_url == products[0].preview_image_url
+
+
+@pytest.mark.asyncio
+async def test_get_product_summary_list_query_with_filter_and_pagination(
+    mediator: Mediator,
+    valid_product_entity_with_category,
+):
+    for _ in range(3):
+        await mediator.handle_command(
+            CreateProductCommand(product=valid_product_entity_with_category("Трансформаторные подстанции")),
+        )
+    await mediator.handle_command(
+        CreateProductCommand(product=valid_product_entity_with_category("Электростанции и установки")),
+    )
+
+    summaries, total = await mediator.handle_query(
+        GetProductSummaryListQuery(
+            sort_field="created_at",
+            sort_order=-1,
+            offset=0,
+            limit=2,
+            category="Трансформаторные подстанции",
+        ),
+    )
+
+    assert len(summaries) == 2
+    assert total == 3
+    assert all(summary.category.as_generic_type() == "Трансформаторные подстанции" for summary in summaries)
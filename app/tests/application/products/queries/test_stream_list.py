@@ -0,0 +1,33 @@
+import pytest
+
+from application.mediator import Mediator
+from application.products.commands import CreateProductCommand
+from application.products.queries import StreamProductListQuery
+from domain.products.entities import ProductEntity
+
+
+@pytest.mark.asyncio
+async def test_stream_product_list_query_success(
+    mediator: Mediator,
+    valid_product_entity_with_category,
+):
+    products = []
+    for _ in range(5):
+        product = valid_product_entity_with_category("Трансформаторные подстанции")
+        await mediator.handle_command(
+            CreateProductCommand(product=product),
+        )
+        products.append(product)
+
+    products_stream = await mediator.handle_query(
+        StreamProductListQuery(
+            sort_field="created_at",
+            sort_order=1,
+            offset=1,
+            limit=3,
+        ),
+    )
+    streamed = [product async for product in products_stream]
+
+    assert all(isinstance(product, ProductEntity) for product in streamed)
+    assert [product.oid for product in streamed] == [product.oid for product in products[1:4]]
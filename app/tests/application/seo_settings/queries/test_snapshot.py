@@ -0,0 +1,152 @@
+import asyncio
+
+import pytest
+from punq import Container
+
+from application.mediator import Mediator
+from application.seo_settings.commands import (
+    CreateSeoSettingsCommand,
+    DeleteSeoSettingsCommand,
+)
+from application.seo_settings.queries import GetSeoSettingsByPathQuery
+from domain.seo_settings.exceptions.seo_settings import SeoSettingsNotFoundByPathException
+from domain.seo_settings.interfaces.repository import BaseSeoSettingsRepository
+from domain.seo_settings.services import SeoSettingsSnapshot
+from domain.seo_settings.value_objects import PagePathValueObject
+
+
+@pytest.mark.asyncio
+async def test_get_seo_settings_by_path_prefix_fallback(
+    mediator: Mediator,
+    valid_seo_settings_entity,
+):
+    valid_seo_settings_entity.page_path = PagePathValueObject(value="/products/*")
+    await mediator.handle_command(CreateSeoSettingsCommand(seo_settings=valid_seo_settings_entity))
+
+    settings = await mediator.handle_query(GetSeoSettingsByPathQuery(page_path="/products/ktp-10"))
+
+    assert settings.oid == valid_seo_settings_entity.oid
+
+
+@pytest.mark.asyncio
+async def test_get_seo_settings_by_path_served_from_snapshot(
+    container: Container,
+    mediator: Mediator,
+    valid_seo_settings_entity,
+    monkeypatch,
+):
+    page_path = valid_seo_settings_entity.page_path.as_generic_type()
+    await mediator.handle_command(CreateSeoSettingsCommand(seo_settings=valid_seo_settings_entity))
+
+    repository = container.resolve(BaseSeoSettingsRepository)
+
+    async def fail(*args, **kwargs):
+        raise AssertionError("Чтение по пути не должно обращаться к репозиторию")
+
+    monkeypatch.setattr(repository, "get_by_path", fail)
+    monkeypatch.setattr(repository, "get_version", fail)
+
+    for _ in range(3):
+        settings = await mediator.handle_query(GetSeoSettingsByPathQuery(page_path=page_path))
+        assert settings.oid == valid_seo_settings_entity.oid
+
+
+@pytest.mark.asyncio
+async def test_seo_settings_snapshot_refreshed_on_delete(
+    mediator: Mediator,
+    valid_seo_settings_entity,
+):
+    page_path = valid_seo_settings_entity.page_path.as_generic_type()
+    await mediator.handle_command(CreateSeoSettingsCommand(seo_settings=valid_seo_settings_entity))
+    await mediator.handle_query(GetSeoSettingsByPathQuery(page_path=page_path))
+
+    await mediator.handle_command(DeleteSeoSettingsCommand(seo_settings_id=valid_seo_settings_entity.oid))
+
+    with pytest.raises(SeoSettingsNotFoundByPathException):
+        await mediator.handle_query(GetSeoSettingsByPathQuery(page_path=page_path))
+
+
+@pytest.mark.asyncio
+async def test_seo_settings_snapshot_picks_up_external_changes_on_version_check(
+    container: Container,
+    mediator: Mediator,
+    valid_seo_settings_entity,
+):
+    page_path = valid_seo_settings_entity.page_path.as_generic_type()
+    snapshot = container.resolve(SeoSettingsSnapshot)
+    snapshot.version_check_interval = 0
+
+    with pytest.raises(SeoSettingsNotFoundByPathException):
+        await mediator.handle_query(GetSeoSettingsByPathQuery(page_path=page_path))
+
+    # Запись другим воркером: мимо сервиса и его снимка
+    await container.resolve(BaseSeoSettingsRepository).add(valid_seo_settings_entity)
+
+    # Первый запрос отдается из старого снимка и запускает фоновую сверку версии
+    with pytest.raises(SeoSettingsNotFoundByPathException):
+        await mediator.handle_query(GetSeoSettingsByPathQuery(page_path=page_path))
+
+    await asyncio.sleep(0)
+    await snapshot._background_check
+
+    settings = await mediator.handle_query(GetSeoSettingsByPathQuery(page_path=page_path))
+
+    assert settings.oid == valid_seo_settings_entity.oid
+
+
+@pytest.mark.asyncio
+async def test_seo_settings_snapshot_concurrent_cold_reads_load_once(
+    container: Container,
+    mediator: Mediator,
+    valid_seo_settings_entity,
+    monkeypatch,
+):
+    page_path = valid_seo_settings_entity.page_path.as_generic_type()
+    repository = container.resolve(BaseSeoSettingsRepository)
+    await repository.add(valid_seo_settings_entity)
+
+    find_all = repository.find_all
+    loads = 0
+
+    def counting_find_all():
+        nonlocal loads
+        loads += 1
+        return find_all()
+
+    monkeypatch.setattr(repository, "find_all", counting_find_all)
+
+    results = await asyncio.gather(
+        *(mediator.handle_query(GetSeoSettingsByPathQuery(page_path=page_path)) for _ in range(5)),
+    )
+
+    assert {settings.oid for settings in results} == {valid_seo_settings_entity.oid}
+    assert loads == 1
+
+
+@pytest.mark.asyncio
+async def test_seo_settings_write_survives_snapshot_refresh_failure(
+    container: Container,
+    mediator: Mediator,
+    valid_seo_settings_entity,
+    monkeypatch,
+    caplog,
+):
+    page_path = valid_seo_settings_entity.page_path.as_generic_type()
+    repository = container.resolve(BaseSeoSettingsRepository)
+    snapshot = container.resolve(SeoSettingsSnapshot)
+    get_version = repository.get_version
+
+    async def fail():
+        raise ConnectionError("Mongo недоступна")
+
+    monkeypatch.setattr(repository, "get_version", fail)
+
+    await mediator.handle_command(CreateSeoSettingsCommand(seo_settings=valid_seo_settings_entity))
+
+    assert snapshot.index is None
+    assert "Failed to refresh SEO settings snapshot after write" in caplog.text
+
+    monkeypatch.setattr(repository, "get_version", get_version)
+    settings = await mediator.handle_query(GetSeoSettingsByPathQuery(page_path=page_path))
+
+    assert settings.oid == valid_seo_settings_entity.oid
@@ -0,0 +1,34 @@
+import pytest
+from punq import Container
+
+from application.mediator import Mediator
+from application.sitemap.commands import RebuildSitemapCommand
+from application.sitemap.queries import GetSitemapQuery
+from domain.news.entities import NewsEntity
+from domain.news.interfaces.repository import BaseNewsRepository
+from domain.products.interfaces.repository import BaseProductRepository
+
+
+@pytest.mark.asyncio
+async def test_rebuild_sitemap_backfills_entities_saved_outside_commands(
+    container: Container,
+    mediator: Mediator,
+    valid_product_entity_with_visibility,
+    valid_news_entity: NewsEntity,
+):
+    product_repository: BaseProductRepository = container.resolve(BaseProductRepository)
+    news_repository: BaseNewsRepository = container.resolve(BaseNewsRepository)
+
+    products = [valid_product_entity_with_visibility() for _ in range(3)]
+    for product in [*products, valid_product_entity_with_visibility(is_shown=False)]:
+        await product_repository.add(product)
+    await news_repository.add(valid_news_entity)
+
+    entries_count, *_ = await mediator.handle_command(RebuildSitemapCommand(batch_size=2))
+    sitemap = await mediator.handle_query(GetSitemapQuery())
+
+    assert entries_count == 4
+    assert {entry.page_path for entry in sitemap.entries} == {
+        *(f"/products/{product.slug.as_generic_type()}" for product in products),
+        f"/news/{valid_news_entity.slug.as_generic_type()}",
+    }
@@ -0,0 +1,118 @@
+from dataclasses import dataclass
+
+import pytest
+from punq import (
+    Container,
+    Scope,
+)
+
+from application.mediator import Mediator
+from application.news.commands import (
+    CreateNewsCommand,
+    DeleteNewsCommand,
+)
+from application.portfolios.commands import (
+    CreatePortfolioCommand,
+    UpdatePortfolioCommand,
+)
+from application.products.commands import (
+    CreateProductCommand,
+    UpdateProductCommand,
+)
+from application.sitemap.commands import SitemapRebuildScheduler
+from application.sitemap.queries import (
+    GetSitemapQuery,
+    GetSitemapVersionQuery,
+)
+from domain.news.entities import NewsEntity
+from domain.portfolios.entities import PortfolioEntity
+from domain.portfolios.value_objects.portfolios import SlugValueObject
+from domain.sitemap.entities import SitemapEntryEntity
+from domain.sitemap.interfaces import BaseSitemapRepository
+from infrastructure.database.repositories.dummy.sitemap.sitemap import DummyInMemorySitemapRepository
+
+
+@dataclass
+class UnavailableSitemapRepository(DummyInMemorySitemapRepository):
+    async def upsert(self, entry: SitemapEntryEntity) -> None:
+        raise ConnectionError("sitemap_entries is unavailable")
+
+
+async def _sitemap_paths(mediator: Mediator) -> dict[str, str]:
+    sitemap = await mediator.handle_query(GetSitemapQuery())
+    return {entry.page_path: entry.source for entry in sitemap.entries}
+
+
+@pytest.mark.asyncio
+async def test_sitemap_tracks_created_entities(
+    mediator: Mediator,
+    valid_product_entity_with_visibility,
+    valid_news_entity: NewsEntity,
+    valid_portfolio_entity: PortfolioEntity,
+):
+    product = valid_product_entity_with_visibility()
+    hidden_product = valid_product_entity_with_visibility(is_shown=False)
+
+    await mediator.handle_command(CreateProductCommand(product=product))
+    await mediator.handle_command(CreateProductCommand(product=hidden_product))
+    await mediator.handle_command(CreateNewsCommand(news=valid_news_entity))
+    await mediator.handle_command(CreatePortfolioCommand(portfolio=valid_portfolio_entity))
+
+    assert await _sitemap_paths(mediator) == {
+        f"/products/{product.slug.as_generic_type()}": "products",
+        f"/news/{valid_news_entity.slug.as_generic_type()}": "news",
+        f"/portfolios/{valid_portfolio_entity.slug.as_generic_type()}": "portfolios",
+    }
+
+
+@pytest.mark.asyncio
+async def test_sitemap_follows_slug_change(
+    mediator: Mediator,
+    valid_portfolio_entity: PortfolioEntity,
+    faker,
+):
+    await mediator.handle_command(CreatePortfolioCommand(portfolio=valid_portfolio_entity))
+    version_before = await mediator.handle_query(GetSitemapVersionQuery())
+
+    new_slug = faker.slug()
+    valid_portfolio_entity.slug = SlugValueObject(value=new_slug)
+    await mediator.handle_command(
+        UpdatePortfolioCommand(portfolio_id=valid_portfolio_entity.oid, portfolio=valid_portfolio_entity),
+    )
+
+    assert await _sitemap_paths(mediator) == {f"/portfolios/{new_slug}": "portfolios"}
+    assert await mediator.handle_query(GetSitemapVersionQuery()) != version_before
+
+
+@pytest.mark.asyncio
+async def test_sitemap_drops_hidden_and_deleted_entities(
+    mediator: Mediator,
+    valid_product_entity_with_visibility,
+    valid_news_entity: NewsEntity,
+):
+    product = valid_product_entity_with_visibility()
+    await mediator.handle_command(CreateProductCommand(product=product))
+    await mediator.handle_command(CreateNewsCommand(news=valid_news_entity))
+
+    product.is_shown = False
+    await mediator.handle_command(UpdateProductCommand(product_id=product.oid, product=product))
+    await mediator.handle_command(DeleteNewsCommand(news_id=valid_news_entity.oid))
+
+    assert await _sitemap_paths(mediator) == {}
+
+
+@pytest.mark.asyncio
+async def test_sitemap_sync_failure_keeps_saved_write_and_rebuilds(
+    container: Container,
+    valid_product_entity_with_visibility,
+):
+    container.register(BaseSitemapRepository, instance=UnavailableSitemapRepository(), scope=Scope.singleton)
+    mediator: Mediator = container.resolve(Mediator)
+    product = valid_product_entity_with_visibility()
+
+    # Продукт сохранен: сбой карты сайта не должен превращаться в ошибку команды
+    await mediator.handle_command(CreateProductCommand(product=product))
+
+    await container.resolve(SitemapRebuildScheduler)._task
+
+    assert await _sitemap_paths(mediator) == {f"/products/{product.slug.as_generic_type()}": "products"}
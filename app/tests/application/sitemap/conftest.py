@@ -0,0 +1,95 @@
+from datetime import datetime
+
+import pytest
+from faker import Faker
+
+from domain.news.entities import NewsEntity
+from domain.news.value_objects.news import (
+    AltValueObject,
+    CategoryValueObject as NewsCategoryValueObject,
+    ContentValueObject,
+    ImageUrlValueObject,
+    ReadingTimeValueObject,
+    ShortContentValueObject,
+    SlugValueObject as NewsSlugValueObject,
+    TitleValueObject,
+)
+from domain.portfolios.entities import PortfolioEntity
+from domain.portfolios.value_objects.portfolios import (
+    DescriptionValueObject as PortfolioDescriptionValueObject,
+    ImageAltValueObject,
+    NameValueObject as PortfolioNameValueObject,
+    PosterUrlValueObject,
+    SlugValueObject as PortfolioSlugValueObject,
+    SolutionDescriptionValueObject,
+    SolutionImageUrlValueObject,
+    SolutionSubdescriptionValueObject,
+    SolutionSubtitleValueObject,
+    SolutionTitleValueObject,
+    TaskDescriptionValueObject,
+    TaskTitleValueObject,
+    YearValueObject,
+)
+from domain.products.entities import ProductEntity
+from domain.products.value_objects import (
+    CategoryValueObject,
+    DescriptionValueObject,
+    NameValueObject,
+    PreviewImageAltValueObject,
+    PreviewImageUrlValueObject,
+    SlugValueObject,
+)
+
+
+@pytest.fixture
+def valid_product_entity_with_visibility(faker: Faker):
+    def _create(is_shown: bool = True) -> ProductEntity:
+        return ProductEntity(
+            category=CategoryValueObject(value="Трансформаторные подстанции"),
+            name=NameValueObject(value=faker.sentence(nb_words=5)),
+            slug=SlugValueObject(value=faker.slug()),
+            description=DescriptionValueObject(value=faker.text(max_nb_chars=500)),
+            preview_image_url=PreviewImageUrlValueObject(value=faker.image_url()),
+            preview_image_alt=PreviewImageAltValueObject(value=faker.sentence(nb_words=3)),
+            is_shown=is_shown,
+        )
+
+    return _create
+
+
+@pytest.fixture
+def valid_news_entity(faker: Faker) -> NewsEntity:
+    return NewsEntity(
+        category=NewsCategoryValueObject(value="События"),
+        title=TitleValueObject(value=faker.sentence(nb_words=5)),
+        slug=NewsSlugValueObject(value=faker.slug()),
+        content=ContentValueObject(value=faker.text(max_nb_chars=1000)),
+        short_content=ShortContentValueObject(value=faker.text(max_nb_chars=200)),
+        image_url=ImageUrlValueObject(value=faker.image_url()),
+        alt=AltValueObject(value=faker.sentence(nb_words=3)),
+        reading_time=ReadingTimeValueObject(value=faker.random_int(min=1, max=60)),
+        date=datetime.now(),
+    )
+
+
+@pytest.fixture
+def valid_portfolio_entity(faker: Faker) -> PortfolioEntity:
+    return PortfolioEntity(
+        name=PortfolioNameValueObject(value=faker.sentence(nb_words=3)),
+        slug=PortfolioSlugValueObject(value=faker.slug()),
+        poster=PosterUrlValueObject(value=faker.image_url()),
+        poster_alt=ImageAltValueObject(value=faker.sentence(nb_words=3)),
+        year=YearValueObject(value=faker.random_int(min=2000, max=2100)),
+        description=PortfolioDescriptionValueObject(value=faker.text(max_nb_chars=1000)),
+        task_title=TaskTitleValueObject(value=faker.sentence(nb_words=5)),
+        task_description=TaskDescriptionValueObject(value=faker.text(max_nb_chars=500)),
+        solution_title=SolutionTitleValueObject(value=faker.sentence(nb_words=5)),
+        solution_description=SolutionDescriptionValueObject(value=faker.text(max_nb_chars=500)),
+        solution_subtitle=SolutionSubtitleValueObject(value=faker.sentence(nb_words=3)),
+        solution_subdescription=SolutionSubdescriptionValueObject(value=faker.text(max_nb_chars=300)),
+        solution_image_left=SolutionImageUrlValueObject(value=faker.image_url()),
+        solution_image_left_alt=ImageAltValueObject(value=faker.sentence(nb_words=3)),
+        solution_image_right=SolutionImageUrlValueObject(value=faker.image_url()),
+        solution_image_right_alt=ImageAltValueObject(value=faker.sentence(nb_words=3)),
+        has_review=False,
+    )
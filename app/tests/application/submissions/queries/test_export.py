@@ -0,0 +1,36 @@
+from datetime import (
+    datetime,
+    timedelta,
+)
+
+import pytest
+
+from application.mediator import Mediator
+from application.submissions.commands import CreateSubmissionCommand
+from application.submissions.queries import ExportSubmissionsQuery
+
+
+@pytest.mark.asyncio
+async def test_export_submissions_query_filters_by_form_type_and_period(
+    mediator: Mediator,
+    valid_submission_entity_with_form_type,
+):
+    now = datetime.now()
+    created = []
+
+    for days_ago, form_type in ((40, "Опросный лист"), (10, "Опросный лист"), (5, "Обращение"), (3, "Опросный лист")):
+        submission = valid_submission_entity_with_form_type(form_type)
+        submission.created_at = now - timedelta(days=days_ago)
+        await mediator.handle_command(CreateSubmissionCommand(submission=submission))
+        created.append(submission)
+
+    submissions = await mediator.handle_query(
+        ExportSubmissionsQuery(
+            form_type="Опросный лист",
+            created_from=now - timedelta(days=30),
+            created_to=now,
+        ),
+    )
+    exported = [submission async for submission in submissions]
+
+    assert [submission.oid for submission in exported] == [created[1].oid, created[3].oid]
@@ -0,0 +1,32 @@
+import pytest
+
+from application.mediator import Mediator
+from application.submissions.commands import CreateSubmissionCommand
+from application.submissions.queries import StreamSubmissionListQuery
+from domain.submissions.entities.submissions import SubmissionEntity
+
+
+@pytest.mark.asyncio
+async def test_stream_submission_list_query_with_form_type_filter(
+    mediator: Mediator,
+    valid_submission_entity_with_form_type,
+):
+    for form_type in ("Опросный лист", "Обращение", "Опросный лист"):
+        await mediator.handle_command(
+            CreateSubmissionCommand(submission=valid_submission_entity_with_form_type(form_type)),
+        )
+
+    submissions_stream = await mediator.handle_query(
+        StreamSubmissionListQuery(
+            sort_field="created_at",
+            sort_order=-1,
+            offset=0,
+            limit=10,
+            form_type="Опросный лист",
+        ),
+    )
+    streamed = [submission async for submission in submissions_stream]
+
+    assert len(streamed) == 2
+    assert all(isinstance(submission, SubmissionEntity) for submission in streamed)
+    assert all(submission.form_type.as_generic_type() == "Опросный лист" for submission in streamed)
@@ -0,0 +1,184 @@
+import asyncio
+from dataclasses import (
+    dataclass,
+    field,
+)
+from typing import ClassVar
+
+import pytest
+
+from application.base.query import (
+    BaseQuery,
+    BaseQueryHandler,
+)
+from application.mediator import Mediator
+from infrastructure.database.gateways.routing import (
+    pin_reads_to_primary,
+    ReadRoutingMiddleware,
+    reads_from_replicas,
+)
+from infrastructure.metrics.instruments import MEDIATOR_DISPATCH_DURATION
+from infrastructure.metrics.mediator import MediatorMetricsMiddleware
+
+
+@dataclass(frozen=True)
+class SlowQuery(BaseQuery):
+    key: str
+
+
+@dataclass(frozen=True)
+class UncoalescedSlowQuery(BaseQuery):
+    coalesce: ClassVar[bool] = False
+
+    key: str
+
+
+@dataclass(frozen=True)
+class UnhashableSlowQuery(BaseQuery):
+    keys: list[str]
+
+
+@dataclass(frozen=True)
+class SlowQueryHandler(BaseQueryHandler[BaseQuery, list[str]]):
+    release: asyncio.Event
+    calls: list[BaseQuery] = field(default_factory=list)
+    error: Exception | None = None
+
+    async def handle(self, query: BaseQuery) -> list[str]:
+        self.calls.append(query)
+        await self.release.wait()
+
+        if self.error is not None:
+            raise self.error
+
+        return [getattr(query, "key", "")]
+
+
+async def _dispatch_concurrently(mediator: Mediator, handler: SlowQueryHandler, *queries: BaseQuery) -> list:
+    tasks = [asyncio.ensure_future(mediator.handle_query(query)) for query in queries]
+    await asyncio.sleep(0)
+    handler.release.set()
+    return await asyncio.gather(*tasks, return_exceptions=True)
+
+
+@pytest.mark.asyncio
+async def test_handle_query_coalesces_identical_concurrent_queries():
+    mediator = Mediator()
+    handler = SlowQueryHandler(release=asyncio.Event())
+    mediator.register_query(SlowQuery, handler)
+
+    results = await _dispatch_concurrently(
+        mediator,
+        handler,
+        *(SlowQuery(key="a") for _ in range(5)),
+        SlowQuery(key="b"),
+    )
+
+    assert len(handler.calls) == 2
+    assert results[:5] == [["a"]] * 5
+    assert all(result is results[0] for result in results[:5])
+    assert results[5] == ["b"]
+    assert mediator.in_flight_queries == {}
+
+
+@pytest.mark.asyncio
+async def test_handle_query_shares_exception_and_does_not_cache():
+    mediator = Mediator()
+    handler = SlowQueryHandler(release=asyncio.Event(), error=ValueError("boom"))
+    mediator.register_query(SlowQuery, handler)
+
+    results = await _dispatch_concurrently(mediator, handler, SlowQuery(key="a"), SlowQuery(key="a"))
+
+    assert len(handler.calls) == 1
+    assert all(isinstance(result, ValueError) for result in results)
+
+    # После завершения запрос выполняется заново, результат не кэшируется
+    with pytest.raises(ValueError):
+        await mediator.handle_query(SlowQuery(key="a"))
+
+    assert len(handler.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_handle_query_cancelled_waiter_does_not_cancel_shared_query():
+    mediator = Mediator()
+    handler = SlowQueryHandler(release=asyncio.Event())
+    mediator.register_query(SlowQuery, handler)
+
+    first = asyncio.ensure_future(mediator.handle_query(SlowQuery(key="a")))
+    second = asyncio.ensure_future(mediator.handle_query(SlowQuery(key="a")))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    handler.release.set()
+
+    assert await second == ["a"]
+    assert first.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_handle_query_without_coalescing():
+    mediator = Mediator()
+    handler = SlowQueryHandler(release=asyncio.Event())
+    mediator.register_query(UncoalescedSlowQuery, handler)
+    mediator.register_query(UnhashableSlowQuery, handler)
+
+    await _dispatch_concurrently(
+        mediator,
+        handler,
+        UncoalescedSlowQuery(key="a"),
+        UncoalescedSlowQuery(key="a"),
+        UnhashableSlowQuery(keys=["a"]),
+        UnhashableSlowQuery(keys=["a"]),
+    )
+
+    assert len(handler.calls) == 4
+
+
+@dataclass(frozen=True)
+class ReadRoutingQueryHandler(BaseQueryHandler[SlowQuery, bool]):
+    async def handle(self, query: SlowQuery) -> bool:
+        return reads_from_replicas()
+
+
+@pytest.mark.asyncio
+async def test_handle_query_routes_reads_to_replicas():
+    mediator = Mediator(middlewares=[ReadRoutingMiddleware()])
+    mediator.register_query(SlowQuery, ReadRoutingQueryHandler())
+
+    assert await mediator.handle_query(SlowQuery(key="a")) is True
+    assert reads_from_replicas() is False
+
+
+@pytest.mark.asyncio
+async def test_handle_query_pinned_to_primary_is_not_coalesced():
+    mediator = Mediator(middlewares=[ReadRoutingMiddleware()])
+    handler = SlowQueryHandler(release=asyncio.Event())
+    mediator.register_query(SlowQuery, handler)
+
+    public = asyncio.ensure_future(mediator.handle_query(SlowQuery(key="a")))
+    await asyncio.sleep(0)
+
+    # Админский запрос не должен дождаться результата, прочитанного с реплики
+    pin_reads_to_primary()
+    admin = asyncio.ensure_future(mediator.handle_query(SlowQuery(key="a")))
+    await asyncio.sleep(0)
+    handler.release.set()
+
+    assert await asyncio.gather(public, admin) == [["a"], ["a"]]
+    assert len(handler.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_handle_query_records_dispatch_duration_per_waiter():
+    mediator = Mediator(middlewares=[MediatorMetricsMiddleware()])
+    handler = SlowQueryHandler(release=asyncio.Event(), error=ValueError("boom"))
+    mediator.register_query(SlowQuery, handler)
+    failed = MEDIATOR_DISPATCH_DURATION.labels("query", "SlowQuery", "error")
+    count_before = sum(failed.bucket_counts)
+
+    await _dispatch_concurrently(mediator, handler, SlowQuery(key="a"), SlowQuery(key="a"))
+
+    # Запрос выполнился один раз, но каждый ожидавший учтен со своим временем ожидания
+    assert len(handler.calls) == 1
+    assert sum(failed.bucket_counts) == count_before + 2
@@ -0,0 +1,171 @@
+import asyncio
+from contextlib import contextmanager
+from dataclasses import dataclass
+from uuid import uuid4
+
+import pytest
+
+from domain.base.cache import SlugCache
+
+
+@dataclass
+class FakeClock:
+    now: float = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@dataclass
+class CountingLoader:
+    value: str | None
+    calls: int = 0
+
+    async def __call__(self) -> str | None:
+        self.calls += 1
+        return self.value
+
+
+@pytest.mark.asyncio
+async def test_slug_cache_serves_fresh_hit_without_loading():
+    clock = FakeClock()
+    cache = SlugCache[str](clock=clock)
+    loader = CountingLoader(value="v1")
+
+    assert await cache.get("slug", None, loader) == "v1"
+    clock.now = 10
+    assert await cache.get("slug", None, loader) == "v1"
+
+    assert loader.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_slug_cache_caches_miss_for_negative_ttl():
+    clock = FakeClock()
+    cache = SlugCache[str](clock=clock, negative_ttl=5)
+    loader = CountingLoader(value=None)
+
+    assert await cache.get("missing", None, loader) is None
+    assert await cache.get("missing", None, loader) is None
+    assert loader.calls == 1
+
+    clock.now = 6
+    assert await cache.get("missing", None, loader) is None
+    assert loader.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_slug_cache_serves_stale_and_revalidates_in_background():
+    clock = FakeClock()
+    cache = SlugCache[str](clock=clock, fresh_ttl=10, stale_ttl=100)
+    loader = CountingLoader(value="v1")
+
+    await cache.get("slug", None, loader)
+    loader.value = "v2"
+    clock.now = 50
+
+    # Устаревшее значение отдается сразу, обновление идет в фоне
+    assert await cache.get("slug", None, loader) == "v1"
+    await asyncio.sleep(0)
+
+    assert loader.calls == 2
+    assert await cache.get("slug", None, loader) == "v2"
+
+    clock.now = 500
+    loader.value = "v3"
+
+    # После stale_ttl значение перечитывается синхронно
+    assert await cache.get("slug", None, loader) == "v3"
+
+
+@pytest.mark.asyncio
+async def test_slug_cache_invalidate_drops_every_projection():
+    cache = SlugCache[str](clock=FakeClock())
+    loader = CountingLoader(value="v1")
+
+    await cache.get("slug", None, loader)
+    await cache.get("slug", frozenset({"name"}), loader)
+    cache.invalidate("slug")
+    await cache.get("slug", None, loader)
+    await cache.get("slug", frozenset({"name"}), loader)
+
+    assert loader.calls == 4
+
+
+@pytest.mark.asyncio
+async def test_slug_cache_evicts_least_recently_used():
+    cache = SlugCache[str](clock=FakeClock(), max_entries=2)
+    loader = CountingLoader(value="v")
+
+    await cache.get("a", None, loader)
+    await cache.get("b", None, loader)
+    await cache.get("a", None, loader)
+    await cache.get("c", None, loader)
+    await cache.get("a", None, loader)
+
+    assert loader.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_slug_cache_loads_inside_read_scope():
+    clock = FakeClock()
+    scopes = []
+
+    @contextmanager
+    def read_scope():
+        scopes.append("enter")
+        yield
+        scopes.append("exit")
+
+    cache = SlugCache[str](clock=clock, fresh_ttl=10, stale_ttl=100, read_scope=read_scope)
+    loader = CountingLoader(value="v1")
+
+    await cache.get("slug", None, loader)
+    clock.now = 50
+    await cache.get("slug", None, loader)
+    await asyncio.sleep(0)
+
+    # И первое чтение, и фоновое перечитывание устаревшего значения
+    assert loader.calls == 2
+    assert scopes == ["enter", "exit", "enter", "exit"]
+
+
+@dataclass
+class SlowLoader:
+    value: str
+    calls: int = 0
+
+    def __post_init__(self) -> None:
+        self.release = asyncio.Event()
+
+    async def __call__(self) -> str:
+        self.calls += 1
+        await self.release.wait()
+        return self.value
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("invalidate", ["slug", "oid", "clear"])
+async def test_slug_cache_does_not_store_value_loaded_before_invalidation(invalidate: str):
+    cache = SlugCache[str](clock=FakeClock())
+    loader = SlowLoader(value="before-write")
+
+    pending = asyncio.create_task(cache.get("slug", None, loader))
+    await asyncio.sleep(0)
+
+    # Запись завершилась и сбросила ключ, пока чтение еще не вернулось
+    if invalidate == "slug":
+        cache.invalidate("slug")
+    elif invalidate == "oid":
+        cache.invalidate_oid(uuid4())
+    else:
+        cache.clear()
+
+    loader.release.set()
+
+    assert await pending == "before-write"
+
+    loader.value = "after-write"
+    assert await cache.get("slug", None, loader) == "after-write"
+    assert loader.calls == 2
+    assert cache._generations == {}
@@ -242,3 +242,21 @@ def test_product_entity_with_portfolio_ids():
     assert len(product.portfolio_ids) == 2
     assert portfolio_id_1 in product.portfolio_ids
     assert portfolio_id_2 in product.portfolio_ids
+
+
+def test_product_entity_has_no_instance_dict():
+    product = ProductEntity(
+        category=CategoryValueObject("Трансформаторные подстанции"),
+        name=NameValueObject("Трансформаторная подстанция 10 кВ"),
+        slug=SlugValueObject("transformatornaya-podstantsiya-10-kv"),
+        description=DescriptionValueObject("Полное описание трансформаторной подстанции"),
+        preview_image_url=PreviewImageUrlValueObject("https://sibkomplekt.ru/products/preview.jpg"),
+        simple_description=[SimpleDescriptionEntity(text="Описание")],
+    )
+
+    assert not hasattr(product, "__dict__")
+    assert not hasattr(product.slug, "__dict__")
+    assert not hasattr(product.simple_description[0], "__dict__")
+
+    product.order = 5
+    assert product.order == 5
@@ -177,3 +177,20 @@ def test_preview_image_url_invalid(preview_image_url_value, exception):
 def test_preview_image_alt_valid(preview_image_alt_value, expected):
     preview_image_alt = PreviewImageAltValueObject(preview_image_alt_value)
     assert preview_image_alt.as_generic_type() == expected
+
+
+def test_from_trusted_equals_validated():
+    trusted = SlugValueObject.from_trusted("transformatornaya-podstantsiya-10-kv")
+    validated = SlugValueObject("transformatornaya-podstantsiya-10-kv")
+
+    assert trusted == validated
+    assert hash(trusted) == hash(validated)
+    assert trusted.as_generic_type() == "transformatornaya-podstantsiya-10-kv"
+
+
+def test_from_trusted_skips_validation():
+    slug = SlugValueObject.from_trusted("")
+
+    assert slug.as_generic_type() == ""
+    with pytest.raises(SlugEmptyException):
+        SlugValueObject("")
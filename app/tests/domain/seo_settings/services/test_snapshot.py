@@ -0,0 +1,63 @@
+import pytest
+
+from domain.seo_settings.entities import SeoSettingsEntity
+from domain.seo_settings.services.snapshot import (
+    normalize_page_path,
+    SeoSettingsPathIndex,
+)
+from domain.seo_settings.value_objects import (
+    DescriptionValueObject,
+    PageNameValueObject,
+    PagePathValueObject,
+    TitleValueObject,
+)
+
+
+def make_seo_settings(page_path: str) -> SeoSettingsEntity:
+    return SeoSettingsEntity(
+        page_path=PagePathValueObject(value=page_path),
+        page_name=PageNameValueObject(value=page_path),
+        title=TitleValueObject(value=page_path),
+        description=DescriptionValueObject(value=page_path),
+    )
+
+
+@pytest.mark.parametrize(
+    "page_path,expected",
+    [
+        ("/", "/"),
+        ("", "/"),
+        ("about", "/about"),
+        ("/about/", "/about"),
+        ("//products//kru?utm=1#top", "/products/kru"),
+    ],
+)
+def test_normalize_page_path(page_path, expected):
+    assert normalize_page_path(page_path) == expected
+
+
+@pytest.mark.parametrize(
+    "page_path,expected",
+    [
+        ("/", "/"),
+        ("/products", "/products"),
+        ("/products/", "/products"),
+        ("/products/ktp", "/products/*"),
+        ("/products/ktp/specs", "/products/ktp/*"),
+        ("/products/ktp/specs/pdf", "/products/ktp/*"),
+        ("/news/2025", "/*"),
+    ],
+)
+def test_seo_settings_path_index_longest_prefix(page_path, expected):
+    index = SeoSettingsPathIndex.build(
+        [make_seo_settings(path) for path in ("/", "/*", "/products", "/products/*", "/products/ktp/*")],
+    )
+
+    assert index.lookup(page_path).page_path.as_generic_type() == expected
+
+
+def test_seo_settings_path_index_without_default():
+    index = SeoSettingsPathIndex.build([make_seo_settings("/products/*")])
+
+    assert index.lookup("/news") is None
+    assert index.lookup("/products") is None
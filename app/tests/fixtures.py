@@ -12,6 +12,7 @@ from domain.portfolios.interfaces.repository import BasePortfolioRepository
 from domain.products.interfaces.repository import BaseProductRepository
 from domain.reviews.interfaces.repository import BaseReviewRepository
 from domain.seo_settings.interfaces.repository import BaseSeoSettingsRepository
+from domain.sitemap.interfaces import BaseSitemapRepository
 from domain.submissions.interfaces.repository import BaseSubmissionRepository
 from domain.users.interfaces.repository import BaseUserRepository
 from domain.vacancies.interfaces.repository import BaseVacancyRepository
@@ -25,6 +26,7 @@ from infrastructure.database.repositories.dummy.portfolios.portfolios import Dum
 from infrastructure.database.repositories.dummy.products.products import DummyInMemoryProductRepository
 from infrastructure.database.repositories.dummy.reviews.reviews import DummyInMemoryReviewRepository
 from infrastructure.database.repositories.dummy.seo_settings.seo_settings import DummyInMemorySeoSettingsRepository
+from infrastructure.database.repositories.dummy.sitemap.sitemap import DummyInMemorySitemapRepository
 from infrastructure.database.repositories.dummy.submissions.submissions import DummyInMemorySubmissionRepository
 from infrastructure.database.repositories.dummy.users.users import DummyInMemoryUserRepository
 from infrastructure.database.repositories.dummy.vacancies.vacancies import DummyInMemoryVacancyRepository
@@ -89,5 +91,10 @@ def get_dummy_container() -> Container:
         DummyInMemorySubmissionRepository,
         scope=Scope.singleton,
     )
+    container.register(
+        BaseSitemapRepository,
+        DummyInMemorySitemapRepository,
+        scope=Scope.singleton,
+    )
 
     return container
@@ -0,0 +1,52 @@
+from datetime import datetime
+
+import pytest
+from faker import Faker
+
+from domain.news.entities.news import NewsEntity
+from domain.news.value_objects.news import (
+    AltValueObject,
+    CategoryValueObject as NewsCategoryValueObject,
+    ContentValueObject,
+    ImageUrlValueObject,
+    ReadingTimeValueObject,
+    ShortContentValueObject,
+    SlugValueObject as NewsSlugValueObject,
+    TitleValueObject,
+)
+from domain.products.entities import ProductEntity
+from domain.products.value_objects import (
+    CategoryValueObject,
+    DescriptionValueObject,
+    NameValueObject,
+    PreviewImageAltValueObject,
+    PreviewImageUrlValueObject,
+    SlugValueObject,
+)
+
+
+@pytest.fixture
+def valid_product_entity(faker: Faker) -> ProductEntity:
+    return ProductEntity(
+        category=CategoryValueObject(value="Трансформаторные подстанции"),
+        name=NameValueObject(value=faker.sentence(nb_words=5)),
+        slug=SlugValueObject(value=faker.slug()),
+        description=DescriptionValueObject(value=faker.text(max_nb_chars=500)),
+        preview_image_url=PreviewImageUrlValueObject(value=faker.image_url()),
+        preview_image_alt=PreviewImageAltValueObject(value=faker.sentence(nb_words=3)),
+    )
+
+
+@pytest.fixture
+def valid_news_entity(faker: Faker) -> NewsEntity:
+    return NewsEntity(
+        category=NewsCategoryValueObject(value="События"),
+        title=TitleValueObject(value=faker.sentence(nb_words=5)),
+        slug=NewsSlugValueObject(value=faker.slug()),
+        content=ContentValueObject(value=faker.text(max_nb_chars=1000)),
+        short_content=ShortContentValueObject(value=faker.text(max_nb_chars=200)),
+        image_url=ImageUrlValueObject(value=faker.image_url()),
+        alt=AltValueObject(value=faker.sentence(nb_words=3)),
+        reading_time=ReadingTimeValueObject(value=faker.random_int(min=1, max=60)),
+        date=datetime.now(),
+    )
@@ -0,0 +1,180 @@
+import asyncio
+from dataclasses import (
+    dataclass,
+    field,
+)
+from uuid import uuid4
+
+import pytest
+from pymongo.errors import OperationFailure
+
+from infrastructure.database.change_streams import (
+    change_events_from_document,
+    ChangeEvent,
+    ChangeStreamWatcher,
+    RESUME_TOKENS_COLLECTION,
+)
+
+
+def test_change_events_carry_oid_and_old_and_new_slugs():
+    oid = uuid4()
+    change = {
+        "operationType": "update",
+        "ns": {"db": "sk", "coll": "products"},
+        "fullDocument": {"oid": oid, "slug": "new-slug"},
+        "fullDocumentBeforeChange": {"oid": str(oid), "slug": "old-slug"},
+    }
+
+    assert change_events_from_document(change) == [
+        ChangeEvent(collection_name="products", operation="update", oid=oid, slugs=frozenset({"new-slug", "old-slug"})),
+    ]
+
+
+def test_change_events_without_documents_are_untargeted():
+    delete = {"operationType": "delete", "ns": {"db": "sk", "coll": "news"}, "documentKey": {"_id": "x"}}
+    drop_database = {"operationType": "dropDatabase", "ns": {"db": "sk"}}
+
+    assert change_events_from_document(delete) == [ChangeEvent(collection_name="news", operation="delete")]
+    assert {event.collection_name for event in change_events_from_document(drop_database, ("news", "products"))} == {
+        "news",
+        "products",
+    }
+
+
+@dataclass
+class FakeChangeStream:
+    changes: list
+    error: Exception | None = None
+    resume_token: dict | None = None
+    alive: bool = True
+
+    async def __aenter__(self) -> "FakeChangeStream":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        self.alive = False
+
+    async def try_next(self) -> dict | None:
+        if self.changes:
+            change = self.changes.pop(0)
+            self.resume_token = change["_id"]
+            return change
+
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise error
+
+        await asyncio.sleep(0.01)
+        return None
+
+
+@dataclass
+class FakeTokensCollection:
+    documents: dict = field(default_factory=dict)
+
+    async def find_one(self, query: dict) -> dict | None:
+        return self.documents.get(query["_id"])
+
+    async def replace_one(self, query: dict, document: dict, upsert: bool) -> None:
+        self.documents[query["_id"]] = document
+
+
+@dataclass
+class FakeConnection:
+    streams: list[FakeChangeStream]
+    tokens: FakeTokensCollection = field(default_factory=FakeTokensCollection)
+    watch_calls: list[dict] = field(default_factory=list)
+    commands: list[tuple] = field(default_factory=list)
+
+    def watch(self, pipeline: list, **kwargs) -> FakeChangeStream:
+        self.watch_calls.append(kwargs)
+        return self.streams.pop(0)
+
+    async def command(self, *args, **kwargs) -> None:
+        self.commands.append(args)
+
+    def __getitem__(self, collection_name: str) -> FakeTokensCollection:
+        assert collection_name == RESUME_TOKENS_COLLECTION
+        return self.tokens
+
+
+@dataclass
+class FakeMongoDatabase:
+    connection: FakeConnection
+
+
+def _change(token: str, collection_name: str, slug: str) -> dict:
+    return {
+        "_id": {"_data": token},
+        "operationType": "insert",
+        "ns": {"db": "sk", "coll": collection_name},
+        "fullDocument": {"oid": uuid4(), "slug": slug},
+    }
+
+
+async def _wait_for(predicate) -> None:
+    for _ in range(100):
+        if predicate():
+            return
+
+        await asyncio.sleep(0.01)
+
+    raise AssertionError("Condition was not met")
+
+
+@pytest.mark.asyncio
+async def test_watcher_publishes_events_and_resumes_after_error():
+    history_lost = OperationFailure("Resume of change stream was not possible", code=286)
+    connection = FakeConnection(
+        streams=[
+            FakeChangeStream(changes=[_change("1", "products", "a")], error=history_lost),
+            FakeChangeStream(changes=[_change("2", "news", "b")]),
+        ],
+    )
+    connection.tokens.documents["cache_invalidation"] = {"token": {"_data": "0"}}
+    events: list[ChangeEvent] = []
+
+    async def publish(event: ChangeEvent) -> None:
+        events.append(event)
+
+    watcher = ChangeStreamWatcher(
+        mongo_database=FakeMongoDatabase(connection=connection),
+        publish=publish,
+        collections=("products", "news"),
+    )
+    await watcher.start()
+    await _wait_for(lambda: any(event.slugs == frozenset({"b"}) for event in events))
+    await watcher.stop()
+
+    # Первый поток продолжает сохраненный токен, после потери истории поток открывается заново
+    assert connection.watch_calls[0]["resume_after"] == {"_data": "0"}
+    assert connection.watch_calls[1]["resume_after"] is None
+    assert [(event.collection_name, event.slugs) for event in events] == [
+        ("products", frozenset({"a"})),
+        ("products", frozenset()),
+        ("news", frozenset()),
+        ("news", frozenset({"b"})),
+    ]
+    assert connection.tokens.documents["cache_invalidation"]["token"] == {"_data": "2"}
+    assert len(connection.commands) == 2
+
+
+@pytest.mark.asyncio
+async def test_watcher_survives_failing_subscriber():
+    connection = FakeConnection(
+        streams=[FakeChangeStream(changes=[_change("1", "products", "a"), _change("2", "products", "b")])],
+    )
+    events: list[ChangeEvent] = []
+
+    async def publish(event: ChangeEvent) -> None:
+        events.append(event)
+
+        if len(events) == 1:
+            raise RuntimeError("subscriber failed")
+
+    watcher = ChangeStreamWatcher(mongo_database=FakeMongoDatabase(connection=connection), publish=publish)
+    await watcher.start()
+    await _wait_for(lambda: len(events) == 2)
+    await watcher.stop()
+
+    assert watcher.resume_token == {"_data": "2"}
@@ -0,0 +1,126 @@
+import logging
+from datetime import timedelta
+
+from pymongo import monitoring
+
+from infrastructure.database.explain import plan_summary
+from infrastructure.database.gateways.command_stats import (
+    command_filter,
+    CommandStatsListener,
+    explainable_command,
+    redact,
+)
+
+
+ADDRESS = ("mongodb", 27017)
+
+FIND_COMMAND = {
+    "find": "portfolio",
+    "filter": {"$or": [{"name": {"$regex": "склад", "$options": "i"}}, {"year": 2024}]},
+    "sort": {"created_at": -1, "oid": -1},
+    "limit": 20,
+    "comment": "MongoPortfolioRepository.find_many",
+    "lsid": {"id": "session"},
+    "$db": "sk",
+}
+
+
+def run_command(
+    listener: CommandStatsListener,
+    command: dict,
+    reply: dict,
+    duration_ms: float,
+    request_id: int = 1,
+    failed: bool = False,
+) -> None:
+    command_name = next(iter(command))
+    listener.started(monitoring.CommandStartedEvent(command, "sk", request_id, ADDRESS, request_id))
+
+    duration = timedelta(milliseconds=duration_ms)
+
+    if failed:
+        listener.failed(monitoring.CommandFailedEvent(duration, reply, command_name, request_id, ADDRESS, request_id))
+    else:
+        listener.succeeded(
+            monitoring.CommandSucceededEvent(duration, reply, command_name, request_id, ADDRESS, request_id),
+        )
+
+
+def test_redact_keeps_shape_without_literals():
+    assert redact({"oid": {"$in": ["a", "b", "c"]}, "is_shown": True}) == {"oid": {"$in": ["?"]}, "is_shown": "?"}
+
+
+def test_command_filter_of_find_keeps_sort():
+    assert command_filter("find", FIND_COMMAND) == {
+        "filter": {"$or": [{"name": {"$regex": "?", "$options": "?"}}, {"year": "?"}]},
+        "sort": {"created_at": -1, "oid": -1},
+    }
+    assert command_filter("insert", {"insert": "products", "documents": [{"name": "КТП"}]}) is None
+
+
+def test_listener_records_latency_and_documents_per_method():
+    listener = CommandStatsListener()
+
+    run_command(listener, FIND_COMMAND, {"cursor": {"firstBatch": [{}, {}, {}]}, "ok": 1}, 3, request_id=1)
+    run_command(listener, FIND_COMMAND, {"cursor": {"firstBatch": [{}]}, "ok": 1}, 40, request_id=2)
+    run_command(listener, FIND_COMMAND, {"errmsg": "timeout", "ok": 0}, 10_000, request_id=3, failed=True)
+
+    (stats,) = listener.snapshot()
+
+    assert (stats["collection"], stats["command"], stats["method"]) == (
+        "portfolio",
+        "find",
+        "MongoPortfolioRepository.find_many",
+    )
+    assert stats["count"] == 3
+    assert stats["failed_total"] == 1
+    assert stats["documents_total"] == 4
+    assert stats["buckets"]["5"] == 1
+    assert stats["buckets"]["50"] == 2
+    assert stats["buckets"]["+Inf"] == 3
+
+
+def test_listener_logs_slow_commands_without_literals(caplog):
+    listener = CommandStatsListener(slow_command_ms=100)
+
+    with caplog.at_level(logging.WARNING):
+        run_command(listener, FIND_COMMAND, {"cursor": {"firstBatch": []}, "ok": 1}, 50, request_id=1)
+        run_command(listener, FIND_COMMAND, {"cursor": {"firstBatch": []}, "ok": 1}, 250, request_id=2)
+
+    assert len(caplog.records) == 1
+    assert "MongoPortfolioRepository.find_many" in caplog.text
+    assert "склад" not in caplog.text
+
+    (shape,) = listener.slow_shapes()
+
+    assert shape.count == 1
+    assert shape.max_duration_ms == 250
+    # Без keep_commands команды для explain не сохраняются
+    assert listener.commands_to_explain() == {}
+
+
+def test_listener_keeps_only_slowest_shapes():
+    listener = CommandStatsListener(slow_command_ms=1, max_slow_shapes=2)
+
+    for request_id, (collection, duration_ms) in enumerate((("products", 10), ("news", 30), ("vacancies", 20)), 1):
+        command = {"count": collection, "query": {}}
+        run_command(listener, command, {"n": 0, "ok": 1}, duration_ms, request_id=request_id)
+
+    assert [shape.collection for shape in listener.slow_shapes()] == ["news", "vacancies"]
+
+
+def test_listener_keeps_commands_to_explain():
+    listener = CommandStatsListener(slow_command_ms=100, keep_commands=True)
+
+    run_command(listener, FIND_COMMAND, {"cursor": {"firstBatch": []}, "ok": 1}, 250)
+
+    ((key, (database_name, command)),) = listener.commands_to_explain().items()
+
+    assert database_name == "sk"
+    assert command == explainable_command(FIND_COMMAND)
+    assert "lsid" not in command and "$db" not in command
+
+    listener.set_explain(key, plan_summary({"queryPlanner": {"winningPlan": {"stage": "COLLSCAN"}}}))
+
+    assert listener.commands_to_explain() == {}
+    assert listener.slow_shapes()[0].explain == {"stages": ["COLLSCAN"], "index_name": None, "rejected_plans": 0}
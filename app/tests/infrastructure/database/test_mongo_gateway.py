@@ -0,0 +1,173 @@
+import contextvars
+
+import pytest
+from pymongo import (
+    monitoring,
+    ReadPreference,
+)
+from pymongo.read_preferences import SecondaryPreferred
+
+from infrastructure.database.gateways.mongo import MongoDatabase
+from infrastructure.database.gateways.pool_stats import PoolStatsListener
+from infrastructure.database.gateways.routing import (
+    make_read_preference,
+    pin_reads_to_primary,
+    primary_reads,
+    query_reads,
+)
+from infrastructure.database.repositories.base.mongo import RepositoryCollection
+from infrastructure.database.repositories.products.mongo import MongoProductRepository
+from settings.config import Config
+from settings.mongo import available_compressors
+
+
+ADDRESS = ("mongodb", 27017)
+
+
+def test_mongo_database_applies_client_options():
+    config = Config()
+    # Клиент Motor подключается лениво, поэтому сервер для проверки опций не нужен
+    mongo_database = MongoDatabase(
+        mongo_url=config.mongo_connection_url,
+        mongo_database=config.mongo_database,
+        client_options=config.mongo_client_options,
+        max_time_ms=config.mongo_max_time_ms,
+    )
+
+    options = mongo_database.connection.client.options
+
+    assert options.pool_options.max_pool_size == config.mongo_max_pool_size
+    assert options.pool_options.min_pool_size == config.mongo_min_pool_size
+    assert options.server_selection_timeout == config.mongo_server_selection_timeout_ms / 1000
+    assert options.retry_reads is config.mongo_retry_reads
+
+    mongo_database.close()
+
+
+def test_repository_reads_are_time_limited():
+    mongo_database = MongoDatabase(mongo_url="mongodb://localhost:27017", mongo_database="sk", max_time_ms=250)
+    repository = MongoProductRepository(mongo_database=mongo_database)
+
+    assert isinstance(repository.collection_for("find_many"), RepositoryCollection)
+    assert repository.collection_for("find_many").find({}).sort("created_at", -1).delegate._max_time_ms == 250
+
+    # Потоковые выдачи и выгрузки получают свой лимит (по умолчанию без ограничения)
+    assert repository.collection_for("find_many", max_time_ms=0).find({}).delegate._max_time_ms is None
+    assert repository.collection_for("find_many", max_time_ms=60_000).find({}).delegate._max_time_ms == 60_000
+
+    mongo_database.max_time_ms = 0
+    assert repository.collection_for("find_many").find({}).delegate._max_time_ms is None
+
+    mongo_database.close()
+
+
+def test_repository_commands_are_tagged_with_method():
+    mongo_database = MongoDatabase(mongo_url="mongodb://localhost:27017", mongo_database="sk")
+    repository = MongoProductRepository(mongo_database=mongo_database)
+
+    assert repository.collection_for("find_many").find({}).delegate._comment == "MongoProductRepository.find_many"
+    assert repository.collection_for("delete").delete_one.keywords == {"comment": "MongoProductRepository.delete"}
+
+    state = repository.collection_for("get_version", "sitemap_state")
+
+    assert state.name == "sitemap_state"
+    assert state.update_one.keywords == {"comment": "MongoProductRepository.get_version"}
+
+    mongo_database.close()
+
+
+def test_query_reads_use_query_read_preference():
+    mongo_database = MongoDatabase(
+        mongo_url="mongodb://localhost:27017",
+        mongo_database="sk",
+        query_read_preference=make_read_preference("secondaryPreferred", 90),
+    )
+    repository = MongoProductRepository(mongo_database=mongo_database)
+
+    assert repository.collection_for("find_many").read_preference == ReadPreference.PRIMARY
+
+    with query_reads():
+        assert repository.collection_for("find_many").read_preference == SecondaryPreferred(max_staleness=90)
+
+    mongo_database.close()
+
+
+def test_primary_pinned_reads_ignore_query_read_preference():
+    mongo_database = MongoDatabase(
+        mongo_url="mongodb://localhost:27017",
+        mongo_database="sk",
+        query_read_preference=make_read_preference("secondaryPreferred", 90),
+    )
+    repository = MongoProductRepository(mongo_database=mongo_database)
+
+    def read_preference_after_pin():
+        pin_reads_to_primary()
+
+        with query_reads():
+            return repository.collection_for("find_many").read_preference
+
+    # Закрепление действует в рамках контекста запроса, поэтому проверяем в копии контекста
+    assert contextvars.copy_context().run(read_preference_after_pin) == ReadPreference.PRIMARY
+
+    mongo_database.close()
+
+
+def test_primary_reads_override_query_read_preference():
+    mongo_database = MongoDatabase(
+        mongo_url="mongodb://localhost:27017",
+        mongo_database="sk",
+        query_read_preference=make_read_preference("secondaryPreferred", 90),
+    )
+    repository = MongoProductRepository(mongo_database=mongo_database)
+
+    with query_reads():
+        with primary_reads():
+            assert repository.collection_for("find_many").read_preference == ReadPreference.PRIMARY
+
+        assert repository.collection_for("find_many").read_preference == SecondaryPreferred(max_staleness=90)
+
+    mongo_database.close()
+
+
+def test_make_read_preference():
+    assert make_read_preference("primary") is None
+    assert make_read_preference("nearest", 120).max_staleness == 120
+
+    with pytest.raises(ValueError):
+        make_read_preference("fastest")
+
+
+def test_available_compressors_skips_missing_packages(monkeypatch):
+    monkeypatch.setattr("settings.mongo.find_spec", lambda name: None)
+
+    assert available_compressors("zstd, snappy,zlib") == "zlib"
+
+
+def test_pool_stats_listener_tracks_connections():
+    listener = PoolStatsListener()
+
+    listener.pool_created(monitoring.PoolCreatedEvent(ADDRESS, {}))
+    listener.connection_created(monitoring.ConnectionCreatedEvent(ADDRESS, 1))
+    listener.connection_created(monitoring.ConnectionCreatedEvent(ADDRESS, 2))
+
+    for _ in range(3):
+        listener.connection_check_out_started(monitoring.ConnectionCheckOutStartedEvent(ADDRESS))
+
+    listener.connection_checked_out(monitoring.ConnectionCheckedOutEvent(ADDRESS, 1, 0.01))
+    listener.connection_check_out_failed(monitoring.ConnectionCheckOutFailedEvent(ADDRESS, "timeout", 5.0))
+
+    stats = listener.snapshot()["mongodb:27017"]
+
+    assert stats["open"] == 2
+    assert stats["in_use"] == 1
+    assert stats["waiting"] == 1
+    assert stats["checkout_failed_total"] == 1
+
+    listener.connection_checked_in(monitoring.ConnectionCheckedInEvent(ADDRESS, 1))
+    listener.connection_closed(monitoring.ConnectionClosedEvent(ADDRESS, 2, "idle"))
+
+    stats = listener.snapshot()["mongodb:27017"]
+
+    assert stats["in_use"] == 0
+    assert stats["open"] == 1
+    assert stats["closed_total"] == 1
@@ -0,0 +1,108 @@
+from datetime import datetime
+from uuid import uuid4
+
+from bson import Binary
+
+from infrastructure.database.converters.base.mongo import datetime_range_document_query
+from infrastructure.database.converters.news.mongo import (
+    news_document_to_entity,
+    news_entity_to_document,
+)
+from infrastructure.database.converters.products.mongo import (
+    product_document_to_entity,
+    product_entity_to_document,
+)
+from infrastructure.database.migrations.native_bson import (
+    CollectionMigrationSpec,
+    convert_legacy_fields,
+)
+
+
+def test_product_document_uses_native_bson_types(valid_product_entity):
+    valid_product_entity.portfolio_ids = [uuid4()]
+
+    document = product_entity_to_document(valid_product_entity)
+
+    assert document["oid"] == Binary.from_uuid(valid_product_entity.oid)
+    assert document["portfolio_ids"] == [Binary.from_uuid(valid_product_entity.portfolio_ids[0])]
+    assert isinstance(document["created_at"], datetime)
+    assert isinstance(document["updated_at"], datetime)
+
+
+def test_product_document_round_trip(valid_product_entity):
+    valid_product_entity.portfolio_ids = [uuid4()]
+
+    entity = product_document_to_entity(product_entity_to_document(valid_product_entity))
+
+    assert entity.oid == valid_product_entity.oid
+    assert entity.portfolio_ids == valid_product_entity.portfolio_ids
+    assert entity.created_at == valid_product_entity.created_at
+
+
+def test_product_legacy_document_is_still_readable(valid_product_entity):
+    document = product_entity_to_document(valid_product_entity)
+    document["oid"] = str(valid_product_entity.oid)
+    document["created_at"] = valid_product_entity.created_at.isoformat()
+    document["updated_at"] = valid_product_entity.updated_at.isoformat()
+
+    entity = product_document_to_entity(document)
+
+    assert entity.oid == valid_product_entity.oid
+    assert entity.created_at == valid_product_entity.created_at
+
+
+def test_news_document_decoded_uuid_is_readable(valid_news_entity):
+    document = news_entity_to_document(valid_news_entity)
+    document["oid"] = valid_news_entity.oid
+
+    entity = news_document_to_entity(document)
+
+    assert entity.oid == valid_news_entity.oid
+    assert entity.date == valid_news_entity.date
+
+
+def test_convert_legacy_fields_converts_only_legacy_values():
+    oid = uuid4()
+    portfolio_id = uuid4()
+    created_at = datetime(2025, 1, 2, 3, 4, 5)
+    spec = CollectionMigrationSpec("products", uuid_list_fields=("portfolio_ids",))
+
+    changes = convert_legacy_fields(
+        {
+            "oid": str(oid),
+            "portfolio_ids": [str(portfolio_id)],
+            "created_at": created_at.isoformat(),
+            "updated_at": created_at,
+        },
+        spec,
+    )
+
+    assert changes == {
+        "oid": Binary.from_uuid(oid),
+        "portfolio_ids": [Binary.from_uuid(portfolio_id)],
+        "created_at": created_at,
+    }
+
+
+def test_convert_legacy_fields_skips_migrated_document():
+    spec = CollectionMigrationSpec("members")
+
+    changes = convert_legacy_fields(
+        {"oid": Binary.from_uuid(uuid4()), "created_at": datetime.now(), "updated_at": datetime.now()},
+        spec,
+    )
+
+    assert changes == {}
+
+
+def test_datetime_range_query_matches_legacy_strings():
+    start = datetime(2024, 3, 1)
+    end = datetime(2024, 4, 1, 12, 30)
+
+    native, legacy = datetime_range_document_query("created_at", start, end)["$or"]
+
+    assert native == {"created_at": {"$gte": start, "$lt": end}}
+    assert legacy == {"created_at": {"$gte": "2024-03-01T00:00:00", "$lt": "2024-04-01T12:30:00"}}
+    # Строковое сравнение ISO-дат совпадает с хронологическим, в том числе без микросекунд
+    assert legacy["created_at"]["$gte"] <= datetime(2024, 3, 1, 0, 0, 0, 1).isoformat() < legacy["created_at"]["$lt"]
+    assert datetime_range_document_query("created_at") == {}
@@ -0,0 +1,47 @@
+from infrastructure.database.converters.base.mongo import fields_projection
+from infrastructure.database.converters.news.mongo import (
+    news_document_to_entity,
+    news_entity_to_document,
+)
+from infrastructure.database.converters.products.mongo import (
+    product_entity_to_document,
+    product_summary_document_to_entity,
+    PRODUCT_SUMMARY_PROJECTION,
+)
+
+
+def test_product_summary_projection_covers_summary_fields(valid_product_entity):
+    document = product_entity_to_document(valid_product_entity)
+    projected = {key: value for key, value in document.items() if PRODUCT_SUMMARY_PROJECTION.get(key)}
+
+    summary = product_summary_document_to_entity(projected)
+
+    assert "advantages" not in projected
+    assert "description" not in projected
+    assert summary.oid == valid_product_entity.oid
+    assert summary.slug == valid_product_entity.slug
+    assert summary.preview_image_url == valid_product_entity.preview_image_url
+
+
+def test_fields_projection_always_reads_entity_fields():
+    assert fields_projection(None) is None
+    assert fields_projection(frozenset({"slug"})) == {
+        "_id": 0,
+        "oid": 1,
+        "created_at": 1,
+        "updated_at": 1,
+        "slug": 1,
+    }
+
+
+def test_news_partial_document_to_entity(valid_news_entity):
+    document = news_entity_to_document(valid_news_entity)
+    projection = fields_projection(frozenset({"title"}))
+    projected = {key: value for key, value in document.items() if projection.get(key)}
+
+    news = news_document_to_entity(projected)
+
+    assert news.oid == valid_news_entity.oid
+    assert news.title == valid_news_entity.title
+    assert news.reading_time is None
+    assert news.date is None
@@ -0,0 +1,73 @@
+import os
+
+import pytest
+from benchmarks.query_plans import (
+    build_report,
+    QueryPlanCase,
+    run,
+)
+
+
+# Проверка планов на живой MongoDB: QUERY_PLANS_MONGO_URL=mongodb://localhost:27017 pytest -k query_plans
+QUERY_PLANS_MONGO_URL = os.getenv("QUERY_PLANS_MONGO_URL")
+
+CASE = QueryPlanCase(collection_name="products", filter_name="all", query={}, sort_field="name", sort_order=1)
+
+
+def _explain(winning_plan: dict) -> dict:
+    return {
+        "queryPlanner": {"winningPlan": winning_plan},
+        "executionStats": {"totalKeysExamined": 20, "totalDocsExamined": 20, "nReturned": 20},
+    }
+
+
+def test_index_served_plan_has_no_violations():
+    report = build_report(
+        CASE,
+        _explain(
+            {
+                "stage": "LIMIT",
+                "inputStage": {
+                    "stage": "FETCH",
+                    "inputStage": {"stage": "IXSCAN", "indexName": "name_oid"},
+                },
+            },
+        ),
+    )
+
+    assert report.stages == ("LIMIT", "FETCH", "IXSCAN")
+    assert report.index_name == "name_oid"
+    assert report.keys_examined == 20
+    assert report.violations == frozenset()
+
+
+def test_collection_scan_with_blocking_sort_is_reported():
+    report = build_report(
+        CASE,
+        _explain({"queryPlan": {"stage": "SORT", "inputStage": {"stage": "COLLSCAN"}}}),
+    )
+
+    assert report.index_name is None
+    assert report.violations == frozenset({"SORT", "COLLSCAN"})
+
+
+def test_or_branches_are_walked():
+    report = build_report(
+        CASE,
+        _explain({"stage": "OR", "inputStages": [{"stage": "IXSCAN", "indexName": "slug"}, {"stage": "COLLSCAN"}]}),
+    )
+
+    assert report.violations == frozenset({"COLLSCAN"})
+
+
+@pytest.mark.skipif(QUERY_PLANS_MONGO_URL is None, reason="QUERY_PLANS_MONGO_URL is not set")
+@pytest.mark.asyncio
+async def test_repository_list_queries_are_index_served():
+    reports = await run(QUERY_PLANS_MONGO_URL, documents_count=2_000)
+
+    violations = [
+        f"{report.case.collection_name}[{report.case.filter_name}] {report.case.sort_field}: {report.stages}"
+        for report in reports
+        if report.violations
+    ]
+    assert violations == []
@@ -0,0 +1,29 @@
+import pytest
+
+from domain.base.exceptions import InvalidSortFieldException
+from infrastructure.database.indexes import MONGO_INDEXES
+from infrastructure.database.sorting import (
+    SORT_FIELDS,
+    sort_index_name,
+    sort_spec,
+)
+
+
+def test_sort_spec_adds_oid_tiebreaker_in_same_direction():
+    assert sort_spec("products", "created_at", -1) == [("created_at", -1), ("oid", -1)]
+    assert sort_spec("members", "order", 1) == [("order", 1), ("oid", 1)]
+
+
+def test_sort_spec_rejects_field_without_index():
+    with pytest.raises(InvalidSortFieldException) as exc_info:
+        sort_spec("products", "description", 1)
+
+    assert exc_info.value.allowed_fields == SORT_FIELDS["products"]
+
+
+@pytest.mark.parametrize("collection_name", SORT_FIELDS)
+def test_every_sort_field_has_backing_index(collection_name: str):
+    indexes = {model.document["name"]: model.document["key"] for model in MONGO_INDEXES[collection_name]}
+
+    for sort_field in SORT_FIELDS[collection_name]:
+        assert list(indexes[sort_index_name(sort_field)]) == [sort_field, "oid"]
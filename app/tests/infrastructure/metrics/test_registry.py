@@ -0,0 +1,170 @@
+import os
+
+import pytest
+
+from infrastructure.metrics.collectors import mongo_commands_snapshot
+from infrastructure.metrics.instruments import (
+    EXTERNAL_CALL_DURATION,
+    track_external_call,
+)
+from infrastructure.metrics.multiprocess import (
+    clear_directory,
+    collect,
+    merge_snapshots,
+    process_key,
+    read_snapshots,
+    write_snapshot,
+)
+from infrastructure.metrics.registry import (
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    render,
+)
+
+
+# pid, которого заведомо нет среди живых процессов
+DEAD_PID = 2**22 + 1
+
+
+@pytest.fixture
+def registry() -> MetricsRegistry:
+    return MetricsRegistry()
+
+
+def test_render_counter_gauge_and_histogram(registry: MetricsRegistry):
+    requests = Counter("requests_total", "Requests", ["route"], registry=registry)
+    in_flight = Gauge("in_flight", "In flight", registry=registry)
+    duration = Histogram("duration_seconds", "Duration", ["route"], buckets=(0.1, 1.0), registry=registry)
+
+    requests.labels('/a/{slug}"').inc()
+    requests.labels('/a/{slug}"').inc(2)
+    in_flight.inc()
+    duration.labels("/a").observe(0.05)
+    duration.labels("/a").observe(0.5)
+    duration.labels("/a").observe(5)
+
+    text = render(registry.snapshot())
+
+    assert "# TYPE requests_total counter" in text
+    assert 'requests_total{route="/a/{slug}\\""} 3.0' in text
+    assert "in_flight 1.0" in text
+    assert 'duration_seconds_bucket{route="/a",le="0.1"} 1.0' in text
+    assert 'duration_seconds_bucket{route="/a",le="1.0"} 2.0' in text
+    assert 'duration_seconds_bucket{route="/a",le="+Inf"} 3.0' in text
+    assert 'duration_seconds_sum{route="/a"} 5.55' in text
+    assert 'duration_seconds_count{route="/a"} 3.0' in text
+
+
+def test_labels_must_match_label_names(registry: MetricsRegistry):
+    requests = Counter("requests_total", "Requests", ["route"], registry=registry)
+
+    with pytest.raises(ValueError):
+        requests.labels("/a", "GET")
+
+    with pytest.raises(ValueError):
+        Counter("requests_total", "Requests", registry=registry)
+
+
+def test_merge_sums_counters_and_drops_gauges_of_dead_workers(registry: MetricsRegistry):
+    requests = Counter("requests_total", "Requests", registry=registry)
+    in_flight = Gauge("in_flight", "In flight", registry=registry)
+    lag = Gauge("lag_seconds", "Lag", aggregate="max", registry=registry)
+    duration = Histogram("duration_seconds", "Duration", buckets=(1.0,), registry=registry)
+
+    requests.inc(2)
+    in_flight.set(3)
+    lag.set(0.2)
+    duration.observe(0.5)
+    first = registry.snapshot()
+
+    lag.set(0.7)
+    duration.observe(2)
+    second = registry.snapshot()
+
+    merged = merge_snapshots([(first, True), (second, True), (second, False)])
+
+    assert merged["requests_total"]["samples"] == [[[], 6.0]]
+    assert merged["in_flight"]["samples"] == [[[], 6.0]]
+    assert merged["lag_seconds"]["samples"] == [[[], 0.7]]
+    assert merged["duration_seconds"]["samples"] == [[[], {"buckets": [3, 2], "sum": 5.5}]]
+
+
+def test_collect_aggregates_worker_files(registry: MetricsRegistry, tmp_path):
+    requests = Counter("requests_total", "Requests", registry=registry)
+    in_flight = Gauge("in_flight", "In flight", registry=registry)
+    requests.inc()
+    in_flight.inc()
+
+    # Снимок уже завершившегося воркера: его счетчик остается в сумме, gauge - нет
+    write_snapshot(str(tmp_path), registry.snapshot(), key=f"{DEAD_PID}-1")
+
+    merged = collect(registry, str(tmp_path))
+
+    assert merged["requests_total"]["samples"] == [[[], 2.0]]
+    assert merged["in_flight"]["samples"] == [[[], 1.0]]
+    assert (tmp_path / f"{process_key()}.json").exists()
+
+
+def test_reused_pid_does_not_overwrite_dead_worker(registry: MetricsRegistry, tmp_path):
+    requests = Counter("requests_total", "Requests", registry=registry)
+    in_flight = Gauge("in_flight", "In flight", registry=registry)
+    requests.inc()
+    in_flight.inc()
+
+    # Завершившийся воркер с тем же pid, но другим временем старта
+    write_snapshot(str(tmp_path), registry.snapshot(), key=f"{os.getpid()}-1")
+
+    merged = collect(registry, str(tmp_path))
+
+    assert process_key() != f"{os.getpid()}-1"
+    assert len(read_snapshots(str(tmp_path))) == 2
+    assert merged["requests_total"]["samples"] == [[[], 2.0]]
+    assert merged["in_flight"]["samples"] == [[[], 1.0]]
+
+
+def test_clear_directory_removes_previous_run(registry: MetricsRegistry, tmp_path):
+    directory = tmp_path / "metrics"
+    directory.mkdir()
+    write_snapshot(str(directory), registry.snapshot(), key=f"{DEAD_PID}-1")
+
+    clear_directory(str(directory))
+
+    assert directory.is_dir()
+    assert read_snapshots(str(directory)) == []
+
+
+def test_mongo_commands_snapshot_converts_to_seconds():
+    snapshot = mongo_commands_snapshot(
+        [
+            {
+                "collection": "products",
+                "command": "find",
+                "method": "MongoProductRepository.find_many",
+                "count": 2,
+                "failed_total": 0,
+                "documents_total": 40,
+                "duration_ms_total": 30.0,
+                "max_duration_ms": 25.0,
+                "buckets": {"1": 0, "5": 1, "25": 2, "+Inf": 2},
+            },
+        ],
+    )
+
+    ((labels, value),) = snapshot["mongo_command_duration_seconds"]["samples"]
+
+    assert labels == ["products", "find", "MongoProductRepository.find_many"]
+    assert value == {"buckets": [0, 1, 1, 0], "sum": 0.03}
+    assert snapshot["mongo_command_documents_total"]["samples"] == [[labels, 40]]
+
+
+def test_track_external_call_records_errors():
+    failed = EXTERNAL_CALL_DURATION.labels("smtp", "send", "error")
+    count_before = sum(failed.bucket_counts)
+
+    with pytest.raises(ConnectionError):
+        with track_external_call("smtp", "send"):
+            raise ConnectionError
+
+    assert sum(failed.bucket_counts) == count_before + 1
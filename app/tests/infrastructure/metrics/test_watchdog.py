@@ -0,0 +1,53 @@
+import asyncio
+import logging
+import time
+
+import pytest
+
+from infrastructure.metrics.instruments import (
+    EVENT_LOOP_BLOCK_DURATION,
+    EVENT_LOOP_BLOCKS,
+)
+from infrastructure.metrics.watchdog import EventLoopWatchdog
+
+
+def render_report_synchronously() -> None:
+    time.sleep(0.3)
+
+
+@pytest.mark.asyncio
+async def test_watchdog_captures_stack_of_blocking_call(caplog):
+    location = "tests/infrastructure/metrics/test_watchdog.py:render_report_synchronously"
+    blocks = EVENT_LOOP_BLOCKS.labels(location)
+    blocks_before = blocks.value
+    durations_before = sum(EVENT_LOOP_BLOCK_DURATION.labels().bucket_counts)
+    watchdog = EventLoopWatchdog(threshold=0.1, interval=0.01)
+
+    with caplog.at_level(logging.WARNING, logger="infrastructure.metrics.watchdog"):
+        await watchdog.start()
+        await asyncio.sleep(0.05)
+        render_report_synchronously()
+        await asyncio.sleep(0.05)
+        await watchdog.stop()
+
+    # Одна блокировка - одна запись стека, сколько бы проверок она ни пережила
+    assert blocks.value == blocks_before + 1
+    assert sum(EVENT_LOOP_BLOCK_DURATION.labels().bucket_counts) == durations_before + 1
+
+    stack_record, duration_record = caplog.records
+    assert location in stack_record.getMessage()
+    assert "time.sleep(0.3)" in stack_record.getMessage()
+    assert duration_record.getMessage().startswith("Event loop was blocked for 0.")
+
+
+@pytest.mark.asyncio
+async def test_watchdog_ignores_short_pauses(caplog):
+    watchdog = EventLoopWatchdog(threshold=0.2, interval=0.01)
+
+    with caplog.at_level(logging.WARNING, logger="infrastructure.metrics.watchdog"):
+        await watchdog.start()
+        time.sleep(0.05)
+        await asyncio.sleep(0.05)
+        await watchdog.stop()
+
+    assert caplog.records == []
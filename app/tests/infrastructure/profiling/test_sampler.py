@@ -0,0 +1,110 @@
+import asyncio
+import sys
+import time
+from dataclasses import dataclass
+
+import pytest
+
+from application.base.query import (
+    BaseQuery,
+    BaseQueryHandler,
+)
+from application.mediator import Mediator
+from infrastructure.profiling.sampler import (
+    CHILD_TASK,
+    IDLE,
+    OTHER_TASKS,
+    StackSampler,
+)
+from infrastructure.profiling.store import ProfileStore
+
+
+def busy(seconds: float) -> None:
+    started_at = time.perf_counter()
+
+    while time.perf_counter() - started_at < seconds:
+        pass
+
+
+def serialize_portfolios() -> None:
+    busy(0.05)
+
+
+async def search_portfolios() -> None:
+    serialize_portfolios()
+    # Дольше, чем работает other_request: остаток ожидания loop простаивает
+    await asyncio.sleep(0.15)
+
+
+async def other_request() -> None:
+    await asyncio.sleep(0)
+    busy(0.05)
+
+
+@dataclass(frozen=True)
+class SearchPortfoliosQuery(BaseQuery):
+    search: str
+
+
+@dataclass(frozen=True)
+class SearchPortfoliosQueryHandler(BaseQueryHandler[SearchPortfoliosQuery, list]):
+    async def handle(self, query: SearchPortfoliosQuery) -> list:
+        serialize_portfolios()
+        return []
+
+
+async def profile(request) -> dict[str, int]:
+    sampler = StackSampler(root=sys._getframe(), interval=0.001)
+    sampler.start()
+
+    try:
+        await request()
+    finally:
+        sampler.stop()
+
+    return {stack: int(count) for stack, count in (line.rsplit(" ", 1) for line in sampler.folded().splitlines())}
+
+
+@pytest.mark.asyncio
+async def test_samples_are_attributed_to_profiled_request():
+    stacks, _ = await asyncio.gather(profile(search_portfolios), other_request())
+    own_stacks = [stack for stack in stacks if stack not in (IDLE, OTHER_TASKS)]
+
+    assert any(
+        stack.startswith("search_portfolios (tests/infrastructure/profiling/test_sampler.py:")
+        and stack.split(";")[-1].startswith("busy ")
+        for stack in own_stacks
+    )
+    assert not any("other_request" in stack for stack in own_stacks)
+    # Время, пока loop занят другим запросом и пока запрос ждет, не теряется
+    assert OTHER_TASKS in stacks
+    assert IDLE in stacks
+
+
+@pytest.mark.asyncio
+async def test_coalesced_mediator_query_is_attributed_to_request():
+    mediator = Mediator()
+    mediator.register_query(SearchPortfoliosQuery, SearchPortfoliosQueryHandler())
+
+    # Обработчик выполняется в задаче single-flight, а не в корутине запроса
+    stacks = await profile(lambda: mediator.handle_query(SearchPortfoliosQuery(search="кран")))
+
+    assert any(
+        stack.startswith(f"{CHILD_TASK};SearchPortfoliosQueryHandler.handle (tests/infrastructure/profiling/")
+        and stack.split(";")[-1].startswith("busy ")
+        for stack in stacks
+    )
+    assert OTHER_TASKS not in stacks
+
+
+def test_store_keeps_latest_profiles(tmp_path):
+    store = ProfileStore(directory=str(tmp_path), max_profiles=2)
+    profile_ids = [store.new_id() for _ in range(3)]
+
+    for index, profile_id in enumerate(profile_ids):
+        store.save(profile_id, f"handler {index}\n")
+        time.sleep(0.01)
+
+    assert store.load(profile_ids[0]) is None
+    assert store.load(profile_ids[2]) == "handler 2\n"
+    assert store.load("../../etc/passwd") is None
@@ -0,0 +1,152 @@
+import json
+from datetime import timedelta
+from typing import Iterator
+
+import pytest
+from faststream.rabbit import (
+    RabbitBroker,
+    TestRabbitBroker,
+)
+from pymongo import monitoring
+
+from infrastructure.tracing.broker import BrokerTracingMiddleware
+from infrastructure.tracing.exporters import (
+    BatchSpanProcessor,
+    FileSpanExporter,
+)
+from infrastructure.tracing.mongo import CommandTracingListener
+from infrastructure.tracing.tracer import (
+    current_span_context,
+    extract,
+    inject,
+    Span,
+    SpanKind,
+    StatusCode,
+    TRACER,
+)
+
+
+class InMemoryProcessor:
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+
+    def on_end(self, span: Span) -> None:
+        self.spans.append(span)
+
+    def shutdown(self) -> None: ...
+
+
+@pytest.fixture
+def spans() -> Iterator[list[Span]]:
+    processor = InMemoryProcessor()
+    TRACER.configure(service_name="sk-test", processor=processor)
+
+    yield processor.spans
+
+    TRACER.shutdown()
+
+
+def test_disabled_tracer_records_nothing():
+    with TRACER.start_span("query GetProductListQuery") as span:
+        assert span is None
+        assert current_span_context() is None
+
+
+def test_nested_spans_share_trace_and_record_errors(spans: list[Span]):
+    with pytest.raises(ValueError):
+        with TRACER.start_span("command CreateSubmissionCommand") as parent:
+            with TRACER.start_span("s3 upload_fileobj", kind=SpanKind.CLIENT):
+                raise ValueError("boom")
+
+    child, root = spans
+
+    assert child.context.trace_id == root.context.trace_id == parent.context.trace_id
+    assert child.parent_span_id == root.context.span_id
+    assert root.parent_span_id is None
+    assert child.status_code == StatusCode.ERROR
+    assert child.attributes["exception.type"] == "ValueError"
+    assert current_span_context() is None
+
+
+def test_traceparent_round_trip(spans: list[Span]):
+    with TRACER.start_span("submission_created publish") as span:
+        headers = inject({})
+
+    assert headers["traceparent"] == f"00-{span.context.trace_id}-{span.context.span_id}-01"
+    assert extract(headers) == span.context
+    assert extract({"traceparent": "00-zz-1-01"}) is None
+    assert extract({}) is None
+
+
+def test_unsampled_decision_is_propagated():
+    TRACER.configure(service_name="sk-test", processor=InMemoryProcessor(), sample_ratio=0.0)
+
+    try:
+        with TRACER.start_span("GET /api/v1/products", kind=SpanKind.SERVER) as span:
+            with TRACER.start_span("query GetProductListQuery") as child:
+                headers = inject({})
+
+        assert span is None and child is None
+        assert headers["traceparent"].endswith("-00")
+        assert TRACER.processor.spans == []
+    finally:
+        TRACER.shutdown()
+
+
+def test_mongo_commands_are_child_spans(spans: list[Span]):
+    listener = CommandTracingListener()
+    address = ("mongodb", 27017)
+    command = {"insert": "submissions", "documents": [], "comment": "MongoSubmissionRepository.add"}
+
+    with TRACER.start_span("command CreateSubmissionCommand") as parent:
+        listener.started(monitoring.CommandStartedEvent(command, "sk", 1, address, 1))
+        listener.succeeded(
+            monitoring.CommandSucceededEvent(timedelta(milliseconds=2), {"n": 1}, "insert", 1, address, 1),
+        )
+
+    mongo_span, _ = spans
+
+    assert mongo_span.name == "MongoSubmissionRepository.add insert"
+    assert mongo_span.parent_span_id == parent.context.span_id
+    assert mongo_span.attributes["db.mongodb.collection"] == "submissions"
+
+
+@pytest.mark.asyncio
+async def test_trace_context_travels_in_message_headers(spans: list[Span]):
+    broker = RabbitBroker(middlewares=[BrokerTracingMiddleware])
+    consumed = []
+
+    @broker.subscriber("submission_created")
+    async def consumer(message: dict) -> None:
+        consumed.append(current_span_context())
+
+    async with TestRabbitBroker(broker):
+        with TRACER.start_span("POST /api/v1/submissions", kind=SpanKind.SERVER) as request_span:
+            await broker.publish({"name": "Иван"}, queue="submission_created")
+
+    publish_span = next(span for span in spans if span.kind == SpanKind.PRODUCER)
+    consume_span = next(span for span in spans if span.kind == SpanKind.CONSUMER)
+
+    assert publish_span.parent_span_id == request_span.context.span_id
+    assert consume_span.parent_span_id == publish_span.context.span_id
+    assert consumed == [consume_span.context]
+
+
+def test_file_exporter_writes_otlp_json(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    processor = BatchSpanProcessor(FileSpanExporter(str(path)), service_name="sk-test", schedule_delay=60)
+    TRACER.configure(service_name="sk-test", processor=processor)
+
+    with TRACER.start_span("bitrix crm.lead.add", kind=SpanKind.CLIENT, attributes={"peer.service": "bitrix"}):
+        pass
+
+    TRACER.shutdown()
+
+    (line,) = path.read_text().splitlines()
+    resource_spans = json.loads(line)["resourceSpans"][0]
+    (span,) = resource_spans["scopeSpans"][0]["spans"]
+
+    assert resource_spans["resource"]["attributes"][0]["value"] == {"stringValue": "sk-test"}
+    assert span["name"] == "bitrix crm.lead.add"
+    assert span["kind"] == SpanKind.CLIENT
+    assert span["attributes"] == [{"key": "peer.service", "value": {"stringValue": "bitrix"}}]
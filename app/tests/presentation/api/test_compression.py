@@ -0,0 +1,186 @@
+import gzip
+import zlib
+
+from fastapi import (
+    Depends,
+    FastAPI,
+    Request,
+)
+from fastapi.responses import (
+    PlainTextResponse,
+    Response,
+    StreamingResponse,
+)
+from fastapi.testclient import TestClient
+
+import brotli
+import pytest
+import zstandard
+
+from presentation.api.compression import (
+    CompressionMiddleware,
+    disable_compression,
+    PrecompressedContent,
+    select_encoding,
+)
+from presentation.api.responses import cacheable_response
+
+
+LARGE_TEXT = "Подробное описание решения для трансформаторной подстанции. " * 100
+
+
+@pytest.fixture
+def compression_client() -> TestClient:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=500)
+
+    @app.get("/large")
+    async def large() -> PlainTextResponse:
+        return PlainTextResponse(LARGE_TEXT)
+
+    @app.get("/etag")
+    async def etag(request: Request) -> Response:
+        return cacheable_response(request, PlainTextResponse(LARGE_TEXT), max_age=60)
+
+    @app.get("/small")
+    async def small() -> PlainTextResponse:
+        return PlainTextResponse("ok")
+
+    @app.get("/opt-out", dependencies=[Depends(disable_compression)])
+    async def opt_out() -> PlainTextResponse:
+        return PlainTextResponse(LARGE_TEXT)
+
+    @app.get("/binary")
+    async def binary() -> PlainTextResponse:
+        return PlainTextResponse(LARGE_TEXT, media_type="application/octet-stream")
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def chunks():
+            for index in range(3):
+                yield f"{index}:{LARGE_TEXT}\n".encode()
+
+        return StreamingResponse(chunks(), media_type="application/x-ndjson")
+
+    @app.get("/precompressed")
+    async def precompressed(request: Request):
+        return PrecompressedContent.build(LARGE_TEXT.encode()).response(request, media_type="text/plain")
+
+    return TestClient(app=app)
+
+
+@pytest.mark.parametrize(
+    "accept_encoding,expected",
+    [
+        (None, None),
+        ("", None),
+        ("identity", None),
+        ("gzip", "gzip"),
+        ("gzip;q=0", None),
+        ("*", "br"),
+        ("gzip;q=0.5, br", "br"),
+        ("br;q=0.1, gzip;q=0.9", "gzip"),
+        ("zstd, br", "br"),
+        ("*;q=0.3, gzip;q=0", "br"),
+    ],
+)
+def test_select_encoding(accept_encoding, expected):
+    assert select_encoding(accept_encoding, ("br", "zstd", "gzip")) == expected
+
+
+def test_compresses_large_response(compression_client: TestClient):
+    response = compression_client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert int(response.headers["content-length"]) < len(LARGE_TEXT.encode())
+    assert response.text == LARGE_TEXT
+
+
+@pytest.mark.parametrize(
+    "encoding,decompress",
+    [
+        ("br", brotli.decompress),
+        ("zstd", lambda data: zstandard.ZstdDecompressor().decompressobj().decompress(data)),
+    ],
+)
+def test_negotiates_encoding(compression_client: TestClient, encoding, decompress):
+    with compression_client.stream("GET", "/large", headers={"Accept-Encoding": encoding}) as response:
+        raw = b"".join(response.iter_raw())
+
+    assert response.headers["content-encoding"] == encoding
+    assert int(response.headers["content-length"]) == len(raw) < len(LARGE_TEXT.encode())
+    assert decompress(raw).decode() == LARGE_TEXT
+
+
+def test_weakens_etag_of_compressed_response(compression_client: TestClient):
+    identity = compression_client.get("/etag", headers={"Accept-Encoding": "identity"})
+    compressed = compression_client.get("/etag", headers={"Accept-Encoding": "gzip"})
+
+    assert not identity.headers["etag"].startswith("W/")
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert compressed.headers["etag"] == f"W/{identity.headers['etag']}"
+
+    revalidated = compression_client.get(
+        "/etag",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": compressed.headers["etag"]},
+    )
+    assert revalidated.status_code == 304
+
+
+def test_skips_response_below_minimum_size(compression_client: TestClient):
+    response = compression_client.get("/small", headers={"Accept-Encoding": "gzip"})
+
+    assert "content-encoding" not in response.headers
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.text == "ok"
+
+
+def test_skips_without_accept_encoding(compression_client: TestClient):
+    response = compression_client.get("/large", headers={"Accept-Encoding": "identity"})
+
+    assert "content-encoding" not in response.headers
+    assert response.text == LARGE_TEXT
+
+
+def test_route_opt_out(compression_client: TestClient):
+    response = compression_client.get("/opt-out", headers={"Accept-Encoding": "gzip"})
+
+    assert "content-encoding" not in response.headers
+    assert "vary" not in response.headers
+    assert response.text == LARGE_TEXT
+
+
+def test_skips_incompressible_content_type(compression_client: TestClient):
+    response = compression_client.get("/binary", headers={"Accept-Encoding": "gzip"})
+
+    assert "content-encoding" not in response.headers
+
+
+def test_compresses_stream_chunk_by_chunk(compression_client: TestClient):
+    with compression_client.stream("GET", "/stream", headers={"Accept-Encoding": "gzip"}) as response:
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+
+        decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+        # Каждый чанк сбрасывается компрессором и раскодируется сразу, не дожидаясь конца потока
+        decoded_chunks = [decompressor.decompress(chunk) for chunk in response.iter_raw() if chunk]
+
+    assert b"".join(decoded_chunks).decode() == "".join(f"{index}:{LARGE_TEXT}\n" for index in range(3))
+    assert decoded_chunks[0].startswith(b"0:")
+
+
+def test_precompressed_content_is_not_compressed_twice(compression_client: TestClient):
+    with compression_client.stream("GET", "/precompressed", headers={"Accept-Encoding": "gzip"}) as response:
+        raw = b"".join(response.iter_raw())
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert gzip.decompress(raw).decode() == LARGE_TEXT
+
+
+def test_precompressed_content_identity(compression_client: TestClient):
+    response = compression_client.get("/precompressed", headers={"Accept-Encoding": "identity"})
+
+    assert "content-encoding" not in response.headers
+    assert response.text == LARGE_TEXT
@@ -0,0 +1,87 @@
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from punq import (
+    Container,
+    Scope,
+)
+
+from infrastructure.database.gateways.command_stats import SlowCommandShape
+from infrastructure.database.gateways.mongo import MongoDatabase
+
+
+class FakeMongoDatabase:
+    def pool_stats(self) -> dict[str, dict[str, int]]:
+        return {
+            "mongodb:27017": {
+                "open": 5,
+                "in_use": 2,
+                "waiting": 0,
+                "created_total": 7,
+                "closed_total": 2,
+                "checked_out_total": 120,
+                "checkout_failed_total": 0,
+                "cleared_total": 0,
+            },
+        }
+
+    def command_stats(self) -> list[dict]:
+        return [
+            {
+                "collection": "products",
+                "command": "find",
+                "method": "MongoProductRepository.find_many",
+                "count": 3,
+                "failed_total": 0,
+                "documents_total": 60,
+                "duration_ms_total": 12.5,
+                "max_duration_ms": 7.0,
+                "buckets": {"5": 2, "10": 3, "+Inf": 3},
+            },
+        ]
+
+    async def slow_commands(self) -> list[SlowCommandShape]:
+        return [
+            SlowCommandShape(
+                collection="portfolio",
+                command="find",
+                method="MongoPortfolioRepository.find_many",
+                filter={"filter": {"name": {"$regex": "?"}}},
+                count=1,
+                max_duration_ms=420.0,
+            ),
+        ]
+
+
+def test_get_mongo_pool_stats(container: Container, authenticated_client: TestClient):
+    container.register(MongoDatabase, instance=FakeMongoDatabase(), scope=Scope.singleton)
+
+    response = authenticated_client.get("/healthcheck/mongo-pool")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["data"]["mongodb:27017"]["in_use"] == 2
+
+
+def test_get_mongo_pool_stats_requires_auth(client: TestClient):
+    response = client.get("/healthcheck/mongo-pool")
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def test_get_mongo_command_stats(container: Container, authenticated_client: TestClient):
+    container.register(MongoDatabase, instance=FakeMongoDatabase(), scope=Scope.singleton)
+
+    response = authenticated_client.get("/healthcheck/mongo-commands")
+
+    assert response.status_code == status.HTTP_200_OK
+
+    data = response.json()["data"]
+
+    assert data["commands"][0]["method"] == "MongoProductRepository.find_many"
+    assert data["slow_commands"][0]["filter"] == {"filter": {"name": {"$regex": "?"}}}
+
+
+def test_get_mongo_command_stats_requires_auth(client: TestClient):
+    response = client.get("/healthcheck/mongo-commands")
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
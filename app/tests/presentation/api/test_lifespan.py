@@ -0,0 +1,147 @@
+from collections import defaultdict
+from dataclasses import (
+    dataclass,
+    field,
+)
+
+from fastapi import (
+    FastAPI,
+    status,
+)
+from fastapi.testclient import TestClient
+
+import pytest
+from faker import Faker
+from punq import (
+    Container,
+    Scope,
+)
+
+from application.container import get_container
+from application.mediator import Mediator
+from application.products.commands import CreateProductCommand
+from domain.products.interfaces.repository import BaseProductRepository
+from domain.products.services import ProductSlugCache
+from infrastructure.database.gateways.mongo import MongoDatabase
+from infrastructure.database.indexes import MONGO_INDEXES
+from infrastructure.database.migrations.native_bson import (
+    MIGRATIONS_COLLECTION,
+    NATIVE_BSON_MIGRATION_ID,
+)
+from presentation.api.healthcheck import healthcheck_router
+from presentation.api.lifespan import lifespan
+from presentation.api.v1.products.schemas import ProductRequestSchema
+
+
+@dataclass
+class FakeCollection:
+    created_indexes: list = field(default_factory=list)
+    # Документ, который вернет любой find_one (например, документ старого формата)
+    found_document: dict | None = None
+    updates: list = field(default_factory=list)
+
+    async def create_indexes(self, models: list) -> None:
+        self.created_indexes.extend(models)
+
+    async def find_one(self, query: dict, projection: dict | None = None) -> dict | None:
+        return self.found_document
+
+    async def update_one(self, query: dict, update: dict, upsert: bool = False) -> None:
+        self.updates.append(query)
+
+
+@dataclass
+class FakeMongoDatabase:
+    pings: int = 0
+    closed: bool = False
+    connection: dict = field(default_factory=lambda: defaultdict(FakeCollection))
+
+    async def ping(self) -> None:
+        self.pings += 1
+
+    async def warm_up(self, connections: int) -> None:
+        for _ in range(connections):
+            await self.ping()
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def fake_mongo_database(container: Container) -> FakeMongoDatabase:
+    mongo_database = FakeMongoDatabase()
+    container.register(MongoDatabase, instance=mongo_database, scope=Scope.singleton)
+    return mongo_database
+
+
+def test_readiness_is_false_without_lifespan(client: TestClient):
+    response = client.get("/healthcheck/ready")
+
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response.json()["data"]["result"] is False
+
+
+@pytest.fixture
+def lifespan_app(container: Container) -> FastAPI:
+    # Полное приложение в lifespan еще и подключается к RabbitMQ (роутер заявок), поэтому проверяем хук отдельно
+    app = FastAPI(lifespan=lifespan)
+    app.dependency_overrides[get_container] = lambda: container
+    app.include_router(healthcheck_router)
+
+    return app
+
+
+@pytest.mark.asyncio
+async def test_lifespan_warms_up_and_closes_clients(
+    lifespan_app: FastAPI,
+    container: Container,
+    mediator: Mediator,
+    fake_mongo_database: FakeMongoDatabase,
+    faker: Faker,
+):
+    product_request = ProductRequestSchema(
+        category="Трансформаторные подстанции",
+        name=faker.sentence(nb_words=5),
+        slug=faker.slug(),
+        description=faker.text(max_nb_chars=500),
+        preview_image_url=faker.image_url(),
+        preview_image_alt=faker.sentence(nb_words=3),
+    )
+    product, *_ = await mediator.handle_command(CreateProductCommand(product=product_request.to_entity()))
+
+    with TestClient(app=lifespan_app) as client:
+        response = client.get("/healthcheck/ready")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["data"]["result"] is True
+        assert fake_mongo_database.pings >= 1
+        assert set(fake_mongo_database.connection) == {*MONGO_INDEXES, MIGRATIONS_COLLECTION}
+        # Документов старого формата нет: отметка о миграции ставится при первом запуске
+        assert fake_mongo_database.connection[MIGRATIONS_COLLECTION].updates == [{"_id": NATIVE_BSON_MIGRATION_ID}]
+
+        # Продукт уже в кэше slug: чтение по slug не идет в репозиторий
+        product_repository = container.resolve(BaseProductRepository)
+        await product_repository.delete(product.oid)
+        cached = await container.resolve(ProductSlugCache).get(
+            product.slug.as_generic_type(),
+            None,
+            loader=lambda: product_repository.get_by_slug(product.slug.as_generic_type()),
+        )
+        assert cached.oid == product.oid
+
+    assert fake_mongo_database.closed is True
+
+
+def test_lifespan_serves_during_native_bson_migration(
+    lifespan_app: FastAPI,
+    fake_mongo_database: FakeMongoDatabase,
+    caplog: pytest.LogCaptureFixture,
+):
+    fake_mongo_database.connection["submissions"].found_document = {"_id": 1}
+
+    with TestClient(app=lifespan_app) as client:
+        assert client.get("/healthcheck/ready").status_code == status.HTTP_200_OK
+
+    assert "migrate-native-bson" in caplog.text
+    # Отметка ставится только после миграции
+    assert fake_mongo_database.connection[MIGRATIONS_COLLECTION].updates == []
@@ -0,0 +1,61 @@
+from fastapi import status
+from fastapi.testclient import TestClient
+
+import pytest
+from punq import Container
+
+from application.container import get_container
+from presentation.api.main import create_app
+from presentation.api.metrics import MetricsMiddleware
+from presentation.api.tracing import TracingMiddleware
+from settings.config import Config
+
+
+@pytest.fixture
+def metrics_enabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(get_container().resolve(Config), "metrics_enabled", True)
+
+
+@pytest.fixture
+def container(metrics_enabled, container: Container) -> Container:
+    # Медиатор тестового контейнера собирается по его собственному Config
+    container.resolve(Config).metrics_enabled = True
+    return container
+
+
+def test_metrics_report_request_latency_by_route_template(client: TestClient):
+    client.get("/api/v1/products/slug/missing-product")
+
+    response = client.get("/metrics")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'http_request_duration_seconds_count{method="GET",route="/api/v1/products/slug/{slug}",status="404"}' in (
+        response.text
+    )
+    assert 'mediator_dispatch_duration_seconds_count{kind="query",name="GetProductBySlugQuery"' in response.text
+    assert "http_requests_in_flight 1.0" in response.text
+
+
+def test_metrics_do_not_label_unmatched_paths(client: TestClient):
+    client.get("/wp-admin/setup.php")
+
+    response = client.get("/metrics")
+
+    assert "/wp-admin" not in response.text
+    assert 'route="<unmatched>",status="404"' in response.text
+
+
+def test_metrics_middleware_is_outermost(metrics_enabled, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(get_container().resolve(Config), "tracing_enabled", True)
+
+    middleware = [item.cls for item in create_app().user_middleware]
+
+    # Первый в списке - самый внешний
+    assert middleware[:2] == [MetricsMiddleware, TracingMiddleware]
+
+
+def test_metrics_endpoint_disabled_by_default(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.delenv("METRICS_ENABLED", raising=False)
+
+    assert Config().metrics_enabled is False
@@ -604,3 +604,49 @@ async def test_delete_news_not_found(
     json_response = response.json()
     assert "errors" in json_response
     assert len(json_response["errors"]) > 0
+
+
+@pytest.mark.asyncio
+async def test_get_news_by_slug_with_fields(
+    app: FastAPI,
+    client: TestClient,
+    mediator: Mediator,
+    faker: Faker,
+):
+    """Тест получения новости с ограниченным набором полей."""
+    slug = faker.slug()
+    data = {
+        "category": "События",
+        "title": faker.sentence(nb_words=5),
+        "slug": slug,
+        "content": faker.text(max_nb_chars=1000),
+        "short_content": faker.text(max_nb_chars=200),
+        "image_url": faker.image_url(),
+        "alt": faker.sentence(nb_words=3),
+        "reading_time": 7,
+        "date": datetime.now(),
+    }
+
+    request_schema = NewsRequestSchema(**data)
+    await mediator.handle_command(CreateNewsCommand(news=request_schema.to_entity()))
+
+    url = app.url_path_for("get_news_by_slug", slug=slug)
+
+    response: Response = client.get(url=url, params={"fields": "title, reading_time"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["data"] == {"title": data["title"], "reading_time": 7}
+
+
+@pytest.mark.asyncio
+async def test_get_news_list_with_unknown_fields(
+    app: FastAPI,
+    client: TestClient,
+):
+    """Тест отклонения неизвестных полей в fields."""
+    url = app.url_path_for("get_news_list")
+
+    response: Response = client.get(url=url, params={"fields": "title,password"})
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+    assert "password" in response.json()["errors"][0]["message"]
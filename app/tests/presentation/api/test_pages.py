@@ -0,0 +1,92 @@
+from fastapi import (
+    FastAPI,
+    status,
+)
+from fastapi.testclient import TestClient
+
+import pytest
+from faker import Faker
+from httpx import Response
+
+from application.mediator import Mediator
+from application.products.commands import CreateProductCommand
+from application.seo_settings.commands import CreateSeoSettingsCommand
+from presentation.api.v1.products.schemas import ProductRequestSchema
+from presentation.api.v1.seo_settings.schemas import SeoSettingsRequestSchema
+
+
+@pytest.mark.asyncio
+async def test_get_home_page_bundle_success(
+    app: FastAPI,
+    client: TestClient,
+    mediator: Mediator,
+    faker: Faker,
+):
+    """Тест получения всех данных главной страницы одним запросом."""
+    url = app.url_path_for("get_home_page_bundle")
+
+    seo_request = SeoSettingsRequestSchema(
+        page_path="/",
+        page_name="Главная",
+        title=faker.sentence(nb_words=5),
+        description=faker.text(max_nb_chars=200),
+    )
+    await mediator.handle_command(CreateSeoSettingsCommand(seo_settings=seo_request.to_entity()))
+
+    for is_shown in (True, True, False):
+        product_request = ProductRequestSchema(
+            category="Трансформаторные подстанции",
+            name=faker.sentence(nb_words=5),
+            slug=faker.slug(),
+            description=faker.text(max_nb_chars=500),
+            preview_image_url=faker.image_url(),
+            preview_image_alt=faker.sentence(nb_words=3),
+            is_shown=is_shown,
+        )
+        await mediator.handle_command(CreateProductCommand(product=product_request.to_entity()))
+
+    response: Response = client.get(url=url, params={"limit": 5})
+
+    assert response.status_code == status.HTTP_200_OK
+
+    json_response = response.json()
+    data = json_response["data"]
+
+    assert json_response["errors"] == []
+    assert data["seo_settings"]["page_path"] == "/"
+    assert data["products"]["pagination"]["total"] == 2
+    assert len(data["products"]["items"]) == 2
+    assert data["news"]["items"] == []
+    assert {"reviews", "members", "certificates"} <= set(data)
+    assert response.headers["cache-control"] == "public, max-age=60"
+
+
+@pytest.mark.asyncio
+async def test_get_home_page_bundle_without_seo_settings(app: FastAPI, client: TestClient):
+    """Тест главной страницы без SEO настроек: секция пустая, причина в errors."""
+    url = app.url_path_for("get_home_page_bundle")
+
+    response: Response = client.get(url=url)
+
+    assert response.status_code == status.HTTP_200_OK
+
+    json_response = response.json()
+
+    assert json_response["data"]["seo_settings"] is None
+    assert json_response["errors"][0]["section"] == "seo_settings"
+    assert json_response["errors"][0]["type"] == "SeoSettingsNotFoundByPathException"
+
+
+@pytest.mark.asyncio
+async def test_get_home_page_bundle_not_modified(app: FastAPI, client: TestClient):
+    """Тест условного запроса главной страницы по ETag."""
+    url = app.url_path_for("get_home_page_bundle")
+
+    response: Response = client.get(url=url)
+    etag = response.headers["etag"]
+
+    cached_response: Response = client.get(url=url, headers={"If-None-Match": etag})
+
+    assert cached_response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert cached_response.headers["etag"] == etag
+    assert cached_response.content == b""
@@ -780,3 +780,49 @@ async def test_delete_portfolio_not_found(
     json_response = response.json()
     assert "errors" in json_response
     assert len(json_response["errors"]) > 0
+
+
+@pytest.mark.asyncio
+async def test_get_portfolios_summary_list_success(
+    app: FastAPI,
+    client: TestClient,
+    mediator: Mediator,
+    faker: Faker,
+):
+    """Тест получения облегченного списка портфолио."""
+    url = app.url_path_for("get_portfolios_summary_list")
+
+    data = {
+        "name": faker.sentence(nb_words=3),
+        "slug": faker.slug(),
+        "poster": faker.image_url(),
+        "poster_alt": faker.sentence(nb_words=3),
+        "year": 2024,
+        "description": faker.text(max_nb_chars=1000),
+        "task_title": faker.sentence(nb_words=5),
+        "task_description": faker.text(max_nb_chars=500),
+        "solution_title": faker.sentence(nb_words=5),
+        "solution_description": faker.text(max_nb_chars=500),
+        "solution_subtitle": faker.sentence(nb_words=3),
+        "solution_subdescription": faker.text(max_nb_chars=300),
+        "solution_image_left": faker.image_url(),
+        "solution_image_left_alt": faker.sentence(nb_words=3),
+        "solution_image_right": faker.image_url(),
+        "solution_image_right_alt": faker.sentence(nb_words=3),
+        "has_review": False,
+    }
+    request_schema = PortfolioRequestSchema(**data)
+    await mediator.handle_command(CreatePortfolioCommand(portfolio=request_schema.to_entity()))
+
+    response: Response = client.get(url=url)
+
+    assert response.status_code == status.HTTP_200_OK
+
+    json_response = response.json()
+    item = json_response["data"]["items"][0]
+
+    assert json_response["data"]["pagination"]["total"] == 1
+    assert item["slug"] == data["slug"]
+    assert item["year"] == 2024
+    assert "task_description" not in item
+    assert "solution_description" not in item
@@ -1,3 +1,4 @@
+import json
 from uuid import uuid4
 
 from fastapi import (
@@ -51,6 +52,46 @@ async def test_get_products_list_success(
     assert json_response["data"]["pagination"]["total"] == 3
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("limit,expected_lines", [(None, 11), (2, 2)])
+async def test_get_products_list_ndjson(
+    app: FastAPI,
+    client: TestClient,
+    mediator: Mediator,
+    faker: Faker,
+    limit,
+    expected_lines,
+):
+    """Тест потоковой выдачи списка продуктов в NDJSON: с offset, весь список, если limit не передан явно."""
+    url = app.url_path_for("get_products_list")
+
+    for _ in range(12):
+        data = {
+            "category": "Трансформаторные подстанции",
+            "name": faker.sentence(nb_words=5),
+            "slug": faker.slug(),
+            "description": faker.text(max_nb_chars=500),
+            "preview_image_url": faker.image_url(),
+            "preview_image_alt": faker.sentence(nb_words=3),
+        }
+        request_schema = ProductRequestSchema(**data)
+        await mediator.handle_command(CreateProductCommand(product=request_schema.to_entity()))
+
+    response: Response = client.get(
+        url=url,
+        params={"offset": 1, "fields": "name,slug"} | ({"limit": limit} if limit is not None else {}),
+        headers={"Accept": "application/x-ndjson"},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/x-ndjson"
+
+    lines = response.text.splitlines()
+
+    assert len(lines) == expected_lines
+    assert all(set(json.loads(line)) == {"name", "slug"} for line in lines)
+
+
 @pytest.mark.asyncio
 async def test_get_products_list_with_pagination(
     app: FastAPI,
@@ -251,6 +292,18 @@ async def test_get_products_list_with_sorting(
         assert product_names[0] < product_names[1]
 
 
+def test_get_products_list_rejects_unindexed_sort_field(app: FastAPI, client: TestClient):
+    """Тест отклонения сортировки по полю без индекса."""
+    url = app.url_path_for("get_products_list")
+
+    response: Response = client.get(url=url, params={"sort_field": "description"})
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+    json_response = response.json()
+    assert json_response["errors"][0]["type"] == "InvalidSortFieldException"
+    assert "created_at" in json_response["errors"][0]["message"]
+
+
 @pytest.mark.asyncio
 async def test_get_product_by_id_success(
     app: FastAPI,
@@ -780,3 +833,81 @@ async def test_delete_product_not_found(
     json_response = response.json()
     assert "errors" in json_response
     assert len(json_response["errors"]) > 0
+
+
+@pytest.mark.asyncio
+async def test_get_products_summary_list_success(
+    app: FastAPI,
+    client: TestClient,
+    mediator: Mediator,
+    faker: Faker,
+):
+    """Тест получения облегченного списка продуктов."""
+    url = app.url_path_for("get_products_summary_list")
+
+    for _ in range(3):
+        data = {
+            "category": "Трансформаторные подстанции",
+            "name": faker.sentence(nb_words=5),
+            "slug": faker.slug(),
+            "description": faker.text(max_nb_chars=500),
+            "preview_image_url": faker.image_url(),
+            "preview_image_alt": faker.sentence(nb_words=3),
+            "simple_description": [{"text": faker.text(max_nb_chars=200)}],
+        }
+        request_schema = ProductRequestSchema(**data)
+        await mediator.handle_command(CreateProductCommand(product=request_schema.to_entity()))
+
+    response: Response = client.get(url=url, params={"limit": 2})
+
+    assert response.status_code == status.HTTP_200_OK
+
+    json_response = response.json()
+
+    assert len(json_response["data"]["items"]) == 2
+    assert json_response["data"]["pagination"]["total"] == 3
+    assert set(json_response["data"]["items"][0]) == {
+        "oid",
+        "category",
+        "name",
+        "slug",
+        "preview_image_url",
+        "preview_image_alt",
+        "order",
+        "is_shown",
+        "created_at",
+        "updated_at",
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_products_list_with_fields(
+    app: FastAPI,
+    client: TestClient,
+    mediator: Mediator,
+    faker: Faker,
+):
+    """Тест получения списка продуктов с ограниченным набором полей."""
+    url = app.url_path_for("get_products_list")
+
+    for _ in range(2):
+        data = {
+            "category": "Трансформаторные подстанции",
+            "name": faker.sentence(nb_words=5),
+            "slug": faker.slug(),
+            "description": faker.text(max_nb_chars=500),
+            "preview_image_url": faker.image_url(),
+            "advantages": [{"label": faker.word(), "icon": faker.image_url()}],
+        }
+        request_schema = ProductRequestSchema(**data)
+        await mediator.handle_command(CreateProductCommand(product=request_schema.to_entity()))
+
+    response: Response = client.get(url=url, params={"fields": "name,slug,advantages"})
+
+    assert response.status_code == status.HTTP_200_OK
+
+    json_response = response.json()
+
+    assert json_response["data"]["pagination"]["total"] == 2
+    assert all(set(item) == {"name", "slug", "advantages"} for item in json_response["data"]["items"])
+    assert len(json_response["data"]["items"][0]["advantages"]) == 1
@@ -0,0 +1,84 @@
+import asyncio
+import contextvars
+
+from fastapi import (
+    FastAPI,
+    status,
+)
+from fastapi.testclient import TestClient
+
+import pytest
+
+from infrastructure.database.gateways.routing import reads_pinned_to_primary
+from infrastructure.profiling.store import ProfileStore
+from presentation.api.profiling import (
+    is_admin_request,
+    PROFILE_ID_HEADER,
+    profiling_router,
+    ProfilingMiddleware,
+)
+
+
+@pytest.fixture
+def app(app: FastAPI, tmp_path) -> FastAPI:
+    app.state.profile_store = ProfileStore(directory=str(tmp_path))
+    app.add_middleware(ProfilingMiddleware, store=app.state.profile_store)
+    app.include_router(profiling_router)
+
+    return app
+
+
+def test_admin_request_with_header_is_profiled(authenticated_client: TestClient):
+    response = authenticated_client.get("/api/v1/portfolios", headers={"X-Profile": "1"})
+
+    assert response.status_code == status.HTTP_200_OK
+    profile_id = response.headers[PROFILE_ID_HEADER]
+
+    profile = authenticated_client.get(f"/profiles/{profile_id}")
+
+    assert profile.status_code == status.HTTP_200_OK
+    assert profile.headers["content-type"].startswith("text/plain")
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in profile.text.splitlines())
+
+
+def test_request_without_header_is_not_profiled(authenticated_client: TestClient, tmp_path):
+    response = authenticated_client.get("/api/v1/portfolios")
+
+    assert PROFILE_ID_HEADER not in response.headers
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_anonymous_request_with_header_is_not_profiled(client: TestClient, tmp_path):
+    response = client.get("/api/v1/portfolios", headers={"X-Profile": "1"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert PROFILE_ID_HEADER not in response.headers
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_profiles_require_authentication(client: TestClient):
+    response = client.get(f"/profiles/{ProfileStore.new_id()}")
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def test_unknown_profile_returns_404(authenticated_client: TestClient):
+    response = authenticated_client.get(f"/profiles/{ProfileStore.new_id()}")
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.asyncio
+async def test_admin_check_does_not_pin_reads(authenticated_client: TestClient):
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/api/v1/portfolios",
+        "headers": [(b"authorization", authenticated_client.headers["Authorization"].encode())],
+    }
+
+    async def check_admin() -> tuple[bool, bool]:
+        return await is_admin_request(scope), reads_pinned_to_primary()
+
+    # Чистый контекст, как у нового запроса; иначе профилируемый запрос читал бы из primary и мимо single-flight
+    assert await asyncio.create_task(check_admin(), context=contextvars.Context()) == (True, False)
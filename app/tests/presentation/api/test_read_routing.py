@@ -0,0 +1,54 @@
+import time
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import pytest
+
+from infrastructure.database.gateways.routing import (
+    reads_pinned_to_primary,
+    record_write,
+)
+from presentation.api.read_routing import (
+    READ_PRIMARY_COOKIE,
+    ReadYourWritesMiddleware,
+)
+
+
+@pytest.fixture
+def client() -> TestClient:
+    app = FastAPI()
+    app.add_middleware(ReadYourWritesMiddleware, window=90)
+
+    @app.post("/products")
+    async def create_product() -> dict:
+        record_write()
+        return {}
+
+    @app.get("/products")
+    async def get_products() -> dict:
+        return {"pinned": reads_pinned_to_primary()}
+
+    return TestClient(app)
+
+
+def test_command_pins_following_requests_of_client(client: TestClient):
+    assert client.get("/products").json() == {"pinned": False}
+
+    response = client.post("/products")
+
+    assert 0 < float(response.cookies[READ_PRIMARY_COOKIE]) - time.time() <= 90
+    assert "Max-Age=90" in response.headers["set-cookie"]
+    # Публичный запрос без авторизации сразу после команды читает из primary
+    assert client.get("/products").json() == {"pinned": True}
+
+
+def test_expired_or_broken_cookie_is_ignored(client: TestClient):
+    client.cookies.set(READ_PRIMARY_COOKIE, str(int(time.time()) - 1))
+    assert client.get("/products").json() == {"pinned": False}
+
+    client.cookies.set(READ_PRIMARY_COOKIE, "soon")
+    response = client.get("/products")
+
+    assert response.json() == {"pinned": False}
+    assert "set-cookie" not in response.headers
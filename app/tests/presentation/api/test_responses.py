@@ -0,0 +1,64 @@
+import json
+from datetime import datetime
+from uuid import uuid4
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import pytest
+
+from presentation.api import responses
+from presentation.api.responses import (
+    FastJSONResponse,
+    ndjson_chunks,
+)
+from presentation.api.schemas import (
+    ApiResponse,
+    PingResponseSchema,
+)
+
+
+def test_fast_json_response_renders_model():
+    oid = uuid4()
+    now = datetime(2025, 1, 15, 12, 30, 0, 123456)
+
+    response = FastJSONResponse(ApiResponse(data={"oid": oid, "date": now, "title": "Новость"}))
+
+    assert response.headers["content-type"] == "application/json"
+    assert json.loads(response.body) == {
+        "data": {"oid": str(oid), "date": "2025-01-15T12:30:00.123456", "title": "Новость"},
+        "meta": {},
+        "errors": [],
+    }
+
+
+def test_fast_json_response_keeps_openapi_schema(app: FastAPI, client: TestClient):
+    url = app.url_path_for("get_products_list")
+
+    response = client.get(url=url)
+    schema = app.openapi()["paths"][url]["get"]["responses"]["200"]["content"]["application/json"]["schema"]
+
+    assert response.status_code == 200
+    assert response.json()["data"]["items"] == []
+    assert schema["$ref"].endswith("ApiResponse_ListPaginatedResponse_ProductResponseSchema__")
+
+
+def test_fast_json_response_ping_model():
+    response = FastJSONResponse(ApiResponse[PingResponseSchema](data=PingResponseSchema(result=True)))
+
+    assert response.body == b'{"data":{"result":true},"meta":{},"errors":[]}'
+
+
+@pytest.mark.asyncio
+async def test_ndjson_chunks_sends_first_line_immediately_and_batches_rest(monkeypatch):
+    monkeypatch.setattr(responses, "NDJSON_CHUNK_SIZE", 30)
+
+    async def items():
+        for index in range(5):
+            yield {"index": index}
+
+    chunks = [chunk async for chunk in ndjson_chunks(items(), lambda item: item)]
+
+    assert chunks[0] == b'{"index":0}\n'
+    assert len(chunks) < 5
+    assert b"".join(chunks).splitlines() == [f'{{"index":{index}}}'.encode() for index in range(5)]
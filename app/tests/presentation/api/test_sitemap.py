@@ -0,0 +1,155 @@
+import gzip
+
+from fastapi import (
+    FastAPI,
+    status,
+)
+from fastapi.testclient import TestClient
+
+import pytest
+from faker import Faker
+from httpx import Response
+from punq import Container
+
+from application.mediator import Mediator
+from application.products.commands import (
+    CreateProductCommand,
+    DeleteProductCommand,
+)
+from application.seo_settings.commands import CreateSeoSettingsCommand
+from application.sitemap.documents import SitemapDocumentCache
+from application.sitemap.queries import GetSitemapVersionQuery
+from presentation.api.v1.products.schemas import ProductRequestSchema
+from presentation.api.v1.seo_settings.schemas import SeoSettingsRequestSchema
+
+
+async def _create_product(mediator: Mediator, faker: Faker, slug: str):
+    product_request = ProductRequestSchema(
+        category="Трансформаторные подстанции",
+        name=faker.sentence(nb_words=5),
+        slug=slug,
+        description=faker.text(max_nb_chars=500),
+        preview_image_url=faker.image_url(),
+        preview_image_alt=faker.sentence(nb_words=3),
+    )
+    product, *_ = await mediator.handle_command(CreateProductCommand(product=product_request.to_entity()))
+    return product
+
+
+async def _create_seo_settings(mediator: Mediator, faker: Faker, page_path: str, title: str):
+    seo_request = SeoSettingsRequestSchema(
+        page_path=page_path,
+        page_name=faker.sentence(nb_words=3),
+        title=title,
+        description=faker.text(max_nb_chars=200),
+    )
+    await mediator.handle_command(CreateSeoSettingsCommand(seo_settings=seo_request.to_entity()))
+
+
+@pytest.mark.asyncio
+async def test_get_sitemap_bundle_joins_seo_settings(
+    app: FastAPI,
+    client: TestClient,
+    mediator: Mediator,
+    faker: Faker,
+):
+    """Тест JSON-бандла: страницы сущностей получают точные или префиксные SEO настройки, статические страницы добавляются."""
+    url = app.url_path_for("get_sitemap_bundle")
+
+    await _create_product(mediator, faker, slug="ktp-1000")
+    await _create_seo_settings(mediator, faker, page_path="/products/*", title="Продукция")
+    await _create_seo_settings(mediator, faker, page_path="/", title="Главная")
+
+    response: Response = client.get(url=url)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["etag"].startswith('W/"json-')
+
+    pages = {page["path"]: page for page in response.json()["data"]["pages"]}
+
+    assert set(pages) == {"/products/ktp-1000", "/"}
+    assert pages["/products/ktp-1000"]["source"] == "products"
+    assert pages["/products/ktp-1000"]["seo"]["title"] == "Продукция"
+    assert pages["/"]["source"] == "pages"
+    assert pages["/"]["seo"]["title"] == "Главная"
+
+
+@pytest.mark.asyncio
+async def test_get_sitemap_xml_precompressed(
+    app: FastAPI,
+    client: TestClient,
+    mediator: Mediator,
+    faker: Faker,
+):
+    """Тест sitemap.xml: абсолютные ссылки и заранее сжатое тело."""
+    url = app.url_path_for("get_sitemap_xml")
+
+    await _create_product(mediator, faker, slug="ktp-2000")
+
+    with client.stream("GET", url, headers={"Accept-Encoding": "gzip"}) as response:
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("application/xml")
+        assert response.headers["content-encoding"] == "gzip"
+
+        body = gzip.decompress(b"".join(response.iter_raw())).decode()
+
+    assert "<loc>http://localhost:3000/products/ktp-2000</loc>" in body
+    assert body.startswith('<?xml version="1.0" encoding="UTF-8"?>')
+
+
+@pytest.mark.asyncio
+async def test_get_sitemap_etag_changes_on_write(
+    app: FastAPI,
+    client: TestClient,
+    mediator: Mediator,
+    faker: Faker,
+):
+    """Тест ETag: повторный запрос получает 304, удаление продукта меняет версию."""
+    url = app.url_path_for("get_sitemap_xml")
+
+    product = await _create_product(mediator, faker, slug="ktp-3000")
+
+    first: Response = client.get(url=url)
+    etag = first.headers["etag"]
+
+    not_modified: Response = client.get(url=url, headers={"If-None-Match": etag})
+
+    assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+    assert not_modified.content == b""
+
+    await mediator.handle_command(DeleteProductCommand(product_id=product.oid))
+
+    changed: Response = client.get(url=url, headers={"If-None-Match": etag})
+
+    assert changed.status_code == status.HTTP_200_OK
+    assert changed.headers["etag"] != etag
+    assert "ktp-3000" not in changed.text
+
+
+@pytest.mark.asyncio
+async def test_rendered_sitemap_is_cached_in_container(
+    app: FastAPI,
+    client: TestClient,
+    container: Container,
+    mediator: Mediator,
+    faker: Faker,
+):
+    """Тест кэша документов: без записей документ не пересобирается, запись меняет версию документа."""
+    url = app.url_path_for("get_sitemap_xml")
+    documents: SitemapDocumentCache = container.resolve(SitemapDocumentCache)
+
+    await _create_product(mediator, faker, slug="ktp-4000")
+    client.get(url=url)
+    version = await mediator.handle_query(GetSitemapVersionQuery())
+    rendered = documents.get("xml", version)
+
+    client.get(url=url)
+
+    assert rendered is not None
+    assert documents.get("xml", version) is rendered
+
+    await _create_product(mediator, faker, slug="ktp-5000")
+    client.get(url=url)
+
+    assert documents.get("xml", version) is None
+    assert documents.get("xml", await mediator.handle_query(GetSitemapVersionQuery())) is not None
@@ -1,3 +1,7 @@
+import csv
+import io
+import json
+import zipfile
 from uuid import uuid4
 
 from fastapi import (
@@ -291,6 +295,145 @@ async def test_get_submissions_list_with_form_type_filter(
     assert all(item["form_type"] == "Опросный лист" for item in json_response["data"]["items"])
 
 
+@pytest.mark.asyncio
+async def test_get_submissions_list_ndjson(
+    authenticated_client: TestClient,
+    mediator: Mediator,
+    faker: Faker,
+):
+    """Тест потоковой выдачи списка заявок в NDJSON: весь список без limit страницы."""
+    url = "/api/v1/submissions"
+
+    for form_type in ("Опросный лист", "Обращение", "Опросный лист") * 6:
+        request_schema = SubmissionRequestSchema(form_type=form_type, name=faker.name(), email=faker.email())
+        await mediator.handle_command(CreateSubmissionCommand(submission=request_schema.to_entity()))
+
+    response: Response = authenticated_client.get(
+        url=url,
+        params={"form_type": "Опросный лист"},
+        headers={"Accept": "application/x-ndjson"},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/x-ndjson"
+
+    items = [json.loads(line) for line in response.text.splitlines()]
+
+    assert len(items) == 12
+    assert all(item["form_type"] == "Опросный лист" for item in items)
+    assert all("oid" in item for item in items)
+
+
+@pytest.mark.asyncio
+async def test_get_submissions_list_ndjson_honours_explicit_limit(
+    authenticated_client: TestClient,
+    mediator: Mediator,
+    faker: Faker,
+):
+    """Тест: явно переданный limit ограничивает поток заявок."""
+    for _ in range(5):
+        request_schema = SubmissionRequestSchema(form_type="Обращение", name=faker.name(), email=faker.email())
+        await mediator.handle_command(CreateSubmissionCommand(submission=request_schema.to_entity()))
+
+    response: Response = authenticated_client.get(
+        url="/api/v1/submissions",
+        params={"limit": 3, "offset": 1},
+        headers={"Accept": "application/x-ndjson"},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.text.splitlines()) == 3
+
+
+def test_get_submissions_list_ndjson_requires_auth(client: TestClient):
+    """Тест: поток заявок без токена отклоняется, обычный список по-прежнему доступен."""
+    url = "/api/v1/submissions"
+
+    response: Response = client.get(url=url, headers={"Accept": "application/x-ndjson"})
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    assert client.get(url=url).status_code == status.HTTP_200_OK
+
+
+@pytest.mark.asyncio
+async def test_export_submissions_csv(
+    authenticated_client: TestClient,
+    mediator: Mediator,
+    faker: Faker,
+):
+    """Тест выгрузки заявок в CSV с фильтром по типу формы."""
+    url = "/api/v1/submissions/export"
+
+    for form_type, comments in (("Опросный лист", "=HYPERLINK()"), ("Обращение", None), ("Опросный лист", None)):
+        request_schema = SubmissionRequestSchema(
+            form_type=form_type,
+            name=faker.name(),
+            email=faker.email(),
+            comments=comments,
+        )
+        await mediator.handle_command(CreateSubmissionCommand(submission=request_schema.to_entity()))
+
+    response: Response = authenticated_client.get(url=url, params={"form_type": "Опросный лист"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/csv")
+    assert response.headers["content-disposition"].startswith('attachment; filename="submissions_')
+
+    rows = list(csv.reader(io.StringIO(response.content.decode("utf-8-sig")), delimiter=";"))
+
+    assert rows[0][:3] == ["Дата", "Тип формы", "Имя"]
+    assert len(rows) == 3
+    assert all(row[1] == "Опросный лист" for row in rows[1:])
+    # Формулы из пользовательского ввода не исполняются в Excel
+    assert rows[1][5] == "'=HYPERLINK()"
+
+
+@pytest.mark.asyncio
+async def test_export_submissions_xlsx(
+    authenticated_client: TestClient,
+    mediator: Mediator,
+    faker: Faker,
+):
+    """Тест выгрузки заявок в XLSX."""
+    url = "/api/v1/submissions/export"
+
+    for _ in range(2):
+        request_schema = SubmissionRequestSchema(form_type="Обращение", name=faker.name(), email=faker.email())
+        await mediator.handle_command(CreateSubmissionCommand(submission=request_schema.to_entity()))
+
+    response: Response = authenticated_client.get(url=url, params={"format": "xlsx"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+    archive = zipfile.ZipFile(io.BytesIO(response.content))
+    sheet = archive.read("xl/worksheets/sheet1.xml").decode()
+
+    assert archive.testzip() is None
+    assert sheet.count("<row>") == 3
+    assert "Обращение" in sheet
+
+
+@pytest.mark.asyncio
+async def test_export_submissions_unauthorized(client: TestClient):
+    """Тест выгрузки заявок без авторизации."""
+    response: Response = client.get(url="/api/v1/submissions/export")
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.asyncio
+async def test_export_submissions_invalid_period(authenticated_client: TestClient):
+    """Тест выгрузки заявок с пустым периодом."""
+    response: Response = authenticated_client.get(
+        url="/api/v1/submissions/export",
+        params={"created_from": "2025-02-01T00:00:00", "created_to": "2025-01-01T00:00:00"},
+    )
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+    assert "created_to" in response.json()["errors"][0]["message"]
+
+
 @pytest.mark.asyncio
 async def test_delete_submission_success(
     app: FastAPI,